@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+bulk insert benchmark.
+
+it measures throughput and peak python memory of inserting a generator
+of entities into sqlite, using the `insert` method of bulk services which
+serializes all values up front, and the `stream_insert` method which
+serializes values lazily per chunk.
+
+usage: python bulk_insert.py [rows] [chunk_size]
+"""
+
+import os
+import sys
+import time
+import logging
+import tracemalloc
+
+SOURCE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, SOURCE_PATH)
+os.chdir(SOURCE_PATH)
+
+import pyrin.database.bulk.services as bulk_services
+import pyrin.database.migration.services as migration_services
+
+from pyrin.core.globals import SECURE_TRUE
+from pyrin.database.services import get_current_store
+
+from tests.unit import PyrinUnitTestApplication
+
+
+def generate_entities(entity, count):
+    """
+    generates the given number of entities.
+
+    :param type[BaseEntity] entity: entity class to be generated.
+    :param int count: number of entities.
+
+    :rtype: iterator[BaseEntity]
+    """
+
+    for index in range(1, count + 1):
+        yield entity(id=index, name='name_{index}'.format(index=index),
+                     age=index % 100, populate_all=SECURE_TRUE)
+
+
+def insert(entity, rows, method, **options):
+    """
+    deletes all rows of given entity and inserts the given number of rows.
+
+    :param type[BaseEntity] entity: entity class to be inserted.
+    :param int rows: number of rows to be inserted.
+    :param function method: bulk method to be called.
+    """
+
+    store = get_current_store()
+    store.query(entity).delete()
+    store.commit()
+    method(generate_entities(entity, rows), **options)
+
+
+def measure(entity, name, rows, method, **options):
+    """
+    inserts the given number of rows using provided method and prints the results.
+
+    throughput is measured without memory tracing, because tracing
+    slows down the allocations. then peak memory is measured in
+    a separate run.
+
+    :param type[BaseEntity] entity: entity class to be inserted.
+    :param str name: name of the measurement.
+    :param int rows: number of rows to be inserted.
+    :param function method: bulk method to be called.
+    """
+
+    start = time.perf_counter()
+    insert(entity, rows, method, **options)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    insert(entity, rows, method, **options)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print('{name:<28}{rate:>14.0f}{peak:>14.1f}'
+          .format(name=name, rate=rows / elapsed, peak=peak / 1024 / 1024))
+
+
+def main(rows=100000, chunk_size=1000):
+    """
+    runs the benchmark and prints the results.
+
+    :param int rows: number of rows to be inserted.
+    :param int chunk_size: chunk size to insert values.
+    """
+
+    PyrinUnitTestApplication(import_name='tests.unit', scripting_mode=True)
+    logging.disable(logging.CRITICAL)
+    migration_services.create_all()
+
+    from tests.unit.common.models import BoundedLocalEntity
+
+    print('value: {rows} rows, chunk size {chunk_size}'
+          .format(rows=rows, chunk_size=chunk_size))
+    print('{name:<28}{rate:>14}{peak:>14}'.format(name='method', rate='rows/sec',
+                                                  peak='peak mb'))
+
+    entity = BoundedLocalEntity
+    try:
+        measure(entity, 'insert', rows, lambda values, **options:
+                bulk_services.insert(*values, **options), chunk_size=chunk_size)
+        measure(entity, 'stream_insert', rows, bulk_services.stream_insert,
+                chunk_size=chunk_size)
+        measure(entity, 'stream_insert multi_values', rows, bulk_services.stream_insert,
+                chunk_size=chunk_size, multi_values=True)
+    finally:
+        migration_services.drop_all()
+
+
+if __name__ == '__main__':
+    main(*(int(item) for item in sys.argv[1:]))
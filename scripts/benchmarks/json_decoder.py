@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+json decoder benchmark.
+
+it measures deserialization time of a request body with complex and normal
+string values, using the legacy decoder which used the pure python scanner
+and matched every string against all regular expressions, the plain flask
+decoder without any coercion, and the current decoder.
+
+usage: python json_decoder.py [rows] [repeat]
+"""
+
+import os
+import sys
+import json
+import timeit
+
+from datetime import datetime, timedelta
+from uuid import UUID
+
+SOURCE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, SOURCE_PATH)
+os.chdir(SOURCE_PATH)
+
+from json.decoder import scanstring
+from json.scanner import py_make_scanner
+
+from flask.json import JSONDecoder
+
+import pyrin.globalization.datetime.services as datetime_services
+import pyrin.utils.unique_id as uuid_utils
+
+from pyrin.converters.json.decoder import CoreJSONDecoder
+from pyrin.utils.unique_id import UUID_REGEX
+from pyrin.utils.datetime import DEFAULT_DATE_TIME_ISO_REGEX, \
+    DEFAULT_DATE_ISO_REGEX, DEFAULT_TIME_ISO_REGEX, DEFAULT_LOCAL_NAIVE_TIME_REGEX, \
+    DEFAULT_UTC_ZULU_DATE_TIME_REGEX, DEFAULT_LOCAL_NAIVE_DATE_TIME_REGEX, \
+    DEFAULT_UTC_ZULU_TIME_REGEX
+
+from tests.unit import PyrinUnitTestApplication
+
+
+def legacy_scanstring(s, end, strict=True):
+    s, end = scanstring(s, end, strict)
+    if DEFAULT_DATE_TIME_ISO_REGEX.match(s):
+        return datetime_services.to_datetime(s, to_server=False, from_server=False), end
+    elif DEFAULT_DATE_ISO_REGEX.match(s):
+        return datetime_services.to_date(s), end
+    elif DEFAULT_TIME_ISO_REGEX.match(s) or \
+            DEFAULT_LOCAL_NAIVE_TIME_REGEX.match(s) or \
+            DEFAULT_UTC_ZULU_TIME_REGEX.match(s):
+        return datetime_services.to_time(s), end
+    elif DEFAULT_UTC_ZULU_DATE_TIME_REGEX.match(s):
+        return datetime_services.to_datetime(s, to_server=False, from_server=False), end
+    elif DEFAULT_LOCAL_NAIVE_DATE_TIME_REGEX.match(s):
+        return datetime_services.to_datetime(s, to_server=False, from_server=False), end
+    elif UUID_REGEX.match(s):
+        return uuid_utils.try_get_uuid_or_value(s), end
+    else:
+        return s, end
+
+
+class LegacyJSONDecoder(JSONDecoder):
+    """
+    legacy json decoder class.
+
+    it is the same as the decoder before using the c scanner
+    and coercing the values in a separate pass.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.parse_string = legacy_scanstring
+        self.scan_once = py_make_scanner(self)
+
+
+def create_body(count):
+    """
+    creates a json body with a list of dicts with complex and normal string values.
+
+    :param int count: number of rows.
+
+    :rtype: str
+    """
+
+    now = datetime(2021, 6, 1, 12, 30)
+    rows = []
+    for index in range(count):
+        rows.append(dict(id=str(UUID(int=index)),
+                         name='name_{index}'.format(index=index),
+                         description='a normal description for row {index}'.format(index=index),
+                         tags=['first', 'second', 'third'],
+                         score=index * 1.25,
+                         created_on=(now - timedelta(days=index)).isoformat(),
+                         birth_date=(now - timedelta(days=index)).date().isoformat(),
+                         is_active=index % 2 == 0))
+
+    return json.dumps(dict(results=rows))
+
+
+def main(rows=5000, repeat=10):
+    """
+    runs the benchmark and prints the results.
+
+    :param int rows: number of rows in the body.
+    :param int repeat: number of repeats for each measurement.
+    """
+
+    PyrinUnitTestApplication(import_name='tests.unit', scripting_mode=True)
+    body = create_body(rows)
+
+    print('body: {rows} rows, {size:.2f} mb, {repeat} repeats'
+          .format(rows=rows, size=len(body) / 1024 / 1024, repeat=repeat))
+    print('{name:<24}{time:>12}'.format(name='decoder', time='ms'))
+
+    for name, decoder in (('legacy', LegacyJSONDecoder),
+                          ('flask', JSONDecoder),
+                          ('current', CoreJSONDecoder)):
+        elapsed = timeit.timeit(lambda: json.loads(body, cls=decoder), number=repeat)
+        print('{name:<24}{time:>12.3f}'.format(name=name, time=elapsed * 1000 / repeat))
+
+
+if __name__ == '__main__':
+    main(*(int(item) for item in sys.argv[1:]))
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+json encoder benchmark.
+
+it measures serialization time of a result with datetime columns, using
+the legacy encoder which converted each datetime through datetime services,
+and the current encoder with all available json backends.
+
+usage: python json_encoder.py [rows] [repeat]
+"""
+
+import os
+import sys
+import json
+import timeit
+
+from datetime import datetime, date, time, timedelta
+from uuid import UUID
+
+SOURCE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, SOURCE_PATH)
+os.chdir(SOURCE_PATH)
+
+from flask.json import JSONEncoder
+
+import pyrin.globalization.datetime.services as datetime_services
+
+from pyrin.converters.json.backends import BACKENDS
+from pyrin.converters.json.encoder import CoreJSONEncoder
+from pyrin.utils import encoding
+
+from tests.unit import PyrinUnitTestApplication
+
+
+class LegacyJSONEncoder(JSONEncoder):
+    """
+    legacy json encoder class.
+
+    it is the same as the encoder before using a type-dispatch table
+    and resolving the timezones once per response.
+    """
+
+    def default(self, o):
+        if isinstance(o, datetime):
+            return datetime_services.to_datetime_string(o, to_server=False, from_server=True)
+        if isinstance(o, date):
+            return datetime_services.to_date_string(o)
+        if isinstance(o, time):
+            return datetime_services.to_time_string(o, to_server=False, from_server=True)
+        if isinstance(o, bytes):
+            return encoding.bytes_to_base64_string(o)
+
+        return super().default(o)
+
+
+def create_rows(count):
+    """
+    creates a list of dicts with five datetime columns.
+
+    :param int count: number of rows.
+
+    :rtype: list[dict]
+    """
+
+    now = datetime(2021, 6, 1, 12, 30)
+    rows = []
+    for index in range(count):
+        rows.append(dict(id=UUID(int=index),
+                         name='name_{index}'.format(index=index),
+                         score=index * 1.25,
+                         created_on=now - timedelta(days=index),
+                         modified_on=now - timedelta(hours=index),
+                         published_on=now + timedelta(minutes=index),
+                         expire_on=now + timedelta(days=index),
+                         last_login=now - timedelta(seconds=index)))
+
+    return dict(count_total=count, results=rows)
+
+
+def main(rows=1000, repeat=50):
+    """
+    runs the benchmark and prints the results.
+
+    :param int rows: number of rows in the value.
+    :param int repeat: number of repeats for each measurement.
+    """
+
+    PyrinUnitTestApplication(import_name='tests.unit', scripting_mode=True)
+    value = create_rows(rows)
+
+    print('value: {rows} rows with 5 datetime columns, {repeat} repeats'
+          .format(rows=rows, repeat=repeat))
+    print('{name:<24}{time:>12}'.format(name='encoder', time='ms'))
+
+    legacy_time = timeit.timeit(lambda: json.dumps(value, cls=LegacyJSONEncoder),
+                                number=repeat)
+    print('{name:<24}{time:>12.3f}'.format(name='legacy', time=legacy_time * 1000 / repeat))
+
+    for name, backend_class in BACKENDS.items():
+        backend = backend_class()
+        if backend.is_available is not True:
+            print('{name:<24}not installed'.format(name=name))
+            continue
+
+        backend_time = timeit.timeit(lambda: backend.dumps(value, CoreJSONEncoder),
+                                     number=repeat)
+        print('{name:<24}{time:>12.3f}'.format(name=name, time=backend_time * 1000 / repeat))
+
+
+if __name__ == '__main__':
+    main(*(int(item) for item in sys.argv[1:]))
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+remote cache serializers benchmark.
+
+it measures encode and decode time and encoded size of representative
+`to_dict()` outputs for all available serializers, with and without compression.
+
+usage: python remote_cache_serializers.py [rows] [repeat]
+"""
+
+import sys
+import timeit
+
+from uuid import UUID
+from decimal import Decimal
+from datetime import datetime, timedelta
+
+sys.path.insert(0, '../../src')
+
+from pyrin.caching.enumerations import SerializerEnum, CompressionEnum
+from pyrin.caching.remote.serializers.structs import ValueCodec
+from pyrin.caching.remote.serializers.exceptions import SerializerIsNotAvailableError
+
+
+def create_rows(count):
+    """
+    creates a list of dicts similar to `to_dict()` output of entities.
+
+    it includes datetime, uuid and decimal values as they are returned by `to_dict()`.
+
+    :param int count: number of rows.
+
+    :rtype: list[dict]
+    """
+
+    now = datetime(2021, 6, 1, 12, 30)
+    rows = []
+    for index in range(count):
+        rows.append(dict(id=index,
+                         username='user_{index}'.format(index=index),
+                         first_name='First {index}'.format(index=index),
+                         last_name='Last {index}'.format(index=index),
+                         email='user_{index}@example.com'.format(index=index),
+                         mobile='+98912{index:07d}'.format(index=index),
+                         is_active=index % 3 != 0,
+                         is_superuser=False,
+                         score=index * 1.25,
+                         group_id=index % 10,
+                         created_on=now - timedelta(days=index),
+                         token=UUID(int=index),
+                         balance=Decimal(index) / 4,
+                         modified_on=None,
+                         roles=['reader', 'writer'] if index % 2 else ['reader']))
+
+    return rows
+
+
+def measure(codec, value, repeat):
+    """
+    measures encode and decode time of given value.
+
+    :param ValueCodec codec: codec to be measured.
+    :param object value: value to be encoded.
+    :param int repeat: number of repeats.
+
+    :returns: tuple[float encode_ms, float decode_ms, int size]
+    :rtype: tuple[float, float, int]
+    """
+
+    encoded = codec.encode(value)
+    encode_time = timeit.timeit(lambda: codec.encode(value), number=repeat)
+    decode_time = timeit.timeit(lambda: codec.decode(encoded), number=repeat)
+    return encode_time * 1000 / repeat, decode_time * 1000 / repeat, len(encoded)
+
+
+def main(rows=500, repeat=200):
+    """
+    runs the benchmark and prints the results.
+
+    :param int rows: number of rows in the value.
+    :param int repeat: number of repeats for each measurement.
+    """
+
+    value = create_rows(rows)
+    print('value: {rows} rows, {repeat} repeats'.format(rows=rows, repeat=repeat))
+    print('{name:<16}{encode:>12}{decode:>12}{size:>12}'.format(
+        name='codec', encode='encode ms', decode='decode ms', size='bytes'))
+
+    for serializer in SerializerEnum.values():
+        for compression in (None, CompressionEnum.ZLIB):
+            try:
+                codec = ValueCodec(serializer, compression, 4096)
+            except SerializerIsNotAvailableError:
+                print('{name:<16}not installed'.format(name=serializer))
+                break
+
+            name = serializer
+            if compression is not None:
+                name = '{serializer}+{compression}'.format(serializer=serializer,
+                                                           compression=compression)
+
+            encode_ms, decode_ms, size = measure(codec, value, repeat)
+            print('{name:<16}{encode:>12.3f}{decode:>12.3f}{size:>12}'.format(
+                name=name, encode=encode_ms, decode=decode_ms, size=size))
+
+
+if __name__ == '__main__':
+    main(*(int(item) for item in sys.argv[1:]))
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+route dispatch benchmark.
+
+it measures the framework overhead of handling a request by a route,
+which is the time of `route.handle` minus the time of calling the
+view function directly, for different kinds of routes. a new mock
+request is injected for each call in both measurements. the best of
+five runs is reported for each measurement.
+
+usage: python route_dispatch.py [repeat]
+"""
+
+import os
+import sys
+import timeit
+import logging
+
+SOURCE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, SOURCE_PATH)
+os.chdir(SOURCE_PATH)
+
+from pyrin.core.enumerations import HTTPMethodEnum
+
+from tests.unit import PyrinUnitTestApplication
+
+
+def view_function(id, name, **options):
+    """
+    a view function that returns a small dict.
+
+    :param int id: id value.
+    :param str name: name value.
+
+    :rtype: dict
+    """
+
+    return dict(id=id, name=name)
+
+
+ROUTES = (('plain', dict()),
+          ('no_cache', dict(no_cache=True)),
+          ('result_schema', dict(depth=1)),
+          ('paged', dict(paged=True, endpoint='benchmark_paged')),
+          ('temporary', dict(request_limit=10 ** 9)))
+
+
+def main(repeat=20000):
+    """
+    runs the benchmark and prints the results.
+
+    :param int repeat: number of requests for each route.
+    """
+
+    PyrinUnitTestApplication(import_name='tests.unit', scripting_mode=True)
+    logging.disable(logging.CRITICAL)
+
+    import pyrin.api.router.services as router_services
+    import tests.unit.security.session.services as test_session_services
+
+    def call(function, inputs):
+        test_session_services.inject_new_request()
+        return function(dict(inputs))
+
+    inputs = dict(id=1, name='pyrin')
+    direct = min(timeit.repeat(lambda: call(lambda values: view_function(**values), inputs),
+                               number=repeat, repeat=5))
+
+    print('{repeat} requests per route'.format(repeat=repeat))
+    print('{name:<20}{time:>16}'.format(name='route', time='overhead us'))
+    for name, options in ROUTES:
+        route = router_services.create_route('/benchmark/{name}'.format(name=name),
+                                             methods=HTTPMethodEnum.GET,
+                                             view_function=view_function,
+                                             authenticated=False, **options)
+
+        elapsed = min(timeit.repeat(lambda: call(route.handle, inputs),
+                                    number=repeat, repeat=5))
+        print('{name:<20}{time:>16.2f}'.format(name=name,
+                                               time=(elapsed - direct) * 10 ** 6 / repeat))
+
+
+if __name__ == '__main__':
+    main(*(int(item) for item in sys.argv[1:]))
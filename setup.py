@@ -63,6 +63,14 @@ REDIS_PACKAGES = [
     'redis==3.5.3',
 ]
 
+MSGPACK_PACKAGES = [
+    'msgpack==1.0.2',
+]
+
+ORJSON_PACKAGES = [
+    'orjson==3.5.4',
+]
+
 setup(
     name='pyrin',
     version=VERSION,
@@ -115,6 +123,8 @@ setup(
         'sentry': SENTRY_PACKAGES,
         'celery': CELERY_PACKAGES,
         'redis': REDIS_PACKAGES,
+        'msgpack': MSGPACK_PACKAGES,
+        'orjson': ORJSON_PACKAGES,
     },
     entry_points={'console_scripts': ['pyrin = pyrin.cli.core.command:main']},
 )
@@ -130,6 +130,13 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
     # config store, otherwise it will be corrected silently.
     list_max_page_size = None
 
+    # count mode to be used for total count of records.
+    # it should be from 'CountModeEnum' values. if not provided, it
+    # will be get from 'count_mode' of 'database' config store.
+    # 'cached' or 'estimated' modes could be used for large tables to
+    # prevent an exact count query on each page of list view.
+    list_count_mode = None
+
     # pagination type to be used on client if paging is enabled for this admin page.
     # it should be from 'PaginationTypeEnum' values.
     list_pagination_type = PaginationTypeEnum.NORMAL
@@ -293,6 +300,8 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
     # ===================== INTERNAL CONFIGS ===================== #
 
     # paginator class to be used.
+    # `KeysetPaginator` could be used for large tables to fetch deep pages by cursor
+    # instead of offset. note that the ordering columns must be present in list fields.
     paginator_class = SimplePaginator
 
     # the fully qualified name of find api.
@@ -334,7 +343,8 @@ class AdminPage(AbstractAdminPage, AdminPageCacheMixin):
         if self.list_paged is True:
             self._paginator = self.paginator_class(self.FIND_ENDPOINT,
                                                    page_size=self._get_page_size(),
-                                                   max_page_size=self._get_max_page_size())
+                                                   max_page_size=self._get_max_page_size(),
+                                                   count_mode=self.list_count_mode)
 
     def _get_hidden_pk_name(self):
         """
@@ -134,5 +134,5 @@ class APIManager(Manager, HookMixin):
         :param Exception error: exception instance that has been occurred.
         """
 
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('exception_occurred'):
             hook.exception_occurred(error, **options)
@@ -158,6 +158,17 @@ def api(url, methods=None, authenticated=True, permissions=None, **options):
                                 `max_page_size` from `database` configs store
                                 if not provided.
 
+    :keyword type[PaginatorBase] paginator_class: paginator class to be used for
+                                                  this route. defaults to `paginator_class`
+                                                  attribute of route class if not provided.
+                                                  `KeysetPaginator` could be used to paginate
+                                                  large tables by cursor instead of offset.
+
+    :keyword str count_mode: count mode to be used for total count of paged
+                             results. it could be one of `exact`, `cached` or
+                             `estimated`. defaults to `count_mode` from
+                             `database` config store if not provided.
+
     :keyword bool cors_enabled: specifies that cross origin resource sharing is enabled.
                                 if not provided, it will be get from cors config store.
 
@@ -191,6 +202,37 @@ def api(url, methods=None, authenticated=True, permissions=None, **options):
                            `order_by` keyword into parameters.
                            defaults to False if not provided.
 
+    :keyword str mimetype: the mimetype of responses of this route. if provided,
+                           mimetype detection of response bodies will be skipped
+                           and this mimetype will be used instead.
+
+    :keyword bool stream: specifies that iterator and query results of this
+                          route must be streamed to client as json in chunks.
+                          note that `count_total` will be emitted after `results`
+                          and pagination metadata will not be included.
+                          defaults to False if not provided.
+
+    :keyword bool | str cache_response: specifies that serialized responses of this route
+                                        must be cached for `GET` and `HEAD` requests. it could
+                                        be the name of a registered cache or True to use the
+                                        `cache_name` of `response` section in `caching` config
+                                        store. cached responses have a strong `ETag` header and
+                                        requests with a matching `If-None-Match` header will get
+                                        a `304` response without calling the view function.
+                                        defaults to False if not provided.
+
+    :keyword int cache_expire: expire time of cached responses in milliseconds.
+                               if not provided, it will be get from `response`
+                               section of `caching` config store.
+
+    :keyword str | list[str] cache_tags: tags of cached responses of this route. all cached
+                                         responses of a tag could be invalidated using
+                                         `pyrin.caching.response.services.invalidate`.
+
+    :keyword bool cache_consider_user: specifies that current user must be included in cache
+                                       key of responses. if not provided, it will be get from
+                                       `response` section of `caching` config store.
+
     :keyword bool provide_automatic_options: controls whether the `OPTIONS` method should be
                                              added automatically.
                                              this can also be controlled by setting the
@@ -413,6 +455,17 @@ def post(url, authenticated=True, permissions=None, **options):
                                 `max_page_size` from `database` configs store
                                 if not provided.
 
+    :keyword type[PaginatorBase] paginator_class: paginator class to be used for
+                                                  this route. defaults to `paginator_class`
+                                                  attribute of route class if not provided.
+                                                  `KeysetPaginator` could be used to paginate
+                                                  large tables by cursor instead of offset.
+
+    :keyword str count_mode: count mode to be used for total count of paged
+                             results. it could be one of `exact`, `cached` or
+                             `estimated`. defaults to `count_mode` from
+                             `database` config store if not provided.
+
     :keyword bool cors_enabled: specifies that cross origin resource sharing is enabled.
                                 if not provided, it will be get from cors config store.
 
@@ -446,6 +499,37 @@ def post(url, authenticated=True, permissions=None, **options):
                            `order_by` keyword into parameters.
                            defaults to False if not provided.
 
+    :keyword str mimetype: the mimetype of responses of this route. if provided,
+                           mimetype detection of response bodies will be skipped
+                           and this mimetype will be used instead.
+
+    :keyword bool stream: specifies that iterator and query results of this
+                          route must be streamed to client as json in chunks.
+                          note that `count_total` will be emitted after `results`
+                          and pagination metadata will not be included.
+                          defaults to False if not provided.
+
+    :keyword bool | str cache_response: specifies that serialized responses of this route
+                                        must be cached for `GET` and `HEAD` requests. it could
+                                        be the name of a registered cache or True to use the
+                                        `cache_name` of `response` section in `caching` config
+                                        store. cached responses have a strong `ETag` header and
+                                        requests with a matching `If-None-Match` header will get
+                                        a `304` response without calling the view function.
+                                        defaults to False if not provided.
+
+    :keyword int cache_expire: expire time of cached responses in milliseconds.
+                               if not provided, it will be get from `response`
+                               section of `caching` config store.
+
+    :keyword str | list[str] cache_tags: tags of cached responses of this route. all cached
+                                         responses of a tag could be invalidated using
+                                         `pyrin.caching.response.services.invalidate`.
+
+    :keyword bool cache_consider_user: specifies that current user must be included in cache
+                                       key of responses. if not provided, it will be get from
+                                       `response` section of `caching` config store.
+
     :keyword bool provide_automatic_options: controls whether the `OPTIONS` method should be
                                              added automatically.
                                              this can also be controlled by setting the
@@ -669,6 +753,17 @@ def patch(url, authenticated=True, permissions=None, **options):
                                 `max_page_size` from `database` configs store
                                 if not provided.
 
+    :keyword type[PaginatorBase] paginator_class: paginator class to be used for
+                                                  this route. defaults to `paginator_class`
+                                                  attribute of route class if not provided.
+                                                  `KeysetPaginator` could be used to paginate
+                                                  large tables by cursor instead of offset.
+
+    :keyword str count_mode: count mode to be used for total count of paged
+                             results. it could be one of `exact`, `cached` or
+                             `estimated`. defaults to `count_mode` from
+                             `database` config store if not provided.
+
     :keyword bool cors_enabled: specifies that cross origin resource sharing is enabled.
                                 if not provided, it will be get from cors config store.
 
@@ -702,6 +797,37 @@ def patch(url, authenticated=True, permissions=None, **options):
                            `order_by` keyword into parameters.
                            defaults to False if not provided.
 
+    :keyword str mimetype: the mimetype of responses of this route. if provided,
+                           mimetype detection of response bodies will be skipped
+                           and this mimetype will be used instead.
+
+    :keyword bool stream: specifies that iterator and query results of this
+                          route must be streamed to client as json in chunks.
+                          note that `count_total` will be emitted after `results`
+                          and pagination metadata will not be included.
+                          defaults to False if not provided.
+
+    :keyword bool | str cache_response: specifies that serialized responses of this route
+                                        must be cached for `GET` and `HEAD` requests. it could
+                                        be the name of a registered cache or True to use the
+                                        `cache_name` of `response` section in `caching` config
+                                        store. cached responses have a strong `ETag` header and
+                                        requests with a matching `If-None-Match` header will get
+                                        a `304` response without calling the view function.
+                                        defaults to False if not provided.
+
+    :keyword int cache_expire: expire time of cached responses in milliseconds.
+                               if not provided, it will be get from `response`
+                               section of `caching` config store.
+
+    :keyword str | list[str] cache_tags: tags of cached responses of this route. all cached
+                                         responses of a tag could be invalidated using
+                                         `pyrin.caching.response.services.invalidate`.
+
+    :keyword bool cache_consider_user: specifies that current user must be included in cache
+                                       key of responses. if not provided, it will be get from
+                                       `response` section of `caching` config store.
+
     :keyword bool provide_automatic_options: controls whether the `OPTIONS` method should be
                                              added automatically.
                                              this can also be controlled by setting the
@@ -925,6 +1051,17 @@ def put(url, authenticated=True, permissions=None, **options):
                                 `max_page_size` from `database` configs store
                                 if not provided.
 
+    :keyword type[PaginatorBase] paginator_class: paginator class to be used for
+                                                  this route. defaults to `paginator_class`
+                                                  attribute of route class if not provided.
+                                                  `KeysetPaginator` could be used to paginate
+                                                  large tables by cursor instead of offset.
+
+    :keyword str count_mode: count mode to be used for total count of paged
+                             results. it could be one of `exact`, `cached` or
+                             `estimated`. defaults to `count_mode` from
+                             `database` config store if not provided.
+
     :keyword bool cors_enabled: specifies that cross origin resource sharing is enabled.
                                 if not provided, it will be get from cors config store.
 
@@ -958,6 +1095,37 @@ def put(url, authenticated=True, permissions=None, **options):
                            `order_by` keyword into parameters.
                            defaults to False if not provided.
 
+    :keyword str mimetype: the mimetype of responses of this route. if provided,
+                           mimetype detection of response bodies will be skipped
+                           and this mimetype will be used instead.
+
+    :keyword bool stream: specifies that iterator and query results of this
+                          route must be streamed to client as json in chunks.
+                          note that `count_total` will be emitted after `results`
+                          and pagination metadata will not be included.
+                          defaults to False if not provided.
+
+    :keyword bool | str cache_response: specifies that serialized responses of this route
+                                        must be cached for `GET` and `HEAD` requests. it could
+                                        be the name of a registered cache or True to use the
+                                        `cache_name` of `response` section in `caching` config
+                                        store. cached responses have a strong `ETag` header and
+                                        requests with a matching `If-None-Match` header will get
+                                        a `304` response without calling the view function.
+                                        defaults to False if not provided.
+
+    :keyword int cache_expire: expire time of cached responses in milliseconds.
+                               if not provided, it will be get from `response`
+                               section of `caching` config store.
+
+    :keyword str | list[str] cache_tags: tags of cached responses of this route. all cached
+                                         responses of a tag could be invalidated using
+                                         `pyrin.caching.response.services.invalidate`.
+
+    :keyword bool cache_consider_user: specifies that current user must be included in cache
+                                       key of responses. if not provided, it will be get from
+                                       `response` section of `caching` config store.
+
     :keyword bool provide_automatic_options: controls whether the `OPTIONS` method should be
                                              added automatically.
                                              this can also be controlled by setting the
@@ -1181,6 +1349,17 @@ def get(url, authenticated=True, permissions=None, **options):
                                 `max_page_size` from `database` configs store
                                 if not provided.
 
+    :keyword type[PaginatorBase] paginator_class: paginator class to be used for
+                                                  this route. defaults to `paginator_class`
+                                                  attribute of route class if not provided.
+                                                  `KeysetPaginator` could be used to paginate
+                                                  large tables by cursor instead of offset.
+
+    :keyword str count_mode: count mode to be used for total count of paged
+                             results. it could be one of `exact`, `cached` or
+                             `estimated`. defaults to `count_mode` from
+                             `database` config store if not provided.
+
     :keyword bool cors_enabled: specifies that cross origin resource sharing is enabled.
                                 if not provided, it will be get from cors config store.
 
@@ -1214,6 +1393,37 @@ def get(url, authenticated=True, permissions=None, **options):
                            `order_by` keyword into parameters.
                            defaults to False if not provided.
 
+    :keyword str mimetype: the mimetype of responses of this route. if provided,
+                           mimetype detection of response bodies will be skipped
+                           and this mimetype will be used instead.
+
+    :keyword bool stream: specifies that iterator and query results of this
+                          route must be streamed to client as json in chunks.
+                          note that `count_total` will be emitted after `results`
+                          and pagination metadata will not be included.
+                          defaults to False if not provided.
+
+    :keyword bool | str cache_response: specifies that serialized responses of this route
+                                        must be cached for `GET` and `HEAD` requests. it could
+                                        be the name of a registered cache or True to use the
+                                        `cache_name` of `response` section in `caching` config
+                                        store. cached responses have a strong `ETag` header and
+                                        requests with a matching `If-None-Match` header will get
+                                        a `304` response without calling the view function.
+                                        defaults to False if not provided.
+
+    :keyword int cache_expire: expire time of cached responses in milliseconds.
+                               if not provided, it will be get from `response`
+                               section of `caching` config store.
+
+    :keyword str | list[str] cache_tags: tags of cached responses of this route. all cached
+                                         responses of a tag could be invalidated using
+                                         `pyrin.caching.response.services.invalidate`.
+
+    :keyword bool cache_consider_user: specifies that current user must be included in cache
+                                       key of responses. if not provided, it will be get from
+                                       `response` section of `caching` config store.
+
     :keyword bool provide_automatic_options: controls whether the `OPTIONS` method should be
                                              added automatically.
                                              this can also be controlled by setting the
@@ -1437,6 +1647,17 @@ def delete(url, authenticated=True, permissions=None, **options):
                                 `max_page_size` from `database` configs store
                                 if not provided.
 
+    :keyword type[PaginatorBase] paginator_class: paginator class to be used for
+                                                  this route. defaults to `paginator_class`
+                                                  attribute of route class if not provided.
+                                                  `KeysetPaginator` could be used to paginate
+                                                  large tables by cursor instead of offset.
+
+    :keyword str count_mode: count mode to be used for total count of paged
+                             results. it could be one of `exact`, `cached` or
+                             `estimated`. defaults to `count_mode` from
+                             `database` config store if not provided.
+
     :keyword bool cors_enabled: specifies that cross origin resource sharing is enabled.
                                 if not provided, it will be get from cors config store.
 
@@ -1470,6 +1691,37 @@ def delete(url, authenticated=True, permissions=None, **options):
                            `order_by` keyword into parameters.
                            defaults to False if not provided.
 
+    :keyword str mimetype: the mimetype of responses of this route. if provided,
+                           mimetype detection of response bodies will be skipped
+                           and this mimetype will be used instead.
+
+    :keyword bool stream: specifies that iterator and query results of this
+                          route must be streamed to client as json in chunks.
+                          note that `count_total` will be emitted after `results`
+                          and pagination metadata will not be included.
+                          defaults to False if not provided.
+
+    :keyword bool | str cache_response: specifies that serialized responses of this route
+                                        must be cached for `GET` and `HEAD` requests. it could
+                                        be the name of a registered cache or True to use the
+                                        `cache_name` of `response` section in `caching` config
+                                        store. cached responses have a strong `ETag` header and
+                                        requests with a matching `If-None-Match` header will get
+                                        a `304` response without calling the view function.
+                                        defaults to False if not provided.
+
+    :keyword int cache_expire: expire time of cached responses in milliseconds.
+                               if not provided, it will be get from `response`
+                               section of `caching` config store.
+
+    :keyword str | list[str] cache_tags: tags of cached responses of this route. all cached
+                                         responses of a tag could be invalidated using
+                                         `pyrin.caching.response.services.invalidate`.
+
+    :keyword bool cache_consider_user: specifies that current user must be included in cache
+                                       key of responses. if not provided, it will be get from
+                                       `response` section of `caching` config store.
+
     :keyword bool provide_automatic_options: controls whether the `OPTIONS` method should be
                                              added automatically.
                                              this can also be controlled by setting the
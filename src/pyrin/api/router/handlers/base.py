@@ -8,12 +8,14 @@ import time
 from uuid import UUID
 from threading import Lock
 
+from flask import Response
 from werkzeug.routing import Rule, UnicodeConverter, PathConverter, IntegerConverter, \
     FloatConverter, UUIDConverter
 
 import pyrin.processor.response.services as response_services
 import pyrin.processor.response.status.services as status_services
 import pyrin.configuration.services as config_services
+import pyrin.caching.response.services as response_cache_services
 import pyrin.security.session.services as session_services
 import pyrin.database.paging.services as paging_services
 import pyrin.utils.misc as misc_utils
@@ -21,10 +23,11 @@ import pyrin.utils.headers as header_utils
 import pyrin.utils.function as func_utils
 
 from pyrin.core.globals import _
+from pyrin.core.structs import CoreHeaders
 from pyrin.processor.cors.structs import CORS
 from pyrin.api.schema.structs import ResultSchema
 from pyrin.core.enumerations import HTTPMethodEnum
-from pyrin.database.paging.paginator import SimplePaginator
+from pyrin.database.paging.paginator import SimplePaginator, KeysetPaginator
 from pyrin.processor.response.wrappers.base import CoreResponse
 from pyrin.processor.response.enumerations import ResponseHeaderEnum
 from pyrin.security.session.enumerations import RequestContextEnum
@@ -200,6 +203,17 @@ class RouteBase(Rule):
                                     `max_page_size` from `database` configs store
                                     if not provided.
 
+        :keyword type[PaginatorBase] paginator_class: paginator class to be used for
+                                                      this route. defaults to `paginator_class`
+                                                      attribute of route class if not provided.
+                                                      `KeysetPaginator` could be used to paginate
+                                                      large tables by cursor instead of offset.
+
+        :keyword str count_mode: count mode to be used for total count of paged
+                                 results. it could be one of `exact`, `cached` or
+                                 `estimated`. defaults to `count_mode` from
+                                 `database` config store if not provided.
+
         :keyword bool cors_enabled: specifies that cross origin resource sharing is enabled.
                                     if not provided, it will be get from cors config store.
 
@@ -233,6 +247,37 @@ class RouteBase(Rule):
                                `order_by` keyword into parameters.
                                defaults to False if not provided.
 
+        :keyword str mimetype: the mimetype of responses of this route. if provided,
+                               mimetype detection of response bodies will be skipped
+                               and this mimetype will be used instead.
+
+        :keyword bool stream: specifies that iterator and query results of this
+                              route must be streamed to client as json in chunks.
+                              note that `count_total` will be emitted after `results`
+                              and pagination metadata will not be included.
+                              defaults to False if not provided.
+
+        :keyword bool | str cache_response: specifies that serialized responses of this route
+                                            must be cached for `GET` and `HEAD` requests. it could
+                                            be the name of a registered cache or True to use the
+                                            `cache_name` of `response` section in `caching` config
+                                            store. cached responses have a strong `ETag` header and
+                                            requests with a matching `If-None-Match` header will get
+                                            a `304` response without calling the view function.
+                                            defaults to False if not provided.
+
+        :keyword int cache_expire: expire time of cached responses in milliseconds.
+                                   if not provided, it will be get from `response`
+                                   section of `caching` config store.
+
+        :keyword str | list[str] cache_tags: tags of cached responses of this route. all cached
+                                             responses of a tag could be invalidated using
+                                             `pyrin.caching.response.services.invalidate`.
+
+        :keyword bool cache_consider_user: specifies that current user must be included in cache
+                                           key of responses. if not provided, it will be get from
+                                           `response` section of `caching` config store.
+
         :raises PageSizeLimitError: page size limit error.
         :raises MaxContentLengthLimitMismatchError: max content length limit mismatch error.
         :raises InvalidViewFunctionTypeError: invalid view function type error.
@@ -297,9 +342,32 @@ class RouteBase(Rule):
                                                        url=self.rule))
 
         self._required_arguments = func_utils.get_required_arguments(self._view_function)
+
+        # required arguments are kept in a tuple to be scanned on each request.
+        self._required_argument_names = tuple(sorted(self._required_arguments))
         self._no_cache = options.get('no_cache', False)
+
+        # headers which must be added to all responses of this route.
+        # it is shared between all responses, so it must not be modified.
+        self._static_headers = None
+        if self._no_cache is True:
+            self._static_headers = CoreHeaders({ResponseHeaderEnum.CACHE_CONTROL: 'no-cache'})
         self._swagger = options.get('swagger', False)
         self._ordered = options.get('ordered', False)
+        self._mimetype = options.get('mimetype', None)
+        self._stream = options.get('stream', False)
+
+        # name of the cache to keep responses of this route and the options
+        # to be passed to it. responses are not cached if the name is None.
+        self._response_cache_name = None
+        self._response_cache_options = None
+        cache_response = options.get('cache_response', False)
+        if cache_response not in (None, False):
+            self._response_cache_name = response_cache_services.get_cache_name(cache_response)
+            self._response_cache_options = dict(
+                expire=options.get('cache_expire', None),
+                tags=misc_utils.make_iterable(options.get('cache_tags', None), tuple),
+                consider_user=options.get('cache_consider_user', None))
 
         status_code = options.pop('status_code', None)
         if status_code is not None and \
@@ -318,6 +386,16 @@ class RouteBase(Rule):
                                                          function=full_name))
         self._status_code = status_code
 
+        # default status code of responses is resolved on first request,
+        # because it depends on the methods which are handled by this route.
+        self._default_status_code = None
+        self._is_default_status_code_resolved = False
+
+        # steps to be performed before and after calling the view function.
+        # they are compiled once to only contain the steps that this route needs.
+        # in the form of: tuple[callable]
+        self._prepare_steps, self._finish_steps = self._compile()
+
     def __eq__(self, other):
         """
         gets a value indicating that current route is equal to provided route.
@@ -399,12 +477,16 @@ class RouteBase(Rule):
         to_be_removed = self.get_duplicate_methods(methods)
         updated_methods = set(self.methods).difference(set(to_be_removed))
         self.methods = updated_methods
+        self._is_default_status_code_resolved = False
         self.refresh()
 
     def handle(self, inputs, **options):
         """
         handles the current route.
 
+        if responses of this route are cached and a cached response is available
+        for current request, it will be returned without calling the view function.
+
         :param dict inputs: view function inputs.
 
         :raises ViewFunctionRequiredParamsError: view function required params error.
@@ -413,17 +495,68 @@ class RouteBase(Rule):
         :rtype: object
         """
 
+        for step in self._prepare_steps:
+            step(inputs, **options)
+
+        if self._response_cache_name is not None:
+            cached_response = response_cache_services.get(self._response_cache_name,
+                                                          self.rule, inputs,
+                                                          **self._response_cache_options)
+            if cached_response is not None:
+                for step in self._finish_steps:
+                    step(cached_response, **options)
+
+                return cached_response
+
+        result = self._call_view_function(inputs, **options)
+        for step in self._finish_steps:
+            step(result, **options)
+
+        response = self._prepare_response(result)
+        if self._response_cache_name is not None:
+            response_cache_services.collect(response)
+
+        return response
+
+    def _compile(self):
+        """
+        compiles the steps that this route needs to handle requests.
+
+        the steps which are not required for this route, such as injecting
+        a result schema or paginator which are not set, or calling `_handle`
+        and `_finished` methods that are not overridden, will be excluded.
+        all steps must accept the same inputs as `_handle` or `_finished` methods.
+
+        :returns: tuple[tuple[callable] prepare_steps, tuple[callable] finish_steps]
+        :rtype: tuple[tuple[callable], tuple[callable]]
+        """
+
+        prepare_steps = []
         if self._result_schema is not None:
-            self._inject_result_schema()
+            prepare_steps.append(self._inject_result_schema)
 
         if self._paginator is not None:
-            self._inject_paginator(inputs, **options)
+            prepare_steps.append(self._inject_paginator)
 
-        self._handle(inputs, **options)
-        result = self._call_view_function(inputs, **options)
-        self._finished(result, **options)
+        if self._is_overridden('_handle'):
+            prepare_steps.append(self._handle)
+
+        finish_steps = []
+        if self._is_overridden('_finished'):
+            finish_steps.append(self._finished)
+
+        return tuple(prepare_steps), tuple(finish_steps)
+
+    def _is_overridden(self, name):
+        """
+        gets a value indicating that given method is overridden by the type of this route.
+
+        :param str name: method name.
+
+        :rtype: bool
+        """
 
-        return self._prepare_response(result)
+        return getattr(type(self), name) is not getattr(RouteBase, name)
 
     def get_argument_type(self, name):
         """
@@ -477,6 +610,17 @@ class RouteBase(Rule):
                                     `max_page_size` from `database` configs store
                                     if not provided.
 
+        :keyword type[PaginatorBase] paginator_class: paginator class to be used for
+                                                      this route. defaults to `paginator_class`
+                                                      attribute of route class if not provided.
+                                                      `KeysetPaginator` could be used to paginate
+                                                      large tables by cursor instead of offset.
+
+        :keyword str count_mode: count mode to be used for total count of paged
+                                 results. it could be one of `exact`, `cached` or
+                                 `estimated`. defaults to `count_mode` from
+                                 `database` config store if not provided.
+
         :raises PageSizeLimitError: page size limit error.
 
         :rtype: PaginatorBase
@@ -484,7 +628,8 @@ class RouteBase(Rule):
 
         paged = options.get('paged', False)
         if paged is True:
-            return self.paginator_class(**options)
+            paginator_class = options.get('paginator_class') or self.paginator_class
+            return paginator_class(**options)
 
         return None
 
@@ -667,15 +812,54 @@ class RouteBase(Rule):
         :rtype: tuple[object, int, dict | Headers] | object
         """
 
+        # the response is only a body in most cases. so there is no need to
+        # unpack it and it could be packed with the prebuilt headers of this route.
+        if not isinstance(response, (tuple, Response)):
+            status_code = self.status_code
+            if status_code is None:
+                status_code = self._get_default_status_code()
+
+            if self._static_headers is None:
+                return response, status_code
+
+            return response, status_code, self._static_headers
+
         body, status_code, headers = response_services.unpack_response(response)
         if status_code is None and self.status_code is not None:
             status_code = self.status_code
         elif status_code is None and self.status_code is None:
-            status_code = status_services.get_status_code()
+            status_code = self._get_default_status_code()
 
         headers = self._prepare_headers(headers)
         return response_services.pack_response(body, status_code, headers)
 
+    def _get_default_status_code(self):
+        """
+        gets the default status code for current request of this route.
+
+        if all http methods which are handled by this route have the same status
+        code, it will be resolved once. otherwise it will be resolved on each request.
+
+        :rtype: int
+        """
+
+        if self._is_default_status_code_resolved is False:
+            methods = set(self.methods)
+            if getattr(self, 'provide_automatic_options', False) is True:
+                methods.discard(HTTPMethodEnum.OPTIONS)
+
+            status_codes = set(status_services.get_status_code(method) for method in methods)
+            self._default_status_code = None
+            if len(status_codes) == 1:
+                self._default_status_code = status_codes.pop()
+
+            self._is_default_status_code_resolved = True
+
+        if self._default_status_code is not None:
+            return self._default_status_code
+
+        return status_services.get_status_code()
+
     def _prepare_headers(self, headers):
         """
         prepares required headers into given dict.
@@ -685,16 +869,17 @@ class RouteBase(Rule):
         :rtype: CoreHeaders
         """
 
-        if self._no_cache is True:
+        if self._static_headers is not None:
             headers = header_utils.convert_headers(headers, ignore_null=False)
-            cache_header = {ResponseHeaderEnum.CACHE_CONTROL: 'no-cache'}
-            headers.extend(cache_header)
+            headers.extend(self._static_headers)
 
         return headers
 
-    def _inject_result_schema(self):
+    def _inject_result_schema(self, inputs, **options):
         """
         injects this route's result schema into current request context.
+
+        :param dict inputs: view function inputs.
         """
 
         session_services.add_request_context(RequestContextEnum.RESULT_SCHEMA,
@@ -722,23 +907,22 @@ class RouteBase(Rule):
         :rtype: object
         """
 
-        self._check_required_arguments(inputs)
+        if len(self._required_argument_names) > 0:
+            self._check_required_arguments(inputs)
+
         return self.view_function(**inputs)
 
     def _check_required_arguments(self, inputs):
         """
         checks that all required arguments for this route are present in inputs.
 
+        required arguments with None value are considered as not present.
+
         :raises ViewFunctionRequiredParamsError: view function required params error.
         """
 
-        not_present = self._required_arguments.difference(set(inputs.keys()))
-        present = self._required_arguments.difference(not_present)
-        not_present = list(not_present)
-
-        for item in present:
-            if inputs.get(item) is None:
-                not_present.append(item)
+        not_present = [name for name in self._required_argument_names
+                       if inputs.get(name) is None]
 
         if len(not_present) > 0:
             raise ViewFunctionRequiredParamsError(_('These values are required: {params}')
@@ -829,6 +1013,16 @@ class RouteBase(Rule):
 
         return self._paginator is not None
 
+    @property
+    def is_keyset_paged(self):
+        """
+        gets a value indicating that this route is paged using keyset pagination.
+
+        :rtype: bool
+        """
+
+        return isinstance(self._paginator, KeysetPaginator)
+
     @property
     def swagger(self):
         """
@@ -852,6 +1046,28 @@ class RouteBase(Rule):
 
         return self._ordered
 
+    @property
+    def mimetype(self):
+        """
+        gets the mimetype of responses of this route.
+
+        it returns None if the mimetype must be detected from response bodies.
+
+        :rtype: str
+        """
+
+        return self._mimetype
+
+    @property
+    def stream(self):
+        """
+        gets a value indicating that iterator and query results of this route must be streamed.
+
+        :rtype: bool
+        """
+
+        return self._stream
+
 
 class TemporaryRouteBase(RouteBase):
     """
@@ -1025,6 +1241,17 @@ class TemporaryRouteBase(RouteBase):
                                     `max_page_size` from `database` configs store
                                     if not provided.
 
+        :keyword type[PaginatorBase] paginator_class: paginator class to be used for
+                                                      this route. defaults to `paginator_class`
+                                                      attribute of route class if not provided.
+                                                      `KeysetPaginator` could be used to paginate
+                                                      large tables by cursor instead of offset.
+
+        :keyword str count_mode: count mode to be used for total count of paged
+                                 results. it could be one of `exact`, `cached` or
+                                 `estimated`. defaults to `count_mode` from
+                                 `database` config store if not provided.
+
         :keyword bool cors_enabled: specifies that cross origin resource sharing is enabled.
                                     if not provided, it will be get from cors config store.
 
@@ -1058,6 +1285,37 @@ class TemporaryRouteBase(RouteBase):
                                `order_by` keyword into parameters.
                                defaults to False if not provided.
 
+        :keyword str mimetype: the mimetype of responses of this route. if provided,
+                               mimetype detection of response bodies will be skipped
+                               and this mimetype will be used instead.
+
+        :keyword bool stream: specifies that iterator and query results of this
+                              route must be streamed to client as json in chunks.
+                              note that `count_total` will be emitted after `results`
+                              and pagination metadata will not be included.
+                              defaults to False if not provided.
+
+        :keyword bool | str cache_response: specifies that serialized responses of this route
+                                            must be cached for `GET` and `HEAD` requests. it could
+                                            be the name of a registered cache or True to use the
+                                            `cache_name` of `response` section in `caching` config
+                                            store. cached responses have a strong `ETag` header and
+                                            requests with a matching `If-None-Match` header will get
+                                            a `304` response without calling the view function.
+                                            defaults to False if not provided.
+
+        :keyword int cache_expire: expire time of cached responses in milliseconds.
+                                   if not provided, it will be get from `response`
+                                   section of `caching` config store.
+
+        :keyword str | list[str] cache_tags: tags of cached responses of this route. all cached
+                                             responses of a tag could be invalidated using
+                                             `pyrin.caching.response.services.invalidate`.
+
+        :keyword bool cache_consider_user: specifies that current user must be included in cache
+                                           key of responses. if not provided, it will be get from
+                                           `response` section of `caching` config store.
+
         :raises PageSizeLimitError: page size limit error.
         :raises MaxContentLengthLimitMismatchError: max content length limit mismatch error.
         :raises InvalidViewFunctionTypeError: invalid view function type error.
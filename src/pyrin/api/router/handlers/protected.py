@@ -180,6 +180,17 @@ class ProtectedRoute(RouteBase):
                                     `max_page_size` from `database` configs store
                                     if not provided.
 
+        :keyword type[PaginatorBase] paginator_class: paginator class to be used for
+                                                      this route. defaults to `paginator_class`
+                                                      attribute of route class if not provided.
+                                                      `KeysetPaginator` could be used to paginate
+                                                      large tables by cursor instead of offset.
+
+        :keyword str count_mode: count mode to be used for total count of paged
+                                 results. it could be one of `exact`, `cached` or
+                                 `estimated`. defaults to `count_mode` from
+                                 `database` config store if not provided.
+
         :keyword bool cors_enabled: specifies that cross origin resource sharing is enabled.
                                     defaults to False if not provided.
 
@@ -207,6 +218,37 @@ class ProtectedRoute(RouteBase):
                                `order_by` keyword into parameters.
                                defaults to False if not provided.
 
+        :keyword str mimetype: the mimetype of responses of this route. if provided,
+                               mimetype detection of response bodies will be skipped
+                               and this mimetype will be used instead.
+
+        :keyword bool stream: specifies that iterator and query results of this
+                              route must be streamed to client as json in chunks.
+                              note that `count_total` will be emitted after `results`
+                              and pagination metadata will not be included.
+                              defaults to False if not provided.
+
+        :keyword bool | str cache_response: specifies that serialized responses of this route
+                                            must be cached for `GET` and `HEAD` requests. it could
+                                            be the name of a registered cache or True to use the
+                                            `cache_name` of `response` section in `caching` config
+                                            store. cached responses have a strong `ETag` header and
+                                            requests with a matching `If-None-Match` header will get
+                                            a `304` response without calling the view function.
+                                            defaults to False if not provided.
+
+        :keyword int cache_expire: expire time of cached responses in milliseconds.
+                                   if not provided, it will be get from `response`
+                                   section of `caching` config store.
+
+        :keyword str | list[str] cache_tags: tags of cached responses of this route. all cached
+                                             responses of a tag could be invalidated using
+                                             `pyrin.caching.response.services.invalidate`.
+
+        :keyword bool cache_consider_user: specifies that current user must be included in cache
+                                           key of responses. if not provided, it will be get from
+                                           `response` section of `caching` config store.
+
         :keyword PermissionBase | tuple[PermissionBase] permissions: all required permissions
                                                                      to access this route.
 
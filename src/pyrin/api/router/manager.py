@@ -210,6 +210,17 @@ class RouterManager(Manager):
                                     `max_page_size` from `database` configs store
                                     if not provided.
 
+        :keyword type[PaginatorBase] paginator_class: paginator class to be used for
+                                                      this route. defaults to `paginator_class`
+                                                      attribute of route class if not provided.
+                                                      `KeysetPaginator` could be used to paginate
+                                                      large tables by cursor instead of offset.
+
+        :keyword str count_mode: count mode to be used for total count of paged
+                                 results. it could be one of `exact`, `cached` or
+                                 `estimated`. defaults to `count_mode` from
+                                 `database` config store if not provided.
+
         :keyword bool cors_enabled: specifies that cross origin resource sharing is enabled.
                                     if not provided, it will be get from cors config store.
 
@@ -243,6 +254,37 @@ class RouterManager(Manager):
                                `order_by` keyword into parameters.
                                defaults to False if not provided.
 
+        :keyword str mimetype: the mimetype of responses of this route. if provided,
+                               mimetype detection of response bodies will be skipped
+                               and this mimetype will be used instead.
+
+        :keyword bool stream: specifies that iterator and query results of this
+                              route must be streamed to client as json in chunks.
+                              note that `count_total` will be emitted after `results`
+                              and pagination metadata will not be included.
+                              defaults to False if not provided.
+
+        :keyword bool | str cache_response: specifies that serialized responses of this route
+                                            must be cached for `GET` and `HEAD` requests. it could
+                                            be the name of a registered cache or True to use the
+                                            `cache_name` of `response` section in `caching` config
+                                            store. cached responses have a strong `ETag` header and
+                                            requests with a matching `If-None-Match` header will get
+                                            a `304` response without calling the view function.
+                                            defaults to False if not provided.
+
+        :keyword int cache_expire: expire time of cached responses in milliseconds.
+                                   if not provided, it will be get from `response`
+                                   section of `caching` config store.
+
+        :keyword str | list[str] cache_tags: tags of cached responses of this route. all cached
+                                             responses of a tag could be invalidated using
+                                             `pyrin.caching.response.services.invalidate`.
+
+        :keyword bool cache_consider_user: specifies that current user must be included in cache
+                                           key of responses. if not provided, it will be get from
+                                           `response` section of `caching` config store.
+
         :raises InvalidCustomRouteTypeError: invalid custom route type error.
         :raises RouteAuthenticationMismatchError: route authentication mismatch error.
         :raises PageSizeLimitError: page size limit error.
@@ -486,6 +528,17 @@ class RouterManager(Manager):
                                     `max_page_size` from `database` configs store
                                     if not provided.
 
+        :keyword type[PaginatorBase] paginator_class: paginator class to be used for
+                                                      this route. defaults to `paginator_class`
+                                                      attribute of route class if not provided.
+                                                      `KeysetPaginator` could be used to paginate
+                                                      large tables by cursor instead of offset.
+
+        :keyword str count_mode: count mode to be used for total count of paged
+                                 results. it could be one of `exact`, `cached` or
+                                 `estimated`. defaults to `count_mode` from
+                                 `database` config store if not provided.
+
         :keyword bool cors_enabled: specifies that cross origin resource sharing is enabled.
                                     if not provided, it will be get from cors config store.
 
@@ -519,6 +572,37 @@ class RouterManager(Manager):
                                `order_by` keyword into parameters.
                                defaults to False if not provided.
 
+        :keyword str mimetype: the mimetype of responses of this route. if provided,
+                               mimetype detection of response bodies will be skipped
+                               and this mimetype will be used instead.
+
+        :keyword bool stream: specifies that iterator and query results of this
+                              route must be streamed to client as json in chunks.
+                              note that `count_total` will be emitted after `results`
+                              and pagination metadata will not be included.
+                              defaults to False if not provided.
+
+        :keyword bool | str cache_response: specifies that serialized responses of this route
+                                            must be cached for `GET` and `HEAD` requests. it could
+                                            be the name of a registered cache or True to use the
+                                            `cache_name` of `response` section in `caching` config
+                                            store. cached responses have a strong `ETag` header and
+                                            requests with a matching `If-None-Match` header will get
+                                            a `304` response without calling the view function.
+                                            defaults to False if not provided.
+
+        :keyword int cache_expire: expire time of cached responses in milliseconds.
+                                   if not provided, it will be get from `response`
+                                   section of `caching` config store.
+
+        :keyword str | list[str] cache_tags: tags of cached responses of this route. all cached
+                                             responses of a tag could be invalidated using
+                                             `pyrin.caching.response.services.invalidate`.
+
+        :keyword bool cache_consider_user: specifies that current user must be included in cache
+                                           key of responses. if not provided, it will be get from
+                                           `response` section of `caching` config store.
+
         :raises PageSizeLimitError: page size limit error.
         :raises MaxContentLengthLimitMismatchError: max content length limit mismatch error.
         :raises InvalidViewFunctionTypeError: invalid view function type error.
@@ -756,6 +840,17 @@ class RouterManager(Manager):
                                     `max_page_size` from `database` configs store
                                     if not provided.
 
+        :keyword type[PaginatorBase] paginator_class: paginator class to be used for
+                                                      this route. defaults to `paginator_class`
+                                                      attribute of route class if not provided.
+                                                      `KeysetPaginator` could be used to paginate
+                                                      large tables by cursor instead of offset.
+
+        :keyword str count_mode: count mode to be used for total count of paged
+                                 results. it could be one of `exact`, `cached` or
+                                 `estimated`. defaults to `count_mode` from
+                                 `database` config store if not provided.
+
         :keyword bool cors_enabled: specifies that cross origin resource sharing is enabled.
                                     if not provided, it will be get from cors config store.
 
@@ -789,6 +884,37 @@ class RouterManager(Manager):
                                `order_by` keyword into parameters.
                                defaults to False if not provided.
 
+        :keyword str mimetype: the mimetype of responses of this route. if provided,
+                               mimetype detection of response bodies will be skipped
+                               and this mimetype will be used instead.
+
+        :keyword bool stream: specifies that iterator and query results of this
+                              route must be streamed to client as json in chunks.
+                              note that `count_total` will be emitted after `results`
+                              and pagination metadata will not be included.
+                              defaults to False if not provided.
+
+        :keyword bool | str cache_response: specifies that serialized responses of this route
+                                            must be cached for `GET` and `HEAD` requests. it could
+                                            be the name of a registered cache or True to use the
+                                            `cache_name` of `response` section in `caching` config
+                                            store. cached responses have a strong `ETag` header and
+                                            requests with a matching `If-None-Match` header will get
+                                            a `304` response without calling the view function.
+                                            defaults to False if not provided.
+
+        :keyword int cache_expire: expire time of cached responses in milliseconds.
+                                   if not provided, it will be get from `response`
+                                   section of `caching` config store.
+
+        :keyword str | list[str] cache_tags: tags of cached responses of this route. all cached
+                                             responses of a tag could be invalidated using
+                                             `pyrin.caching.response.services.invalidate`.
+
+        :keyword bool cache_consider_user: specifies that current user must be included in cache
+                                           key of responses. if not provided, it will be get from
+                                           `response` section of `caching` config store.
+
         :raises DuplicateRouteURLError: duplicate route url error.
         :raises OverwritingEndpointIsNotAllowedError: overwriting endpoint is not allowed error.
         :raises PageSizeLimitError: page size limit error.
@@ -10,6 +10,7 @@ import pyrin.configuration.services as config_services
 
 from pyrin.core.globals import SECURE_TRUE, SECURE_FALSE
 from pyrin.core.structs import CoreObject
+from pyrin.database.model.conversion import ConversionPlanner
 from pyrin.api.schema.exceptions import SecureBooleanIsRequiredError, InvalidStartIndexError
 
 
@@ -238,6 +239,9 @@ class ResultSchema(CoreObject):
                        start_index=start_index,
                        result_schema=self)
 
+        # a single planner is shared between all entities of the item.
+        options.update(planner=ConversionPlanner(**options))
+
         return serializer_services.serialize(item, **options)
 
     def get_computed_row_columns(self, row, **options):
@@ -7,13 +7,16 @@ import os
 import weakref
 
 from time import time
+from itertools import islice
 from collections import OrderedDict
+from collections.abc import Iterator
 
 import dotenv
 
 from flask.app import setupmethod
 from flask.ctx import has_request_context
-from flask import Flask, request as flask_request, _request_ctx_stack as request_stack
+from flask import Flask, stream_with_context, request as flask_request, \
+    _request_ctx_stack as request_stack
 
 import pyrin
 import pyrin.converters.serializer.services as serializer_services
@@ -30,15 +33,20 @@ import pyrin.utils.function as function_utils
 
 from pyrin.api.router.structs import CoreURLMap
 from pyrin.application.container import _set_app
+from pyrin.api.router.handlers.base import RouteBase
 from pyrin.api.router.handlers.public import PublicRoute
 from pyrin.application.enumerations import ApplicationStatusEnum
 from pyrin.application.hooks import ApplicationHookBase, PackagingHook
 from pyrin.application.mixin import SignalMixin
+from pyrin.converters.json.backends import StandardJSONBackend, \
+    get_backend as get_json_backend
 from pyrin.converters.json.decoder import CoreJSONDecoder
 from pyrin.converters.json.encoder import CoreJSONEncoder
 from pyrin.core.enumerations import HTTPMethodEnum
 from pyrin.core.structs import DTO, Manager, CoreHeaders
 from pyrin.core.mixin import HookMixin
+from pyrin.logging.structs import LazyValue
+from pyrin.database.orm.query.base import CoreQuery
 from pyrin.database.transaction.contexts import atomic_context
 from pyrin.packaging import PackagingPackage
 from pyrin.packaging.component import PackagingComponent
@@ -211,6 +219,9 @@ class Application(Flask, HookMixin, SignalMixin,
         self._force_json_response = options.get('force_json_response', True)
         self._version = 'Not Provided'
 
+        # json backend will be resolved from configs on first usage.
+        self._json_backend = None
+
         self._import_name = options.get('import_name', None)
         if self._import_name is not None and (self._import_name == '' or
                                               self._import_name.isspace()):
@@ -827,10 +838,21 @@ class Application(Flask, HookMixin, SignalMixin,
         """
 
         body, status_code, headers = response_services.unpack_response(rv)
+        if self._should_stream(body) is True:
+            body = self._make_json_stream_response(body)
+
+        original_data = body
         if not isinstance(body, self.response_class) and not callable(body):
-            mimetype = mimetype_services.get_mimetype(body)
-            if mimetype != MIMETypeEnum.HTML and (mimetype != MIMETypeEnum.JSON or
-                                                  not isinstance(body, str)):
+            declared_mimetype = self._get_declared_mimetype()
+            mimetype = declared_mimetype
+            if mimetype is None:
+                mimetype = mimetype_services.get_mimetype(body)
+
+            # string bodies of routes with a declared mimetype are already
+            # in their final format, so they must not be converted to json.
+            is_final = declared_mimetype is not None and isinstance(body, (str, bytes))
+            if is_final is not True and mimetype != MIMETypeEnum.HTML and \
+                    (mimetype != MIMETypeEnum.JSON or not isinstance(body, str)):
                 body, metadata, paginator = self._paginate_result(body)
                 if self._force_json_response is True:
                     body = self._prepare_json(body, metadata=metadata, paginator=paginator)
@@ -843,11 +865,158 @@ class Application(Flask, HookMixin, SignalMixin,
                 if body is None:
                     body = ''
 
+            original_data = body
+            if declared_mimetype is not None and isinstance(body, (str, bytes)):
+                body = self.response_class(body, mimetype=declared_mimetype)
+
+        if isinstance(body, dict):
+            body = self._make_json_response(body)
+
         response = response_services.pack_response(body, status_code, headers)
         result = super().make_response(response)
-        result.original_data = body
+        result.original_data = original_data
         return result
 
+    def _get_json_backend(self):
+        """
+        gets the json backend to be used for json responses.
+
+        it falls back to `stdlib` backend if the configured
+        backend's library is not installed.
+
+        :raises InvalidJSONBackendError: invalid json backend error.
+
+        :rtype: JSONBackendBase
+        """
+
+        if self._json_backend is None:
+            name = config_services.get('application', 'json', 'backend',
+                                       default=StandardJSONBackend.name)
+            backend = get_json_backend(name)
+            if backend.is_available is not True:
+                print_warning('JSON backend [{name}] is not installed, '
+                              '[{default}] backend will be used instead.'
+                              .format(name=name, default=StandardJSONBackend.name))
+                backend = StandardJSONBackend()
+
+            self._json_backend = backend
+
+        return self._json_backend
+
+    def _make_json_response(self, value):
+        """
+        converts the given value to a json response using the configured json backend.
+
+        it respects the json configs of flask, the same as `jsonify`.
+
+        :param dict value: value to be converted.
+
+        :rtype: CoreResponse
+        """
+
+        indent = None
+        separators = (',', ':')
+        if self.config['JSONIFY_PRETTYPRINT_REGULAR'] or self.debug:
+            indent = 2
+            separators = (', ', ': ')
+
+        data = self._get_json_backend().dumps(value, self.json_encoder,
+                                              ensure_ascii=self.config['JSON_AS_ASCII'],
+                                              sort_keys=self.config['JSON_SORT_KEYS'],
+                                              indent=indent, separators=separators)
+
+        return self.response_class('{data}\n'.format(data=data),
+                                   mimetype=self.config['JSONIFY_MIMETYPE'])
+
+    def _should_stream(self, body):
+        """
+        gets a value indicating that the given body must be streamed as json.
+
+        only iterators and queries will be streamed and only
+        if the route of current request has enabled streaming.
+
+        :param object body: the return value from the view function.
+
+        :rtype: bool
+        """
+
+        if not isinstance(body, (Iterator, CoreQuery)):
+            return False
+
+        url_rule = session_services.get_current_request().url_rule
+        return isinstance(url_rule, RouteBase) and url_rule.stream is True
+
+    def _make_json_stream_response(self, value):
+        """
+        converts the given iterator or query to a streamed json response.
+
+        the value will be consumed in chunks while the response is being
+        sent to client. so the whole result will never be loaded in memory.
+
+        :param Iterator | CoreQuery value: value to be streamed.
+
+        :rtype: CoreResponse
+        """
+
+        chunk_size = config_services.get('application', 'json', 'stream_chunk_size',
+                                         default=500)
+        if isinstance(value, CoreQuery):
+            value = value.yield_per(chunk_size)
+
+        generator = self._generate_json_stream(iter(value), chunk_size)
+        return self.response_class(stream_with_context(generator),
+                                   mimetype=self.config['JSONIFY_MIMETYPE'])
+
+    def _generate_json_stream(self, items, chunk_size):
+        """
+        generates the json of given items incrementally.
+
+        it yields the json envelope and each chunk of serialized items separately.
+        the total count will be yielded after the results, because it is
+        not known until all items have been consumed.
+
+        :param Iterator items: items to be converted.
+        :param int chunk_size: number of items to be serialized in each chunk.
+
+        :rtype: Iterator[str]
+        """
+
+        backend = self._get_json_backend()
+        count = 0
+        yield '{"results":['
+        while True:
+            chunk = list(islice(items, chunk_size))
+            if len(chunk) <= 0:
+                break
+
+            data = backend.dumps(self._serialize_result(chunk), self.json_encoder,
+                                 ensure_ascii=self.config['JSON_AS_ASCII'],
+                                 sort_keys=self.config['JSON_SORT_KEYS'],
+                                 separators=(',', ':'))
+            if count > 0:
+                yield ','
+
+            # removing the brackets of serialized list to join it with other chunks.
+            yield data[1:-1]
+            count += len(chunk)
+
+        yield '],"count_total":{count}}}\n'.format(count=count)
+
+    def _get_declared_mimetype(self):
+        """
+        gets the mimetype which is declared by the route of current request.
+
+        it returns None if the route has not declared a mimetype.
+
+        :rtype: str
+        """
+
+        url_rule = session_services.get_current_request().url_rule
+        if isinstance(url_rule, RouteBase):
+            return url_rule.mimetype
+
+        return None
+
     def _paginate_result(self, body, **options):
         """
         paginates response body if required.
@@ -1157,6 +1326,17 @@ class Application(Flask, HookMixin, SignalMixin,
                                     `max_page_size` from `database` configs store
                                     if not provided.
 
+        :keyword type[PaginatorBase] paginator_class: paginator class to be used for
+                                                      this route. defaults to `paginator_class`
+                                                      attribute of route class if not provided.
+                                                      `KeysetPaginator` could be used to paginate
+                                                      large tables by cursor instead of offset.
+
+        :keyword str count_mode: count mode to be used for total count of paged
+                                 results. it could be one of `exact`, `cached` or
+                                 `estimated`. defaults to `count_mode` from
+                                 `database` config store if not provided.
+
         :keyword bool cors_enabled: specifies that cross origin resource sharing is enabled.
                                     if not provided, it will be get from cors config store.
 
@@ -1190,6 +1370,37 @@ class Application(Flask, HookMixin, SignalMixin,
                                `order_by` keyword into parameters.
                                defaults to False if not provided.
 
+        :keyword str mimetype: the mimetype of responses of this route. if provided,
+                               mimetype detection of response bodies will be skipped
+                               and this mimetype will be used instead.
+
+        :keyword bool stream: specifies that iterator and query results of this
+                              route must be streamed to client as json in chunks.
+                              note that `count_total` will be emitted after `results`
+                              and pagination metadata will not be included.
+                              defaults to False if not provided.
+
+        :keyword bool | str cache_response: specifies that serialized responses of this route
+                                            must be cached for `GET` and `HEAD` requests. it could
+                                            be the name of a registered cache or True to use the
+                                            `cache_name` of `response` section in `caching` config
+                                            store. cached responses have a strong `ETag` header and
+                                            requests with a matching `If-None-Match` header will get
+                                            a `304` response without calling the view function.
+                                            defaults to False if not provided.
+
+        :keyword int cache_expire: expire time of cached responses in milliseconds.
+                                   if not provided, it will be get from `response`
+                                   section of `caching` config store.
+
+        :keyword str | list[str] cache_tags: tags of cached responses of this route. all cached
+                                             responses of a tag could be invalidated using
+                                             `pyrin.caching.response.services.invalidate`.
+
+        :keyword bool cache_consider_user: specifies that current user must be included in cache
+                                           key of responses. if not provided, it will be get from
+                                           `response` section of `caching` config store.
+
         :raises DuplicateRouteURLError: duplicate route url error.
         :raises OverwritingEndpointIsNotAllowedError: overwriting endpoint is not allowed error.
         :raises PageSizeLimitError: page size limit error.
@@ -1702,10 +1913,12 @@ class Application(Flask, HookMixin, SignalMixin,
         response = None
         client_request = session_services.get_current_request()
         process_start_time = time()
+        sampled = LazyValue(self._is_body_sampled, client_request)
         logging_services.info('Request received with params: [{params}] '
                               'and headers: [{headers}].',
                               interpolation_data=
-                              dict(params=self._get_request_data_for_logging(client_request),
+                              dict(params=LazyValue(self._get_request_data_for_logging,
+                                                    client_request, sampled=sampled),
                                    headers=client_request.headers))
         try:
             self._validate_request(client_request)
@@ -1733,7 +1946,8 @@ class Application(Flask, HookMixin, SignalMixin,
                                'and headers: [{headers}].',
                                interpolation_data=
                                dict(response=response,
-                                    result=self._get_response_data_for_logging(response),
+                                    result=LazyValue(self._get_response_data_for_logging,
+                                                     response, sampled=sampled),
                                     headers=response.headers))
 
         return response
@@ -1781,7 +1995,22 @@ class Application(Flask, HookMixin, SignalMixin,
         extra_headers.extend(headers or {})
         return response_services.pack_response(body, status_code, extra_headers)
 
-    def _get_request_data_for_logging(self, request):
+    def _is_body_sampled(self, request):
+        """
+        gets a value indicating that request and response bodies of given request must be logged.
+
+        :param CoreRequest request: request instance.
+
+        :rtype: bool
+        """
+
+        url_rule = None
+        if request.url_rule is not None:
+            url_rule = request.url_rule.rule
+
+        return logging_services.is_body_sampled(url_rule)
+
+    def _get_request_data_for_logging(self, request, **options):
         """
         gets the request data for logging.
 
@@ -1789,9 +2018,16 @@ class Application(Flask, HookMixin, SignalMixin,
 
         :param CoreRequest request: request instance.
 
+        :keyword LazyValue sampled: a lazy value indicating that the body
+                                    of this request must be logged.
+
         :rtype: dict
         """
 
+        sampled = options.get('sampled')
+        if sampled is not None and sampled.get() is not True:
+            return 'Request payload is not sampled for logging.'
+
         max_length = config_services.get_active('logging', 'max_request_size')
         if request.safe_content_length > max_length:
             return 'Request payload [{size} bytes] is too large for logging.' \
@@ -1799,7 +2035,7 @@ class Application(Flask, HookMixin, SignalMixin,
 
         return request.get_inputs(silent=True)
 
-    def _get_response_data_for_logging(self, response):
+    def _get_response_data_for_logging(self, response, **options):
         """
         gets the response data for logging.
 
@@ -1807,9 +2043,19 @@ class Application(Flask, HookMixin, SignalMixin,
 
         :param CoreResponse response: response instance.
 
+        :keyword LazyValue sampled: a lazy value indicating that the body
+                                    of this response must be logged.
+
         :rtype: dict | object
         """
 
+        sampled = options.get('sampled')
+        if sampled is not None and sampled.get() is not True:
+            return 'Response payload is not sampled for logging.'
+
+        if response.is_streamed is True:
+            return 'Response payload is streamed and is ignored for logging.'
+
         max_length = config_services.get_active('logging', 'max_response_size')
         if response.safe_content_length > max_length:
             return 'Response payload [{size} bytes] is too large for logging.' \
@@ -1875,7 +2121,7 @@ class Application(Flask, HookMixin, SignalMixin,
         this method will call `after_application_loaded` method of all registered hooks.
         """
 
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('after_application_loaded'):
             hook.after_application_loaded()
 
     def _application_initialized(self):
@@ -1883,7 +2129,7 @@ class Application(Flask, HookMixin, SignalMixin,
         this method will call `application_initialized` method of all registered hooks.
         """
 
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('application_initialized'):
             hook.application_initialized()
 
     def get_application_name(self):
@@ -1923,7 +2169,7 @@ class Application(Flask, HookMixin, SignalMixin,
             TERMINATED = 'Terminated'
         """
 
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('application_status_changed'):
             hook.application_status_changed(old_status, new_status)
 
     def _before_application_run(self):
@@ -1933,7 +2179,7 @@ class Application(Flask, HookMixin, SignalMixin,
         note that this method will not get called when application starts in scripting mode.
         """
 
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('before_application_run'):
             hook.before_application_run()
 
     def _prepare_runtime_data(self):
@@ -1947,7 +2193,7 @@ class Application(Flask, HookMixin, SignalMixin,
         note that this method will not get called when application starts in scripting mode.
         """
 
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('prepare_runtime_data'):
             with atomic_context(expire_on_commit=True):
                 hook.prepare_runtime_data()
 
@@ -1958,7 +2204,7 @@ class Application(Flask, HookMixin, SignalMixin,
         note that this method will not get called when application starts in scripting mode.
         """
 
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('after_runtime_data_prepared'):
             hook.after_runtime_data_prepared()
 
     def _provide_response_headers(self, headers, endpoint,
@@ -1984,7 +2230,7 @@ class Application(Flask, HookMixin, SignalMixin,
                        it could be None.
         """
 
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('provide_response_headers'):
             hook.provide_response_headers(headers, endpoint,
                                           status_code, method, **options)
 
@@ -1998,7 +2244,7 @@ class Application(Flask, HookMixin, SignalMixin,
         """
 
         new_response = None
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('finalize_transaction'):
             try:
                 result = hook.finalize_transaction(response, **options)
                 if result is not None:
@@ -2016,7 +2262,7 @@ class Application(Flask, HookMixin, SignalMixin,
         :param CoreRequest request: current request instance.
         """
 
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('validate_request'):
             hook.validate_request(request, **options)
 
     def get_application_version(self):
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+caching binder module.
+"""
+
+import inspect
+
+from inspect import Parameter
+from operator import itemgetter
+
+from pyrin.core.structs import CoreObject
+from pyrin.caching.structs import CacheableDict
+from pyrin.caching.globals import NOT_HASHABLE_TYPES
+
+
+class ArgumentBinder(CoreObject):
+    """
+    argument binder class.
+
+    it inspects the signature of a function once and then binds the inputs of each
+    call of that function into a canonical tuple of `(name, value)` pairs sorted by
+    name, without inspecting the function again. missing arguments which have default
+    values will be filled with their defaults, so `func(1)` and `func(1, b=2)` result
+    in the same inputs if the default value of `b` is 2. keyword arguments which are
+    gathered by `**kwargs` will be folded into the result.
+    """
+
+    # name of arguments which will be considered as the parent of function.
+    PARENT_NAMES = ('self', 'cls')
+
+    # an empty cacheable dict which is used to convert unhashable values.
+    _converter = CacheableDict()
+
+    def __init__(self, func, bound=False):
+        """
+        initializes an instance of ArgumentBinder.
+
+        :param function func: function to create binder for it.
+
+        :param bool bound: specifies that the inputs which will be passed to
+                           this binder do not include the first argument of
+                           function, which is the parent instance or class.
+                           defaults to False if not provided.
+        """
+
+        super().__init__()
+
+        positionals = []
+        keywords = []
+        defaults = {}
+        self._var_positional = None
+        self._var_keyword = None
+
+        signature = inspect.signature(func)
+        for name, param in signature.parameters.items():
+            if param.kind in (Parameter.POSITIONAL_ONLY,
+                              Parameter.POSITIONAL_OR_KEYWORD):
+                positionals.append(name)
+            elif param.kind == Parameter.KEYWORD_ONLY:
+                keywords.append(name)
+            elif param.kind == Parameter.VAR_POSITIONAL:
+                self._var_positional = name
+            else:
+                self._var_keyword = name
+
+            if param.default is not Parameter.empty:
+                defaults[name] = self._convert(param.default)
+
+        self._parent_name = None
+        if len(positionals) > 0:
+            if bound is True:
+                positionals.pop(0)
+            elif positionals[0] in self.PARENT_NAMES:
+                self._parent_name = positionals.pop(0)
+
+        defaults.pop(self._parent_name, None)
+        self._positionals = tuple(positionals)
+        self._names = frozenset(positionals + keywords)
+        self._defaults = defaults
+        self._layouts = tuple(self._create_layout(count)
+                              for count in range(len(positionals) + 1))
+
+    def _create_layout(self, count):
+        """
+        creates the layout of inputs for calls with given number of positional arguments.
+
+        the layout is a tuple of `(name, index, default)` items sorted by name.
+        for provided arguments, the index is the position of argument and for
+        missing arguments, the index is None and default value will be used.
+
+        :param int count: number of positional arguments.
+
+        :rtype: tuple[tuple[str, int, object]]
+        """
+
+        layout = [(name, index, None) for index, name
+                  in enumerate(self._positionals[:count])]
+
+        for name, default in self._defaults.items():
+            if name not in self._positionals[:count]:
+                layout.append((name, None, default))
+
+        return tuple(sorted(layout, key=itemgetter(0)))
+
+    def _convert(self, value):
+        """
+        converts the given value to be hashable if required.
+
+        :param object value: value to be converted.
+
+        :rtype: object
+        """
+
+        if isinstance(value, NOT_HASHABLE_TYPES):
+            return self._converter._convert(value)
+
+        return value
+
+    def _bind_positionals(self, args):
+        """
+        binds the given positional arguments using the precompiled layouts.
+
+        :param tuple args: function positional arguments.
+
+        :rtype: tuple[tuple[str, object]]
+        """
+
+        for value in args:
+            if isinstance(value, NOT_HASHABLE_TYPES):
+                args = tuple(self._convert(item) for item in args)
+                break
+
+        return tuple((name, args[index]) if index is not None else (name, default)
+                     for name, index, default in self._layouts[len(args)])
+
+    def _bind(self, args, kwargs):
+        """
+        binds the given positional and keyword arguments.
+
+        :param tuple args: function positional arguments.
+        :param dict kwargs: function keyword arguments.
+
+        :raises TypeError: type error.
+
+        :rtype: tuple[tuple[str, object]]
+        """
+
+        arguments = dict(zip(self._positionals, args))
+        extra = args[len(self._positionals):]
+        if len(extra) > 0:
+            if self._var_positional is None:
+                raise TypeError('Too many positional arguments provided.')
+
+            arguments[self._var_positional] = extra
+
+        for name, value in kwargs.items():
+            if name in arguments:
+                raise TypeError('Multiple values provided for argument [{name}].'
+                                .format(name=name))
+
+            if name not in self._names and self._var_keyword is None:
+                raise TypeError('Unexpected keyword argument [{name}] provided.'
+                                .format(name=name))
+
+            arguments[name] = value
+
+        result = [(name, self._convert(value)) for name, value in arguments.items()]
+        for name, default in self._defaults.items():
+            if name not in arguments:
+                result.append((name, default))
+
+        return tuple(sorted(result, key=itemgetter(0)))
+
+    def bind(self, args, kwargs):
+        """
+        binds the given inputs of a call of function.
+
+        it returns the canonical inputs and the parent class or instance of
+        function if available. for bound binders, the parent is always None.
+
+        :param tuple args: function positional arguments.
+        :param dict kwargs: function keyword arguments.
+
+        :raises TypeError: type error.
+
+        :returns: tuple[tuple[tuple[str, object]] inputs, object | type parent]
+        :rtype: tuple[tuple[tuple[str, object]], object | type]
+        """
+
+        parent = None
+        if self._parent_name is not None:
+            if len(args) > 0:
+                parent = args[0]
+                args = args[1:]
+            elif self._parent_name in kwargs:
+                kwargs = dict(kwargs)
+                parent = kwargs.pop(self._parent_name)
+
+        if len(kwargs) == 0 and len(args) < len(self._layouts):
+            return self._bind_positionals(args), parent
+
+        return self._bind(args, kwargs), parent
+
+
+# a dict containing all created binders.
+# in the form of: {tuple[function func, bool bound]: ArgumentBinder binder}
+_binders = {}
+
+
+def get_binder(func, bound=False):
+    """
+    gets the argument binder of given function.
+
+    the binder will be created on first call and will be reused afterwards.
+
+    :param function func: function to get its binder.
+
+    :param bool bound: specifies that the inputs which will be passed to
+                       binder do not include the first argument of function,
+                       which is the parent instance or class.
+                       defaults to False if not provided.
+
+    :rtype: ArgumentBinder
+    """
+
+    key = (func, bound)
+    binder = _binders.get(key)
+    if binder is None:
+        binder = ArgumentBinder(func, bound)
+        _binders[key] = binder
+
+    return binder
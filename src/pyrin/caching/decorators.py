@@ -10,6 +10,8 @@ from werkzeug.utils import cached_property as cached_property_base
 import pyrin.caching.services as caching_services
 import pyrin.utils.function as function_utils
 
+from pyrin.caching.binder import get_binder
+from pyrin.caching.flight import CachedCall
 from pyrin.core.decorators import class_property
 
 
@@ -47,6 +49,27 @@ def cache(*args, **kwargs):
                             it will be get from `caching` config store.
                             this is only used in complex caches.
 
+    :keyword str eviction_policy: eviction policy to be used to remove items
+                                  when the limit is reached. if not provided,
+                                  it will be get from `caching` config store.
+                                  this is only used in complex caches.
+    :enum eviction_policy:
+        FIFO = 'fifo'
+        LIFO = 'lifo'
+        LRU = 'lru'
+        LFU = 'lfu'
+        TINY_LFU = 'tinylfu'
+
+    :keyword str copy_mode: specifies how cached values must be kept in the cache.
+                            `deep` copies the value on each set and get, `freeze`
+                            converts the value into a read-only object once on set
+                            and returns the same object on each get. if not provided,
+                            it will be get from `caching` config store.
+                            this is only used in complex caches.
+    :enum copy_mode:
+        DEEP = 'deep'
+        FREEZE = 'freeze'
+
     :keyword int clear_count: number of old items to be removed from cache when
                               the cache is full. if not provided, it will be get
                               from `caching` config store.
@@ -284,9 +307,37 @@ def cached(*old_method, **options):
                                extended on each hit. if not provided, it will be
                                get from `caching` config store.
 
+    :keyword str copy_mode: specifies how the result must be kept in the cache.
+                            `deep` copies the result on each set and get, `freeze`
+                            converts the result into a read-only object once on set
+                            and returns the same object on each get. if not provided,
+                            the cache's default will be used. this is only used in
+                            complex caches.
+    :enum copy_mode:
+        DEEP = 'deep'
+        FREEZE = 'freeze'
+
+    :keyword bool single_flight: specifies that concurrent misses of the same key
+                                 must be coalesced, so only one caller computes
+                                 the result and others wait for it.
+                                 defaults to False if not provided.
+
+    :keyword float refresh_ahead: fraction of expire time after which a hit must
+                                  recompute the result on a background worker while
+                                  the cached result is still returned. it must be
+                                  greater than 0 and less than 1. it implies
+                                  `single_flight`. note that the background worker
+                                  has no request context. defaults to None if not
+                                  provided and refresh-ahead is disabled.
+
+    :raises InvalidRefreshAheadError: invalid refresh ahead error.
+
     :returns: method or function result.
     """
 
+    single_flight = options.pop('single_flight', False)
+    refresh_ahead = options.pop('refresh_ahead', None)
+
     def decorator(method):
         """
         decorates the given method or function and makes it a lazy one.
@@ -296,6 +347,27 @@ def cached(*old_method, **options):
         :returns: method or function result.
         """
 
+        # the binder is compiled here to prevent inspecting the function on each call.
+        get_binder(method)
+
+        if single_flight is True or refresh_ahead is not None:
+            cached_call = CachedCall('complex', method, single_flight,
+                                     refresh_ahead, **options)
+
+            def wrapper(*args, **kwargs):
+                """
+                decorates the given method or function and makes it a lazy one.
+
+                :param object args: function positional arguments.
+                :param object kwargs: function keyword arguments.
+
+                :returns: method or function result.
+                """
+
+                return cached_call(*args, **kwargs)
+
+            return update_wrapper(wrapper, method)
+
         def wrapper(*args, **kwargs):
             """
             decorates the given method or function and makes it a lazy one.
@@ -353,9 +425,37 @@ def custom_cached(name, *old_method, **options):
                                extended on each hit. if not provided, it will be
                                get from `caching` config store.
 
+    :keyword str copy_mode: specifies how the result must be kept in the cache.
+                            `deep` copies the result on each set and get, `freeze`
+                            converts the result into a read-only object once on set
+                            and returns the same object on each get. if not provided,
+                            the cache's default will be used. this is only used in
+                            complex caches.
+    :enum copy_mode:
+        DEEP = 'deep'
+        FREEZE = 'freeze'
+
+    :keyword bool single_flight: specifies that concurrent misses of the same key
+                                 must be coalesced, so only one caller computes
+                                 the result and others wait for it.
+                                 defaults to False if not provided.
+
+    :keyword float refresh_ahead: fraction of expire time after which a hit must
+                                  recompute the result on a background worker while
+                                  the cached result is still returned. it must be
+                                  greater than 0 and less than 1. it implies
+                                  `single_flight`. note that the background worker
+                                  has no request context. defaults to None if not
+                                  provided and refresh-ahead is disabled.
+
+    :raises InvalidRefreshAheadError: invalid refresh ahead error.
+
     :returns: method or function result.
     """
 
+    single_flight = options.pop('single_flight', False)
+    refresh_ahead = options.pop('refresh_ahead', None)
+
     def decorator(method):
         """
         decorates the given method or function and makes it a lazy one.
@@ -365,6 +465,27 @@ def custom_cached(name, *old_method, **options):
         :returns: method or function result.
         """
 
+        # the binder is compiled here to prevent inspecting the function on each call.
+        get_binder(method)
+
+        if single_flight is True or refresh_ahead is not None:
+            cached_call = CachedCall(name, method, single_flight,
+                                     refresh_ahead, **options)
+
+            def wrapper(*args, **kwargs):
+                """
+                decorates the given method or function and makes it a lazy one.
+
+                :param object args: function positional arguments.
+                :param object kwargs: function keyword arguments.
+
+                :returns: method or function result.
+                """
+
+                return cached_call(*args, **kwargs)
+
+            return update_wrapper(wrapper, method)
+
         def wrapper(*args, **kwargs):
             """
             decorates the given method or function and makes it a lazy one.
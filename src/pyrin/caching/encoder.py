@@ -0,0 +1,442 @@
+# -*- coding: utf-8 -*-
+"""
+caching encoder module.
+"""
+
+from enum import Enum
+from uuid import UUID
+from decimal import Decimal
+from hashlib import blake2b
+from collections import OrderedDict
+from datetime import datetime, date, time, timedelta
+from types import FunctionType, BuiltinFunctionType, MethodType
+
+from pyrin.core.structs import CoreObject
+from pyrin.caching.structs import CacheableDict
+
+
+# default `__getstate__` of objects. it is only available on python 3.11 and later.
+DEFAULT_GETSTATE = getattr(object, '__getstate__', None)
+
+
+class CacheKeyEncoder(CoreObject):
+    """
+    cache key encoder class.
+
+    it converts a cache key into a canonical byte sequence and gets its
+    blake2b digest. the result only depends on the content of the key, so
+    it is identical across different processes and hosts, regardless of
+    the value of `PYTHONHASHSEED`.
+
+    each value is written with a type tag and a length prefix, so different
+    keys never result in the same byte sequence. objects which have no dedicated
+    encoder must implement `__getstate__` and their type name and state will be
+    used. otherwise a `TypeError` will be raised, because their default
+    representation contains the memory address and is not stable.
+    """
+
+    # size of generated digests in bytes.
+    DIGEST_SIZE = 16
+
+    # size of short digests in bytes. short digests are
+    # used where a 64 bit integer is required.
+    SHORT_DIGEST_SIZE = 8
+
+    def __init__(self):
+        """
+        initializes an instance of CacheKeyEncoder.
+        """
+
+        super().__init__()
+
+        # a dict containing encoder of each exact type.
+        # in the form of: {type value_type: callable encoder}
+        self._encoders = {
+            type(None): self._encode_none,
+            bool: self._encode_bool,
+            int: self._encode_number,
+            float: self._encode_number,
+            Decimal: self._encode_number,
+            str: self._encode_str,
+            bytes: self._encode_bytes,
+            tuple: self._encode_tuple,
+            list: self._encode_list,
+            set: self._encode_set,
+            frozenset: self._encode_set,
+            CacheableDict: self._encode_ordered_dict,
+            OrderedDict: self._encode_ordered_dict,
+            dict: self._encode_dict,
+            type: self._encode_qualified_name,
+            FunctionType: self._encode_qualified_name,
+            BuiltinFunctionType: self._encode_qualified_name,
+            MethodType: self._encode_method,
+            datetime: self._encode_temporal,
+            date: self._encode_temporal,
+            time: self._encode_temporal,
+            timedelta: self._encode_timedelta,
+            UUID: self._encode_uuid,
+        }
+
+        # a list of base types and their encoders which will be used for
+        # subclasses of supported types. the order of items is important.
+        self._base_encoders = [
+            (Enum, self._encode_enum),
+            (bool, self._encode_bool),
+            (int, self._encode_number),
+            (float, self._encode_number),
+            (str, self._encode_str),
+            (bytes, self._encode_bytes),
+            (tuple, self._encode_tuple),
+            (list, self._encode_list),
+            ((set, frozenset), self._encode_set),
+            (OrderedDict, self._encode_ordered_dict),
+            (dict, self._encode_dict),
+            (type, self._encode_qualified_name),
+        ]
+
+    def _write(self, buffer, tag, data):
+        """
+        writes the given data into buffer with a type tag and a length prefix.
+
+        :param bytearray buffer: buffer to write into it.
+        :param bytes tag: a single byte type tag.
+        :param bytes data: data to be written.
+        """
+
+        buffer += tag
+        buffer += str(len(data)).encode('ascii')
+        buffer += b':'
+        buffer += data
+
+    def _write_text(self, buffer, tag, text):
+        """
+        writes the given text into buffer with a type tag and a length prefix.
+
+        :param bytearray buffer: buffer to write into it.
+        :param bytes tag: a single byte type tag.
+        :param str text: text to be written.
+        """
+
+        self._write(buffer, tag, text.encode('utf-8', 'surrogatepass'))
+
+    def _write_header(self, buffer, tag, count):
+        """
+        writes the header of a collection into buffer.
+
+        :param bytearray buffer: buffer to write into it.
+        :param bytes tag: a single byte type tag.
+        :param int count: number of items of the collection.
+        """
+
+        buffer += tag
+        buffer += str(count).encode('ascii')
+        buffer += b':'
+
+    def _get_qualified_name(self, value):
+        """
+        gets the fully qualified name of given type or function.
+
+        :param type | function value: type or function to get its name.
+
+        :rtype: str
+        """
+
+        module = getattr(value, '__module__', None)
+        name = getattr(value, '__qualname__', None) or getattr(value, '__name__', '')
+        if module is None:
+            return name
+
+        return '{module}.{name}'.format(module=module, name=name)
+
+    def _encode_none(self, buffer, value):
+        """
+        encodes None into given buffer.
+
+        :param bytearray buffer: buffer to write into it.
+        :param NoneType value: value to be encoded.
+        """
+
+        buffer += b'N'
+
+    def _encode_bool(self, buffer, value):
+        """
+        encodes the given boolean into buffer.
+
+        :param bytearray buffer: buffer to write into it.
+        :param bool value: value to be encoded.
+        """
+
+        buffer += b'T' if value else b'F'
+
+    def _encode_number(self, buffer, value):
+        """
+        encodes the given number into buffer.
+
+        equal numbers of different types, result in different encodings.
+
+        :param bytearray buffer: buffer to write into it.
+        :param int | float | Decimal value: value to be encoded.
+        """
+
+        self._write_text(buffer, b'n', '{type}:{value!r}'.format(
+            type=type(value).__name__, value=value))
+
+    def _encode_str(self, buffer, value):
+        """
+        encodes the given string into buffer.
+
+        :param bytearray buffer: buffer to write into it.
+        :param str value: value to be encoded.
+        """
+
+        self._write_text(buffer, b's', value)
+
+    def _encode_bytes(self, buffer, value):
+        """
+        encodes the given bytes into buffer.
+
+        :param bytearray buffer: buffer to write into it.
+        :param bytes value: value to be encoded.
+        """
+
+        self._write(buffer, b'b', bytes(value))
+
+    def _encode_items(self, buffer, tag, value):
+        """
+        encodes the given items into buffer preserving their order.
+
+        :param bytearray buffer: buffer to write into it.
+        :param bytes tag: a single byte type tag.
+        :param list | tuple value: value to be encoded.
+        """
+
+        self._write_header(buffer, tag, len(value))
+        for item in value:
+            self._encode(buffer, item)
+
+    def _encode_tuple(self, buffer, value):
+        """
+        encodes the given tuple into buffer.
+
+        :param bytearray buffer: buffer to write into it.
+        :param tuple value: value to be encoded.
+        """
+
+        self._encode_items(buffer, b'l', value)
+
+    def _encode_list(self, buffer, value):
+        """
+        encodes the given list into buffer.
+
+        :param bytearray buffer: buffer to write into it.
+        :param list value: value to be encoded.
+        """
+
+        self._encode_items(buffer, b'L', value)
+
+    def _encode_set(self, buffer, value):
+        """
+        encodes the given set into buffer.
+
+        the items will be sorted by their encoded value, so
+        the result does not depend on the iteration order.
+
+        :param bytearray buffer: buffer to write into it.
+        :param set | frozenset value: value to be encoded.
+        """
+
+        self._write_header(buffer, b'S', len(value))
+        for item in sorted(self.encode(item) for item in value):
+            buffer += item
+
+    def _encode_ordered_dict(self, buffer, value):
+        """
+        encodes the given ordered dict into buffer.
+
+        the order of items will be preserved.
+
+        :param bytearray buffer: buffer to write into it.
+        :param OrderedDict | CacheableDict value: value to be encoded.
+        """
+
+        self._write_header(buffer, b'o', len(value))
+        for key, item in value.items():
+            self._encode(buffer, key)
+            self._encode(buffer, item)
+
+    def _encode_dict(self, buffer, value):
+        """
+        encodes the given dict into buffer.
+
+        the items will be sorted by their encoded value, so
+        the result does not depend on the insertion order.
+
+        :param bytearray buffer: buffer to write into it.
+        :param dict value: value to be encoded.
+        """
+
+        self._write_header(buffer, b'd', len(value))
+        for item in sorted(self.encode(key) + self.encode(item)
+                           for key, item in value.items()):
+            buffer += item
+
+    def _encode_qualified_name(self, buffer, value):
+        """
+        encodes the given type or function into buffer.
+
+        :param bytearray buffer: buffer to write into it.
+        :param type | function value: value to be encoded.
+        """
+
+        self._write_text(buffer, b'q', self._get_qualified_name(value))
+
+    def _encode_method(self, buffer, value):
+        """
+        encodes the given bound method into buffer.
+
+        :param bytearray buffer: buffer to write into it.
+        :param MethodType value: value to be encoded.
+        """
+
+        self._write_header(buffer, b'm', 2)
+        self._encode(buffer, value.__func__)
+        self._encode(buffer, value.__self__)
+
+    def _encode_temporal(self, buffer, value):
+        """
+        encodes the given datetime, date or time into buffer.
+
+        :param bytearray buffer: buffer to write into it.
+        :param datetime | date | time value: value to be encoded.
+        """
+
+        self._write_text(buffer, b't', '{type}:{value}'.format(
+            type=type(value).__name__, value=value.isoformat()))
+
+    def _encode_timedelta(self, buffer, value):
+        """
+        encodes the given timedelta into buffer.
+
+        :param bytearray buffer: buffer to write into it.
+        :param timedelta value: value to be encoded.
+        """
+
+        self._write_text(buffer, b'D', '{days}:{seconds}:{microseconds}'.format(
+            days=value.days, seconds=value.seconds, microseconds=value.microseconds))
+
+    def _encode_uuid(self, buffer, value):
+        """
+        encodes the given uuid into buffer.
+
+        :param bytearray buffer: buffer to write into it.
+        :param UUID value: value to be encoded.
+        """
+
+        self._write(buffer, b'u', value.bytes)
+
+    def _encode_enum(self, buffer, value):
+        """
+        encodes the given enum member into buffer.
+
+        :param bytearray buffer: buffer to write into it.
+        :param Enum value: value to be encoded.
+        """
+
+        self._write_header(buffer, b'e', 2)
+        self._encode_qualified_name(buffer, type(value))
+        self._encode(buffer, value.value)
+
+    def _encode_object(self, buffer, value):
+        """
+        encodes the given object into buffer using its type and state.
+
+        the state of the object is get from its `__getstate__` method.
+
+        :param bytearray buffer: buffer to write into it.
+        :param object value: value to be encoded.
+
+        :raises TypeError: type error.
+        """
+
+        getstate = getattr(type(value), '__getstate__', None)
+        if getstate is None or getstate is DEFAULT_GETSTATE:
+            raise TypeError('Value of type [{type}] could not be used in cache keys. '
+                            'it must implement `__getstate__` to provide a stable '
+                            'representation.'.format(type=type(value).__name__))
+
+        self._write_header(buffer, b'r', 2)
+        self._encode_qualified_name(buffer, type(value))
+        self._encode(buffer, value.__getstate__())
+
+    def _get_encoder(self, value_type):
+        """
+        gets the encoder for given type.
+
+        :param type value_type: type to get its encoder.
+
+        :rtype: callable
+        """
+
+        for base_type, encoder in self._base_encoders:
+            if issubclass(value_type, base_type):
+                return encoder
+
+        return self._encode_object
+
+    def _encode(self, buffer, value):
+        """
+        encodes the given value into buffer.
+
+        :param bytearray buffer: buffer to write into it.
+        :param object value: value to be encoded.
+        """
+
+        value_type = type(value)
+        encoder = self._encoders.get(value_type)
+        if encoder is None:
+            encoder = self._get_encoder(value_type)
+            self._encoders[value_type] = encoder
+
+        encoder(buffer, value)
+
+    def encode(self, value):
+        """
+        encodes the given value into its canonical byte sequence.
+
+        :param object value: value to be encoded.
+
+        :raises TypeError: type error.
+
+        :rtype: bytes
+        """
+
+        buffer = bytearray()
+        self._encode(buffer, value)
+        return bytes(buffer)
+
+    def get_digest(self, value):
+        """
+        gets the hex digest of given value.
+
+        :param object value: value to get its digest.
+
+        :raises TypeError: type error.
+
+        :rtype: str
+        """
+
+        return blake2b(self.encode(value), digest_size=self.DIGEST_SIZE).hexdigest()
+
+    def get_short_digest(self, value):
+        """
+        gets the digest of given value as a signed 64 bit integer.
+
+        :param object value: value to get its digest.
+
+        :raises TypeError: type error.
+
+        :rtype: int
+        """
+
+        digest = blake2b(self.encode(value), digest_size=self.SHORT_DIGEST_SIZE).digest()
+        return int.from_bytes(digest, 'big', signed=True)
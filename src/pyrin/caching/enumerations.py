@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+caching enumerations module.
+"""
+
+from pyrin.core.enumerations import CoreEnum
+
+
+class EvictionPolicyEnum(CoreEnum):
+    """
+    eviction policy enum.
+    """
+
+    # oldest inserted items will be removed first.
+    FIFO = 'fifo'
+
+    # newest inserted items will be removed first,
+    # items will be moved to the front on each hit.
+    LIFO = 'lifo'
+
+    # least recently used items will be removed first.
+    LRU = 'lru'
+
+    # least frequently used items will be removed first.
+    LFU = 'lfu'
+
+    # least recently used items will be removed first, but new items will
+    # only be admitted into a full cache if they are estimated to be
+    # more frequently used than the item which should be removed for them.
+    TINY_LFU = 'tinylfu'
+
+
+class CopyModeEnum(CoreEnum):
+    """
+    copy mode enum.
+    """
+
+    # values will be deep copied on each set and each get.
+    DEEP = 'deep'
+
+    # values will be frozen once on set and the same
+    # read-only object will be returned on each get.
+    FREEZE = 'freeze'
+
+
+class SerializerEnum(CoreEnum):
+    """
+    serializer enum.
+    """
+
+    # values will be serialized using pickle with the highest protocol.
+    # it supports all picklable python objects.
+    PICKLE = 'pickle'
+
+    # values will be serialized using msgpack.
+    # it only supports msgpack compatible types.
+    MSGPACK = 'msgpack'
+
+    # values will be serialized using json.
+    # it only supports json compatible types.
+    JSON = 'json'
+
+
+class CompressionEnum(CoreEnum):
+    """
+    compression enum.
+    """
+
+    # values will be compressed using zlib.
+    ZLIB = 'zlib'
@@ -74,3 +74,10 @@ class InvalidCacheExpireTimeError(CachingManagerException):
     invalid cache expire time error.
     """
     pass
+
+
+class InvalidRefreshAheadError(CachingManagerException):
+    """
+    invalid refresh ahead error.
+    """
+    pass
@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+"""
+caching flight module.
+"""
+
+import time
+
+from threading import Lock, Event
+
+import pyrin.caching.services as caching_services
+import pyrin.logging.services as logging_services
+
+from pyrin.core.structs import CoreObject
+from pyrin.caching.exceptions import InvalidRefreshAheadError
+
+
+class FlightCall(CoreObject):
+    """
+    flight call class.
+
+    it holds the result of a single in-flight computation of a key.
+    """
+
+    def __init__(self):
+        """
+        initializes an instance of FlightCall.
+        """
+
+        super().__init__()
+
+        self._done = Event()
+        self._result = None
+        self._error = None
+
+    def resolve(self, result=None, error=None):
+        """
+        sets the result or error of this call and releases all waiting callers.
+
+        :param object result: computed result.
+        :param Exception error: error of the computation.
+        """
+
+        self._result = result
+        self._error = error
+        self._done.set()
+
+    def wait(self):
+        """
+        waits for this call to be resolved and returns its result.
+
+        if the computation has been failed, its error will be raised.
+
+        :returns: object
+        """
+
+        self._done.wait()
+        if self._error is not None:
+            raise self._error
+
+        return self._result
+
+
+class SingleFlight(CoreObject):
+    """
+    single flight class.
+
+    it makes sure that each key is computed by a single caller at a time.
+    other concurrent callers of the same key will wait and get the same result.
+    """
+
+    def __init__(self):
+        """
+        initializes an instance of SingleFlight.
+        """
+
+        super().__init__()
+
+        self._lock = Lock()
+
+        # a dict containing in-flight calls of each key.
+        # in the form of: {object key: FlightCall call}
+        self._calls = {}
+
+    def do(self, key, func, *args, **kwargs):
+        """
+        calls the given function for given key or waits for the in-flight call.
+
+        :param object key: hashable key of the computation.
+        :param function func: function to be called.
+        :param object args: function positional arguments.
+        :param object kwargs: function keyword arguments.
+
+        :returns: function result.
+        """
+
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader is True:
+                call = FlightCall()
+                self._calls[key] = call
+
+        if is_leader is not True:
+            return call.wait()
+
+        try:
+            result = func(*args, **kwargs)
+            call.resolve(result=result)
+            return result
+        except Exception as error:
+            call.resolve(error=error)
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def is_in_flight(self, key):
+        """
+        gets a value indicating that given key is being computed.
+
+        :param object key: hashable key of the computation.
+
+        :rtype: bool
+        """
+
+        return key in self._calls
+
+
+class CachedCall(CoreObject):
+    """
+    cached call class.
+
+    it gets the result of a cached function from the cache and computes
+    it on misses, with optional single-flight and refresh-ahead support.
+
+    with single-flight, concurrent misses of the same key in this process
+    will be coalesced into a single call of the function.
+
+    with refresh-ahead, a hit on a key which has passed the given fraction
+    of its expire time will recompute it on a background worker while
+    the cached value is still returned. only keys which have been computed
+    by this process will be refreshed ahead. note that the background worker
+    has no request context, so refresh-ahead should only be used on functions
+    which do not depend on the current request.
+    """
+
+    # minimum number of refresh deadlines to be kept before removing the expired ones.
+    DEADLINES_PRUNE_SIZE = 1000
+
+    def __init__(self, name, func, single_flight=False, refresh_ahead=None, **options):
+        """
+        initializes an instance of CachedCall.
+
+        :param str name: cache name to be used.
+        :param function func: function to cache its result.
+
+        :param bool single_flight: coalesce concurrent misses of the same key.
+                                   defaults to False if not provided.
+
+        :param float refresh_ahead: fraction of expire time after which a hit
+                                    must recompute the value in background.
+                                    it must be greater than 0 and less than 1.
+                                    defaults to None and refresh-ahead is disabled.
+
+        :keyword bool consider_user: specifies that current user must be included in
+                                     key generation.
+
+        :keyword int expire: expire time for given key in milliseconds.
+
+        :keyword bool refreshable: specifies that cached item's expire time must be
+                                   extended on each hit.
+
+        :keyword str copy_mode: specifies how the result must be kept in the cache.
+
+        :raises InvalidRefreshAheadError: invalid refresh ahead error.
+        """
+
+        super().__init__()
+
+        if refresh_ahead is not None and not 0 < refresh_ahead < 1:
+            raise InvalidRefreshAheadError('Refresh ahead fraction must be '
+                                           'greater than 0 and less than 1.')
+
+        self._name = name
+        self._func = func
+        self._options = options
+        self._refresh_ahead = refresh_ahead
+        self._flight = None
+        if single_flight is True or refresh_ahead is not None:
+            self._flight = SingleFlight()
+
+        self._lock = Lock()
+        self._prune_size = self.DEADLINES_PRUNE_SIZE
+
+        # a dict containing refresh and expire time of keys computed by this process.
+        # in the form of: {object key: tuple(float refresh_at, float expire_at)}
+        self._deadlines = {}
+
+    def __call__(self, *args, **kwargs):
+        """
+        gets the result of the function for given inputs.
+
+        :param object args: function positional arguments.
+        :param object kwargs: function keyword arguments.
+
+        :returns: function result.
+        """
+
+        try:
+            key = caching_services.generate_key(self._name, self._func,
+                                                args, kwargs, **self._options)
+        except TypeError as error:
+            logging_services.exception(str(error))
+            return self._func(*args, **kwargs)
+
+        result = caching_services.get(self._name, key, **self._options)
+        if result is not None:
+            if self._refresh_ahead is not None:
+                self._refresh_if_required(key, args, kwargs)
+
+            return result
+
+        if self._flight is None:
+            return self._compute(key, args, kwargs)
+
+        return self._flight.do(key, self._load, key, args, kwargs)
+
+    def _load(self, key, args, kwargs):
+        """
+        gets the value of given key from cache or computes it.
+
+        the cache will be checked again, because another caller may
+        have finished computing the value just before this call.
+
+        :param object key: cache key.
+        :param tuple args: function positional arguments.
+        :param dict kwargs: function keyword arguments.
+
+        :returns: function result.
+        """
+
+        result = caching_services.get(self._name, key, **self._options)
+        if result is not None:
+            return result
+
+        return self._compute(key, args, kwargs)
+
+    def _compute(self, key, args, kwargs):
+        """
+        calls the function and caches its result.
+
+        :param object key: cache key.
+        :param tuple args: function positional arguments.
+        :param dict kwargs: function keyword arguments.
+
+        :returns: function result.
+        """
+
+        result = self._func(*args, **kwargs)
+        caching_services.set(self._name, key, result, **self._options)
+        if self._refresh_ahead is not None:
+            self._add_deadline(key)
+
+        return result
+
+    def _get_expire(self):
+        """
+        gets the expire time of computed values in milliseconds.
+
+        the expire time will be converted to milliseconds based
+        on the expire unit of the cache, because some caches like
+        memcached keep the expire time of their items in seconds.
+
+        :rtype: int
+        """
+
+        cache = caching_services.get_cache(self._name)
+        expire = self._options.get('expire')
+        if expire is None:
+            expire = cache.expire
+
+        return expire * cache.EXPIRE_UNIT
+
+    def _add_deadline(self, key):
+        """
+        adds the refresh and expire time of given key.
+
+        expired deadlines will be removed whenever the count
+        of deadlines reaches the current prune size. it does nothing
+        if computed values have no expire time.
+
+        :param object key: cache key.
+        """
+
+        expire = self._get_expire()
+        if expire <= 0:
+            return
+
+        now = time.time() * 1000
+        with self._lock:
+            self._deadlines[key] = (now + expire * self._refresh_ahead, now + expire)
+            if len(self._deadlines) >= self._prune_size:
+                self._deadlines = {item: deadline for item, deadline
+                                   in self._deadlines.items() if deadline[1] > now}
+                self._prune_size = max(self.DEADLINES_PRUNE_SIZE,
+                                       len(self._deadlines) * 2)
+
+    def _refresh_if_required(self, key, args, kwargs):
+        """
+        recomputes the value of given key in background if it is required.
+
+        the deadline of the key will be removed before submitting the refresh,
+        so each key is only submitted once until it has been computed again.
+
+        :param object key: cache key.
+        :param tuple args: function positional arguments.
+        :param dict kwargs: function keyword arguments.
+        """
+
+        deadline = self._deadlines.get(key)
+        if deadline is None or time.time() * 1000 < deadline[0]:
+            return
+
+        with self._lock:
+            if self._deadlines.get(key) is not deadline:
+                return
+
+            self._deadlines.pop(key)
+
+        caching_services.submit_refresh(self._refresh, key, args, kwargs)
+
+    def _refresh(self, key, args, kwargs):
+        """
+        recomputes the value of given key.
+
+        errors will be logged, the cached value will expire normally.
+
+        :param object key: cache key.
+        :param tuple args: function positional arguments.
+        :param dict kwargs: function keyword arguments.
+        """
+
+        try:
+            self._flight.do(key, self._compute, key, args, kwargs)
+        except Exception as error:
+            logging_services.exception(str(error))
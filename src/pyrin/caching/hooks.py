@@ -32,6 +32,8 @@ class ApplicationHook(ApplicationHookBase):
         """
 
         if new_status == ApplicationStatusEnum.TERMINATED:
+            caching_services.shutdown_refresh_workers()
+            caching_services.flush_all_stats()
             caching_services.persist_all(clear=True)
 
     def prepare_runtime_data(self):
@@ -29,6 +29,10 @@ class AbstractCache(CoreObject, metaclass=CacheSingletonMeta):
     all application caches must be subclassed from this.
     """
 
+    # number of milliseconds in each unit of expire time of this cache.
+    # it must be overridden in caches which do not use milliseconds.
+    EXPIRE_UNIT = 1
+
     def __setitem__(self, key, value):
         """
         sets the given key with given value into this cache.
@@ -201,8 +205,8 @@ class AbstractCache(CoreObject, metaclass=CacheSingletonMeta):
 
         :raises CoreNotImplementedError: core not implemented error.
 
-        :returns: hash of generated key.
-        :rtype: int
+        :returns: generated key.
+        :rtype: object
         """
 
         raise CoreNotImplementedError()
@@ -474,6 +478,19 @@ class AbstractComplexLocalCache(AbstractExtendedLocalCache):
 
         raise CoreNotImplementedError()
 
+    @property
+    @abstractmethod
+    def copy_mode(self):
+        """
+        gets the default copy mode for this cache's items.
+
+        :raises CoreNotImplementedError: core not implemented error.
+
+        :rtype: str
+        """
+
+        raise CoreNotImplementedError()
+
     @property
     @abstractmethod
     def use_lifo(self):
@@ -487,6 +504,19 @@ class AbstractComplexLocalCache(AbstractExtendedLocalCache):
 
         raise CoreNotImplementedError()
 
+    @property
+    @abstractmethod
+    def eviction_policy(self):
+        """
+        gets the eviction policy for this cache.
+
+        :raises CoreNotImplementedError: core not implemented error.
+
+        :rtype: str
+        """
+
+        raise CoreNotImplementedError()
+
     @property
     @abstractmethod
     def clear_count(self):
@@ -521,6 +551,56 @@ class AbstractRemoteCache(AbstractCache):
     all application remote caches must be subclassed from this.
     """
 
+    @abstractmethod
+    def get_many(self, keys, default=None, **options):
+        """
+        gets the values of given keys from cache.
+
+        :param list keys: hashable keys to get their values from cache.
+        :param object default: value to be returned for keys which are not present.
+
+        :raises CoreNotImplementedError: core not implemented error.
+
+        :returns: list of values in the order of given keys.
+        :rtype: list
+        """
+
+        raise CoreNotImplementedError()
+
+    @abstractmethod
+    def set_many(self, items, **options):
+        """
+        sets the given items into cached items.
+
+        :param dict | list[tuple[object, object]] items: keys and values to be cached.
+
+        :raises CoreNotImplementedError: core not implemented error.
+        """
+
+        raise CoreNotImplementedError()
+
+    @abstractmethod
+    def delete_many(self, keys, **options):
+        """
+        removes the given keys from cache.
+
+        :param list keys: keys to be removed.
+
+        :raises CoreNotImplementedError: core not implemented error.
+        """
+
+        raise CoreNotImplementedError()
+
+    @abstractmethod
+    def flush_stats(self):
+        """
+        sends the hit and miss counts which are recorded in process to the server.
+
+        :raises CoreNotImplementedError: core not implemented error.
+        """
+
+        raise CoreNotImplementedError()
+
     @property
     @abstractmethod
     def expire(self):
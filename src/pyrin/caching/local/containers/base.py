@@ -264,3 +264,54 @@ class LocalCacheContainerBase(CoreObject):
         """
 
         raise CoreNotImplementedError()
+
+    @abstractmethod
+    def touch(self, key):
+        """
+        records a hit for the given key.
+
+        containers should update their eviction order or frequency
+        info for the given key here. it does nothing if the key is
+        not present in the container.
+
+        :param object key: key which has been hit.
+
+        :raises CoreNotImplementedError: core not implemented error.
+        """
+
+        raise CoreNotImplementedError()
+
+    @abstractmethod
+    def evict(self, count):
+        """
+        removes the given number of items from this container.
+
+        the items will be removed based on the eviction policy of this container.
+
+        :param int count: number of items to be removed.
+
+        :raises CoreNotImplementedError: core not implemented error.
+
+        :returns: list of removed keys.
+        :rtype: list[object]
+        """
+
+        raise CoreNotImplementedError()
+
+    @abstractmethod
+    def admit(self, key, full):
+        """
+        gets a value indicating that given new key should be admitted into this container.
+
+        it will be called before adding each new key, so containers
+        could also record the access to the given key here.
+
+        :param object key: key which is going to be added.
+        :param bool full: specifies that the container is full.
+
+        :raises CoreNotImplementedError: core not implemented error.
+
+        :rtype: bool
+        """
+
+        raise CoreNotImplementedError()
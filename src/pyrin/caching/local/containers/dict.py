@@ -15,6 +15,9 @@ class OrderedDictContainer(OrderedDict, LocalCacheContainerBase):
     it is actually a regular ordered dict.
     it is inherited from `OrderedDict` instead of `dict` to let efficiently
     remove items in `FIFO` or `LIFO` order when items count limit is reached.
+
+    by default, each hit moves the item to the end and the items will
+    be evicted from the beginning, which results in `LRU` order.
     """
 
     def set(self, key, value, *args, **kwargs):
@@ -44,3 +47,127 @@ class OrderedDictContainer(OrderedDict, LocalCacheContainerBase):
             return items[:count]
         else:
             return items[count * -1:]
+
+    def touch(self, key):
+        """
+        records a hit for the given key.
+
+        it moves the given key to the end.
+
+        :param object key: key which has been hit.
+        """
+
+        try:
+            self.move_to_end(key)
+        except KeyError:
+            pass
+
+    def evict(self, count):
+        """
+        removes the given number of items from the beginning of this container.
+
+        :param int count: number of items to be removed.
+
+        :returns: list of removed keys.
+        :rtype: list[object]
+        """
+
+        return self._evict(count, False)
+
+    def admit(self, key, full):
+        """
+        gets a value indicating that given new key should be admitted into this container.
+
+        this container always admits new keys.
+
+        :param object key: key which is going to be added.
+        :param bool full: specifies that the container is full.
+
+        :rtype: bool
+        """
+
+        return True
+
+    def _evict(self, count, last):
+        """
+        removes the given number of items from this container.
+
+        :param int count: number of items to be removed.
+        :param bool last: specifies that items must be removed from end.
+
+        :returns: list of removed keys.
+        :rtype: list[object]
+        """
+
+        removed = []
+        for i in range(count):
+            try:
+                key, value = self.popitem(last)
+                removed.append(key)
+            except KeyError:
+                break
+
+        return removed
+
+
+class LRUContainer(OrderedDictContainer):
+    """
+    lru container class.
+
+    least recently used items will be removed first.
+    """
+    pass
+
+
+class FIFOContainer(OrderedDictContainer):
+    """
+    fifo container class.
+
+    oldest inserted items will be removed first, hits do not change the order.
+    """
+
+    def touch(self, key):
+        """
+        records a hit for the given key.
+
+        it does nothing in this container.
+
+        :param object key: key which has been hit.
+        """
+        pass
+
+
+class LIFOContainer(OrderedDictContainer):
+    """
+    lifo container class.
+
+    newest inserted items will be removed first.
+    each hit moves the item to the beginning, so hot
+    items will be the last ones to be removed.
+    """
+
+    def touch(self, key):
+        """
+        records a hit for the given key.
+
+        it moves the given key to the beginning.
+
+        :param object key: key which has been hit.
+        """
+
+        try:
+            self.move_to_end(key, last=False)
+        except KeyError:
+            pass
+
+    def evict(self, count):
+        """
+        removes the given number of items from the end of this container.
+
+        :param int count: number of items to be removed.
+
+        :returns: list of removed keys.
+        :rtype: list[object]
+        """
+
+        return self._evict(count, True)
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+caching local containers lfu module.
+"""
+
+from collections import OrderedDict
+from threading import RLock
+
+from pyrin.caching.local.containers.base import LocalCacheContainerBase
+
+
+class LFUContainer(dict, LocalCacheContainerBase):
+    """
+    lfu container class.
+
+    least frequently used items will be removed first. items with the same
+    frequency will be removed in the order they have reached that frequency.
+
+    it keeps a bucket of keys per frequency, so recording a hit and
+    removing the least frequently used item are both O(1) operations.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        initializes an instance of LFUContainer.
+        """
+
+        super().__init__()
+
+        # a dict containing the frequency of each key.
+        # in the form of: {object key: int frequency}
+        self._frequencies = dict()
+
+        # a dict containing the keys of each frequency in the order they are reached.
+        # in the form of: {int frequency: OrderedDict[object key, None]}
+        self._buckets = dict()
+
+        self._min_frequency = 0
+        self._lock = RLock()
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, key, value):
+        """
+        sets the given key with given value into the cache.
+
+        if the key is already present, its frequency will be increased.
+
+        :param object key: key to set value with it.
+        :param object value: value to be cached.
+        """
+
+        with self._lock:
+            existed = key in self
+            super().__setitem__(key, value)
+            if existed is True:
+                self._increment(key)
+            else:
+                self._frequencies[key] = 1
+                self._buckets.setdefault(1, OrderedDict())[key] = None
+                self._min_frequency = 1
+
+    def __delitem__(self, key):
+        """
+        deletes the given key from cache.
+
+        it raises an error if the key does not exist.
+
+        :param object key: key to be deleted.
+        """
+
+        with self._lock:
+            super().__delitem__(key)
+            self._discard(key)
+
+    def _increment(self, key):
+        """
+        increases the frequency of given key.
+
+        :param object key: key to increase its frequency.
+        """
+
+        frequency = self._frequencies[key]
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if len(bucket) == 0:
+            del self._buckets[frequency]
+            if self._min_frequency == frequency:
+                self._min_frequency = frequency + 1
+
+        frequency += 1
+        self._frequencies[key] = frequency
+        self._buckets.setdefault(frequency, OrderedDict())[key] = None
+
+    def _discard(self, key):
+        """
+        removes the frequency info of given key.
+
+        :param object key: key to remove its frequency info.
+        """
+
+        frequency = self._frequencies.pop(key, None)
+        if frequency is None:
+            return
+
+        bucket = self._buckets[frequency]
+        bucket.pop(key, None)
+        if len(bucket) == 0:
+            del self._buckets[frequency]
+
+    def _pop_least_frequent(self):
+        """
+        removes the least frequently used item from this container and returns it.
+
+        it raises an error if the container is empty.
+
+        :raises KeyError: key error.
+
+        :rtype: tuple[object, object]
+        """
+
+        if len(self._buckets) == 0:
+            raise KeyError('Container is empty.')
+
+        if self._min_frequency not in self._buckets:
+            self._min_frequency = min(self._buckets)
+
+        bucket = self._buckets[self._min_frequency]
+        key, none = bucket.popitem(last=False)
+        if len(bucket) == 0:
+            del self._buckets[self._min_frequency]
+
+        del self._frequencies[key]
+        return key, super().pop(key)
+
+    def set(self, key, value, *args, **kwargs):
+        """
+        sets a new value into cached items.
+
+        :param object key: hashable key of the cache to be registered.
+        :param object value: value to be cached.
+        """
+
+        self[key] = value
+
+    def update(self, *args, **kwargs):
+        """
+        updates this container with given items.
+        """
+
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        """
+        sets the given default value for the key if it does not exist and returns its value.
+
+        :param object key: key to get its value.
+        :param object default: value to be set if key is not present.
+
+        :returns: object
+        """
+
+        with self._lock:
+            if key not in self:
+                self[key] = default
+
+            return self[key]
+
+    def contains(self, key):
+        """
+        gets a value indicating that given key is existed in the cached items.
+
+        :param object key: key to be checked for existence.
+
+        :rtype: bool
+        """
+
+        return key in self
+
+    def pop(self, key, default=None):
+        """
+        pops the given key from cache and returns its value.
+
+        if key does not exist, it returns None or the specified default value.
+
+        :param object key: key to get its value.
+        :param object default: value to be returned if key is not present.
+
+        :returns: object
+        """
+
+        with self._lock:
+            if key not in self:
+                return default
+
+            self._discard(key)
+            return super().pop(key)
+
+    def popitem(self):
+        """
+        removes the least frequently used item from this container and returns it.
+
+        it raises an error if the container is empty.
+
+        :raises KeyError: key error.
+
+        :rtype: tuple[object, object]
+        """
+
+        with self._lock:
+            return self._pop_least_frequent()
+
+    def remove(self, key):
+        """
+        removes the given key from cache.
+
+        it does nothing if the key is not present in the cache.
+
+        :param object key: key to be removed.
+        """
+
+        self.pop(key)
+
+    def clear(self):
+        """
+        clears all items from cache.
+        """
+
+        with self._lock:
+            super().clear()
+            self._frequencies.clear()
+            self._buckets.clear()
+            self._min_frequency = 0
+
+    def move_to_end(self, key, last=True):
+        """
+        moves the given key and its value to the end of queue.
+
+        in this container, it increases the frequency of given key.
+
+        :param object key: key to be moved.
+
+        :param bool last: specifies that item must be moved to end.
+                          it has no effect in this container.
+        """
+
+        self.touch(key)
+
+    def slice(self, count, last=False):
+        """
+        gets a slice of items of this container with the count length.
+
+        the keys are in the order of removal.
+
+        :param int count: number of items to include in slice.
+
+        :param bool last: specifies that slice must include items from end.
+                          defaults to False if not provided.
+
+        :returns: iterable
+        """
+
+        with self._lock:
+            items = [key for frequency in sorted(self._buckets)
+                     for key in self._buckets[frequency]]
+
+        if last is not True:
+            return items[:count]
+        else:
+            return items[count * -1:]
+
+    def touch(self, key):
+        """
+        records a hit for the given key.
+
+        it increases the frequency of given key.
+
+        :param object key: key which has been hit.
+        """
+
+        with self._lock:
+            if key in self._frequencies:
+                self._increment(key)
+
+    def evict(self, count):
+        """
+        removes the given number of least frequently used items from this container.
+
+        :param int count: number of items to be removed.
+
+        :returns: list of removed keys.
+        :rtype: list[object]
+        """
+
+        removed = []
+        with self._lock:
+            while len(removed) < count and len(self._buckets) > 0:
+                key, value = self._pop_least_frequent()
+                removed.append(key)
+
+        return removed
+
+    def admit(self, key, full):
+        """
+        gets a value indicating that given new key should be admitted into this container.
+
+        this container always admits new keys.
+
+        :param object key: key which is going to be added.
+        :param bool full: specifies that the container is full.
+
+        :rtype: bool
+        """
+
+        return True
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+caching local containers structs module.
+"""
+
+from pyrin.core.structs import CoreObject
+
+
+class FrequencySketch(CoreObject):
+    """
+    frequency sketch class.
+
+    it is a count-min sketch which estimates the access frequency of keys
+    in a fixed amount of memory. counters are saturated at `MAX_FREQUENCY`
+    and all of them will be halved after a sample of accesses has been
+    recorded, so old popularity fades over time.
+    """
+
+    # multipliers used to spread the hash of keys over each row.
+    SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F,
+             0x165667B19E3779F9, 0x27D4EB2F165667C5)
+
+    MAX_FREQUENCY = 15
+    HASH_MASK = 0xFFFFFFFFFFFFFFFF
+
+    # a translation table to halve all counters of a row at once.
+    HALVING_TABLE = bytes(value >> 1 for value in range(256))
+
+    def __init__(self, width):
+        """
+        initializes an instance of FrequencySketch.
+
+        :param int width: number of counters in each row.
+                          it will be rounded up to a power of two.
+        """
+
+        super().__init__()
+
+        width = 1 << max(width - 1, 1).bit_length()
+        self._mask = width - 1
+        self._rows = [bytearray(width) for seed in self.SEEDS]
+        self._sample_size = width * 10
+        self._additions = 0
+
+    def _get_indexes(self, key):
+        """
+        gets the counter index of given key in each row.
+
+        :param object key: key to get its indexes.
+
+        :rtype: list[int]
+        """
+
+        key_hash = hash(key)
+        return [(((key_hash * seed) & self.HASH_MASK) >> 32) & self._mask
+                for seed in self.SEEDS]
+
+    def _reset(self):
+        """
+        halves all counters of this sketch.
+        """
+
+        for row in self._rows:
+            row[:] = row.translate(self.HALVING_TABLE)
+
+        self._additions = self._additions // 2
+
+    def increment(self, key):
+        """
+        records an access to the given key.
+
+        :param object key: key to record its access.
+        """
+
+        added = False
+        for row, index in zip(self._rows, self._get_indexes(key)):
+            if row[index] < self.MAX_FREQUENCY:
+                row[index] += 1
+                added = True
+
+        if added is True:
+            self._additions += 1
+            if self._additions >= self._sample_size:
+                self._reset()
+
+    def estimate(self, key):
+        """
+        gets the estimated access frequency of given key.
+
+        :param object key: key to get its frequency.
+
+        :rtype: int
+        """
+
+        return min(row[index] for row, index in zip(self._rows, self._get_indexes(key)))
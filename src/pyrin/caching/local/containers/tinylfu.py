@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+caching local containers tinylfu module.
+"""
+
+from pyrin.caching.local.containers.dict import LRUContainer
+from pyrin.caching.local.containers.structs import FrequencySketch
+
+
+class TinyLFUContainer(LRUContainer):
+    """
+    tiny lfu container class.
+
+    least recently used items will be removed first, but when the container
+    is full, a new key will only be admitted if its estimated access frequency
+    is higher than the frequency of the item which should be removed for it.
+    this prevents one-off keys from pushing hot keys out of the cache.
+
+    access frequencies are kept in a `FrequencySketch`.
+    """
+
+    # number of counters in each row of the frequency sketch.
+    # it should be equal or greater than the limit of the cache.
+    # it could be overridden in subclasses.
+    sketch_width = 8192
+
+    def __init__(self, *args, **kwargs):
+        """
+        initializes an instance of TinyLFUContainer.
+        """
+
+        super().__init__(*args, **kwargs)
+
+        self._sketch = FrequencySketch(self.sketch_width)
+
+    def touch(self, key):
+        """
+        records a hit for the given key.
+
+        it records the access into frequency sketch and moves the given key to the end.
+
+        :param object key: key which has been hit.
+        """
+
+        self._sketch.increment(key)
+        super().touch(key)
+
+    def admit(self, key, full):
+        """
+        gets a value indicating that given new key should be admitted into this container.
+
+        it records the access into frequency sketch. if the container is full, the
+        key will be admitted only if it is estimated to be more frequently used than
+        the least recently used item of this container.
+
+        :param object key: key which is going to be added.
+        :param bool full: specifies that the container is full.
+
+        :rtype: bool
+        """
+
+        self._sketch.increment(key)
+        if full is not True:
+            return True
+
+        try:
+            victim = next(iter(self))
+        except (StopIteration, RuntimeError):
+            return True
+
+        return self._sketch.estimate(key) > self._sketch.estimate(victim)
@@ -6,7 +6,6 @@ caching local handlers base module.
 import pickle
 
 from abc import abstractmethod
-from threading import Thread
 
 import pyrin.database.bulk.services as bulk_services
 import pyrin.logging.services as logging_services
@@ -16,6 +15,7 @@ import pyrin.globalization.datetime.services as datetime_services
 from pyrin.caching.mixin.base import ComplexKeyGeneratorMixin, SimpleKeyGeneratorMixin
 from pyrin.caching.models import CacheItemEntity
 from pyrin.caching.globals import NO_LIMIT
+from pyrin.caching.enumerations import EvictionPolicyEnum, CopyModeEnum
 from pyrin.core.exceptions import CoreNotImplementedError
 from pyrin.caching.local.items.base import LocalCacheItemBase, ComplexLocalCacheItemBase
 from pyrin.database.services import get_current_store
@@ -28,7 +28,7 @@ from pyrin.caching.exceptions import CacheIsNotPersistentError, CacheNameIsRequi
 from pyrin.caching.local.handlers.exceptions import InvalidCacheContainerTypeError, \
     InvalidCacheItemTypeError, InvalidCacheClearCountError, InvalidChunkSizeError, \
     CacheClearanceLockTypeIsRequiredError, CacheVersionIsRequiredError, \
-    CachePersistentLockTypeIsRequiredError
+    CachePersistentLockTypeIsRequiredError, InvalidEvictionPolicyError, InvalidCopyModeError
 
 
 class LocalCacheBase(SimpleKeyGeneratorMixin, AbstractCache):
@@ -82,12 +82,13 @@ class LocalCacheBase(SimpleKeyGeneratorMixin, AbstractCache):
 
         self._set_name(self.cache_name)
 
-        if self.container_class is None or \
-                not issubclass(self.container_class, LocalCacheContainerBase):
+        container_class = self._get_container_class(**options)
+        if container_class is None or \
+                not issubclass(container_class, LocalCacheContainerBase):
             raise InvalidCacheContainerTypeError('Provided cache container [{container}] '
                                                  'for cache [{name}] is not a subclass '
                                                  'of [{base}].'
-                                                 .format(container=self.container_class,
+                                                 .format(container=container_class,
                                                          name=self.get_name(),
                                                          base=LocalCacheContainerBase))
 
@@ -99,19 +100,32 @@ class LocalCacheBase(SimpleKeyGeneratorMixin, AbstractCache):
                                                     name=self.get_name(),
                                                     base=LocalCacheItemBase))
 
-        self._container = self.container_class()
+        self._container = container_class()
         self._last_cleared_time = datetime_services.now()
 
-    def _get_cache_item(self, value, *args, **options):
+    def _get_container_class(self, **options):
         """
-        gets the equivalent cache item for given value.
+        gets the container class to be used for this cache.
 
+        it returns the `container_class` attribute by default.
+        it could be overridden in subclasses.
+
+        :rtype: type[LocalCacheContainerBase]
+        """
+
+        return self.container_class
+
+    def _get_cache_item(self, key, value, *args, **options):
+        """
+        gets the equivalent cache item for given key and value.
+
+        :param object key: key of the cache item.
         :param object value: value to be cached.
 
         :rtype: CacheItemBase
         """
 
-        return self.cache_item_class(value, *args, **options)
+        return self.cache_item_class(key, value, *args, **options)
 
     def _get_configs(self):
         """
@@ -186,9 +200,27 @@ class LocalCacheBase(SimpleKeyGeneratorMixin, AbstractCache):
         :param object value: value to be cached.
         """
 
-        hash_key = hash(key)
-        cache_item = self._get_cache_item(hash_key, value, *args, **options)
-        self._container[hash_key] = cache_item
+        cache_item = self._get_cache_item(key, value, *args, **options)
+        self._container[self.get_key_digest(key)] = cache_item
+
+    def _get_item(self, key, digest):
+        """
+        gets the cache item of given key.
+
+        the full key of the cache item will be checked against the given
+        key, so if another key has the same digest, it returns None.
+
+        :param object key: hashable key to get its cache item.
+        :param str digest: digest of given key.
+
+        :rtype: LocalCacheItemBase
+        """
+
+        cache_item = self._container.get(digest)
+        if cache_item is None or cache_item.key != key:
+            return None
+
+        return cache_item
 
     def get(self, key, default=None, **options):
         """
@@ -202,11 +234,11 @@ class LocalCacheBase(SimpleKeyGeneratorMixin, AbstractCache):
         :returns: object
         """
 
-        result = self._container.get(hash(key), default)
-        if result not in (None, default):
-            return result.value
+        cache_item = self._get_item(key, self.get_key_digest(key))
+        if cache_item is None:
+            return default
 
-        return result
+        return cache_item.value
 
     def try_set(self, value, func, parent, *args, **options):
         """
@@ -257,7 +289,7 @@ class LocalCacheBase(SimpleKeyGeneratorMixin, AbstractCache):
         :rtype: bool
         """
 
-        return hash(key) in self._container
+        return self._get_item(key, self.get_key_digest(key)) is not None
 
     def pop(self, key, default=None):
         """
@@ -271,7 +303,13 @@ class LocalCacheBase(SimpleKeyGeneratorMixin, AbstractCache):
         :returns: object
         """
 
-        return self._container.pop(hash(key), default)
+        digest = self.get_key_digest(key)
+        cache_item = self._get_item(key, digest)
+        if cache_item is None:
+            return default
+
+        self._container.pop(digest, None)
+        return cache_item.value
 
     def remove(self, key, **options):
         """
@@ -282,10 +320,9 @@ class LocalCacheBase(SimpleKeyGeneratorMixin, AbstractCache):
         :param object key: key to be removed.
         """
 
-        try:
-            del self._container[hash(key)]
-        except Exception:
-            pass
+        digest = self.get_key_digest(key)
+        if self._get_item(key, digest) is not None:
+            self._container.pop(digest, None)
 
     def clear(self):
         """
@@ -498,6 +535,18 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
     # a lock type to be used on clearing cached items when cache limit is reached.
     clearance_lock_class = None
 
+    # a dict containing container types to be used for each eviction policy.
+    # in the form of: {str eviction_policy: type[LocalCacheContainerBase] container}
+    # if not provided, `container_class` will be used for all eviction policies.
+    # it could be overridden in subclasses.
+    eviction_containers = None
+
+    # a dict containing cache item types to be used for each copy mode.
+    # in the form of: {str copy_mode: type[ComplexLocalCacheItemBase] cache_item}
+    # if not provided, `cache_item_class` will be used for all copy modes.
+    # it could be overridden in subclasses.
+    cache_item_classes = None
+
     # a lock type to be used on persisting or loading cached items to or from database.
     # this will only be used in persistent caches.
     persistent_lock_class = None
@@ -520,6 +569,18 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
         :keyword bool use_lifo: specifies that items of the cache must
                                 be removed in lifo order. if not provided,
                                 it will be get from `caching` config store.
+                                it is only used if `eviction_policy` is not set.
+
+        :keyword str eviction_policy: eviction policy to be used for this cache.
+                                      if not provided, it will be get from `caching`
+                                      config store. if it is not set there, it will
+                                      be `lifo` or `lru` based on `use_lifo` value.
+        :enum eviction_policy:
+            FIFO = 'fifo'
+            LIFO = 'lifo'
+            LRU = 'lru'
+            LFU = 'lfu'
+            TINY_LFU = 'tinylfu'
 
         :keyword int clear_count: number of old items to be removed from cache when
                                   the cache is full. if not provided, it will be get
@@ -544,7 +605,18 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
                                    extended on each hit. if not provided, will be get
                                    from `caching` config store.
 
+        :keyword str copy_mode: specifies how cached values must be kept in the cache.
+                                `deep` copies the value on each set and get, `freeze`
+                                converts the value into a read-only object once on set
+                                and returns the same object on each get. if not provided,
+                                will be get from `caching` config store.
+        :enum copy_mode:
+            DEEP = 'deep'
+            FREEZE = 'freeze'
+
         :raises CacheNameIsRequiredError: cache name is required error.
+        :raises InvalidEvictionPolicyError: invalid eviction policy error.
+        :raises InvalidCopyModeError: invalid copy mode error.
         :raises InvalidCacheContainerTypeError: invalid cache container type error.
         :raises InvalidCacheItemTypeError: invalid cache item type error.
         :raises CacheClearanceLockTypeIsRequiredError: cache clearance lock type
@@ -567,6 +639,15 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
                                                     name=self.get_name(),
                                                     base=ComplexLocalCacheItemBase))
 
+        if self.cache_item_classes is not None:
+            for item_class in self.cache_item_classes.values():
+                if not issubclass(item_class, ComplexLocalCacheItemBase):
+                    raise InvalidCacheItemTypeError('Provided cache item [{item}] for cache '
+                                                    '[{name}] is not a subclass of [{base}].'
+                                                    .format(item=item_class,
+                                                            name=self.get_name(),
+                                                            base=ComplexLocalCacheItemBase))
+
         if self.clearance_lock_class is None:
             raise CacheClearanceLockTypeIsRequiredError('Cache clearance lock type for '
                                                         'cache [{name}] is required.'
@@ -578,11 +659,11 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
 
         limit = options.get('limit')
         expire = options.get('expire')
-        use_lifo = options.get('use_lifo')
         clear_count = options.get('clear_count')
         persistent = options.get('persistent')
         chunk_size = options.get('chunk_size')
         refreshable = options.get('refreshable')
+        copy_mode = options.get('copy_mode')
 
         configs = self._get_configs()
         if limit is None:
@@ -591,9 +672,6 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
         if expire is None:
             expire = configs['expire']
 
-        if use_lifo is None:
-            use_lifo = configs['use_lifo']
-
         if clear_count is None:
             clear_count = configs['clear_count']
 
@@ -606,6 +684,14 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
         if refreshable is None:
             refreshable = configs['refreshable']
 
+        if copy_mode is None:
+            copy_mode = configs.get('copy_mode')
+
+        if copy_mode is None:
+            copy_mode = CopyModeEnum.DEEP
+
+        self._validate_copy_mode(copy_mode)
+
         if limit != NO_LIMIT and limit <= 0:
             raise InvalidCacheLimitError('Cache limit for cache [{name}] '
                                          'must be a positive integer.'
@@ -634,11 +720,11 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
         self._persistent_lock = self.persistent_lock_class()
         self._limit = limit
         self._expire = expire
-        self._use_lifo = use_lifo
         self._clear_count = clear_count
         self._persistent = persistent
         self._chunk_size = chunk_size
         self._refreshable = refreshable
+        self._copy_mode = copy_mode
 
     def _get_default_configs(self):
         """
@@ -649,60 +735,177 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
 
         return config_services.get_section('caching', 'complex')
 
-    def _get_hit_ratio(self):
+    def _get_use_lifo(self, configs, **options):
         """
-        gets hit ratio for this cache in percentage.
+        gets the use lifo value for this cache.
 
-        :rtype: float
+        :param dict configs: configs of this cache.
+
+        :keyword bool use_lifo: specifies that items of the cache must
+                                be removed in lifo order. if not provided,
+                                it will be get from given configs.
+
+        :rtype: bool
         """
 
-        hit = self.hit_count
-        miss = self.miss_count
-        if hit == 0 and miss == 0:
-            return 0
+        use_lifo = options.get('use_lifo')
+        if use_lifo is None:
+            use_lifo = configs['use_lifo']
 
-        ratio = hit / (hit + miss)
-        return round(ratio * 100, 1)
+        return use_lifo
 
-    def _is_cleaning_queue(self):
+    def _get_eviction_policy(self, configs, **options):
         """
-        gets a value indicating that a thread is busy cleaning old cached items.
+        gets the eviction policy for this cache.
 
-        :rtype: bool
+        :param dict configs: configs of this cache.
+
+        :keyword str eviction_policy: eviction policy to be used for this cache.
+                                      if not provided, it will be get from given
+                                      configs. if it is not set there, it will be
+                                      `lifo` or `lru` based on `use_lifo` value.
+        :enum eviction_policy:
+            FIFO = 'fifo'
+            LIFO = 'lifo'
+            LRU = 'lru'
+            LFU = 'lfu'
+            TINY_LFU = 'tinylfu'
+
+        :raises InvalidEvictionPolicyError: invalid eviction policy error.
+
+        :rtype: str
         """
 
-        return self._clearance_lock.locked() is True
+        eviction_policy = options.get('eviction_policy')
+        if eviction_policy is None:
+            eviction_policy = configs.get('eviction_policy')
 
-    def _manage_queue(self):
+        if eviction_policy is None:
+            if self._get_use_lifo(configs, **options) is True:
+                eviction_policy = EvictionPolicyEnum.LIFO
+            else:
+                eviction_policy = EvictionPolicyEnum.LRU
+
+        if eviction_policy not in EvictionPolicyEnum:
+            raise InvalidEvictionPolicyError('Eviction policy [{policy}] for cache [{name}] '
+                                             'is invalid. it must be one of {values}.'
+                                             .format(policy=eviction_policy,
+                                                     name=self.get_name(),
+                                                     values=list(EvictionPolicyEnum.values())))
+
+        return eviction_policy
+
+    def _get_container_class(self, **options):
         """
-        manages this cache's queue and removes old items if required.
+        gets the container class to be used for this cache.
+
+        it returns the container of current eviction policy from `eviction_containers`.
+        if `eviction_containers` is not set, it returns the `container_class` attribute.
+        this method is called once on initialization, before the container is created.
+        so it also resolves `use_lifo` and eviction policy of this cache from configs
+        and keeps them on this instance to prevent reading configs again.
 
-        the operation will be run in a new thread and does not block the current request.
+        :keyword bool use_lifo: specifies that items of the cache must
+                                be removed in lifo order. if not provided,
+                                it will be get from `caching` config store.
+
+        :keyword str eviction_policy: eviction policy to be used for this cache.
+                                      if not provided, it will be get from `caching`
+                                      config store.
+
+        :raises InvalidEvictionPolicyError: invalid eviction policy error.
+
+        :rtype: type[LocalCacheContainerBase]
         """
 
-        if self._is_cleaning_queue() is True:
-            return
+        configs = self._get_configs()
+        self._use_lifo = self._get_use_lifo(configs, **options)
+        self._eviction_policy = self._get_eviction_policy(configs, **options)
+
+        if self.eviction_containers is None:
+            return super()._get_container_class(**options)
+
+        return self.eviction_containers.get(self._eviction_policy)
+
+    def _validate_copy_mode(self, copy_mode):
+        """
+        validates the given copy mode.
+
+        :param str copy_mode: copy mode to be validated.
+
+        :raises InvalidCopyModeError: invalid copy mode error.
+        """
+
+        if copy_mode not in CopyModeEnum:
+            raise InvalidCopyModeError('Copy mode [{mode}] for cache [{name}] is '
+                                       'invalid. it must be one of {values}.'
+                                       .format(mode=copy_mode, name=self.get_name(),
+                                               values=list(CopyModeEnum.values())))
+
+    def _get_cache_item(self, key, value, *args, **options):
+        """
+        gets the equivalent cache item for given key and value.
 
-        cleaner = Thread(target=self._remove_old_items)
-        cleaner.start()
+        the cache item type will be chosen based on the copy mode.
 
-    def _remove_old_items(self):
+        :param object key: key of the cache item.
+        :param object value: value to be cached.
+
+        :keyword str copy_mode: copy mode to be used for this item.
+                                defaults to `copy_mode` attribute if not provided.
+
+        :raises InvalidCopyModeError: invalid copy mode error.
+
+        :rtype: ComplexLocalCacheItemBase
+        """
+
+        if self.cache_item_classes is None:
+            return super()._get_cache_item(key, value, *args, **options)
+
+        copy_mode = options.get('copy_mode')
+        if copy_mode is None:
+            copy_mode = self.copy_mode
+        else:
+            self._validate_copy_mode(copy_mode)
+
+        cache_item_class = self.cache_item_classes.get(copy_mode, self.cache_item_class)
+        return cache_item_class(key, value, *args, **options)
+
+    def _get_hit_ratio(self):
+        """
+        gets hit ratio for this cache in percentage.
+
+        :rtype: float
+        """
+
+        hit = self.hit_count
+        miss = self.miss_count
+        if hit == 0 and miss == 0:
+            return 0
+
+        ratio = hit / (hit + miss)
+        return round(ratio * 100, 1)
+
+    def _remove_old_items(self, count):
         """
         removes old items from cache.
 
-        the number of old items to be removed is calculated
-        considering the `caching` config store.
+        the items to be removed are chosen by the container based on the eviction
+        policy of this cache. the number of old items to be removed is calculated
+        considering the `caching` config store, so the removal cost is amortized
+        over the next inserts. if another thread is already removing old items,
+        it does nothing and returns immediately.
+
+        :param int count: number of old items to be removed.
         """
 
-        if self._is_cleaning_queue() is True:
+        if self._clearance_lock.acquire(blocking=False) is not True:
             return
 
-        with self._clearance_lock:
-            is_full, count = self.is_full
-            if is_full is True:
-                to_be_removed = self._container.slice(count, self._use_lifo)
-                for key in to_be_removed:
-                    self.remove(key)
+        try:
+            self._container.evict(count)
+        finally:
+            self._clearance_lock.release()
 
     def _validate_persisting(self, version):
         """
@@ -749,6 +952,14 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
         :keyword bool refreshable: specifies that cached item's expire time must be
                                    extended on each hit. defaults to `refreshable`
                                    attribute if not provided.
+
+        :keyword str copy_mode: specifies how the value must be kept in the cache.
+                                defaults to `copy_mode` attribute if not provided.
+        :enum copy_mode:
+            DEEP = 'deep'
+            FREEZE = 'freeze'
+
+        :raises InvalidCopyModeError: invalid copy mode error.
         """
 
         expire = options.get('expire')
@@ -760,8 +971,13 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
             options.update(refreshable=self.refreshable)
 
         is_full, count = self.is_full
+        digest = self.get_key_digest(key)
+        if digest not in self._container and \
+                self._container.admit(digest, is_full) is not True:
+            return
+
         if is_full is True:
-            self._manage_queue()
+            self._remove_old_items(count)
 
         super().set(key, value, **options)
 
@@ -777,20 +993,20 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
         :returns: object
         """
 
-        key_hash = hash(key)
-        result = self._container.get(key_hash, default)
-        if result in (None, default):
+        digest = self.get_key_digest(key)
+        cache_item = self._get_item(key, digest)
+        if cache_item is None:
             self._miss_count = self._miss_count + 1
-            return result
+            return default
 
-        if result.is_expired is True:
+        if cache_item.is_expired is True:
             self._miss_count = self._miss_count + 1
-            self.remove(key_hash)
+            self._container.pop(digest, None)
             return default
 
         self._hit_count = self._hit_count + 1
-        self._container.move_to_end(key_hash, not self._use_lifo)
-        return result.value
+        self._container.touch(digest)
+        return cache_item.value
 
     def persist(self, version, **options):
         """
@@ -818,7 +1034,7 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
                         entity.cache_name = self.get_name()
                         entity.shard_name = shard_name
                         entity.version = version
-                        entity.key = item.key
+                        entity.key = self.key_encoder.get_short_digest(item.key)
                         entity.item = pickled_item
                         caches.append(entity)
 
@@ -892,7 +1108,7 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
         """
 
         if self.limit == NO_LIMIT:
-            return False
+            return False, 0
 
         count = self.count
         is_full = False
@@ -953,6 +1169,16 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
 
         return self._use_lifo
 
+    @property
+    def eviction_policy(self):
+        """
+        gets the eviction policy for this cache.
+
+        :rtype: str
+        """
+
+        return self._eviction_policy
+
     @property
     def clear_count(self):
         """
@@ -973,6 +1199,16 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
 
         return self._refreshable
 
+    @property
+    def copy_mode(self):
+        """
+        gets the default copy mode for this cache's items.
+
+        :rtype: str
+        """
+
+        return self._copy_mode
+
     @property
     def stats(self):
         """
@@ -988,7 +1224,9 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
                        int limit: items count limit,
                        int expire: items default expire time,
                        bool refreshable: items default refreshable value.
+                       str copy_mode: items default copy mode,
                        bool use_lifo: use lifo order,
+                       str eviction_policy: eviction policy,
                        int clear_count: clear count,
                        int chunk_size: chunk size)
         :rtype: dict
@@ -1002,7 +1240,9 @@ class ComplexLocalCacheBase(ExtendedLocalCacheBase, AbstractComplexLocalCache):
                      limit=self.limit,
                      expire=self.expire,
                      refreshable=self.refreshable,
+                     copy_mode=self.copy_mode,
                      use_lifo=self.use_lifo,
+                     eviction_policy=self.eviction_policy,
                      clear_count=self.clear_count,
                      chunk_size=self.chunk_size)
 
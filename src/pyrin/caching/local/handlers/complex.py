@@ -5,10 +5,15 @@ caching local handlers complex module.
 
 from threading import Lock
 
-from pyrin.caching.local.containers.dict import OrderedDictContainer
 from pyrin.caching.decorators import cache
+from pyrin.caching.enumerations import EvictionPolicyEnum, CopyModeEnum
+from pyrin.caching.local.containers.lfu import LFUContainer
+from pyrin.caching.local.containers.tinylfu import TinyLFUContainer
 from pyrin.caching.local.handlers.base import ComplexLocalCacheBase
-from pyrin.caching.local.items.complex import ComplexLocalCacheItem
+from pyrin.caching.local.items.complex import ComplexLocalCacheItem, \
+    FrozenComplexLocalCacheItem
+from pyrin.caching.local.containers.dict import OrderedDictContainer, FIFOContainer, \
+    LIFOContainer, LRUContainer
 
 
 @cache()
@@ -23,6 +28,17 @@ class ComplexLocalCache(ComplexLocalCacheBase):
 
     cache_name = 'complex'
     container_class = OrderedDictContainer
+    eviction_containers = {
+        EvictionPolicyEnum.FIFO: FIFOContainer,
+        EvictionPolicyEnum.LIFO: LIFOContainer,
+        EvictionPolicyEnum.LRU: LRUContainer,
+        EvictionPolicyEnum.LFU: LFUContainer,
+        EvictionPolicyEnum.TINY_LFU: TinyLFUContainer,
+    }
     cache_item_class = ComplexLocalCacheItem
+    cache_item_classes = {
+        CopyModeEnum.DEEP: ComplexLocalCacheItem,
+        CopyModeEnum.FREEZE: FrozenComplexLocalCacheItem,
+    }
     clearance_lock_class = Lock
     persistent_lock_class = Lock
@@ -60,3 +60,17 @@ class CacheVersionIsRequiredError(CachingLocalHandlersException):
     cache version is required error.
     """
     pass
+
+
+class InvalidEvictionPolicyError(CachingLocalHandlersException):
+    """
+    invalid eviction policy error.
+    """
+    pass
+
+
+class InvalidCopyModeError(CachingLocalHandlersException):
+    """
+    invalid copy mode error.
+    """
+    pass
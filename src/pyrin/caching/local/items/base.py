@@ -7,6 +7,8 @@ from copy import deepcopy
 
 import time
 
+import pyrin.utils.immutable as immutable_utils
+
 from pyrin.core.structs import CoreObject
 
 
@@ -186,3 +188,42 @@ class ComplexLocalCacheItemBase(LocalCacheItemBase):
         """
 
         return self._expire
+
+
+class FrozenComplexLocalCacheItemBase(ComplexLocalCacheItemBase):
+    """
+    frozen complex local cache item base class.
+
+    this type of cache item supports expire time.
+    it freezes the value once when it is cached and returns
+    the same read-only object on each hit, so it does not copy
+    the value on each get. the value could not be modified by
+    the callers, they should copy it if they need to modify it.
+
+    all application frozen complex cache items must be subclassed from this.
+    """
+
+    def _get_cached_value(self, value):
+        """
+        gets the cached value.
+
+        :param object value: value to be returned from cached.
+
+        :rtype: object
+        """
+
+        if self._refreshable is True and self.is_expired is False:
+            self.refresh()
+
+        return value
+
+    def _prepare_cache(self, value):
+        """
+        prepares value to be cached.
+
+        :param object value: value to be cached.
+
+        :rtype: object
+        """
+
+        return immutable_utils.freeze(value)
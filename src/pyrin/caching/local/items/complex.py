@@ -3,7 +3,8 @@
 caching local items complex module.
 """
 
-from pyrin.caching.local.items.base import ComplexLocalCacheItemBase
+from pyrin.caching.local.items.base import ComplexLocalCacheItemBase, \
+    FrozenComplexLocalCacheItemBase
 
 
 class ComplexLocalCacheItem(ComplexLocalCacheItemBase):
@@ -14,3 +15,13 @@ class ComplexLocalCacheItem(ComplexLocalCacheItemBase):
     it also keeps the deep copy of the value into the cache.
     """
     pass
+
+
+class FrozenComplexLocalCacheItem(FrozenComplexLocalCacheItemBase):
+    """
+    frozen complex local cache item class.
+
+    this type of cache item supports expire time.
+    it also keeps a read-only version of the value into the cache.
+    """
+    pass
@@ -3,10 +3,15 @@
 caching manager module.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
 import pyrin.application.services as application_services
+import pyrin.configuration.services as config_services
 
 from pyrin.caching import CachingPackage
-from pyrin.caching.interface import AbstractCache, AbstractExtendedLocalCache
+from pyrin.caching.interface import AbstractCache, AbstractExtendedLocalCache, \
+    AbstractRemoteCache
 from pyrin.core.structs import Manager, Context
 from pyrin.utils.custom_print import print_warning
 from pyrin.caching.exceptions import CacheNotFoundError, DuplicatedCacheError, \
@@ -29,6 +34,15 @@ class CachingManager(Manager):
 
         self._caches = Context()
 
+        # executor of refresh-ahead computations.
+        # it will be created on first usage.
+        self._refresh_executor = None
+        self._refresh_lock = Lock()
+
+        # futures of submitted refreshes which are not done yet.
+        # they are kept to be able to cancel pending ones on shutdown.
+        self._refresh_futures = set()
+
     def register_cache(self, instance, **options):
         """
         registers a new cache or replaces the existing one.
@@ -302,8 +316,8 @@ class CachingManager(Manager):
 
         :raises CacheNotFoundError: cache not found error.
 
-        :returns: hash of generated key.
-        :rtype: int
+        :returns: generated key.
+        :rtype: object
         """
 
         cache = self.get_cache(name)
@@ -416,6 +430,61 @@ class CachingManager(Manager):
             if cache.persistent is True:
                 self.load(name, **options)
 
+    def flush_all_stats(self):
+        """
+        sends the hit and miss counts of all remote caches to their servers.
+
+        hit and miss counts of remote caches are kept in process and will be
+        sent periodically. this method sends all remaining counts immediately.
+        """
+
+        for name, cache in self._caches.items():
+            if isinstance(cache, AbstractRemoteCache):
+                cache.flush_stats()
+
+    def submit_refresh(self, func, *args, **kwargs):
+        """
+        submits the given function to be called on a background refresh worker.
+
+        the number of workers will be get from `caching` config store.
+
+        :param function func: function to be called.
+        :param object args: function positional arguments.
+        :param object kwargs: function keyword arguments.
+        """
+
+        with self._refresh_lock:
+            if self._refresh_executor is None:
+                workers = config_services.get('caching', 'general', 'refresh_workers')
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix='cache_refresh')
+
+            future = self._refresh_executor.submit(func, *args, **kwargs)
+            self._refresh_futures.add(future)
+            future.add_done_callback(self._refresh_futures.discard)
+
+    def shutdown_refresh_workers(self):
+        """
+        shuts down background refresh workers.
+
+        pending refreshes will be cancelled, but the running
+        ones will be finished before this method returns.
+        the workers are detached under the lock, so refreshes which are
+        submitted meanwhile will be executed by new workers.
+        """
+
+        with self._refresh_lock:
+            executor = self._refresh_executor
+            futures = self._refresh_futures
+            self._refresh_executor = None
+            self._refresh_futures = set()
+
+        if executor is not None:
+            for future in list(futures):
+                future.cancel()
+
+            executor.shutdown(wait=True)
+
     def clear_required_caches(self):
         """
         clears all caches that are required.
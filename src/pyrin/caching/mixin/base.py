@@ -8,7 +8,8 @@ from abc import abstractmethod
 import pyrin.utils.function as func_utils
 import pyrin.security.session.services as session_services
 
-from pyrin.caching.structs import CacheableDict
+from pyrin.caching.binder import get_binder
+from pyrin.caching.encoder import CacheKeyEncoder
 from pyrin.core.exceptions import CoreNotImplementedError
 
 
@@ -75,8 +76,27 @@ class CacheMixinBase:
 class SimpleKeyGeneratorMixin:
     """
     simple key generator mixin class.
+
+    generated keys are the full key values, not their hash. so they could be
+    verified on each hit. the `get_key_digest` method could be used to get a
+    stable digest of a key which is identical across different processes.
     """
 
+    # key encoder to be used for getting digest of keys.
+    # it could be overridden in subclasses.
+    key_encoder = CacheKeyEncoder()
+
+    def get_key_digest(self, key):
+        """
+        gets the stable digest of given key.
+
+        :param object key: key to get its digest.
+
+        :rtype: str
+        """
+
+        return self.key_encoder.get_digest(key)
+
     def generate_key(self, func, parent, *args, **options):
         """
         generates a cache key from given inputs.
@@ -84,11 +104,11 @@ class SimpleKeyGeneratorMixin:
         :param function func: function to to be cached.
         :param type | object parent: parent class or instance of given function.
 
-        :returns: hash of generated key
-        :rtype: int
+        :returns: tuple[type parent, str function_name]
+        :rtype: tuple[type, str]
         """
 
-        return hash(self._generate_key(func, parent, *args, **options))
+        return self._generate_key(func, parent, *args, **options)
 
     def _generate_key(self, func, parent, *args, **options):
         """
@@ -145,11 +165,15 @@ class ComplexKeyGeneratorMixin(SimpleKeyGeneratorMixin):
                                      key generation. it will be get from `caching` config
                                      store if not provided.
 
-        :returns: hash of generated key
-        :rtype: int
+        :returns: tuple[type parent, str function_name,
+                        tuple inputs, object user,
+                        object component key,
+                        str timezone, str locale]
+
+        :rtype: tuple[type, str, tuple, object, object, str, str]
         """
 
-        return hash(self._generate_key(func, inputs, kw_inputs, *args, **options))
+        return self._generate_key(func, inputs, kw_inputs, *args, **options)
 
     def _generate_key(self, func, inputs, kw_inputs, *args, **options):
         """
@@ -164,11 +188,11 @@ class ComplexKeyGeneratorMixin(SimpleKeyGeneratorMixin):
                                      store if not provided.
 
         :returns: tuple[type parent, str function_name,
-                        dict inputs, object user,
+                        tuple inputs, object user,
                         object component key,
                         str timezone, str locale]
 
-        :rtype: tuple[type, str, dict, object, object, str, str]
+        :rtype: tuple[type, str, tuple, object, object, str, str]
         """
 
         current_request = session_services.get_safe_current_request()
@@ -186,8 +210,7 @@ class ComplexKeyGeneratorMixin(SimpleKeyGeneratorMixin):
             timezone = current_request.timezone.zone
             locale = current_request.locale
 
-        cacheable_inputs, parent = func_utils.get_inputs(func, inputs,
-                                                         kw_inputs, CacheableDict)
+        cacheable_inputs, parent = get_binder(func).bind(inputs, kw_inputs)
 
         parent_type, name = super()._generate_key(func, parent, *args, **options)
 
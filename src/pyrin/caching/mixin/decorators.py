@@ -5,6 +5,8 @@ caching mixin decorators module.
 
 from functools import update_wrapper
 
+from pyrin.caching.binder import get_binder
+
 
 def fast_cache(*old_method):
     """
@@ -95,6 +97,9 @@ def extended_fast_cache(*old_method, **options):
         :returns: method or property result.
         """
 
+        # the binder is compiled here to prevent inspecting the method on each call.
+        get_binder(method, bound=True)
+
         def wrapper(self, *args, **kwargs):
             """
             decorates the given method or property and makes it a lazy one.
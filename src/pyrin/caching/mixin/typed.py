@@ -3,10 +3,9 @@
 caching mixin typed module.
 """
 
-import pyrin.utils.function as func_utils
 import pyrin.security.session.services as session_services
 
-from pyrin.caching.structs import CacheableDict
+from pyrin.caching.binder import get_binder
 from pyrin.caching.mixin.base import CacheMixinBase
 
 
@@ -39,6 +38,8 @@ class ExtendedTypedCacheMixin(CacheMixinBase):
 
     this type of cache mixin, is the same as `TypedCacheMixin`, but it also
     considers method inputs and component key and current user in cache key generation.
+
+    note that the provided inputs must not include the instance or class itself.
     """
 
     _container = {}
@@ -49,14 +50,16 @@ class ExtendedTypedCacheMixin(CacheMixinBase):
         generates a cache key from given inputs.
 
         :param function func: function to be cached.
-        :param tuple inputs: function positional arguments.
+        :param tuple inputs: function positional arguments excluding the instance.
         :param dict kw_inputs: function keyword arguments.
 
         :keyword bool consider_user: specifies that current user must be included in
                                      key generation. defaults to True if not provided.
 
-        :returns: hash of generated key
-        :rtype: int
+        :returns: tuple[type cls, str function_name, tuple inputs,
+                        object user, object component key]
+
+        :rtype: tuple[type, str, tuple, object, object]
         """
 
         consider_user = options.get('consider_user', True)
@@ -64,8 +67,7 @@ class ExtendedTypedCacheMixin(CacheMixinBase):
         if consider_user is not False:
             current_user = session_services.get_safe_cacheable_current_user()
 
-        cacheable_inputs, parent = func_utils.get_inputs(func, inputs, kw_inputs,
-                                                         CacheableDict)
+        cacheable_inputs, parent = get_binder(func, bound=True).bind(inputs, kw_inputs)
         component_key = session_services.get_safe_component_custom_key()
 
-        return hash((cls, func.__name__, cacheable_inputs, current_user, component_key))
+        return cls, func.__name__, cacheable_inputs, current_user, component_key
@@ -3,7 +3,10 @@
 caching remote handlers base module.
 """
 
+import time
+
 from abc import abstractmethod
+from threading import Lock
 
 import pyrin.globalization.datetime.services as datetime_services
 import pyrin.configuration.services as config_services
@@ -11,6 +14,7 @@ import pyrin.logging.services as logging_services
 
 from pyrin.caching.interface import AbstractRemoteCache
 from pyrin.caching.mixin.base import ComplexKeyGeneratorMixin
+from pyrin.caching.remote.serializers.structs import ValueCodec
 from pyrin.core.exceptions import CoreNotImplementedError
 from pyrin.caching.exceptions import CacheNameIsRequiredError, InvalidCacheExpireTimeError
 
@@ -26,6 +30,10 @@ class RemoteCacheBase(ComplexKeyGeneratorMixin, AbstractRemoteCache):
     # it must be unique between all caches.
     cache_name = None
 
+    # a class type to be used for encoding and decoding values.
+    # it could be overridden in subclasses.
+    codec_class = ValueCodec
+
     LOGGER = logging_services.get_logger('caching.remote')
 
     def __init__(self, *args, **options):
@@ -40,8 +48,34 @@ class RemoteCacheBase(ComplexKeyGeneratorMixin, AbstractRemoteCache):
                                      included in cache key. if not provided, will
                                      be get from `caching` config store.
 
+        :keyword int stats_flush_interval: interval in milliseconds to send hit and
+                                           miss counts to the server. if not provided,
+                                           it will be get from `caching` config store.
+
+        :keyword str serializer: serializer name to be used for cached values.
+                                 if not provided, it will be get from `caching`
+                                 config store.
+        :enum serializer:
+            PICKLE = 'pickle'
+            MSGPACK = 'msgpack'
+            JSON = 'json'
+
+        :keyword str compression: compression name to be used for cached values.
+                                  if not provided, it will be get from `caching`
+                                  config store.
+        :enum compression:
+            ZLIB = 'zlib'
+
+        :keyword int compression_threshold: minimum size of serialized values in bytes
+                                            to be compressed. if not provided, it will
+                                            be get from `caching` config store.
+
         :raises CacheNameIsRequiredError: cache name is required error.
         :raises InvalidCacheExpireTimeError: invalid cache expire time error.
+        :raises InvalidSerializerError: invalid serializer error.
+        :raises SerializerIsNotAvailableError: serializer is not available error.
+        :raises InvalidCompressionError: invalid compression error.
+        :raises InvalidCompressionThresholdError: invalid compression threshold error.
         """
 
         super().__init__()
@@ -64,6 +98,23 @@ class RemoteCacheBase(ComplexKeyGeneratorMixin, AbstractRemoteCache):
             consider_user = configs.pop('consider_user')
         configs.pop('consider_user', None)
 
+        stats_flush_interval = options.get('stats_flush_interval',
+                                           configs.get('stats_flush_interval'))
+        configs.pop('stats_flush_interval', None)
+
+        serializer = options.get('serializer')
+        if serializer is None:
+            serializer = configs.get('serializer')
+        configs.pop('serializer', None)
+
+        compression = options.get('compression', configs.get('compression'))
+        configs.pop('compression', None)
+
+        compression_threshold = options.get('compression_threshold')
+        if compression_threshold is None:
+            compression_threshold = configs.get('compression_threshold')
+        configs.pop('compression_threshold', None)
+
         if expire < 0:
             raise InvalidCacheExpireTimeError('Cache expire time for cache [{name}] '
                                               'must be a non-negative integer.'
@@ -72,6 +123,12 @@ class RemoteCacheBase(ComplexKeyGeneratorMixin, AbstractRemoteCache):
         self._last_cleared_time = datetime_services.now()
         self._expire = expire
         self._consider_user = consider_user
+        self._stats_flush_interval = stats_flush_interval
+        self._pending_hits = 0
+        self._pending_misses = 0
+        self._last_stats_flush = time.monotonic()
+        self._stats_lock = Lock()
+        self._codec = self.codec_class(serializer, compression, compression_threshold)
         self._client = self._create_client(*args, kwargs=options, **configs)
 
     @abstractmethod
@@ -137,6 +194,116 @@ class RemoteCacheBase(ComplexKeyGeneratorMixin, AbstractRemoteCache):
 
         raise CoreNotImplementedError()
 
+    def _get_many(self, keys, default=None, **options):
+        """
+        gets the values of given keys from cache.
+
+        it gets each key separately by default.
+        this method is intended to be overridden in subclasses
+        to get all keys in a single round trip.
+
+        :param list keys: prepared keys to get their values from cache.
+        :param object default: value to be returned for keys which are not present.
+
+        :returns: list of values in the order of given keys.
+        :rtype: list
+        """
+
+        return [self._get(key, default=default, **options) for key in keys]
+
+    def _set_many(self, items, **options):
+        """
+        sets the given items into cached items.
+
+        it sets each item separately by default.
+        this method is intended to be overridden in subclasses
+        to set all items in a single round trip.
+
+        :param list[tuple[object, object]] items: prepared keys and values to be cached.
+        """
+
+        for key, value in items:
+            self._set(key, value, **options)
+
+    def _delete_many(self, keys, **options):
+        """
+        removes the given keys from cache.
+
+        it removes each key separately by default.
+        this method is intended to be overridden in subclasses
+        to remove all keys in a single round trip.
+
+        :param list keys: prepared keys to be removed.
+        """
+
+        for key in keys:
+            self._delete(key, **options)
+
+    def _delete(self, key, **options):
+        """
+        removes the given key from cache.
+
+        this method is intended to be overridden in subclasses.
+
+        :param object key: prepared key to be removed.
+
+        :raises CoreNotImplementedError: core not implemented error.
+        """
+
+        raise CoreNotImplementedError()
+
+    def _increase_hit(self, count=1):
+        """
+        increases hit count of this cache.
+
+        :param int count: number of hits. defaults to 1 if not provided.
+        """
+
+        self._record_stats(count, 0)
+
+    def _increase_miss(self, count=1):
+        """
+        increases miss count of this cache.
+
+        :param int count: number of misses. defaults to 1 if not provided.
+        """
+
+        self._record_stats(0, count)
+
+    def _record_stats(self, hits, misses):
+        """
+        records the given hit and miss counts in process.
+
+        recorded counts will be sent to the server when
+        `stats_flush_interval` is passed since the last flush.
+        it does nothing if `stats_flush_interval` is None.
+
+        :param int hits: number of hits.
+        :param int misses: number of misses.
+        """
+
+        if self._stats_flush_interval is None:
+            return
+
+        with self._stats_lock:
+            self._pending_hits += hits
+            self._pending_misses += misses
+            elapsed = (time.monotonic() - self._last_stats_flush) * 1000
+
+        if elapsed >= self._stats_flush_interval:
+            self.flush_stats()
+
+    def _flush_stats(self, hits, misses):
+        """
+        sends the given hit and miss counts to the server.
+
+        this method is intended to be overridden in subclasses.
+
+        :param int hits: number of hits to be added.
+        :param int misses: number of misses to be added.
+        """
+        pass
+
     def _prepare_key(self, key):
         """
         prepares the key to be used in cache.
@@ -251,10 +418,9 @@ class RemoteCacheBase(ComplexKeyGeneratorMixin, AbstractRemoteCache):
         :param object value: value to be cached.
         """
 
-        hashed_key = hash(key)
-        hashed_key = self._prepare_key(hashed_key)
+        prepared_key = self._prepare_key(key)
         prepared_value = self._prepare_for_set(value)
-        self._set(hashed_key, prepared_value, *args, **options)
+        self._set(prepared_key, prepared_value, *args, **options)
 
     def get(self, key, default=None, **options):
         """
@@ -268,14 +434,88 @@ class RemoteCacheBase(ComplexKeyGeneratorMixin, AbstractRemoteCache):
         :returns: object
         """
 
-        hashed_key = hash(key)
-        hashed_key = self._prepare_key(hashed_key)
-        result = self._get(hashed_key, default=default, **options)
+        prepared_key = self._prepare_key(key)
+        result = self._get(prepared_key, default=default, **options)
         if result in (None, default):
             return result
 
         return self._prepare_for_get(result)
 
+    def get_many(self, keys, default=None, **options):
+        """
+        gets the values of given keys from cache.
+
+        all values will be fetched in a single round trip if supported by the server.
+
+        :param list keys: hashable keys to get their values from cache.
+        :param object default: value to be returned for keys which are not present.
+
+        :returns: list of values in the order of given keys.
+        :rtype: list
+        """
+
+        if len(keys) == 0:
+            return []
+
+        prepared_keys = [self._prepare_key(key) for key in keys]
+        results = self._get_many(prepared_keys, default=default, **options)
+        hits = 0
+        for index, result in enumerate(results):
+            if result not in (None, default):
+                results[index] = self._prepare_for_get(result)
+                hits += 1
+
+        self._record_stats(hits, len(results) - hits)
+        return results
+
+    def set_many(self, items, **options):
+        """
+        sets the given items into cached items.
+
+        all items will be sent in a single round trip if supported by the server.
+
+        :param dict | list[tuple[object, object]] items: keys and values to be cached.
+        """
+
+        if isinstance(items, dict):
+            items = items.items()
+
+        prepared_items = [(self._prepare_key(key), self._prepare_for_set(value))
+                          for key, value in items]
+
+        if len(prepared_items) > 0:
+            self._set_many(prepared_items, **options)
+
+    def delete_many(self, keys, **options):
+        """
+        removes the given keys from cache.
+
+        all keys will be removed in a single round trip if supported by the server.
+        it does nothing for keys which are not present in the cache.
+
+        :param list keys: keys to be removed.
+        """
+
+        if len(keys) == 0:
+            return
+
+        self._delete_many([self._prepare_key(key) for key in keys], **options)
+
+    def flush_stats(self):
+        """
+        sends the hit and miss counts which are recorded in process to the server.
+        """
+
+        with self._stats_lock:
+            hits = self._pending_hits
+            misses = self._pending_misses
+            self._pending_hits = 0
+            self._pending_misses = 0
+            self._last_stats_flush = time.monotonic()
+
+        if hits > 0 or misses > 0:
+            self._flush_stats(hits, misses)
+
     def try_set(self, value, func, inputs, kw_inputs, *args, **options):
         """
         sets a new value into cached items.
@@ -363,7 +603,10 @@ class RemoteCacheBase(ComplexKeyGeneratorMixin, AbstractRemoteCache):
                        int expire: cached items expire time,
                        int hit: hit count,
                        int miss: miss count,
-                       float hit_ratio: hit ratio)
+                       float hit_ratio: hit ratio,
+                       int stats_flush_interval: stats flush interval,
+                       str serializer: serializer,
+                       str compressor: compressor)
         :rtype: dict
         """
 
@@ -374,7 +617,10 @@ class RemoteCacheBase(ComplexKeyGeneratorMixin, AbstractRemoteCache):
                     expire=self.expire,
                     hit=self.hit_count,
                     miss=self.miss_count,
-                    hit_ratio=hit_ratio)
+                    hit_ratio=hit_ratio,
+                    stats_flush_interval=self.stats_flush_interval,
+                    serializer=str(self.codec.serializer),
+                    compressor=str(self.codec.compressor))
 
     @property
     def persistent(self):
@@ -396,6 +642,28 @@ class RemoteCacheBase(ComplexKeyGeneratorMixin, AbstractRemoteCache):
 
         return self._expire
 
+    @property
+    def stats_flush_interval(self):
+        """
+        gets the interval of sending hit and miss counts to the server in milliseconds.
+
+        it returns None if hit and miss counts are not recorded.
+
+        :rtype: int
+        """
+
+        return self._stats_flush_interval
+
+    @property
+    def codec(self):
+        """
+        gets the codec which is used for encoding and decoding values of this cache.
+
+        :rtype: ValueCodec
+        """
+
+        return self._codec
+
     @property
     def client(self):
         """
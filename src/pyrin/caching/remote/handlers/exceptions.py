@@ -25,3 +25,10 @@ class HostnameOrUnixSocketRequiredError(CachingRemoteHandlersException):
     hostname or unix socket required error.
     """
     pass
+
+
+class InvalidMemcachedServerError(CachingRemoteHandlersException):
+    """
+    invalid memcached server error.
+    """
+    pass
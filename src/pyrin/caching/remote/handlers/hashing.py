@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+caching remote handlers hashing module.
+"""
+
+import hashlib
+
+from bisect import bisect
+from threading import Lock
+
+
+class KetamaHash:
+    """
+    ketama hash class.
+
+    it implements the ketama consistent hashing algorithm to distribute
+    keys between multiple nodes. each node is placed on a continuum using
+    multiple points, so adding or removing a node only moves the keys of
+    that node and other keys remain on their current nodes.
+    the points are compatible with libmemcached ketama distribution.
+    it could be used as `hasher` of `pymemcache.HashClient`.
+    """
+
+    # number of md5 digests for each node. each digest provides 4 points.
+    DIGESTS_PER_NODE = 40
+    POINTS_PER_DIGEST = 4
+
+    def __init__(self, nodes=None):
+        """
+        initializes an instance of KetamaHash.
+
+        :param list[str] nodes: initial node names.
+        """
+
+        super().__init__()
+
+        self._lock = Lock()
+        self._nodes = []
+
+        # sorted points of the continuum and their corresponding nodes.
+        # it is replaced as a whole on each change to be safe for concurrent reads.
+        # in the form of: tuple[list[int] points, list[str] nodes]
+        self._continuum = ([], [])
+
+        for node in nodes or []:
+            self.add_node(node)
+
+    def _get_digest(self, value):
+        """
+        gets the md5 digest of given value.
+
+        :param str | bytes value: value to get its digest.
+
+        :rtype: bytes
+        """
+
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+
+        return hashlib.md5(value).digest()
+
+    def _get_point(self, digest, index=0):
+        """
+        gets the point of given digest at the given index.
+
+        :param bytes digest: md5 digest.
+        :param int index: index of 4 bytes block of digest.
+
+        :rtype: int
+        """
+
+        offset = index * 4
+        return int.from_bytes(digest[offset:offset + 4], 'little')
+
+    def _build(self):
+        """
+        builds the continuum of current nodes.
+        """
+
+        continuum = []
+        for node in self._nodes:
+            for digest_index in range(self.DIGESTS_PER_NODE):
+                digest = self._get_digest('{node}-{index}'.format(node=node,
+                                                                  index=digest_index))
+                for point_index in range(self.POINTS_PER_DIGEST):
+                    continuum.append((self._get_point(digest, point_index), node))
+
+        continuum.sort()
+        self._continuum = ([point for point, node in continuum],
+                           [node for point, node in continuum])
+
+    def add_node(self, node):
+        """
+        adds the given node into the continuum.
+
+        it does nothing if the node is already added.
+
+        :param str node: node name.
+        """
+
+        with self._lock:
+            if node not in self._nodes:
+                self._nodes.append(node)
+                self._build()
+
+    def remove_node(self, node):
+        """
+        removes the given node from the continuum.
+
+        :param str node: node name.
+
+        :raises ValueError: value error.
+        """
+
+        with self._lock:
+            if node not in self._nodes:
+                raise ValueError('No such node [{node}] to remove.'.format(node=node))
+
+            self._nodes.remove(node)
+            self._build()
+
+    def get_node(self, key):
+        """
+        gets the node name which the given key belongs to.
+
+        it returns None if there is no node available.
+
+        :param str | bytes key: key to get its node.
+
+        :rtype: str
+        """
+
+        points, point_nodes = self._continuum
+        if len(points) <= 0:
+            return None
+
+        index = bisect(points, self._get_point(self._get_digest(key)))
+        if index >= len(points):
+            index = 0
+
+        return point_nodes[index]
+
+    @property
+    def nodes(self):
+        """
+        gets the current node names.
+
+        :rtype: list[str]
+        """
+
+        return list(self._nodes)
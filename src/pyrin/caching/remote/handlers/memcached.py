@@ -3,16 +3,15 @@
 caching remote handlers memcached module.
 """
 
-import pickle
-
-from pymemcache import Client
+from pymemcache import Client, PooledClient, HashClient
 
 from pyrin.caching.decorators import cache
 from pyrin.caching.exceptions import InvalidCacheLimitError
 from pyrin.caching.globals import NO_LIMIT
 from pyrin.caching.remote.handlers.base import RemoteCacheBase
+from pyrin.caching.remote.handlers.hashing import KetamaHash
 from pyrin.caching.remote.handlers.exceptions import HostnameOrUnixSocketRequiredError, \
-    BothHostnameAndUnixSocketProvidedError
+    BothHostnameAndUnixSocketProvidedError, InvalidMemcachedServerError
 
 
 @cache()
@@ -23,9 +22,16 @@ class Memcached(RemoteCacheBase):
 
     cache_name = 'memcached'
 
+    # memcached keeps the expire time of items in seconds.
+    EXPIRE_UNIT = 1000
+
     HIT_KEY = '__HIT_COUNT__'
     MISS_KEY = '__MISS_COUNT__'
 
+    # server statistics to be included in the stats of each node.
+    NODE_STATS = ('curr_items', 'bytes', 'limit_maxbytes', 'curr_connections',
+                  'get_hits', 'get_misses', 'evictions')
+
     def __init__(self, *args, **options):
         """
         initializes an instance of Memcached.
@@ -46,6 +52,10 @@ class Memcached(RemoteCacheBase):
                                      included in cache key. if not provided, will
                                      be get from `caching` config store.
 
+        :keyword int stats_flush_interval: interval in milliseconds to send hit and
+                                           miss counts to the server. if not provided,
+                                           it will be get from `caching` config store.
+
         :raises CacheNameIsRequiredError: cache name is required error.
         :raises InvalidCacheExpireTimeError: invalid cache expire time error.
         :raises InvalidCacheLimitError: invalid cache limit error.
@@ -83,6 +93,35 @@ class Memcached(RemoteCacheBase):
         :note hostname, port and unixsocket: both unixsocket and hostname, port
                                              could not be provided at the same time.
 
+        :keyword list[str] servers: a list of servers to distribute the keys between
+                                    them using ketama consistent hashing. each server
+                                    could be in the form of `hostname:port` or a path
+                                    to a unix socket file. if provided, `hostname`,
+                                    `port` and `unixsocket` will be ignored.
+
+        :keyword bool use_pooling: use a pool of connections for each server
+                                   which makes the client thread-safe.
+                                   defaults to False if not provided.
+
+        :keyword int max_pool_size: maximum number of connections in the pool of each
+                                    server. it is only used if `use_pooling=True` is
+                                    provided. defaults to no limit if not provided.
+
+        :keyword int pool_idle_timeout: milliseconds that an idle connection is kept in
+                                        the pool before being closed. it is only used if
+                                        `use_pooling=True` is provided. defaults to 0
+                                        which never closes idle connections.
+
+        :keyword int retry_attempts: number of times that a failed server will be
+                                     retried before marking it as dead. it is only
+                                     used if `servers` is provided.
+
+        :keyword int retry_timeout: milliseconds between retries of a failed server.
+                                    it is only used if `servers` is provided.
+
+        :keyword int dead_timeout: milliseconds before a dead server is added back.
+                                   it is only used if `servers` is provided.
+
         :keyword int connect_timeout: milliseconds to wait for a connection to
                                       the memcached server. defaults to `forever`
                                       (uses the underlying default socket timeout,
@@ -115,7 +154,9 @@ class Memcached(RemoteCacheBase):
         :raises HostnameOrUnixSocketRequiredError: hostname or unix socket
                                                    required error.
 
-        :rtype: pymemcache.Client
+        :raises InvalidMemcachedServerError: invalid memcached server error.
+
+        :rtype: pymemcache.Client | pymemcache.PooledClient | pymemcache.HashClient
         """
 
         if kwargs is None:
@@ -134,20 +175,13 @@ class Memcached(RemoteCacheBase):
         unixsocket = configs.pop('unixsocket', None)
         hostname = configs.pop('hostname', None)
         port = configs.pop('port', None)
-
-        if unixsocket is not None and (hostname is not None or port is not None):
-            raise BothHostnameAndUnixSocketProvidedError('Both hostname and unix socket could '
-                                                         'not be provided at the same time.')
-
-        if unixsocket is None and (hostname is None or port is None):
-            raise HostnameOrUnixSocketRequiredError('Hostname or unix socket must be provided '
-                                                    'to connect to memcached server.')
-
-        server = None
-        if unixsocket is not None:
-            server = unixsocket
-        else:
-            server = hostname, port
+        servers = configs.pop('servers', None)
+        use_pooling = configs.pop('use_pooling', False)
+        max_pool_size = configs.pop('max_pool_size', None)
+        pool_idle_timeout = configs.pop('pool_idle_timeout', None)
+        retry_attempts = configs.pop('retry_attempts', None)
+        retry_timeout = configs.pop('retry_timeout', None)
+        dead_timeout = configs.pop('dead_timeout', None)
 
         timeout = configs.get('timeout')
         if timeout is not None and timeout > 0:
@@ -159,33 +193,218 @@ class Memcached(RemoteCacheBase):
             connect_timeout = connect_timeout / 1000
             configs.update(connect_timeout=connect_timeout)
 
+        if use_pooling is True:
+            configs.update(max_pool_size=max_pool_size,
+                           pool_idle_timeout=(pool_idle_timeout or 0) / 1000)
+
         configs.update(serde=self)
-        client = Client(server, **configs)
+        if servers:
+            if retry_attempts is not None:
+                configs.update(retry_attempts=retry_attempts)
+
+            if retry_timeout is not None:
+                configs.update(retry_timeout=retry_timeout / 1000)
+
+            if dead_timeout is not None:
+                configs.update(dead_timeout=dead_timeout / 1000)
+
+            client = HashClient([self._get_server(item) for item in servers],
+                                hasher=KetamaHash, use_pooling=use_pooling is True,
+                                **configs)
+        else:
+            if unixsocket is not None and (hostname is not None or port is not None):
+                raise BothHostnameAndUnixSocketProvidedError('Both hostname and unix socket '
+                                                             'could not be provided at '
+                                                             'the same time.')
+
+            if unixsocket is None and (hostname is None or port is None):
+                raise HostnameOrUnixSocketRequiredError('Hostname or unix socket must be '
+                                                        'provided to connect to memcached '
+                                                        'server.')
+
+            server = None
+            if unixsocket is not None:
+                server = unixsocket
+            else:
+                server = hostname, port
+
+            client_class = Client
+            if use_pooling is True:
+                client_class = PooledClient
+
+            client = client_class(server, **configs)
+
         if self.limit != NO_LIMIT:
-            client.cache_memlimit(self.limit)
+            for node in self._get_nodes(client).values():
+                self._set_node_limit(node, self.limit)
 
         return client
 
-    def _increase_hit(self):
+    def _get_server(self, value):
+        """
+        gets the server spec of given value to be passed to memcached client.
+
+        :param str value: server in the form of `hostname:port`
+                          or a path to a unix socket file.
+
+        :raises InvalidMemcachedServerError: invalid memcached server error.
+
+        :rtype: tuple[str, int] | str
+        """
+
+        if not isinstance(value, str) or len(value.strip()) <= 0:
+            raise InvalidMemcachedServerError('Memcached server [{server}] is invalid.'
+                                              .format(server=value))
+
+        value = value.strip()
+        if value.startswith('/'):
+            return value
+
+        hostname, separator, port = value.rpartition(':')
+        hostname = hostname.strip('[]')
+        if len(separator) <= 0 or len(hostname) <= 0 or not port.isdigit():
+            raise InvalidMemcachedServerError('Memcached server [{server}] is invalid. '
+                                              'It must be in the form of "hostname:port" '
+                                              'or a path to a unix socket file.'
+                                              .format(server=value))
+
+        return hostname, int(port)
+
+    def _get_node_name(self, server):
+        """
+        gets the node name of given server spec.
+
+        :param tuple[str, int] | str server: server spec.
+
+        :rtype: str
         """
-        increases hit count of this cache.
+
+        if isinstance(server, (list, tuple)):
+            return '{hostname}:{port}'.format(hostname=server[0], port=server[1])
+
+        return server
+
+    def _get_nodes(self, client):
         """
+        gets all nodes of given client.
 
-        self.client.incr(self.HIT_KEY, 1, noreply=True)
+        :param pymemcache.Client | pymemcache.PooledClient | pymemcache.HashClient client:
+            memcached client.
 
-    def _increase_miss(self):
+        :returns: dict(str name: pymemcache.Client | pymemcache.PooledClient node)
+        :rtype: dict
         """
-        increases miss count of this cache.
+
+        if isinstance(client, HashClient):
+            return dict(client.clients)
+
+        return {self._get_node_name(client.server): client}
+
+    def _set_node_limit(self, node, limit):
         """
+        sets the memory size limit of given node.
 
-        self.client.incr(self.MISS_KEY, 1, noreply=True)
+        :param pymemcache.Client | pymemcache.PooledClient node: node client.
+        :param int limit: memory size limit in megabytes.
+        """
+
+        if isinstance(node, PooledClient):
+            with node.client_pool.get_and_release(destroy_on_fail=True) as connection:
+                connection.cache_memlimit(limit)
+        else:
+            node.cache_memlimit(limit)
+
+    def _get_node_status(self, node):
+        """
+        gets the status of given node.
+
+        it could be `alive`, `failed` or `dead`. failed nodes are being
+        retried and dead nodes are removed until `dead_timeout` is passed.
+
+        :param pymemcache.Client | pymemcache.PooledClient node: node client.
+
+        :rtype: str
+        """
+
+        if isinstance(self.client, HashClient):
+            if node.server in self.client._dead_clients:
+                return 'dead'
+
+            if node.server in self.client._failed_clients:
+                return 'failed'
+
+        return 'alive'
+
+    def _get_node_stats(self):
+        """
+        gets the statistic info of each node.
+
+        dead nodes will not be queried for server statistics and
+        nodes which could not be queried will be marked as failed.
+
+        :returns: dict(str name: dict(str status: node status,
+                                      int curr_items: current items count,
+                                      int bytes: used memory in bytes,
+                                      int limit_maxbytes: memory limit in bytes,
+                                      int curr_connections: current connections count,
+                                      int get_hits: server hit count,
+                                      int get_misses: server miss count,
+                                      int evictions: evicted items count))
+        :rtype: dict
+        """
+
+        result = dict()
+        for name, node in self._get_nodes(self.client).items():
+            status = self._get_node_status(node)
+            node_stats = dict(status=status)
+            result[name] = node_stats
+            if status == 'dead':
+                continue
+
+            # pooled clients return an empty dict on failure if `ignore_exc` is enabled.
+            try:
+                server_stats = node.stats()
+            except Exception:
+                server_stats = None
+
+            if not server_stats:
+                node_stats.update(status='failed')
+                continue
+
+            for key, value in server_stats.items():
+                if isinstance(key, bytes):
+                    key = key.decode()
+
+                if key in self.NODE_STATS:
+                    node_stats[key] = value
+
+        return result
+
+    def _flush_stats(self, hits, misses):
+        """
+        sends the given hit and miss counts to the server.
+
+        counts will be sent without waiting for the reply.
+
+        :param int hits: number of hits to be added.
+        :param int misses: number of misses to be added.
+        """
+
+        if hits > 0:
+            self.client.incr(self.HIT_KEY, hits, noreply=True)
+
+        if misses > 0:
+            self.client.incr(self.MISS_KEY, misses, noreply=True)
 
     def _clear(self):
         """
         clears all items from cache.
         """
 
-        self.client.flush_all(noreply=True)
+        if isinstance(self.client, HashClient):
+            self.client.flush_all()
+        else:
+            self.client.flush_all(noreply=True)
 
     def _set(self, key, value, *args, **options):
         """
@@ -211,6 +430,29 @@ class Memcached(RemoteCacheBase):
                         noreply=options.get('noreply'),
                         flags=options.get('flags'))
 
+    def _set_many(self, items, **options):
+        """
+        sets the given items into cached items in a single round trip.
+
+        :param list[tuple[str, object]] items: prepared keys and values to be cached.
+
+        :keyword int expire: expire time for these items in seconds.
+                             if not provided, it will be get from `expire` attribute.
+
+        :keyword bool noreply: True to not wait for the reply. if not
+                               provided, defaults to `caching` config store.
+
+        :keyword int flags: arbitrary bit field used for memcached server-specific flags.
+        """
+
+        expire = options.get('expire')
+        if expire is None:
+            expire = self.expire
+
+        self.client.set_multi(dict(items), expire=expire,
+                              noreply=options.get('noreply'),
+                              flags=options.get('flags'))
+
     def _get(self, key, default=None, **options):
         """
         gets the value from cache.
@@ -231,17 +473,61 @@ class Memcached(RemoteCacheBase):
         self._increase_hit()
         return result
 
+    def _get_many(self, keys, default=None, **options):
+        """
+        gets the values of given keys from cache in a single round trip.
+
+        :param list[str] keys: prepared keys to get their values from cache.
+        :param object default: value to be returned for keys which are not present.
+
+        :returns: list of values in the order of given keys.
+        :rtype: list
+        """
+
+        results = self.client.get_multi(keys)
+        return [results.get(key, default) for key in keys]
+
+    def _delete(self, key, **options):
+        """
+        removes the given key from cache.
+
+        :param str key: prepared key to be removed.
+
+        :keyword bool noreply: do not wait for reply from server.
+                               will be get from `caching` config store
+                               if not provided.
+        """
+
+        self.client.delete(key, noreply=options.get('noreply'))
+
+    def _delete_many(self, keys, **options):
+        """
+        removes the given keys from cache in a single round trip.
+
+        :param list[str] keys: prepared keys to be removed.
+
+        :keyword bool noreply: do not wait for reply from server.
+                               will be get from `caching` config store
+                               if not provided.
+        """
+
+        self.client.delete_multi(keys, noreply=options.get('noreply'))
+
     def _prepare_key(self, key):
         """
         prepares the key to be used in cache.
 
+        it returns the stable digest of given key, so the
+        same key results in the same prepared key on all
+        processes and hosts.
+
         :param object key: key to be cached.
 
         :returns: prepared key.
         :rtype: str
         """
 
-        return str(key)
+        return self.get_key_digest(key)
 
     def serialize(self, key, value):
         """
@@ -257,7 +543,7 @@ class Memcached(RemoteCacheBase):
         if isinstance(value, int):
             return value, 1
 
-        return pickle.dumps(value), 2
+        return self.codec.encode(value), 2
 
     def deserialize(self, key, value, flags=None):
         """
@@ -275,7 +561,7 @@ class Memcached(RemoteCacheBase):
         if flags == 1:
             return int(value)
 
-        return pickle.loads(value)
+        return self.codec.decode(value)
 
     def increment(self, key, value, noreply=False):
         """
@@ -292,9 +578,8 @@ class Memcached(RemoteCacheBase):
         :rtype: int
         """
 
-        hashed_key = hash(key)
-        hashed_key = self._prepare_key(hashed_key)
-        return self.client.incr(hashed_key, value, noreply)
+        prepared_key = self._prepare_key(key)
+        return self.client.incr(prepared_key, value, noreply)
 
     def decrement(self, key, value, noreply=False):
         """
@@ -311,9 +596,8 @@ class Memcached(RemoteCacheBase):
         :rtype: int
         """
 
-        hashed_key = hash(key)
-        hashed_key = self._prepare_key(hashed_key)
-        return self.client.decr(hashed_key, value, noreply)
+        prepared_key = self._prepare_key(key)
+        return self.client.decr(prepared_key, value, noreply)
 
     def contains(self, key):
         """
@@ -356,9 +640,8 @@ class Memcached(RemoteCacheBase):
         :param object key: key to be removed.
         """
 
-        hashed_key = hash(key)
-        hashed_key = self._prepare_key(hashed_key)
-        self.client.delete(hashed_key, noreply=options.get('noreply'))
+        prepared_key = self._prepare_key(key)
+        self._delete(prepared_key, **options)
 
     def touch(self, key, expire=0, noreply=None):
         """
@@ -377,13 +660,12 @@ class Memcached(RemoteCacheBase):
         :rtype: bool
         """
 
-        hashed_key = hash(key)
-        hashed_key = self._prepare_key(hashed_key)
+        prepared_key = self._prepare_key(key)
 
         if expire is None:
             expire = self.expire
 
-        return self.client.touch(hashed_key, expire=expire, noreply=noreply)
+        return self.client.touch(prepared_key, expire=expire, noreply=noreply)
 
     def add(self, key, value, expire=0, noreply=None, flags=None):
         """
@@ -404,13 +686,12 @@ class Memcached(RemoteCacheBase):
         :rtype: bool
         """
 
-        hashed_key = hash(key)
-        hashed_key = self._prepare_key(hashed_key)
+        prepared_key = self._prepare_key(key)
 
         if expire is None:
             expire = self.expire
 
-        return self.client.add(hashed_key, value, expire=expire, noreply=noreply, flags=flags)
+        return self.client.add(prepared_key, value, expire=expire, noreply=noreply, flags=flags)
 
     @property
     def stats(self):
@@ -424,12 +705,13 @@ class Memcached(RemoteCacheBase):
                        int hit: hit count,
                        int miss: miss count,
                        float hit_ratio: hit ratio,
-                       int limit: memory size limit)
+                       int limit: memory size limit,
+                       dict nodes: statistic info of each node)
         :rtype: dict
         """
 
         base_stats = super().stats
-        stats = dict(limit=self.limit)
+        stats = dict(limit=self.limit, nodes=self._get_node_stats())
         base_stats.update(stats)
         return base_stats
 
@@ -441,6 +723,7 @@ class Memcached(RemoteCacheBase):
         :rtype: int
         """
 
+        self.flush_stats()
         return self.client.get(self.HIT_KEY, default=0)
 
     @property
@@ -451,6 +734,7 @@ class Memcached(RemoteCacheBase):
         :rtype: int
         """
 
+        self.flush_stats()
         return self.client.get(self.MISS_KEY, default=0)
 
     @property
@@ -3,8 +3,6 @@
 caching remote handlers redis module.
 """
 
-import pickle
-
 import redis
 
 from pyrin.caching.decorators import cache
@@ -36,6 +34,10 @@ class Redis(RemoteCacheBase):
                                      included in cache key. if not provided, will
                                      be get from `caching` config store.
 
+        :keyword int stats_flush_interval: interval in milliseconds to send hit and
+                                           miss counts to the server. if not provided,
+                                           it will be get from `caching` config store.
+
         :raises CacheNameIsRequiredError: cache name is required error.
         :raises InvalidCacheExpireTimeError: invalid cache expire time error.
         """
@@ -128,19 +130,24 @@ class Redis(RemoteCacheBase):
         client = redis.Redis(**configs)
         return client
 
-    def _increase_hit(self):
-        """
-        increases hit count of this cache.
+    def _flush_stats(self, hits, misses):
         """
+        sends the given hit and miss counts to the server.
 
-        self.client.incr(self.HIT_KEY, 1)
+        both counts will be sent in a single round trip using a pipeline.
 
-    def _increase_miss(self):
-        """
-        increases miss count of this cache.
+        :param int hits: number of hits to be added.
+        :param int misses: number of misses to be added.
         """
 
-        self.client.incr(self.MISS_KEY, 1)
+        pipeline = self.client.pipeline(transaction=False)
+        if hits > 0:
+            pipeline.incrby(self.HIT_KEY, hits)
+
+        if misses > 0:
+            pipeline.incrby(self.MISS_KEY, misses)
+
+        pipeline.execute()
 
     def _clear(self):
         """
@@ -169,6 +176,31 @@ class Redis(RemoteCacheBase):
 
         self.client.set(key, value, px=expire)
 
+    def _set_many(self, items, **options):
+        """
+        sets the given items into cached items.
+
+        all items will be sent in a single round trip using a pipeline.
+
+        :param list[tuple[str, bytes]] items: prepared keys and values to be cached.
+
+        :keyword int expire: expire time for these items in milliseconds.
+                             if not provided, it will be get from `expire` attribute.
+        """
+
+        expire = options.get('expire')
+        if expire is None:
+            expire = self.expire
+
+        if expire == 0:
+            expire = None
+
+        pipeline = self.client.pipeline(transaction=False)
+        for key, value in items:
+            pipeline.set(key, value, px=expire)
+
+        pipeline.execute()
+
     def _get(self, key, default=None, **options):
         """
         gets the value from cache.
@@ -189,17 +221,55 @@ class Redis(RemoteCacheBase):
         self._increase_hit()
         return result
 
+    def _get_many(self, keys, default=None, **options):
+        """
+        gets the values of given keys from cache.
+
+        all values will be fetched in a single round trip using `MGET`.
+
+        :param list[str] keys: prepared keys to get their values from cache.
+        :param object default: value to be returned for keys which are not present.
+
+        :returns: list of values in the order of given keys.
+        :rtype: list
+        """
+
+        return [default if result is None else result
+                for result in self.client.mget(keys)]
+
+    def _delete(self, key, **options):
+        """
+        removes the given key from cache.
+
+        :param str key: prepared key to be removed.
+        """
+
+        self.client.delete(key)
+
+    def _delete_many(self, keys, **options):
+        """
+        removes the given keys from cache in a single round trip.
+
+        :param list[str] keys: prepared keys to be removed.
+        """
+
+        self.client.delete(*keys)
+
     def _prepare_key(self, key):
         """
         prepares the key to be used in cache.
 
+        it returns the stable digest of given key, so the
+        same key results in the same prepared key on all
+        processes and hosts.
+
         :param object key: key to be cached.
 
         :returns: prepared key.
         :rtype: str
         """
 
-        return str(key)
+        return self.get_key_digest(key)
 
     def _prepare_for_set(self, value):
         """
@@ -211,7 +281,7 @@ class Redis(RemoteCacheBase):
         :rtype: bytes
         """
 
-        return pickle.dumps(value)
+        return self.codec.encode(value)
 
     def _prepare_for_get(self, value):
         """
@@ -222,7 +292,7 @@ class Redis(RemoteCacheBase):
         :returns: prepared value.
         """
 
-        return pickle.loads(value)
+        return self.codec.decode(value)
 
     def increment(self, key, value):
         """
@@ -238,9 +308,8 @@ class Redis(RemoteCacheBase):
         :rtype: int
         """
 
-        hashed_key = hash(key)
-        hashed_key = self._prepare_key(hashed_key)
-        return self.client.incr(hashed_key, value)
+        prepared_key = self._prepare_key(key)
+        return self.client.incr(prepared_key, value)
 
     def decrement(self, key, value):
         """
@@ -256,9 +325,8 @@ class Redis(RemoteCacheBase):
         :rtype: int
         """
 
-        hashed_key = hash(key)
-        hashed_key = self._prepare_key(hashed_key)
-        return self.client.decr(hashed_key, value)
+        prepared_key = self._prepare_key(key)
+        return self.client.decr(prepared_key, value)
 
     def contains(self, key):
         """
@@ -269,9 +337,8 @@ class Redis(RemoteCacheBase):
         :rtype: bool
         """
 
-        hashed_key = hash(key)
-        hashed_key = self._prepare_key(hashed_key)
-        result = self.client.exists(hashed_key)
+        prepared_key = self._prepare_key(key)
+        result = self.client.exists(prepared_key)
         return result > 0
 
     def pop(self, key, default=None):
@@ -299,9 +366,8 @@ class Redis(RemoteCacheBase):
         :param object key: key to be removed.
         """
 
-        hashed_key = hash(key)
-        hashed_key = self._prepare_key(hashed_key)
-        self.client.delete(hashed_key)
+        prepared_key = self._prepare_key(key)
+        self._delete(prepared_key, **options)
 
     def touch(self, key):
         """
@@ -313,9 +379,8 @@ class Redis(RemoteCacheBase):
         :rtype: bool
         """
 
-        hashed_key = hash(key)
-        hashed_key = self._prepare_key(hashed_key)
-        return self.client.touch(hashed_key)
+        prepared_key = self._prepare_key(key)
+        return self.client.touch(prepared_key)
 
     @property
     def stats(self):
@@ -346,6 +411,7 @@ class Redis(RemoteCacheBase):
         :rtype: int
         """
 
+        self.flush_stats()
         return int(self.client.get(self.HIT_KEY) or 0)
 
     @property
@@ -356,4 +422,5 @@ class Redis(RemoteCacheBase):
         :rtype: int
         """
 
+        self.flush_stats()
         return int(self.client.get(self.MISS_KEY) or 0)
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""
+caching remote serializers package.
+"""
+
+from pyrin.packaging.base import Package
+
+
+class CachingRemoteSerializersPackage(Package):
+    """
+    caching remote serializers package class.
+    """
+
+    NAME = __name__
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+caching remote serializers base module.
+"""
+
+from abc import abstractmethod
+
+from pyrin.core.structs import CoreObject
+from pyrin.core.exceptions import CoreNotImplementedError
+
+
+class SerializerBase(CoreObject):
+    """
+    serializer base class.
+
+    all remote cache serializers must be subclassed from this.
+    """
+
+    # a unique code for this serializer between 1 and 15.
+    # it will be written into the header of serialized values,
+    # so it must never be changed after values have been cached.
+    code = None
+
+    def is_available(self):
+        """
+        gets a value indicating that this serializer could be used.
+
+        it could be overridden in subclasses which require optional dependencies.
+
+        :rtype: bool
+        """
+
+        return True
+
+    @abstractmethod
+    def dumps(self, value):
+        """
+        serializes the given value.
+
+        :param object value: value to be serialized.
+
+        :raises CoreNotImplementedError: core not implemented error.
+
+        :rtype: bytes
+        """
+
+        raise CoreNotImplementedError()
+
+    @abstractmethod
+    def loads(self, data):
+        """
+        deserializes the given data.
+
+        :param bytes data: data to be deserialized.
+
+        :raises CoreNotImplementedError: core not implemented error.
+
+        :returns: object
+        """
+
+        raise CoreNotImplementedError()
+
+
+class CompressorBase(CoreObject):
+    """
+    compressor base class.
+
+    all remote cache compressors must be subclassed from this.
+    """
+
+    # a unique code for this compressor between 1 and 7.
+    # it will be written into the header of compressed values,
+    # so it must never be changed after values have been cached.
+    code = None
+
+    @abstractmethod
+    def compress(self, data):
+        """
+        compresses the given data.
+
+        :param bytes data: data to be compressed.
+
+        :raises CoreNotImplementedError: core not implemented error.
+
+        :rtype: bytes
+        """
+
+        raise CoreNotImplementedError()
+
+    @abstractmethod
+    def decompress(self, data):
+        """
+        decompresses the given data.
+
+        :param bytes data: data to be decompressed.
+
+        :raises CoreNotImplementedError: core not implemented error.
+
+        :rtype: bytes
+        """
+
+        raise CoreNotImplementedError()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+caching remote serializers exceptions module.
+"""
+
+from pyrin.core.exceptions import CoreException
+
+
+class CachingRemoteSerializersException(CoreException):
+    """
+    caching remote serializers exception.
+    """
+    pass
+
+
+class InvalidSerializerError(CachingRemoteSerializersException):
+    """
+    invalid serializer error.
+    """
+    pass
+
+
+class InvalidCompressionError(CachingRemoteSerializersException):
+    """
+    invalid compression error.
+    """
+    pass
+
+
+class InvalidCompressionThresholdError(CachingRemoteSerializersException):
+    """
+    invalid compression threshold error.
+    """
+    pass
+
+
+class SerializerIsNotAvailableError(CachingRemoteSerializersException):
+    """
+    serializer is not available error.
+    """
+    pass
+
+
+class UnknownSerializedValueHeaderError(CachingRemoteSerializersException):
+    """
+    unknown serialized value header error.
+    """
+    pass
@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+"""
+caching remote serializers handlers module.
+"""
+
+import json
+import pickle
+import struct
+import zlib
+
+from uuid import UUID
+from decimal import Decimal
+from datetime import datetime, date, time, timedelta, timezone
+
+from pyrin.caching.remote.serializers.base import SerializerBase, CompressorBase
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# codes of complex types which are not supported by msgpack and json.
+# they are used as msgpack ext type codes and json type markers.
+DATETIME_CODE = 1
+DATE_CODE = 2
+TIME_CODE = 3
+UUID_CODE = 4
+DECIMAL_CODE = 5
+
+
+def _get_offset(value):
+    """
+    gets the utc offset of given datetime or time in seconds.
+
+    it returns None if the value is naive.
+
+    :param datetime | time value: value to get its offset.
+
+    :rtype: int
+    """
+
+    offset = value.utcoffset()
+    if offset is None:
+        return None
+
+    return int(offset.total_seconds())
+
+
+def _get_timezone(offset):
+    """
+    gets a fixed offset timezone for given utc offset.
+
+    it returns None if offset is None.
+
+    :param int offset: utc offset in seconds.
+
+    :rtype: timezone
+    """
+
+    if offset is None:
+        return None
+
+    return timezone(timedelta(seconds=offset))
+
+
+def to_complex_parts(value):
+    """
+    gets the type code and parts of given complex value.
+
+    the parts only contain msgpack and json compatible values.
+    it returns None if the type of value is not supported.
+    note that timezones are kept as fixed utc offsets.
+
+    :param object value: value to get its parts.
+
+    :returns: tuple[int code, list parts]
+    :rtype: tuple[int, list]
+    """
+
+    if isinstance(value, datetime):
+        return DATETIME_CODE, [value.year, value.month, value.day, value.hour,
+                               value.minute, value.second, value.microsecond,
+                               _get_offset(value)]
+
+    if isinstance(value, date):
+        return DATE_CODE, [value.year, value.month, value.day]
+
+    if isinstance(value, time):
+        return TIME_CODE, [value.hour, value.minute, value.second,
+                           value.microsecond, _get_offset(value)]
+
+    if isinstance(value, UUID):
+        return UUID_CODE, [value.hex]
+
+    if isinstance(value, Decimal):
+        return DECIMAL_CODE, [str(value)]
+
+    return None
+
+
+def from_complex_parts(code, parts):
+    """
+    creates the complex value of given type code and parts.
+
+    it returns None if the code is not supported.
+
+    :param int code: type code of value.
+    :param list parts: parts of value.
+
+    :returns: datetime | date | time | UUID | Decimal
+    """
+
+    if code == DATETIME_CODE:
+        return datetime(*parts[:7], tzinfo=_get_timezone(parts[7]))
+
+    if code == DATE_CODE:
+        return date(*parts)
+
+    if code == TIME_CODE:
+        return time(*parts[:4], tzinfo=_get_timezone(parts[4]))
+
+    if code == UUID_CODE:
+        return UUID(parts[0])
+
+    if code == DECIMAL_CODE:
+        return Decimal(parts[0])
+
+    return None
+
+
+class PickleSerializer(SerializerBase):
+    """
+    pickle serializer class.
+
+    it supports all picklable python objects.
+    """
+
+    code = 1
+
+    def dumps(self, value):
+        """
+        serializes the given value using the highest pickle protocol.
+
+        :param object value: value to be serialized.
+
+        :rtype: bytes
+        """
+
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data):
+        """
+        deserializes the given data.
+
+        :param bytes data: data to be deserialized.
+
+        :returns: object
+        """
+
+        return pickle.loads(data)
+
+
+class MessagePackSerializer(SerializerBase):
+    """
+    message pack serializer class.
+
+    it supports msgpack compatible types and datetime, date, time, uuid and
+    decimal values which are kept as msgpack extension types. to be able to use
+    this serializer you must install msgpack using `pip install pyrin[msgpack]`.
+    """
+
+    code = 2
+
+    # structs of packed datetime, date and time values and their utc offset.
+    STRUCTS = {DATETIME_CODE: struct.Struct('>HBBBBBI'),
+               DATE_CODE: struct.Struct('>HBB'),
+               TIME_CODE: struct.Struct('>BBBI')}
+    OFFSET_STRUCT = struct.Struct('>i')
+
+    def is_available(self):
+        """
+        gets a value indicating that msgpack is installed.
+
+        :rtype: bool
+        """
+
+        return msgpack is not None
+
+    def dumps(self, value):
+        """
+        serializes the given value.
+
+        :param object value: value to be serialized.
+
+        :rtype: bytes
+        """
+
+        return msgpack.packb(value, use_bin_type=True, default=self._encode)
+
+    def loads(self, data):
+        """
+        deserializes the given data.
+
+        :param bytes data: data to be deserialized.
+
+        :returns: object
+        """
+
+        return msgpack.unpackb(data, raw=False, ext_hook=self._decode)
+
+    def _encode(self, value):
+        """
+        encodes the given value which is not supported by msgpack.
+
+        datetime, date and time values are packed into fixed size structs and
+        their utc offset is appended if available. uuid values are kept as
+        their bytes and decimal values as their string representation.
+
+        :param object value: value to be encoded.
+
+        :raises TypeError: type error.
+
+        :rtype: msgpack.ExtType
+        """
+
+        result = to_complex_parts(value)
+        if result is None:
+            raise TypeError('Object of type [{type}] is not msgpack serializable.'
+                            .format(type=type(value)))
+
+        code, parts = result
+        if code == UUID_CODE:
+            return msgpack.ExtType(code, value.bytes)
+
+        if code == DECIMAL_CODE:
+            return msgpack.ExtType(code, parts[0].encode('ascii'))
+
+        offset = None
+        if code != DATE_CODE:
+            offset = parts.pop()
+
+        data = self.STRUCTS[code].pack(*parts)
+        if offset is not None:
+            data += self.OFFSET_STRUCT.pack(offset)
+
+        return msgpack.ExtType(code, data)
+
+    def _decode(self, code, data):
+        """
+        decodes the given msgpack extension type.
+
+        :param int code: extension type code.
+        :param bytes data: extension data.
+
+        :returns: object
+        """
+
+        if code == UUID_CODE:
+            return UUID(bytes=data)
+
+        if code == DECIMAL_CODE:
+            return Decimal(data.decode('ascii'))
+
+        value_struct = self.STRUCTS.get(code)
+        if value_struct is None:
+            return msgpack.ExtType(code, data)
+
+        parts = list(value_struct.unpack_from(data))
+        if code != DATE_CODE:
+            offset = None
+            if len(data) > value_struct.size:
+                offset = self.OFFSET_STRUCT.unpack_from(data, value_struct.size)[0]
+
+            parts.append(offset)
+
+        return from_complex_parts(code, parts)
+
+
+class JSONSerializer(SerializerBase):
+    """
+    json serializer class.
+
+    it supports json compatible types and datetime, date, time, uuid and
+    decimal values which are kept as marked objects. note that tuples will
+    be deserialized as lists.
+    """
+
+    code = 3
+
+    # the key of objects which contain a complex value.
+    # in the form of: {TYPE_KEY: [int code, list parts]}
+    TYPE_KEY = '__pyrin_type__'
+
+    def dumps(self, value):
+        """
+        serializes the given value.
+
+        :param object value: value to be serialized.
+
+        :rtype: bytes
+        """
+
+        return json.dumps(value, separators=(',', ':'), ensure_ascii=False,
+                          default=self._encode).encode('utf-8')
+
+    def loads(self, data):
+        """
+        deserializes the given data.
+
+        :param bytes data: data to be deserialized.
+
+        :returns: object
+        """
+
+        return json.loads(bytes(data).decode('utf-8'), object_hook=self._decode)
+
+    def _encode(self, value):
+        """
+        encodes the given value which is not supported by json.
+
+        :param object value: value to be encoded.
+
+        :raises TypeError: type error.
+
+        :rtype: dict
+        """
+
+        result = to_complex_parts(value)
+        if result is None:
+            raise TypeError('Object of type [{type}] is not json serializable.'
+                            .format(type=type(value)))
+
+        return {self.TYPE_KEY: result}
+
+    def _decode(self, value):
+        """
+        decodes the given json object.
+
+        :param dict value: json object to be decoded.
+
+        :returns: object
+        """
+
+        if len(value) == 1 and self.TYPE_KEY in value:
+            code, parts = value[self.TYPE_KEY]
+            return from_complex_parts(code, parts)
+
+        return value
+
+
+class ZlibCompressor(CompressorBase):
+    """
+    zlib compressor class.
+    """
+
+    code = 1
+
+    # compression level between 1 and 9. lower levels
+    # are faster but result in bigger values.
+    level = 1
+
+    def compress(self, data):
+        """
+        compresses the given data.
+
+        :param bytes data: data to be compressed.
+
+        :rtype: bytes
+        """
+
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data):
+        """
+        decompresses the given data.
+
+        :param bytes data: data to be decompressed.
+
+        :rtype: bytes
+        """
+
+        return zlib.decompress(data)
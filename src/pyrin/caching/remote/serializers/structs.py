@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+caching remote serializers structs module.
+"""
+
+import pickle
+
+from pyrin.core.structs import CoreObject
+from pyrin.caching.enumerations import SerializerEnum, CompressionEnum
+from pyrin.caching.remote.serializers.handlers import PickleSerializer, \
+    MessagePackSerializer, JSONSerializer, ZlibCompressor
+from pyrin.caching.remote.serializers.exceptions import InvalidSerializerError, \
+    InvalidCompressionError, InvalidCompressionThresholdError, \
+    SerializerIsNotAvailableError, UnknownSerializedValueHeaderError
+
+
+class ValueCodec(CoreObject):
+    """
+    value codec class.
+
+    it serializes values with the configured serializer and compresses
+    the result if it is bigger than the compression threshold.
+
+    each encoded value starts with a single header byte. the lower four bits
+    are the code of the serializer and the next three bits are the code of the
+    compressor, or zero if the value is not compressed. the header byte is
+    always less than `0x80`, so values which have been pickled before adding
+    the header, which start with `0x80`, could still be decoded. values are
+    decoded based on their own header, so changing the serializer or
+    compression of a cache does not break the values which are already cached.
+    """
+
+    # serializer classes of each serializer name.
+    # it could be overridden in subclasses.
+    serializer_classes = {
+        SerializerEnum.PICKLE: PickleSerializer,
+        SerializerEnum.MSGPACK: MessagePackSerializer,
+        SerializerEnum.JSON: JSONSerializer,
+    }
+
+    # compressor classes of each compression name.
+    # it could be overridden in subclasses.
+    compressor_classes = {
+        CompressionEnum.ZLIB: ZlibCompressor,
+    }
+
+    # the first byte of values which have been pickled without a header.
+    LEGACY_PICKLE_HEADER = 0x80
+
+    SERIALIZER_MASK = 0x0F
+    COMPRESSOR_SHIFT = 4
+
+    def __init__(self, serializer, compression=None, compression_threshold=None):
+        """
+        initializes an instance of ValueCodec.
+
+        :param str serializer: serializer name to be used for encoding values.
+        :enum serializer:
+            PICKLE = 'pickle'
+            MSGPACK = 'msgpack'
+            JSON = 'json'
+
+        :param str compression: compression name to be used for encoding values.
+                                it could be None to disable compression.
+        :enum compression:
+            ZLIB = 'zlib'
+
+        :param int compression_threshold: minimum size of serialized values in
+                                          bytes to be compressed. it must be
+                                          provided if compression is set.
+
+        :raises InvalidSerializerError: invalid serializer error.
+        :raises SerializerIsNotAvailableError: serializer is not available error.
+        :raises InvalidCompressionError: invalid compression error.
+        :raises InvalidCompressionThresholdError: invalid compression threshold error.
+        """
+
+        super().__init__()
+
+        serializer_class = self.serializer_classes.get(serializer)
+        if serializer_class is None:
+            raise InvalidSerializerError('Serializer [{serializer}] is invalid. it must '
+                                         'be one of {values}.'
+                                         .format(serializer=serializer,
+                                                 values=list(self.serializer_classes)))
+
+        compressor_class = None
+        if compression is not None:
+            compressor_class = self.compressor_classes.get(compression)
+            if compressor_class is None:
+                raise InvalidCompressionError('Compression [{compression}] is invalid. '
+                                              'it must be one of {values} or None.'
+                                              .format(compression=compression,
+                                                      values=list(self.compressor_classes)))
+
+            if not isinstance(compression_threshold, int) or compression_threshold < 0:
+                raise InvalidCompressionThresholdError('Compression threshold must be a '
+                                                       'non-negative integer.')
+
+        # a dict containing serializers and compressors of each code.
+        # they will be created on first usage.
+        # in the form of: {int code: SerializerBase | CompressorBase instance}
+        self._serializers = {}
+        self._compressors = {}
+
+        self._serializer = self._get_serializer(serializer_class.code)
+        self._compressor = None
+        if compressor_class is not None:
+            self._compressor = self._get_compressor(compressor_class.code)
+
+        self._compression_threshold = compression_threshold
+
+    def _get_serializer(self, code):
+        """
+        gets the serializer with given code.
+
+        :param int code: serializer code.
+
+        :raises UnknownSerializedValueHeaderError: unknown serialized value header error.
+        :raises SerializerIsNotAvailableError: serializer is not available error.
+
+        :rtype: SerializerBase
+        """
+
+        serializer = self._serializers.get(code)
+        if serializer is None:
+            for serializer_class in self.serializer_classes.values():
+                if serializer_class.code == code:
+                    serializer = serializer_class()
+                    break
+            else:
+                raise UnknownSerializedValueHeaderError('Serializer with code [{code}] '
+                                                        'does not exist.'.format(code=code))
+
+            if serializer.is_available() is not True:
+                raise SerializerIsNotAvailableError('Serializer [{serializer}] is not '
+                                                    'available. make sure that its '
+                                                    'dependencies are installed.'
+                                                    .format(serializer=serializer))
+
+            self._serializers[code] = serializer
+
+        return serializer
+
+    def _get_compressor(self, code):
+        """
+        gets the compressor with given code.
+
+        :param int code: compressor code.
+
+        :raises UnknownSerializedValueHeaderError: unknown serialized value header error.
+
+        :rtype: CompressorBase
+        """
+
+        compressor = self._compressors.get(code)
+        if compressor is None:
+            for compressor_class in self.compressor_classes.values():
+                if compressor_class.code == code:
+                    compressor = compressor_class()
+                    break
+            else:
+                raise UnknownSerializedValueHeaderError('Compressor with code [{code}] '
+                                                        'does not exist.'.format(code=code))
+
+            self._compressors[code] = compressor
+
+        return compressor
+
+    def encode(self, value):
+        """
+        encodes the given value.
+
+        the result will be compressed if it is bigger than the compression
+        threshold and the compressed result is smaller than the original one.
+
+        :param object value: value to be encoded.
+
+        :rtype: bytes
+        """
+
+        data = self._serializer.dumps(value)
+        header = self._serializer.code
+        if self._compressor is not None and len(data) >= self._compression_threshold:
+            compressed = self._compressor.compress(data)
+            if len(compressed) < len(data):
+                data = compressed
+                header |= self._compressor.code << self.COMPRESSOR_SHIFT
+
+        return bytes((header,)) + data
+
+    def decode(self, data):
+        """
+        decodes the given data.
+
+        :param bytes data: data to be decoded.
+
+        :raises UnknownSerializedValueHeaderError: unknown serialized value header error.
+        :raises SerializerIsNotAvailableError: serializer is not available error.
+
+        :returns: object
+        """
+
+        header = data[0]
+        if header == self.LEGACY_PICKLE_HEADER:
+            return pickle.loads(data)
+
+        payload = memoryview(data)[1:]
+        compressor_code = header >> self.COMPRESSOR_SHIFT
+        if compressor_code > 0:
+            payload = self._get_compressor(compressor_code).decompress(payload)
+
+        serializer = self._get_serializer(header & self.SERIALIZER_MASK)
+        return serializer.loads(payload)
+
+    @property
+    def serializer(self):
+        """
+        gets the serializer of this codec.
+
+        :rtype: SerializerBase
+        """
+
+        return self._serializer
+
+    @property
+    def compressor(self):
+        """
+        gets the compressor of this codec.
+
+        it returns None if compression is disabled.
+
+        :rtype: CompressorBase
+        """
+
+        return self._compressor
+
+    @property
+    def compression_threshold(self):
+        """
+        gets the minimum size of serialized values in bytes to be compressed.
+
+        :rtype: int
+        """
+
+        return self._compression_threshold
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+caching response package.
+"""
+
+from pyrin.packaging.base import Package
+
+
+class CachingResponsePackage(Package):
+    """
+    caching response package class.
+    """
+
+    NAME = __name__
+    COMPONENT_NAME = 'caching.response.component'
+    DEPENDS = ['pyrin.caching']
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""
+caching response component module.
+"""
+
+from pyrin.application.decorators import component
+from pyrin.application.structs import Component
+from pyrin.caching.response import CachingResponsePackage
+from pyrin.caching.response.manager import CachingResponseManager
+
+
+@component(CachingResponsePackage.COMPONENT_NAME)
+class CachingResponseComponent(Component, CachingResponseManager):
+    """
+    caching response component class.
+    """
+    pass
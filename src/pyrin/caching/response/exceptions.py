@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""
+caching response exceptions module.
+"""
+
+from pyrin.core.exceptions import CoreException
+
+
+class CachingResponseManagerException(CoreException):
+    """
+    caching response manager exception.
+    """
+    pass
+
+
+class InvalidResponseCacheError(CachingResponseManagerException):
+    """
+    invalid response cache error.
+    """
+    pass
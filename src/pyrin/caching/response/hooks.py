@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+caching response hooks module.
+"""
+
+import pyrin.caching.response.services as response_cache_services
+
+from pyrin.application.decorators import application_hook
+from pyrin.application.hooks import ApplicationHookBase
+
+
+@application_hook()
+class ApplicationHook(ApplicationHookBase):
+    """
+    application hook class.
+    """
+
+    def finalize_transaction(self, response, **options):
+        """
+        this method will be called after a request has been fully processed.
+
+        :param CoreResponse response: response object.
+
+        :rtype: CoreResponse | tuple
+        """
+
+        response_cache_services.store(response, **options)
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""
+caching response manager module.
+"""
+
+from hashlib import blake2b
+from threading import Lock
+
+import pyrin.caching.services as caching_services
+import pyrin.configuration.services as config_services
+import pyrin.processor.response.services as response_services
+import pyrin.security.session.services as session_services
+import pyrin.utils.headers as header_utils
+import pyrin.utils.misc as misc_utils
+import pyrin.utils.unique_id as uuid_utils
+
+from pyrin.core.structs import Manager, DTO
+from pyrin.core.enumerations import HTTPMethodEnum, SuccessfulResponseCodeEnum
+from pyrin.caching.response import CachingResponsePackage
+from pyrin.processor.response.wrappers.base import CoreResponse
+from pyrin.security.session.enumerations import RequestContextEnum
+from pyrin.caching.response.exceptions import InvalidResponseCacheError
+
+
+class CachingResponseManager(Manager):
+    """
+    caching response manager class.
+
+    it caches serialized responses of routes which have `cache_response` option.
+    the key of each cached response consists of route rule, request inputs,
+    paging params, timezone, locale, component key and optionally the current user.
+    it also contains the current version of each tag of the route. so invalidating
+    a tag changes the keys of all related responses and their old values will be
+    expired by the cache itself.
+    """
+
+    package_class = CachingResponsePackage
+
+    # only responses of these methods will be cached.
+    CACHEABLE_METHODS = (HTTPMethodEnum.GET, HTTPMethodEnum.HEAD)
+
+    # these are the first part of response and tag keys, to
+    # prevent collision with other keys of the same cache.
+    RESPONSE_KEY_PREFIX = 'pyrin.caching.response'
+    TAG_KEY_PREFIX = 'pyrin.caching.response.tag'
+
+    # size of etag digests in bytes.
+    ETAG_DIGEST_SIZE = 16
+
+    def __init__(self):
+        """
+        initializes an instance of CachingResponseManager.
+        """
+
+        super().__init__()
+
+        self._lock = Lock()
+
+        # names of all caches that are used by routes.
+        # it is used to invalidate tags on all of them.
+        self._cache_names = set()
+
+    def get_cache_name(self, cache_response):
+        """
+        gets the cache name to be used for responses of a route.
+
+        it returns None if responses must not be cached.
+
+        :param bool | str cache_response: the name of a registered cache or True
+                                          to use the default cache for responses.
+                                          False or None means no caching.
+
+        :raises InvalidResponseCacheError: invalid response cache error.
+
+        :rtype: str
+        """
+
+        if cache_response in (None, False):
+            return None
+
+        name = cache_response
+        if cache_response is True:
+            name = config_services.get('caching', 'response', 'cache_name')
+
+        if not isinstance(name, str) or name.strip() == '':
+            raise InvalidResponseCacheError('Response cache [{cache}] is invalid. it must be '
+                                            'True or the name of a registered cache.'
+                                            .format(cache=cache_response))
+
+        with self._lock:
+            self._cache_names.add(name)
+
+        return name
+
+    def get(self, name, rule, inputs, **options):
+        """
+        gets the cached response of current request.
+
+        it returns None if the response is not cached or current request
+        method is not cacheable. in case of a miss, the required info to cache
+        the response will be added into current request context. if the request
+        has a matching `If-None-Match` header, a `304` response will be returned.
+
+        :param str name: cache name.
+        :param str rule: url rule of the route.
+        :param dict inputs: view function inputs.
+
+        :keyword int expire: expire time of cached response in milliseconds.
+                             if not provided, it will be get from `response`
+                             section of `caching` config store.
+
+        :keyword str | list[str] tags: tags of the route.
+
+        :keyword bool consider_user: specifies that current user must be included in
+                                     cache key. if not provided, it will be get from
+                                     `response` section of `caching` config store.
+
+        :raises CacheNotFoundError: cache not found error.
+
+        :rtype: CoreResponse
+        """
+
+        client_request = session_services.get_current_request()
+        if client_request.method not in self.CACHEABLE_METHODS:
+            return None
+
+        key = self._generate_key(client_request, name, rule, inputs, **options)
+        cached = caching_services.get(name, key)
+        if cached is None:
+            expire = options.get('expire')
+            if expire is None:
+                expire = config_services.get('caching', 'response', 'expire')
+
+            client_request.add_context(RequestContextEnum.RESPONSE_CACHE,
+                                       DTO(name=name, key=key, expire=expire, headers=None),
+                                       replace=True)
+            return None
+
+        body, status_code, headers, content_type, etag = cached
+        response = CoreResponse(body, status=status_code,
+                                headers=headers, content_type=content_type)
+        response.set_etag(etag)
+        return response.make_conditional(client_request)
+
+    def collect(self, response):
+        """
+        collects the headers of given route response to be cached.
+
+        it does nothing if the response of current request must not be cached.
+
+        :param object | tuple | CoreResponse response: prepared response of a route.
+        """
+
+        context = session_services.get_request_context(RequestContextEnum.RESPONSE_CACHE)
+        if context is None:
+            return
+
+        body, status_code, headers = response_services.unpack_response(response)
+        context.headers = list(header_utils.convert_headers(headers, ignore_null=False))
+
+    def store(self, response, **options):
+        """
+        caches the given response of current request.
+
+        it does nothing if the response of current request must not be cached or
+        it is not successful. it adds a strong `ETag` header into the response and
+        converts it to a `304` response if the request has a matching `If-None-Match`.
+
+        :param CoreResponse response: response object.
+
+        :raises CacheNotFoundError: cache not found error.
+        """
+
+        client_request = session_services.get_safe_current_request()
+        if client_request is None:
+            return
+
+        context = client_request.get_context(RequestContextEnum.RESPONSE_CACHE)
+        if context is None:
+            return
+
+        client_request.remove_context(RequestContextEnum.RESPONSE_CACHE)
+        if context.headers is None or response.is_streamed or \
+                response.status_code != SuccessfulResponseCodeEnum.OK:
+            return
+
+        body = response.get_data()
+        etag = blake2b(body, digest_size=self.ETAG_DIGEST_SIZE).hexdigest()
+        caching_services.set(context.name, context.key,
+                             (body, response.status_code, context.headers,
+                              response.content_type, etag),
+                             expire=context.expire)
+
+        response.set_etag(etag)
+        response.make_conditional(client_request)
+
+    def invalidate(self, *tags, **options):
+        """
+        invalidates all cached responses which have any of given tags.
+
+        :param str tags: tags to be invalidated.
+
+        :keyword str cache_name: name of the cache to invalidate tags on it.
+                                 if not provided, tags will be invalidated
+                                 on all caches which are used by routes.
+
+        :raises CacheNotFoundError: cache not found error.
+        """
+
+        names = options.get('cache_name')
+        if names is None:
+            with self._lock:
+                names = list(self._cache_names)
+        else:
+            names = [names]
+
+        for name in names:
+            for tag in tags:
+                self._renew_tag_version(name, tag)
+
+    def _generate_key(self, client_request, name, rule, inputs, **options):
+        """
+        generates the cache key of the response of given request.
+
+        :param CoreRequest client_request: current request.
+        :param str name: cache name.
+        :param str rule: url rule of the route.
+        :param dict inputs: view function inputs.
+
+        :keyword str | list[str] tags: tags of the route.
+
+        :keyword bool consider_user: specifies that current user must be included in
+                                     cache key. if not provided, it will be get from
+                                     `response` section of `caching` config store.
+
+        :returns: tuple[str prefix, str rule, dict inputs, dict paging_params,
+                        object user, object component key, str timezone,
+                        str locale, tuple[str] tag_versions]
+
+        :rtype: tuple
+        """
+
+        consider_user = options.get('consider_user')
+        if consider_user is None:
+            consider_user = config_services.get('caching', 'response', 'consider_user')
+
+        current_user = None
+        if consider_user is not False:
+            current_user = client_request.cacheable_user
+
+        tags = misc_utils.make_iterable(options.get('tags'), tuple)
+        versions = tuple(self._get_tag_version(name, tag) for tag in tags)
+
+        return self.RESPONSE_KEY_PREFIX, rule, dict(inputs), \
+            client_request.get_paging_params(), current_user, \
+            client_request.component_custom_key, client_request.timezone.zone, \
+            client_request.locale, versions
+
+    def _get_tag_version(self, name, tag):
+        """
+        gets the current version of given tag from given cache.
+
+        if the tag has no version, a new version will be set for it. so
+        responses cached with a lost version will never be used again.
+
+        :param str name: cache name.
+        :param str tag: tag name.
+
+        :rtype: str
+        """
+
+        version = caching_services.get(name, (self.TAG_KEY_PREFIX, tag))
+        if version is None:
+            version = self._renew_tag_version(name, tag)
+
+        return version
+
+    def _renew_tag_version(self, name, tag):
+        """
+        sets a new version for given tag into given cache and returns it.
+
+        :param str name: cache name.
+        :param str tag: tag name.
+
+        :rtype: str
+        """
+
+        version = str(uuid_utils.generate_uuid4())
+        expire = config_services.get('caching', 'response', 'tag_expire')
+        caching_services.set(name, (self.TAG_KEY_PREFIX, tag), version, expire=expire)
+        return version
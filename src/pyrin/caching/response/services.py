@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+caching response services module.
+"""
+
+from pyrin.application.services import get_component
+from pyrin.caching.response import CachingResponsePackage
+
+
+def get_cache_name(cache_response):
+    """
+    gets the cache name to be used for responses of a route.
+
+    it returns None if responses must not be cached.
+
+    :param bool | str cache_response: the name of a registered cache or True
+                                      to use the default cache for responses.
+                                      False or None means no caching.
+
+    :raises InvalidResponseCacheError: invalid response cache error.
+
+    :rtype: str
+    """
+
+    return get_component(CachingResponsePackage.COMPONENT_NAME).get_cache_name(cache_response)
+
+
+def get(name, rule, inputs, **options):
+    """
+    gets the cached response of current request.
+
+    it returns None if the response is not cached or current request
+    method is not cacheable. in case of a miss, the required info to cache
+    the response will be added into current request context. if the request
+    has a matching `If-None-Match` header, a `304` response will be returned.
+
+    :param str name: cache name.
+    :param str rule: url rule of the route.
+    :param dict inputs: view function inputs.
+
+    :keyword int expire: expire time of cached response in milliseconds.
+                         if not provided, it will be get from `response`
+                         section of `caching` config store.
+
+    :keyword str | list[str] tags: tags of the route.
+
+    :keyword bool consider_user: specifies that current user must be included in
+                                 cache key. if not provided, it will be get from
+                                 `response` section of `caching` config store.
+
+    :raises CacheNotFoundError: cache not found error.
+
+    :rtype: CoreResponse
+    """
+
+    return get_component(CachingResponsePackage.COMPONENT_NAME).get(name, rule,
+                                                                    inputs, **options)
+
+
+def collect(response):
+    """
+    collects the headers of given route response to be cached.
+
+    it does nothing if the response of current request must not be cached.
+
+    :param object | tuple | CoreResponse response: prepared response of a route.
+    """
+
+    get_component(CachingResponsePackage.COMPONENT_NAME).collect(response)
+
+
+def store(response, **options):
+    """
+    caches the given response of current request.
+
+    it does nothing if the response of current request must not be cached or
+    it is not successful. it adds a strong `ETag` header into the response and
+    converts it to a `304` response if the request has a matching `If-None-Match`.
+
+    :param CoreResponse response: response object.
+
+    :raises CacheNotFoundError: cache not found error.
+    """
+
+    get_component(CachingResponsePackage.COMPONENT_NAME).store(response, **options)
+
+
+def invalidate(*tags, **options):
+    """
+    invalidates all cached responses which have any of given tags.
+
+    :param str tags: tags to be invalidated.
+
+    :keyword str cache_name: name of the cache to invalidate tags on it.
+                             if not provided, tags will be invalidated
+                             on all caches which are used by routes.
+
+    :raises CacheNotFoundError: cache not found error.
+    """
+
+    get_component(CachingResponsePackage.COMPONENT_NAME).invalidate(*tags, **options)
@@ -260,8 +260,8 @@ def generate_key(name, func, *extra_keys, **options):
 
     :raises CacheNotFoundError: cache not found error.
 
-    :returns: hash of generated key.
-    :rtype: int
+    :returns: generated key.
+    :rtype: object
     """
 
     return get_component(CachingPackage.COMPONENT_NAME).generate_key(name, func,
@@ -364,6 +364,42 @@ def load_all(**options):
     return get_component(CachingPackage.COMPONENT_NAME).load_all(**options)
 
 
+def flush_all_stats():
+    """
+    sends the hit and miss counts of all remote caches to their servers.
+
+    hit and miss counts of remote caches are kept in process and will be
+    sent periodically. this method sends all remaining counts immediately.
+    """
+
+    return get_component(CachingPackage.COMPONENT_NAME).flush_all_stats()
+
+
+def submit_refresh(func, *args, **kwargs):
+    """
+    submits the given function to be called on a background refresh worker.
+
+    the number of workers will be get from `caching` config store.
+
+    :param function func: function to be called.
+    :param object args: function positional arguments.
+    :param object kwargs: function keyword arguments.
+    """
+
+    return get_component(CachingPackage.COMPONENT_NAME).submit_refresh(func, *args, **kwargs)
+
+
+def shutdown_refresh_workers():
+    """
+    shuts down background refresh workers.
+
+    pending refreshes will be cancelled, but the running
+    ones will be finished before this method returns.
+    """
+
+    return get_component(CachingPackage.COMPONENT_NAME).shutdown_refresh_workers()
+
+
 def clear_required_caches():
     """
     clears all caches that are required.
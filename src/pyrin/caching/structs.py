@@ -77,15 +77,10 @@ class CacheableDict(OrderedDict):
         if not isinstance(other, CacheableDict):
             return False
 
-        self_len = len(self)
-        other_len = len(other)
-        if self_len != other_len:
+        if len(self) != len(other):
             return False
 
-        if self_len == 0:
-            return True
-
-        return hash(self) == hash(other)
+        return super().__eq__(other)
 
     def __ne__(self, other):
         """
@@ -419,6 +419,10 @@ class ConfigurationManager(Manager):
         """
         gets all key/values stored in given section of specified config store.
 
+        the result is a mutable copy of the section. if you
+        do not need to modify the result, use `get_section_view`
+        method which does not copy anything.
+
         :param str store_name: config store name.
         :param str section: section name.
 
@@ -437,6 +441,26 @@ class ConfigurationManager(Manager):
 
         return self._get_config_store(store_name).get_section(section, **options)
 
+    def get_section_view(self, store_name, section):
+        """
+        gets a read-only view of all key/values stored in given section of specified config store.
+
+        the result is not copied, so it could not be modified.
+        if you need to modify the result, use `get_section` method.
+
+        :param str store_name: config store name.
+        :param str section: section name.
+
+        :raises ConfigurationStoreNotFoundError: configuration store not found error.
+
+        :raises ConfigurationStoreSectionNotFoundError: configuration store section
+                                                        not found error.
+
+        :rtype: CoreImmutableDict
+        """
+
+        return self._get_config_store(store_name).get_section_view(section)
+
     def get_section_keys(self, store_name, section, **options):
         """
         gets all available keys in given section of specified config store.
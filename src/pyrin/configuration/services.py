@@ -277,6 +277,10 @@ def get_section(store_name, section, **options):
     """
     gets all key/values stored in given section of specified config store.
 
+    the result is a mutable copy of the section. if you
+    do not need to modify the result, use `get_section_view`
+    function which does not copy anything.
+
     :param str store_name: config store name.
     :param str section: section name.
 
@@ -297,6 +301,28 @@ def get_section(store_name, section, **options):
                                                                           **options)
 
 
+def get_section_view(store_name, section):
+    """
+    gets a read-only view of all key/values stored in given section of specified config store.
+
+    the result is not copied, so it could not be modified.
+    if you need to modify the result, use `get_section` function.
+
+    :param str store_name: config store name.
+    :param str section: section name.
+
+    :raises ConfigurationStoreNotFoundError: configuration store not found error.
+
+    :raises ConfigurationStoreSectionNotFoundError: configuration store section
+                                                    not found error.
+
+    :rtype: CoreImmutableDict
+    """
+
+    return get_component(ConfigurationPackage.COMPONENT_NAME).get_section_view(store_name,
+                                                                               section)
+
+
 def get_section_keys(store_name, section, **options):
     """
     gets all available keys in given section of specified config store.
@@ -12,6 +12,7 @@ import pyrin.utils.configuration as config_utils
 
 from pyrin.utils.exceptions import ConfigurationFileNotFoundError as UtilsFileNotFoundError
 from pyrin.core.structs import CoreObject, DTO
+from pyrin.configuration.structs import ConfigSnapshot
 from pyrin.utils.dictionary import change_key_case
 from pyrin.configuration.exceptions import ConfigurationFileNotFoundError, \
     ConfigurationStoreKeyNotFoundError, ConfigurationStoreSectionNotFoundError, \
@@ -26,6 +27,9 @@ class ConfigStore(CoreObject):
     config store class.
 
     all configurations will be stored with lowercase keys.
+    configurations are kept in a read-only snapshot which will be
+    replaced as a whole on each reload. the active section name is
+    also resolved once on each load.
     """
 
     ACTIVE_SECTION_NAME = 'active'
@@ -52,7 +56,7 @@ class ConfigStore(CoreObject):
 
         super().__init__()
 
-        self._configs = DTO()
+        self._snapshot = None
         self._defaults = options.get('defaults', None)
         self._name = name
         self._config_file_path = config_file_path
@@ -79,14 +83,31 @@ class ConfigStore(CoreObject):
         """
 
         try:
-            self._configs = config_utils.load(self._config_file_path,
-                                              deserializer_services.deserialize,
-                                              **options)
+            configs = config_utils.load(self._config_file_path,
+                                        deserializer_services.deserialize,
+                                        **options)
 
         except UtilsFileNotFoundError as error:
             raise ConfigurationFileNotFoundError(error) from error
 
-        self._sync_with_env(**options)
+        self._sync_with_env(configs, **options)
+        self._snapshot = self._create_snapshot(configs)
+
+    def _create_snapshot(self, configs):
+        """
+        creates a read-only snapshot from given configurations.
+
+        :param dict[str, dict] configs: all sections of this config store.
+
+        :rtype: ConfigSnapshot
+        """
+
+        active_section_name = None
+        active_section = configs.get(self.ACTIVE_SECTION_NAME)
+        if active_section is not None:
+            active_section_name = active_section.get(self.SELECTED_SECTION_NAME)
+
+        return ConfigSnapshot(configs, active_section_name)
 
     def reload(self, **options):
         """
@@ -105,7 +126,6 @@ class ConfigStore(CoreObject):
         else:
             self._defaults = defaults
 
-        self._configs.clear()
         self._load(**options)
 
     def get(self, section, key, **options):
@@ -125,9 +145,19 @@ class ConfigStore(CoreObject):
                                                     key not found error.
         """
 
-        section_data = self.get_section(section, **options)
-        if key in section_data:
-            return section_data[key]
+        if options.get('converter') is not None:
+            section_data = self.get_section(section, **options)
+            if key in section_data:
+                return section_data[key]
+        else:
+            snapshot = self._snapshot
+            section_data = self._get_section_data(snapshot, section)
+            if key in section_data:
+                value = section_data[key]
+                if snapshot.is_immutable(value) is True:
+                    return value
+
+                return deepcopy(snapshot.raw_sections[section][key])
 
         if 'default' not in options:
             raise ConfigurationStoreKeyNotFoundError('Key [{key}] not found in section '
@@ -166,12 +196,16 @@ class ConfigStore(CoreObject):
         :rtype: list[str]
         """
 
-        return list(self._configs.keys())
+        return list(self._snapshot.sections.keys())
 
     def get_section(self, section, **options):
         """
         gets all key/values stored in given section.
 
+        the result is a mutable copy of the section. if you
+        do not need to modify the result, use `get_section_view`
+        method which does not copy anything.
+
         :param str section: section name.
 
         :keyword callable converter: a callable to use as case converter for keys.
@@ -185,14 +219,49 @@ class ConfigStore(CoreObject):
         :rtype: dict
         """
 
-        if section not in self._configs:
+        snapshot = self._snapshot
+        self._get_section_data(snapshot, section)
+        result = deepcopy(DTO(snapshot.raw_sections[section]))
+        return self._change_key_case(result, **options)
+
+    def get_section_view(self, section):
+        """
+        gets a read-only view of all key/values stored in given section.
+
+        the result is not copied, so it could not be modified.
+        if you need to modify the result, use `get_section` method.
+
+        :param str section: section name.
+
+        :raises ConfigurationStoreSectionNotFoundError: configuration store section
+                                                        not found error.
+
+        :rtype: CoreImmutableDict
+        """
+
+        return self._get_section_data(self._snapshot, section)
+
+    def _get_section_data(self, snapshot, section):
+        """
+        gets the read-only data of given section from provided snapshot.
+
+        :param ConfigSnapshot snapshot: config snapshot to get section from it.
+        :param str section: section name.
+
+        :raises ConfigurationStoreSectionNotFoundError: configuration store section
+                                                        not found error.
+
+        :rtype: CoreImmutableDict
+        """
+
+        section_data = snapshot.sections.get(section)
+        if section_data is None:
             raise ConfigurationStoreSectionNotFoundError('Section [{section}] not found in '
                                                          'config store [{name}].'
                                                          .format(section=section,
                                                                  name=self._name))
 
-        result = deepcopy(self._configs.get(section))
-        return self._change_key_case(result, **options)
+        return section_data
 
     def get_section_keys(self, section, **options):
         """
@@ -381,15 +450,17 @@ class ConfigStore(CoreObject):
 
         return value
 
-    def _sync_with_env(self, **options):
+    def _sync_with_env(self, configs, **options):
         """
-        synchronizes all keys with None value of this config store.
+        synchronizes all keys with None value of given configurations.
 
         with environment variables if available. it searches for environment
         variables with name `STORE_SECTION_KEY`. for example `API_GENERAL_NAMESPACE`.
         it also updates all keys that their values start with `ENV_PLACE_HOLDER`
         from environment variables.
 
+        :param dict[str, dict] configs: all sections of this config store.
+
         :keyword bool silent: indicates that if an environment variable for the
                               config key not found, ignore it and return None, otherwise
                               raise an error. defaults to True.
@@ -410,8 +481,7 @@ class ConfigStore(CoreObject):
         :raises InvalidEnvironmentVariableKeyError: invalid environment variable key error.
         """
 
-        for section_name in self.get_section_names():
-            section = self.get_section(section_name)
+        for section_name, section in configs.items():
             for key, value in section.items():
                 if self._should_try_env(value) is True:
                     env_value = None
@@ -422,7 +492,7 @@ class ConfigStore(CoreObject):
                         env_key = self._extract_env_key(section_name, key, value)
                         env_value = self._get_from_env(env_key, silent=False)
                     converted_value = deserializer_services.deserialize(env_value)
-                    self._configs[section_name][key] = converted_value
+                    section[key] = converted_value
 
     def _get_env_key_name(self, store, section, key):
         """
@@ -521,6 +591,10 @@ class ConfigStore(CoreObject):
         :rtype: str
         """
 
+        active_section_name = self._snapshot.active_section_name
+        if active_section_name is not None:
+            return active_section_name
+
         return self.get(self.ACTIVE_SECTION_NAME, self.SELECTED_SECTION_NAME)
 
     def get_all_sections(self, **options):
@@ -532,4 +606,5 @@ class ConfigStore(CoreObject):
         :rtype: dict
         """
 
-        return deepcopy(self._configs)
+        return DTO((name, deepcopy(DTO(section_data)))
+                   for name, section_data in self._snapshot.raw_sections.items())
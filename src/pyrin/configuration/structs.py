@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+configuration structs module.
+"""
+
+from uuid import UUID
+from decimal import Decimal
+from datetime import datetime, date, time, timedelta
+
+from pyrin.core.structs import CoreObject, CoreImmutableDict
+from pyrin.utils.immutable import freeze
+
+
+class ConfigSnapshot(CoreObject):
+    """
+    config snapshot class.
+
+    this is a compiled and read-only view of all sections of a config store.
+    it will be created once on each load of a config store and will be replaced
+    as a whole on each reload, so readers always see a consistent state.
+    """
+
+    # value types which are immutable and could be returned
+    # to callers without copying them.
+    IMMUTABLE_TYPES = frozenset((str, int, float, bool, bytes, type(None),
+                                 datetime, date, time, timedelta, Decimal, UUID))
+
+    def __init__(self, sections, active_section_name):
+        """
+        initializes an instance of ConfigSnapshot.
+
+        :param dict[str, dict] sections: all sections of config store.
+
+        :param str active_section_name: the name of active section of config store.
+                                        it could be None if config store does not
+                                        have an active section.
+        """
+
+        super().__init__()
+
+        # nested values of sections are also frozen, so
+        # the sections could be shared with all readers.
+        self._sections = CoreImmutableDict((name, CoreImmutableDict(
+            (key, freeze(value)) for key, value in values.items()))
+            for name, values in sections.items())
+
+        # the original data of sections. it must not be exposed to readers
+        # and it is only used to create mutable copies of the values.
+        self._raw_sections = sections
+        self._active_section_name = active_section_name
+
+    @property
+    def sections(self):
+        """
+        gets all sections of this snapshot.
+
+        :rtype: CoreImmutableDict[str, CoreImmutableDict]
+        """
+
+        return self._sections
+
+    @property
+    def raw_sections(self):
+        """
+        gets the original data of all sections of this snapshot.
+
+        it must not be modified or returned to callers, it
+        should only be used to create mutable copies of values.
+
+        :rtype: dict[str, dict]
+        """
+
+        return self._raw_sections
+
+    @property
+    def active_section_name(self):
+        """
+        gets the active section name of this snapshot.
+
+        it returns None if this snapshot does not have an active section.
+
+        :rtype: str
+        """
+
+        return self._active_section_name
+
+    def is_immutable(self, value):
+        """
+        gets a value indicating that given value is immutable.
+
+        :param object value: value to be checked.
+
+        :rtype: bool
+        """
+
+        return type(value) in self.IMMUTABLE_TYPES
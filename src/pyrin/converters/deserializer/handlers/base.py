@@ -52,15 +52,36 @@ class DeserializerBase(AbstractDeserializerBase):
         :returns: deserialized value.
         """
 
+        deserialized_value = self.try_deserialize(value, **options)
+        if deserialized_value is NULL:
+            if self._next_handler is not None:
+                return self._next_handler.deserialize(value, **options)
+
+        return deserialized_value
+
+    def try_deserialize(self, value, **options):
+        """
+        deserializes the given value only using this deserializer.
+
+        it does not call the next handler if deserialization fails.
+        returns `NULL` object if deserialization fails.
+
+        :param object value: value to be deserialized.
+
+        :keyword bool include_internal: specifies that internal deserializers
+                                        must also be used for deserialization.
+                                        if set to False and this deserializer is
+                                        internal, it returns `NULL` object.
+                                        defaults to True if not provided.
+
+        :returns: deserialized value.
+        """
+
         deserialized_value = NULL
         include_internal = options.get('include_internal', True)
         if include_internal is not False or self.internal is False:
             deserialized_value = self._deserialize_operation(value, **options)
 
-        if deserialized_value is NULL:
-            if self._next_handler is not None:
-                return self._next_handler.deserialize(value, **options)
-
         if isinstance(deserialized_value, str):
             deserialized_value = remove_line_break_escapes(deserialized_value)
 
@@ -181,6 +202,12 @@ class StringDeserializerBase(DeserializerBase):
         custom_accepted_formats = options.get('accepted_formats', [])
         self._accepted_formats.extend(custom_accepted_formats)
 
+        # custom formats may start with any character, so
+        # first characters are only used for default formats.
+        self._first_characters = None
+        if len(custom_accepted_formats) <= 0:
+            self._first_characters = self.default_first_characters
+
         # min and max accepted length of strings
         # to be deserialized by this deserializer.
         self._min_length, self._max_length = self._calculate_accepted_length()
@@ -223,6 +250,33 @@ class StringDeserializerBase(DeserializerBase):
 
         return self._min_length, self._max_length
 
+    @property
+    def first_characters(self):
+        """
+        gets the characters that deserializable values could start with.
+
+        it returns None if values could start with any character.
+
+        :rtype: frozenset[str]
+        """
+
+        return self._first_characters
+
+    @property
+    def default_first_characters(self):
+        """
+        gets the characters that values of default formats could start with.
+
+        it is used to skip this deserializer for values which could never
+        match its formats, without running its patterns. it returns None
+        if values could start with any character.
+        this method could be overridden in subclasses.
+
+        :rtype: frozenset[str]
+        """
+
+        return None
+
     @property
     def accepted_formats(self):
         """
@@ -68,6 +68,16 @@ class BooleanDeserializer(StringPatternDeserializerBase):
         return [(self.TRUE_REGEX, 4, 4),
                 (self.FALSE_REGEX, 5, 5)]
 
+    @property
+    def default_first_characters(self):
+        """
+        gets the characters that values of default formats could start with.
+
+        :rtype: frozenset[str]
+        """
+
+        return frozenset('tTfF')
+
     def _get_converter_map(self):
         """
         gets converter map dictionary.
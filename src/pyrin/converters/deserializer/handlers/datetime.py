@@ -69,6 +69,16 @@ class DateDeserializer(StringPatternDeserializerBase):
 
         return [(DEFAULT_DATE_ISO_REGEX, 10, 10)]
 
+    @property
+    def default_first_characters(self):
+        """
+        gets the characters that values of default formats could start with.
+
+        :rtype: frozenset[str]
+        """
+
+        return frozenset('0123456789')
+
 
 @deserializer()
 class TimeDeserializer(StringPatternDeserializerBase):
@@ -128,6 +138,16 @@ class TimeDeserializer(StringPatternDeserializerBase):
                 (DEFAULT_UTC_ZULU_TIME_REGEX, 9, 16),
                 (DEFAULT_LOCAL_NAIVE_TIME_REGEX, 8, 15)]
 
+    @property
+    def default_first_characters(self):
+        """
+        gets the characters that values of default formats could start with.
+
+        :rtype: frozenset[str]
+        """
+
+        return frozenset('0123456789')
+
 
 @deserializer()
 class DateTimeDeserializer(StringPatternDeserializerBase):
@@ -188,3 +208,13 @@ class DateTimeDeserializer(StringPatternDeserializerBase):
         return [(DEFAULT_DATE_TIME_ISO_REGEX, 25, 32),
                 (DEFAULT_UTC_ZULU_DATE_TIME_REGEX, 20, 27),
                 (DEFAULT_LOCAL_NAIVE_DATE_TIME_REGEX, 19, 26)]
+
+    @property
+    def default_first_characters(self):
+        """
+        gets the characters that values of default formats could start with.
+
+        :rtype: frozenset[str]
+        """
+
+        return frozenset('0123456789')
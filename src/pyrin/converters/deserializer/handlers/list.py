@@ -132,3 +132,13 @@ class StringListDeserializer(StringPatternDeserializerBase):
         """
 
         return [(self.LIST_REGEX, self.UNDEF_LENGTH, self.UNDEF_LENGTH)]
+
+    @property
+    def default_first_characters(self):
+        """
+        gets the characters that values of default formats could start with.
+
+        :rtype: frozenset[str]
+        """
+
+        return frozenset('[')
@@ -64,3 +64,13 @@ class NoneDeserializer(StringPatternDeserializerBase):
 
         return [(self.NONE_REGEX, 4, 4),
                 (self.NULL_REGEX, 4, 4)]
+
+    @property
+    def default_first_characters(self):
+        """
+        gets the characters that values of default formats could start with.
+
+        :rtype: frozenset[str]
+        """
+
+        return frozenset('nN')
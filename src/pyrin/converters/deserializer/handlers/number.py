@@ -64,6 +64,16 @@ class IntegerDeserializer(StringPatternDeserializerBase):
 
         return [(self.INTEGER_REGEX, self.UNDEF_LENGTH, self.UNDEF_LENGTH)]
 
+    @property
+    def default_first_characters(self):
+        """
+        gets the characters that values of default formats could start with.
+
+        :rtype: frozenset[str]
+        """
+
+        return frozenset('-0123456789')
+
 
 @deserializer()
 class FloatDeserializer(StringPatternDeserializerBase):
@@ -122,3 +132,13 @@ class FloatDeserializer(StringPatternDeserializerBase):
         """
 
         return [(self.FLOAT_REGEX, self.UNDEF_LENGTH, self.UNDEF_LENGTH)]
+
+    @property
+    def default_first_characters(self):
+        """
+        gets the characters that values of default formats could start with.
+
+        :rtype: frozenset[str]
+        """
+
+        return frozenset('-0123456789')
@@ -75,6 +75,16 @@ class PoolDeserializer(StringPatternDeserializerBase):
                 (self.SINGLETON_THREAD_POOL_REGEX, 19, 19),
                 (self.STATIC_POOL_REGEX, 10, 10)]
 
+    @property
+    def default_first_characters(self):
+        """
+        gets the characters that values of default formats could start with.
+
+        :rtype: frozenset[str]
+        """
+
+        return frozenset('pPnNaAqQsS')
+
     def _get_converter_map(self):
         """
         gets converter map dictionary.
@@ -72,3 +72,13 @@ class StringDeserializer(StringPatternDeserializerBase):
 
         return [(self.DOUBLE_QUOTE_REGEX, self.UNDEF_LENGTH, self.UNDEF_LENGTH),
                 (self.SINGLE_QUOTE_REGEX, self.UNDEF_LENGTH, self.UNDEF_LENGTH)]
+
+    @property
+    def default_first_characters(self):
+        """
+        gets the characters that values of default formats could start with.
+
+        :rtype: frozenset[str]
+        """
+
+        return frozenset('\'"')
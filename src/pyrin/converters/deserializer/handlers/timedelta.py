@@ -72,3 +72,13 @@ class TimedeltaDeserializer(StringPatternDeserializerBase):
         """
 
         return [(self.TIMEDELTA_REGEX, 11, self.UNDEF_LENGTH)]
+
+    @property
+    def default_first_characters(self):
+        """
+        gets the characters that values of default formats could start with.
+
+        :rtype: frozenset[str]
+        """
+
+        return frozenset('t')
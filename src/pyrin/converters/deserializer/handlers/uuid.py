@@ -65,3 +65,13 @@ class UUIDDeserializer(StringPatternDeserializerBase):
         """
 
         return [(UUID_REGEX, 36, 36)]
+
+    @property
+    def default_first_characters(self):
+        """
+        gets the characters that values of default formats could start with.
+
+        :rtype: frozenset[str]
+        """
+
+        return frozenset('0123456789abcdefABCDEF')
@@ -5,6 +5,7 @@ deserializer manager module.
 
 from pyrin.converters.deserializer import DeserializerPackage
 from pyrin.converters.deserializer.interface import AbstractDeserializerBase
+from pyrin.converters.deserializer.structs import StringDispatcher
 from pyrin.core.structs import Context, Manager
 from pyrin.core.globals import NULL
 from pyrin.utils.custom_print import print_warning
@@ -30,6 +31,12 @@ class DeserializerManager(Manager):
         # example: dict(type accepted_type: list[AbstractDeserializerBase] instances)
         self._deserializers = Context()
 
+        # a dictionary containing the dispatch steps of each value type.
+        # it will be filled on first usage of each type and will be
+        # cleared whenever a new deserializer is registered.
+        # example: dict(type value_type: tuple[callable] steps)
+        self._dispatch = {}
+
     def deserialize(self, value, **options):
         """
         deserializes the given value.
@@ -47,16 +54,44 @@ class DeserializerManager(Manager):
         :returns: deserialized object
         """
 
-        options.update(accepted_type=type(value))
-        for deserializer in self.get_deserializers(**options):
-            deserialized_value = deserializer.deserialize(value, **options)
+        accepted_type = type(value)
+        steps = self._dispatch.get(accepted_type)
+        if steps is None:
+            steps = self._get_dispatch_steps(accepted_type)
+            self._dispatch[accepted_type] = steps
 
+        options.update(accepted_type=accepted_type)
+        for step in steps:
+            deserialized_value = step(value, **options)
             if deserialized_value is not NULL:
                 return deserialized_value
-            continue
 
         return value
 
+    def _get_dispatch_steps(self, accepted_type):
+        """
+        gets the dispatch steps of given type.
+
+        each step is a callable which gets the value and returns
+        the deserialized value or `NULL` object. string deserializers
+        are dispatched using a `StringDispatcher`, other deserializers
+        are dispatched using their chain.
+
+        :param type accepted_type: type of values to get their dispatch steps.
+
+        :rtype: tuple[callable]
+        """
+
+        steps = []
+        for key in self._deserializers:
+            if issubclass(accepted_type, key):
+                if key is str:
+                    steps.append(StringDispatcher(self._deserializers[key]))
+                else:
+                    steps.append(self._deserializers[key][0].deserialize)
+
+        return tuple(steps)
+
     def register_deserializer(self, instance, **options):
         """
         registers a new deserializer or replaces the existing one.
@@ -112,6 +147,7 @@ class DeserializerManager(Manager):
         previous_instances.append(instance)
         self._set_next_handlers(previous_instances)
         self._deserializers[instance.accepted_type] = previous_instances
+        self._dispatch.clear()
 
     def _set_next_handlers(self, deserializers):
         """
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+deserializer structs module.
+"""
+
+from pyrin.core.globals import NULL
+from pyrin.core.structs import CoreObject
+from pyrin.converters.deserializer.handlers.base import StringDeserializerBase
+
+
+class StringDispatcher(CoreObject):
+    """
+    string dispatcher class.
+
+    it deserializes string values using a chain of string deserializers,
+    but only calls those deserializers that accept the first character
+    and the length of the value. so for example, a plain alphanumeric value
+    never runs the patterns of datetime, uuid or number deserializers.
+    """
+
+    def __init__(self, deserializers):
+        """
+        initializes an instance of StringDispatcher.
+
+        :param list[AbstractDeserializerBase] deserializers: string deserializers in
+                                                             the order of their chain.
+        """
+
+        super().__init__()
+
+        candidates = []
+        characters = set()
+        for deserializer in deserializers:
+            first_characters = None
+            min_length = 0
+            max_length = float('inf')
+            if isinstance(deserializer, StringDeserializerBase):
+                first_characters = deserializer.first_characters
+                min_length, max_length = deserializer.accepted_length
+
+            if first_characters is not None:
+                characters.update(first_characters)
+
+            candidates.append((first_characters, (deserializer, min_length, max_length)))
+
+        # deserializers that accept values starting with any character.
+        self._any_candidates = tuple(item for first_characters, item
+                                     in candidates if first_characters is None)
+
+        # a dict containing deserializers that could accept values starting with each character.
+        # in the form of: {str character: tuple[tuple[AbstractDeserializerBase, int, int]]}
+        self._candidates = {}
+        for character in characters:
+            self._candidates[character] = tuple(item for first_characters, item in candidates
+                                                if first_characters is None or
+                                                character in first_characters)
+
+    def __call__(self, value, **options):
+        """
+        deserializes the given string value.
+
+        returns `NULL` object if deserialization fails.
+
+        :param str value: value to be deserialized.
+
+        :keyword bool include_internal: specifies that internal deserializers
+                                        must also be used for deserialization.
+                                        defaults to True if not provided.
+
+        :returns: deserialized value.
+        """
+
+        stripped_value = value.strip()
+        length = len(stripped_value)
+        candidates = self._candidates.get(stripped_value[:1], self._any_candidates)
+        for deserializer, min_length, max_length in candidates:
+            if min_length <= length <= max_length:
+                deserialized_value = deserializer.try_deserialize(value, **options)
+                if deserialized_value is not NULL:
+                    return deserialized_value
+
+        return NULL
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+json backends module.
+"""
+
+import re
+import json
+
+from abc import abstractmethod
+
+from pyrin.core.structs import CoreObject
+from pyrin.core.exceptions import CoreNotImplementedError
+from pyrin.converters.json.exceptions import InvalidJSONBackendError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONBackendBase(CoreObject):
+    """
+    json backend base class.
+
+    all json backends must be subclassed from this.
+    """
+
+    # the name of this backend to be used in configs.
+    name = None
+
+    @abstractmethod
+    def dumps(self, value, encoder_class, **options):
+        """
+        serializes the given value into a json string.
+
+        :param object value: value to be serialized.
+
+        :param type[JSONEncoder] encoder_class: encoder class to be used to
+                                                convert complex types.
+
+        :keyword bool sort_keys: sort the keys of dicts.
+        :keyword int indent: indentation of the output.
+
+        :raises CoreNotImplementedError: core not implemented error.
+
+        :rtype: str
+        """
+
+        raise CoreNotImplementedError()
+
+    @property
+    def is_available(self):
+        """
+        gets a value indicating that the required library of this backend is installed.
+
+        :rtype: bool
+        """
+
+        return True
+
+
+class StandardJSONBackend(JSONBackendBase):
+    """
+    standard json backend class.
+
+    it uses the python `json` module.
+    """
+
+    name = 'stdlib'
+
+    def dumps(self, value, encoder_class, **options):
+        """
+        serializes the given value into a json string.
+
+        :param object value: value to be serialized.
+
+        :param type[JSONEncoder] encoder_class: encoder class to be used to
+                                                convert complex types.
+
+        :keyword bool sort_keys: sort the keys of dicts.
+        :keyword int indent: indentation of the output.
+        :keyword tuple[str, str] separators: item and key separators.
+
+        :rtype: str
+        """
+
+        return json.dumps(value, cls=encoder_class, **options)
+
+
+class ORJSONBackend(JSONBackendBase):
+    """
+    orjson backend class.
+
+    it uses the `orjson` library which is implemented in rust. it serializes
+    dicts, lists and primitive types natively and only calls the encoder for
+    other types. the `orjson` library must be installed to use this backend.
+
+    note that `orjson` does not support custom separators. so the output is
+    always compact, or uses `: ` between keys and values if it is indented.
+    """
+
+    name = 'orjson'
+
+    # matches the characters which must be escaped if `ensure_ascii` is enabled.
+    NON_ASCII_REGEX = re.compile(r'[^\x00-\x7f]')
+
+    def dumps(self, value, encoder_class, **options):
+        """
+        serializes the given value into a json string.
+
+        :param object value: value to be serialized.
+
+        :param type[JSONEncoder] encoder_class: encoder class to be used to
+                                                convert complex types.
+
+        :keyword bool ensure_ascii: escape all non-ascii characters of the output.
+                                    defaults to False if not provided.
+
+        :keyword bool sort_keys: sort the keys of dicts.
+        :keyword int indent: indentation of the output. any value
+                             other than None, will be an indentation
+                             of two spaces.
+
+        :keyword tuple[str, str] separators: item and key separators.
+                                             it is ignored by this backend.
+
+        :rtype: str
+        """
+
+        # datetime values must be passed to the encoder to
+        # be converted into client timezone, and non-string keys
+        # must be accepted the same as python `json` module.
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if options.get('sort_keys') is True:
+            option |= orjson.OPT_SORT_KEYS
+
+        if options.get('indent') is not None:
+            option |= orjson.OPT_INDENT_2
+
+        result = orjson.dumps(value, default=encoder_class().default,
+                              option=option).decode()
+
+        if options.get('ensure_ascii') is True:
+            result = self.NON_ASCII_REGEX.sub(self._escape, result)
+
+        return result
+
+    def _escape(self, match):
+        """
+        escapes the matched non-ascii character the same as python `json` module.
+
+        characters outside of the basic multilingual plane
+        will be escaped as a surrogate pair.
+
+        :param re.Match match: matched character.
+
+        :rtype: str
+        """
+
+        code = ord(match.group())
+        if code <= 0xFFFF:
+            return '\\u{code:04x}'.format(code=code)
+
+        code -= 0x10000
+        high = 0xD800 | (code >> 10)
+        low = 0xDC00 | (code & 0x3FF)
+        return '\\u{high:04x}\\u{low:04x}'.format(high=high, low=low)
+
+    @property
+    def is_available(self):
+        """
+        gets a value indicating that the required library of this backend is installed.
+
+        :rtype: bool
+        """
+
+        return orjson is not None
+
+
+def get_backend(name):
+    """
+    gets the json backend with given name.
+
+    :param str name: backend name.
+
+    :raises InvalidJSONBackendError: invalid json backend error.
+
+    :rtype: JSONBackendBase
+    """
+
+    backend_class = BACKENDS.get(name)
+    if backend_class is None:
+        raise InvalidJSONBackendError('JSON backend [{name}] is invalid. '
+                                      'it must be one of {names}.'
+                                      .format(name=name, names=list(BACKENDS.keys())))
+
+    return backend_class()
+
+
+# a dict containing all available json backends.
+# in the form of: {str name: type[JSONBackendBase] backend_class}
+BACKENDS = {
+    StandardJSONBackend.name: StandardJSONBackend,
+    ORJSONBackend.name: ORJSONBackend,
+}
@@ -3,12 +3,11 @@
 json decoder module.
 """
 
-from json.decoder import scanstring
-from json.scanner import py_make_scanner
-
 from flask.json import JSONDecoder
 
+import pyrin.configuration.services as config_services
 import pyrin.globalization.datetime.services as datetime_services
+import pyrin.utils.datetime as datetime_utils
 import pyrin.utils.unique_id as uuid_utils
 
 from pyrin.utils.unique_id import UUID_REGEX
@@ -17,29 +16,134 @@ from pyrin.utils.datetime import DEFAULT_DATE_TIME_ISO_REGEX, \
     DEFAULT_UTC_ZULU_DATE_TIME_REGEX, DEFAULT_LOCAL_NAIVE_DATE_TIME_REGEX, \
     DEFAULT_UTC_ZULU_TIME_REGEX
 
+# minimum and maximum length of complex strings.
+# the shortest one is a naive time like '23:40:15' and
+# the longest one is a uuid like '0b7b5c5e-3e62-4f0e-8a47-3e4a2c7d1f90'.
+MIN_COMPLEX_LENGTH = 8
+MAX_COMPLEX_LENGTH = 36
+
+UUID_LENGTH = 36
+DATE_LENGTH = 10
+MIN_DATE_TIME_LENGTH = 19
+DIGITS = frozenset('0123456789')
+
 
-def scanstring_extended(s, end, strict=True):
+def _to_datetime(value, timezone):
     """
-    extended scan string method to be able to parse complex strings.
+    converts the given string to its equivalent python datetime in given timezone.
+
+    naive values are considered to be in the given timezone.
+
+    :param str value: string representation of datetime to be converted.
+    :param tzinfo timezone: timezone to be used.
+
+    :rtype: datetime
+    """
+
+    result = datetime_utils.to_datetime(value)
+    if result.tzinfo is None:
+        result = timezone.localize(result)
+
+    return timezone.normalize(result.astimezone(timezone))
+
+
+def coerce_string(value, **options):
     """
+    converts the given string to its equivalent python object if it is a complex string.
+
+    complex strings are datetime, date, time and uuid strings.
+    the length and separator positions of the value are checked before
+    any regular expression, so most of the normal strings will be
+    returned without running any regular expression on them.
+    it returns the same input if it is not a complex string.
+
+    :param str value: value to be coerced.
+
+    :keyword tzinfo client_timezone: client timezone to be used for datetime values.
+                                     if not provided, it will be resolved from
+                                     datetime services for each datetime value.
+
+    :rtype: datetime | date | time | UUID | str | object
+    """
+
+    if not isinstance(value, str):
+        return value
+
+    length = len(value)
+    if length < MIN_COMPLEX_LENGTH or length > MAX_COMPLEX_LENGTH:
+        return value
+
+    if length == UUID_LENGTH:
+        if value[8] == '-' and UUID_REGEX.match(value):
+            return uuid_utils.try_get_uuid_or_value(value)
+
+        return value
+
+    if value[0] not in DIGITS:
+        return value
 
-    s, end = scanstring(s, end, strict)
-    if DEFAULT_DATE_TIME_ISO_REGEX.match(s):
-        return datetime_services.to_datetime(s, to_server=False, from_server=False), end
-    elif DEFAULT_DATE_ISO_REGEX.match(s):
-        return datetime_services.to_date(s), end
-    elif DEFAULT_TIME_ISO_REGEX.match(s) or \
-            DEFAULT_LOCAL_NAIVE_TIME_REGEX.match(s) or \
-            DEFAULT_UTC_ZULU_TIME_REGEX.match(s):
-        return datetime_services.to_time(s), end
-    elif DEFAULT_UTC_ZULU_DATE_TIME_REGEX.match(s):
-        return datetime_services.to_datetime(s, to_server=False, from_server=False), end
-    elif DEFAULT_LOCAL_NAIVE_DATE_TIME_REGEX.match(s):
-        return datetime_services.to_datetime(s, to_server=False, from_server=False), end
-    elif UUID_REGEX.match(s):
-        return uuid_utils.try_get_uuid_or_value(s), end
-    else:
-        return s, end
+    if value[4] == '-':
+        if length == DATE_LENGTH:
+            if DEFAULT_DATE_ISO_REGEX.match(value):
+                return datetime_utils.to_date(value)
+
+        elif length >= MIN_DATE_TIME_LENGTH and value[DATE_LENGTH] == 'T':
+            if DEFAULT_DATE_TIME_ISO_REGEX.match(value) or \
+                    DEFAULT_UTC_ZULU_DATE_TIME_REGEX.match(value) or \
+                    DEFAULT_LOCAL_NAIVE_DATE_TIME_REGEX.match(value):
+                client_timezone = options.get('client_timezone')
+                if client_timezone is not None:
+                    return _to_datetime(value, client_timezone)
+
+                return datetime_services.to_datetime(value, to_server=False,
+                                                     from_server=False)
+
+    elif value[2] == ':':
+        if DEFAULT_TIME_ISO_REGEX.match(value) or \
+                DEFAULT_LOCAL_NAIVE_TIME_REGEX.match(value) or \
+                DEFAULT_UTC_ZULU_TIME_REGEX.match(value):
+            return datetime_utils.to_time(value)
+
+    return value
+
+
+def coerce_values(value, **options):
+    """
+    converts all complex string values of given decoded json to their python objects.
+
+    only values of dicts and items of lists will be converted, keys are kept as they are.
+    dicts and lists will be updated in place.
+
+    :param dict | list | object value: decoded json value.
+
+    :keyword tzinfo client_timezone: client timezone to be used for datetime values.
+                                     if not provided, it will be resolved from
+                                     datetime services for each datetime value.
+
+    :rtype: dict | list | object
+    """
+
+    value_type = type(value)
+    if value_type is str:
+        return coerce_string(value, **options)
+
+    if value_type is dict:
+        for key, item in value.items():
+            item_type = type(item)
+            if item_type is str:
+                value[key] = coerce_string(item, **options)
+            elif item_type is dict or item_type is list:
+                coerce_values(item, **options)
+
+    elif value_type is list:
+        for index, item in enumerate(value):
+            item_type = type(item)
+            if item_type is str:
+                value[index] = coerce_string(item, **options)
+            elif item_type is dict or item_type is list:
+                coerce_values(item, **options)
+
+    return value
 
 
 class CoreJSONDecoder(JSONDecoder):
@@ -48,13 +152,27 @@ class CoreJSONDecoder(JSONDecoder):
 
     it extends the default flask json decoder to be able to
     convert complex strings to their equivalent python object.
+    the json is decoded using the c scanner and then complex
+    string values are converted in a separate pass. client
+    timezone is resolved once per decode.
     """
 
-    def __init__(self, *args, **kwargs):
+    def decode(self, s, *args, **kwargs):
         """
-        initializes an instance of CoreJSONDecoder.
+        decodes the given json string.
+
+        complex string values will be converted to their equivalent
+        python object if `coerce_strings` of `json` section of
+        `application` config store is enabled.
+
+        :param str s: json string to be decoded.
+
+        :returns: dict | list | object
         """
 
-        super().__init__(*args, **kwargs)
-        self.parse_string = scanstring_extended
-        self.scan_once = py_make_scanner(self)
+        result = super().decode(s, *args, **kwargs)
+        if config_services.get('application', 'json', 'coerce_strings', default=True) is True:
+            client_timezone = datetime_services.get_current_timezone(server=False)
+            return coerce_values(result, client_timezone=client_timezone)
+
+        return result
@@ -3,6 +3,7 @@
 json encoder module.
 """
 
+from uuid import UUID
 from datetime import datetime, date, time
 
 from flask.json import JSONEncoder
@@ -19,8 +20,158 @@ class CoreJSONEncoder(JSONEncoder):
 
     it extends the default flask json encoder to get the
     correct string representation for other complex types.
+
+    each encoder instance is used for a single `dumps` call. so the server
+    and client timezones are resolved once per response, on the first datetime.
     """
 
+    # a dict containing the name of converter method of each type.
+    # values of subclasses of these types will also be converted
+    # with the converter of their nearest base type.
+    # it could be extended in subclasses to support other types.
+    converters = {
+        datetime: '_convert_datetime',
+        date: '_convert_date',
+        time: '_convert_time',
+        UUID: '_convert_uuid',
+        bytes: '_convert_bytes',
+        BaseEntity: '_convert_entity',
+    }
+
+    def __init__(self, **kwargs):
+        """
+        initializes an instance of CoreJSONEncoder.
+
+        it accepts the same keyword arguments of `json.JSONEncoder`.
+        """
+
+        super().__init__(**kwargs)
+
+        # server and client timezones will be resolved on first usage.
+        # in the form of: tuple[tzinfo server_timezone, tzinfo client_timezone]
+        self._timezones = None
+
+    def _get_timezones(self):
+        """
+        gets the server and client timezones.
+
+        :returns: tuple[tzinfo server_timezone, tzinfo client_timezone]
+        :rtype: tuple[tzinfo, tzinfo]
+        """
+
+        if self._timezones is None:
+            self._timezones = (datetime_services.get_current_timezone(server=True),
+                               datetime_services.get_current_timezone(server=False))
+
+        return self._timezones
+
+    def _to_client(self, value):
+        """
+        converts the given datetime into client timezone.
+
+        naive values are considered to be in server timezone.
+
+        :param datetime value: value to be converted.
+
+        :rtype: datetime
+        """
+
+        server_timezone, client_timezone = self._get_timezones()
+        if value.tzinfo is None:
+            value = server_timezone.localize(value)
+
+        return client_timezone.normalize(value.astimezone(client_timezone))
+
+    def _convert_datetime(self, value):
+        """
+        converts the given datetime into a string in client timezone.
+
+        :param datetime value: value to be converted.
+
+        :rtype: str
+        """
+
+        return self._to_client(value).isoformat(timespec='seconds')
+
+    def _convert_date(self, value):
+        """
+        converts the given date into a string.
+
+        :param date value: value to be converted.
+
+        :rtype: str
+        """
+
+        return value.isoformat()
+
+    def _convert_time(self, value):
+        """
+        converts the given time into a string.
+
+        :param time value: value to be converted.
+
+        :rtype: str
+        """
+
+        return value.isoformat(timespec='seconds')
+
+    def _convert_uuid(self, value):
+        """
+        converts the given uuid into a string.
+
+        :param UUID value: value to be converted.
+
+        :rtype: str
+        """
+
+        return str(value)
+
+    def _convert_bytes(self, value):
+        """
+        converts the given bytes into a base64 string.
+
+        :param bytes value: value to be converted.
+
+        :rtype: str
+        """
+
+        return encoding.bytes_to_base64_string(value)
+
+    def _convert_entity(self, value):
+        """
+        converts the given entity into a dict.
+
+        :param BaseEntity value: value to be converted.
+
+        :rtype: dict
+        """
+
+        return value.to_dict()
+
+    @classmethod
+    def _get_converter(cls, value_type):
+        """
+        gets the name of converter method of given type.
+
+        it returns None if there is no converter for given type.
+
+        :param type value_type: type to get its converter.
+
+        :rtype: str
+        """
+
+        key = (cls, value_type)
+        if key not in _converters:
+            name = None
+            for base in value_type.__mro__:
+                name = cls.converters.get(base)
+                if name is not None:
+                    break
+
+            _converters[key] = name
+
+        return _converters[key]
+
     def default(self, o):
         """
         implement this method in a subclass such that it returns a
@@ -33,15 +184,13 @@ class CoreJSONEncoder(JSONEncoder):
         :returns: serializable object
         """
 
-        if isinstance(o, datetime):
-            return datetime_services.to_datetime_string(o, to_server=False, from_server=True)
-        if isinstance(o, date):
-            return datetime_services.to_date_string(o)
-        if isinstance(o, time):
-            return datetime_services.to_time_string(o, to_server=False, from_server=True)
-        if isinstance(o, bytes):
-            return encoding.bytes_to_base64_string(o)
-        if isinstance(o, BaseEntity):
-            return o.to_dict()
+        name = self._get_converter(type(o))
+        if name is not None:
+            return getattr(self, name)(o)
 
         return super().default(o)
+
+
+# a dict containing the resolved converter method name of each type for each encoder.
+# in the form of: {tuple[type encoder_class, type value_type]: str name}
+_converters = {}
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""
+json exceptions module.
+"""
+
+from pyrin.core.exceptions import CoreException
+
+
+class JSONException(CoreException):
+    """
+    json exception.
+    """
+    pass
+
+
+class InvalidJSONBackendError(JSONException):
+    """
+    invalid json backend error.
+    """
+    pass
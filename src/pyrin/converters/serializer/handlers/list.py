@@ -7,6 +7,7 @@ import pyrin.converters.serializer.services as serializer_services
 import pyrin.configuration.services as config_services
 
 from pyrin.converters.serializer.decorators import serializer
+from pyrin.database.model.conversion import ConversionPlanner
 from pyrin.converters.serializer.handlers.base import SerializerBase
 
 
@@ -51,6 +52,12 @@ class ListSerializer(SerializerBase):
                                              used to create computed columns.
                                              defaults to None if not provided.
 
+        :keyword ConversionPlanner planner: conversion planner to be used for
+                                            entities of the list. if not provided,
+                                            a new one will be created from given
+                                            options and will be shared between
+                                            all items.
+
         :returns: serialized list of objects
         :rtype: list[dict]
         """
@@ -61,6 +68,9 @@ class ListSerializer(SerializerBase):
         indexed = options.get('indexed', False)
         index_name = options.get('index_name', self._default_index_name)
         start_index = options.get('start_index', self._default_start_index)
+        if options.get('planner') is None:
+            options.update(planner=ConversionPlanner(**options))
+
         result = []
 
         # if indexing is requested, all items must be a dict after serialization.
@@ -28,15 +28,93 @@ class HookMixin(CoreObject):
 
         self._hooks = []
 
-    def _get_hooks(self):
+        # a dict containing the hooks which override each hook method.
+        # it is rebuilt on each registration, so hook methods which are
+        # not overridden by any hook will not be called at all.
+        # in the form of: {str method_name: tuple[Hook]}
+        self._dispatch_table = self._build_dispatch_table()
+
+    def _get_hooks(self, method_name=None):
+        """
+        gets registered hooks.
+
+        if method name is provided, it only gets the hooks which override that
+        method. it gets all registered hooks if method name is not provided or
+        it is not a method of `hook_type`.
+
+        :param str method_name: hook method name to get its hooks.
+
+        :returns: list[Hook] | tuple[Hook]
+        :rtype: list | tuple
+        """
+
+        if method_name is None:
+            return self._hooks
+
+        hooks = self._dispatch_table.get(method_name)
+        if hooks is None:
+            return self._hooks
+
+        return hooks
+
+    def _get_hook_method_names(self):
+        """
+        gets the names of all public methods of `hook_type`.
+
+        :rtype: list[str]
+        """
+
+        names = []
+        for base in self.hook_type.__mro__:
+            if base is Hook or not issubclass(base, Hook):
+                continue
+
+            for name, value in vars(base).items():
+                if not name.startswith('_') and callable(value) and name not in names:
+                    names.append(name)
+
+        return names
+
+    def _is_overridden(self, instance, method_name):
+        """
+        gets a value indicating that given hook overrides the given method of `hook_type`.
+
+        :param Hook instance: hook instance.
+        :param str method_name: hook method name.
+
+        :rtype: bool
         """
-        gets all registered hooks.
 
-        :returns: list[Hook]
-        :rtype: list
+        if method_name in vars(instance):
+            return True
+
+        return getattr(type(instance), method_name, None) is not \
+            getattr(self.hook_type, method_name, None)
+
+    def _build_dispatch_table(self):
+        """
+        builds the dispatch table of current hooks.
+
+        :returns: dict[str method_name: tuple[Hook]]
+        :rtype: dict
+        """
+
+        return {name: tuple(hook for hook in self._hooks if self._is_overridden(hook, name))
+                for name in self._get_hook_method_names()}
+
+    def get_active_hooks(self):
+        """
+        gets the active hooks of each hook method.
+
+        active hooks of a method are the hooks which override that method.
+        methods which are not overridden by any hook have an empty list.
+
+        :returns: dict[str method_name: list[str] hook_names]
+        :rtype: dict
         """
 
-        return self._hooks
+        return {name: [misc_utils.try_get_fully_qualified_name(type(hook)) for hook in hooks]
+                for name, hooks in self._dispatch_table.items()}
 
     def register_hook(self, instance):
         """
@@ -54,3 +132,4 @@ class HookMixin(CoreObject):
                                                .format(instance=instance,
                                                        hook=full_name))
         self._hooks.append(instance)
+        self._dispatch_table = self._build_dispatch_table()
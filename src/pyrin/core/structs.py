@@ -7,7 +7,8 @@ from collections import deque
 from threading import Lock
 from abc import abstractmethod
 
-from werkzeug.datastructures import MultiDict, ImmutableMultiDict, ImmutableDict, Headers
+from werkzeug.datastructures import MultiDict, ImmutableMultiDict, ImmutableDict, Headers, \
+    ImmutableList, ImmutableDictMixin
 
 import pyrin.utils.misc as misc_utils
 
@@ -572,6 +573,53 @@ class CoreImmutableDict(ImmutableDict):
         return dict.__repr__(self)
 
 
+class CoreImmutableDTO(ImmutableDictMixin, DTO):
+    """
+    core immutable dto class.
+
+    it is the same as `DTO` but it could not be modified.
+    """
+
+    def __hash__(self):
+        """
+        gets the hash of this object.
+
+        :rtype: int
+        """
+
+        return hash(frozenset(self.items()))
+
+    def __repr__(self):
+        return dict.__repr__(self)
+
+    def copy(self):
+        """
+        returns a shallow mutable copy of this object.
+
+        :rtype: DTO
+        """
+
+        return DTO(self)
+
+
+class CoreImmutableList(ImmutableList):
+    """
+    core immutable list class.
+    """
+
+    def __repr__(self):
+        return list.__repr__(self)
+
+    def copy(self):
+        """
+        returns a shallow mutable copy of this object.
+
+        :rtype: list
+        """
+
+        return list(self)
+
+
 class CoreHeaders(Headers):
     """
     core headers class.
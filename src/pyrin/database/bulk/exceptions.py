@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""
+database bulk exceptions module.
+"""
+
+from pyrin.core.exceptions import CoreException
+
+
+class DatabaseBulkException(CoreException):
+    """
+    database bulk exception.
+    """
+    pass
+
+
+class BulkEntityTypeIsRequiredError(DatabaseBulkException):
+    """
+    bulk entity type is required error.
+    """
+    pass
@@ -253,3 +253,115 @@ def update(*entities, **options):
     """
 
     return get_component(DatabaseBulkPackage.COMPONENT_NAME).update(*entities, **options)
+
+
+def stream_insert(values, entity=None, **options):
+    """
+    bulk inserts the given values while consuming them in chunks.
+
+    values could be any iterable or generator of entities or mappings
+    from the same type. each chunk is serialized lazily and inserted
+    using a core insert statement, then the store will be committed.
+    so it could insert a large number of values with bounded memory.
+
+    note that core insert statements do not fire orm events and
+    all mappings of each chunk must have the same keys.
+
+    :param iterable[BaseEntity | dict] values: values to be inserted.
+
+    :param type[BaseEntity] entity: entity class of the values.
+                                    it is required if the values are mappings.
+
+    :keyword int chunk_size: chunk size to insert values.
+                             after each chunk, store will be committed.
+                             if not provided, it will be get from
+                             `chunk_size` of `bulk` section of
+                             `database` config store.
+
+    :keyword bool multi_values: specifies that each chunk must be inserted using
+                                a single statement with multiple values, instead
+                                of executemany. note that `chunk_size` multiplied
+                                by the number of columns, must not exceed the max
+                                number of bind params of the database. for example
+                                sqlite accepts 32766 params since version 3.32.0.
+                                defaults to False if not provided.
+
+    :keyword bool return_primary_keys: specifies that primary keys of inserted
+                                       rows must be returned. if the database
+                                       does not support `RETURNING`, rows will
+                                       be inserted one by one to fetch their keys,
+                                       unless all primary keys are already known.
+                                       defaults to False if not provided.
+
+    :keyword bool prefetch_sequences: specifies that values of sequence columns which
+                                      are not provided, must be allocated using
+                                      sequence services for each chunk at once,
+                                      before inserting the chunk. defaults to
+                                      False if not provided.
+
+    :keyword SECURE_TRUE | SECURE_FALSE readable: specifies that any column or attribute
+                                                  which has `allow_read=False` or its name
+                                                  starts with underscore `_`, should not
+                                                  be included in inserted values. defaults
+                                                  to `SECURE_FALSE` if not provided.
+
+    :keyword dict[str, list[str]] | list[str] exclude: column names to be excluded from
+                                                       inserted values. it accepts all
+                                                       serialization options of `insert`
+                                                       method as well.
+
+    :raises BulkEntityTypeIsRequiredError: bulk entity type is required error.
+
+    :returns: count of inserted rows or a list of primary keys of
+              inserted rows if `return_primary_keys=True` is provided.
+
+    :rtype: int | list[tuple]
+    """
+
+    return get_component(DatabaseBulkPackage.COMPONENT_NAME).stream_insert(values, entity=entity,
+                                                                           **options)
+
+
+def stream_update(values, entity=None, **options):
+    """
+    bulk updates the given values while consuming them in chunks.
+
+    values could be any iterable or generator of entities or mappings
+    from the same type. each chunk is serialized lazily and updated by
+    primary key using a core update statement with executemany, then the
+    store will be committed. so it could update a large number of values
+    with bounded memory.
+
+    note that core update statements do not fire orm events and all
+    mappings of each chunk must have the same keys including primary keys.
+
+    :param iterable[BaseEntity | dict] values: values to be updated.
+
+    :param type[BaseEntity] entity: entity class of the values.
+                                    it is required if the values are mappings.
+
+    :keyword int chunk_size: chunk size to update values.
+                             after each chunk, store will be committed.
+                             if not provided, it will be get from
+                             `chunk_size` of `bulk` section of
+                             `database` config store.
+
+    :keyword SECURE_TRUE | SECURE_FALSE readable: specifies that any column or attribute
+                                                  which has `allow_read=False` or its name
+                                                  starts with underscore `_`, should not
+                                                  be included in updated values. defaults
+                                                  to `SECURE_FALSE` if not provided.
+
+    :keyword dict[str, list[str]] | list[str] exclude: column names to be excluded from
+                                                       updated values. it accepts all
+                                                       serialization options of `update`
+                                                       method as well.
+
+    :raises BulkEntityTypeIsRequiredError: bulk entity type is required error.
+
+    :returns: count of updated values.
+    :rtype: int
+    """
+
+    return get_component(DatabaseBulkPackage.COMPONENT_NAME).stream_update(values, entity=entity,
+                                                                           **options)
@@ -515,7 +515,7 @@ class DatabaseManager(Manager, HookMixin):
         this will call `after_session_factories_configured` method of registered hooks.
         """
 
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('after_session_factories_configured'):
             hook.after_session_factories_configured()
 
     def get_entity_engine(self, entity):
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+model conversion module.
+"""
+
+import pyrin.configuration.services as config_services
+
+from pyrin.core.structs import CoreObject
+from pyrin.core.globals import SECURE_TRUE, SECURE_FALSE
+from pyrin.database.model.exceptions import InvalidDepthProvidedError
+
+
+class ConversionPlan(CoreObject):
+    """
+    conversion plan class.
+
+    it holds the attributes of an entity class which must be converted
+    for a set of conditions, so they are computed once and reused for
+    all entities of that class.
+    """
+
+    def __init__(self, attributes, relationships):
+        """
+        initializes an instance of ConversionPlan.
+
+        :param tuple[tuple[str, str]] attributes: source attribute and output key
+                                                  of each non-relationship attribute.
+
+        :param tuple[tuple[str, str]] relationships: source attribute and output key
+                                                     of each relationship attribute.
+                                                     related entities must be converted
+                                                     using the child planner.
+        """
+
+        super().__init__()
+
+        self._attributes = attributes
+        self._relationships = relationships
+
+    @property
+    def attributes(self):
+        """
+        gets source attribute and output key of each non-relationship attribute.
+
+        :rtype: tuple[tuple[str, str]]
+        """
+
+        return self._attributes
+
+    @property
+    def relationships(self):
+        """
+        gets source attribute and output key of each relationship attribute.
+
+        :rtype: tuple[tuple[str, str]]
+        """
+
+        return self._relationships
+
+
+class ConversionPlanner(CoreObject):
+    """
+    conversion planner class.
+
+    it holds the conditions of a conversion and gets the plan of
+    each entity class for them. a single planner could be passed to
+    `to_dict()` of many entities to prevent preparing the same
+    conditions for each entity.
+    """
+
+    def __init__(self, **options):
+        """
+        initializes an instance of ConversionPlanner.
+
+        :keyword SECURE_TRUE | SECURE_FALSE readable: specifies that any column or attribute
+                                                      which has `allow_read=False` or its name
+                                                      starts with underscore `_`, should not
+                                                      be included in result dict. defaults to
+                                                      `SECURE_TRUE` if not provided.
+
+        :keyword dict[str, list[str]] | list[str] columns: column names to be included in result.
+
+        :keyword dict[str, dict[str, str]] | dict[str, str] rename: column names that must be
+                                                                    renamed in the result.
+
+        :keyword dict[str, list[str]] | list[str] exclude: column names to be excluded from
+                                                           result.
+
+        :keyword int depth: a value indicating the depth for conversion.
+                            defaults to `default_depth` value of database
+                            config store.
+        """
+
+        super().__init__()
+
+        readable = options.get('readable', SECURE_TRUE)
+        if readable is not SECURE_FALSE:
+            readable = SECURE_TRUE
+
+        depth = options.get('depth', None)
+        if depth is None:
+            depth = config_services.get('database', 'conversion', 'default_depth')
+
+        self._readable = readable
+        self._depth = depth
+        self._columns = options.get('columns', None)
+        self._rename = options.get('rename', None)
+        self._exclude = options.get('exclude', None)
+        self._key = (readable is SECURE_TRUE, depth, _freeze(self._columns),
+                     _freeze(self._rename), _freeze(self._exclude))
+
+        self._child = None
+
+        # a dict containing plans of each entity class which has been used with this planner.
+        # in the form of: {type entity_class: ConversionPlan plan}
+        self._plans = {}
+
+    def _create_plan(self, entity_class):
+        """
+        creates the conversion plan of given entity class.
+
+        :param type[BaseEntity] entity_class: entity class to create its plan.
+
+        :raises InvalidDepthProvidedError: invalid depth provided error.
+
+        :rtype: ConversionPlan
+        """
+
+        requested_columns, rename, excluded_columns = \
+            entity_class._extract_entity_conditions(columns=self._columns,
+                                                    rename=self._rename,
+                                                    exclude=self._exclude)
+
+        if self._readable is SECURE_FALSE:
+            all_attributes = entity_class.all_attributes
+            relations = entity_class.relationships
+        else:
+            all_attributes = entity_class.all_readable_attributes
+            relations = entity_class.exposed_relationships
+
+        if len(requested_columns) > 0:
+            requested_columns = [item for item in all_attributes
+                                 if item in requested_columns]
+        else:
+            requested_columns = [item for item in all_attributes
+                                 if item not in excluded_columns]
+
+        attributes = []
+        relationships = []
+        for col in requested_columns:
+            if col in relations:
+                relationships.append((col, rename.get(col, col)))
+            else:
+                attributes.append((col, rename.get(col, col)))
+
+        if self._depth <= 0:
+            relationships = []
+        elif len(relationships) > 0:
+            if self._depth > entity_class.MAX_DEPTH:
+                raise InvalidDepthProvidedError('Maximum valid "depth" for conversion '
+                                                'is [{max_depth}]. provided depth '
+                                                '[{invalid_depth}] is invalid.'
+                                                .format(max_depth=entity_class.MAX_DEPTH,
+                                                        invalid_depth=self._depth))
+
+        return ConversionPlan(tuple(attributes), tuple(relationships))
+
+    def get_plan(self, entity_class):
+        """
+        gets the conversion plan of given entity class.
+
+        plans are shared between all planners with the same conditions.
+
+        :param type[BaseEntity] entity_class: entity class to get its plan.
+
+        :raises InvalidDepthProvidedError: invalid depth provided error.
+
+        :rtype: ConversionPlan
+        """
+
+        plan = self._plans.get(entity_class)
+        if plan is None:
+            key = (entity_class,) + self._key
+            plan = _plans.get(key)
+            if plan is None:
+                plan = self._create_plan(entity_class)
+                if len(_plans) >= MAX_PLANS:
+                    _plans.clear()
+
+                _plans[key] = plan
+
+            self._plans[entity_class] = plan
+
+        return plan
+
+    def matches(self, **options):
+        """
+        gets a value indicating that given options are the conditions of this planner.
+
+        the conditions are compared by identity, so it is cheap enough to be
+        called for each entity. this prevents using a planner for an entity
+        which has changed the conditions before calling `to_dict()`.
+
+        :keyword SECURE_TRUE | SECURE_FALSE readable: readable value.
+        :keyword dict[str, list[str]] | list[str] columns: column names to be included in result.
+        :keyword dict[str, dict[str, str]] | dict[str, str] rename: column names to be renamed.
+        :keyword dict[str, list[str]] | list[str] exclude: column names to be excluded.
+        :keyword int depth: a value indicating the depth for conversion.
+
+        :rtype: bool
+        """
+
+        depth = options.get('depth', None)
+        return options.get('columns', None) is self._columns and \
+            options.get('rename', None) is self._rename and \
+            options.get('exclude', None) is self._exclude and \
+            (options.get('readable', SECURE_TRUE) is SECURE_FALSE) is \
+            (self._readable is SECURE_FALSE) and \
+            (depth is None or depth == self._depth)
+
+    @property
+    def child(self):
+        """
+        gets the planner of related entities.
+
+        it has the same conditions of this planner with one less depth.
+
+        :rtype: ConversionPlanner
+        """
+
+        if self._child is None:
+            self._child = ConversionPlanner(readable=self._readable,
+                                            columns=self._columns,
+                                            rename=self._rename,
+                                            exclude=self._exclude,
+                                            depth=self._depth - 1)
+
+        return self._child
+
+    @property
+    def depth(self):
+        """
+        gets the depth of this planner.
+
+        :rtype: int
+        """
+
+        return self._depth
+
+
+def _freeze(value):
+    """
+    converts the given condition value into a hashable value.
+
+    :param dict | list | set | tuple | str value: value to be converted.
+
+    :rtype: object
+    """
+
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+
+    return value
+
+
+# maximum number of plans to be kept. all plans will be
+# removed if this limit is reached, to prevent unbounded growth
+# when conditions are generated dynamically.
+MAX_PLANS = 2000
+
+# a dict containing shared conversion plans.
+# in the form of: {tuple key: ConversionPlan plan}
+_plans = {}
@@ -40,7 +40,7 @@ class ModelManager(Manager, HookMixin):
         this will call `after_entities_collected` method of registered hooks.
         """
 
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('after_entities_collected'):
             hook.after_entities_collected()
 
     def get_declarative_base(self):
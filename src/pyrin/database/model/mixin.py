@@ -25,7 +25,7 @@ from sqlalchemy import inspect as sqla_inspect, UniqueConstraint
 
 import pyrin.globalization.datetime.services as datetime_services
 import pyrin.database.model.services as model_services
-import pyrin.configuration.services as config_services
+import pyrin.database.sequence.services as sequence_services
 import pyrin.utils.sqlalchemy as sqlalchemy_utils
 import pyrin.utils.misc as misc_utils
 
@@ -39,10 +39,11 @@ from pyrin.database.orm.sql.schema.columns import TimeStampColumn
 from pyrin.utils.custom_print import print_warning
 from pyrin.core.exceptions import CoreNotImplementedError
 from pyrin.database.services import get_current_store
+from pyrin.database.model.conversion import ConversionPlanner
 from pyrin.core.structs import DTO, CoreImmutableDict
 from pyrin.utils.exceptions import InvalidOrderingColumnError
 from pyrin.database.model.exceptions import ColumnNotExistedError, \
-    InvalidDeclarativeBaseTypeError, InvalidDepthProvidedError, InvalidOrderingColumnTypeError
+    InvalidDeclarativeBaseTypeError, InvalidOrderingColumnTypeError
 
 
 class ModelMixinBase:
@@ -1053,53 +1054,32 @@ class ConverterMixin:
                             in `ConverterMixin.MAX_DEPTH` class variable. providing higher
                             `depth` value than this limit, will cause an error.
 
+        :keyword ConversionPlanner planner: conversion planner to be used instead of
+                                            preparing the conditions on each call.
+                                            if provided, `readable`, `columns`, `rename`,
+                                            `exclude` and `depth` must be the same
+                                            objects which it has been created with.
+                                            it could be used to convert many entities
+                                            with the same conditions.
+
         :raises InvalidDepthProvidedError: invalid depth provided error.
 
         :rtype: dict
         """
 
-        all_attributes = None
-        relations = None
-        requested_columns, rename, excluded_columns = self._extract_conditions(**options)
-        readable = options.get('readable', SECURE_TRUE)
-
-        depth = options.get('depth', None)
-        if depth is None:
-            depth = config_services.get('database', 'conversion', 'default_depth')
-
-        if readable is SECURE_FALSE:
-            all_attributes = self.all_attributes
-            relations = self.relationships
-        else:
-            all_attributes = self.all_readable_attributes
-            relations = self.exposed_relationships
-
-        requested_relationships = []
-        all_attributes = set(all_attributes)
-        if len(requested_columns) > 0:
-            requested_columns = requested_columns.intersection(all_attributes)
-        else:
-            requested_columns = all_attributes.difference(excluded_columns)
+        planner = options.get('planner')
+        if planner is None or planner.matches(**options) is not True:
+            planner = ConversionPlanner(**options)
 
+        plan = planner.get_plan(type(self))
         result = DTO()
-        for col in requested_columns:
-            if col in relations:
-                requested_relationships.append(col)
-            else:
-                result[rename.get(col, col)] = getattr(self, col)
-
-        if depth > 0 and len(requested_relationships) > 0:
-            if depth > self.MAX_DEPTH:
-                raise InvalidDepthProvidedError('Maximum valid "depth" for conversion '
-                                                'is [{max_depth}]. provided depth '
-                                                '[{invalid_depth}] is invalid.'
-                                                .format(max_depth=self.MAX_DEPTH,
-                                                        invalid_depth=depth))
-
-            options.update(depth=depth - 1)
-            for relation in requested_relationships:
+        for col, new_name in plan.attributes:
+            result[new_name] = getattr(self, col)
+
+        if len(plan.relationships) > 0:
+            options.update(depth=planner.depth - 1, planner=planner.child)
+            for relation, new_name in plan.relationships:
                 value = getattr(self, relation)
-                new_name = rename.get(relation, relation)
                 result[new_name] = None
                 if value is not None:
                     if isinstance(value, LIST_TYPES):
@@ -1360,20 +1340,44 @@ class ConverterMixin:
         :rtype: tuple[set[str], dict[str, str], set[str]]
         """
 
+        return self._extract_entity_conditions(**options)
+
+    @classmethod
+    def _extract_entity_conditions(cls, **options):
+        """
+        extracts all conditions available in given options for this entity class.
+
+        it extracts columns, rename and exclude values. it is a class method,
+        so conversion plans could be created without an entity instance.
+        see `_extract_conditions` method for all available options.
+
+        :keyword dict[str, list[str]] | list[str] columns: column names to be included in result.
+        :keyword dict[str, dict[str, str]] | dict[str, str] rename: column names that must be
+                                                                    renamed in the result.
+        :keyword dict[str, list[str]] | list[str] exclude: column names to be excluded from
+                                                           result.
+
+        :returns: tuple[set[str column_name],
+                        dict[str original_column, str new_column],
+                        set[str excluded_column]]
+
+        :rtype: tuple[set[str], dict[str, str], set[str]]
+        """
+
         columns = options.get('columns', None)
         rename = options.get('rename', None)
         exclude = options.get('exclude', None)
 
         if isinstance(columns, dict):
-            columns = columns.get(self.get_class_name(), None)
+            columns = columns.get(cls.__name__, None)
 
         if isinstance(rename, dict) and len(rename) > 0 and \
                 isinstance(list(rename.values())[0], dict):
 
-            rename = rename.get(self.get_class_name(), None)
+            rename = rename.get(cls.__name__, None)
 
         if isinstance(exclude, dict):
-            exclude = exclude.get(self.get_class_name(), None)
+            exclude = exclude.get(cls.__name__, None)
 
         if columns is None:
             columns = []
@@ -2117,6 +2121,9 @@ class DefaultPrefetchMixin(ModelMixinBase):
         prefetching by passing `prefetch_complex_defaults=False` in corresponding method.
         otherwise unexpected behavior may occur.
 
+        sequence values are handed out by sequence services from blocks which
+        are kept in memory, to prevent a round trip for each entity.
+
         :param ColumnDefault default: column default instance.
 
         :returns: object
@@ -2125,8 +2132,7 @@ class DefaultPrefetchMixin(ModelMixinBase):
         # the order of if conditions must be exactly this way. because
         # 'Sequence' object does not have the other attributes.
         if default.is_sequence:
-            store = get_current_store()
-            return store.execute(default.next_value()).scalar()
+            return sequence_services.next_value(default, mapper=cls)
         elif default.is_scalar:
             return default.arg
         elif default.is_callable:
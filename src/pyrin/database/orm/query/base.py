@@ -300,6 +300,8 @@ class CoreQuery(Query):
         sets the offset and limit for current query.
 
         the offset and limit values will be extracted from given inputs.
+        the actual pagination is delegated to the paginator of current request.
+        for example, `KeysetPaginator` filters the query by its cursor instead of offset.
         note that `.paginate` must be called after all other query methods
         have been called. otherwise unexpected behaviour may occur.
 
@@ -313,7 +315,9 @@ class CoreQuery(Query):
         :keyword SECURE_TRUE | SECURE_FALSE inject_total: inject total count into
                                                           current request.
                                                           defaults to `SECURE_FALSE`
-                                                          if not provided.
+                                                          if not provided. the total
+                                                          count will be produced using
+                                                          the count mode of paginator.
 
         :keyword CoreColumn column: column to be used in count function.
                                     defaults to `*` if not provided.
@@ -340,10 +344,15 @@ class CoreQuery(Query):
 
         if paginator is not None:
             if inject_total is SECURE_TRUE:
-                paginator.total_count = self.order_by(None).count(**options)
-
-            limit, offset = paging_services.get_paging_keys(**options)
-            return self.limit(limit).offset(offset)
+                total_count, mode = paging_services.count(self.order_by(None),
+                                                          mode=paginator.count_mode,
+                                                          column=options.get('column'),
+                                                          distinct=options.get('distinct',
+                                                                               False))
+                paginator.total_count = total_count
+                paginator.total_count_mode = mode
+
+            return paginator.prepare_query(self, **options)
 
         return self
 
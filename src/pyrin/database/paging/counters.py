@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""
+database paging counters module.
+"""
+
+import json
+
+from abc import abstractmethod
+from hashlib import blake2b
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import lazyload
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.expression import ClauseElement
+from sqlalchemy.ext.compiler import compiles
+
+import pyrin.caching.services as caching_services
+import pyrin.configuration.services as config_services
+
+from pyrin.core.structs import CoreObject
+from pyrin.core.exceptions import CoreNotImplementedError
+from pyrin.database.enumerations import DialectEnum
+from pyrin.database.paging.enumerations import CountModeEnum
+from pyrin.settings.static import APPLICATION_ENCODING
+
+
+class CounterBase(CoreObject):
+    """
+    counter base class.
+
+    all total count strategies of paginated queries must be subclassed from this.
+    """
+
+    # the count mode that this counter provides.
+    mode = None
+
+    @abstractmethod
+    def count(self, query, **options):
+        """
+        gets the total count of rows of given query.
+
+        it returns a tuple of two items. first item is the total count and
+        the second item is the count mode which has produced the count.
+
+        :param CoreQuery query: query to get its total count.
+
+        :keyword CoreColumn column: column to be used in count function.
+        :keyword bool distinct: specifies that count should be executed on distinct select.
+
+        :raises CoreNotImplementedError: core not implemented error.
+
+        :returns: tuple[int count, str mode]
+        :rtype: tuple[int, str]
+        """
+
+        raise CoreNotImplementedError()
+
+
+class ExactCounter(CounterBase):
+    """
+    exact counter class.
+
+    it executes a count query on each call.
+    """
+
+    mode = CountModeEnum.EXACT
+
+    def count(self, query, **options):
+        """
+        gets the total count of rows of given query.
+
+        it returns a tuple of two items. first item is the total count and
+        the second item is the count mode which has produced the count.
+
+        :param CoreQuery query: query to get its total count.
+
+        :keyword CoreColumn column: column to be used in count function.
+        :keyword bool distinct: specifies that count should be executed on distinct select.
+
+        :returns: tuple[int count, str mode]
+        :rtype: tuple[int, str]
+        """
+
+        return query.count(**options), CountModeEnum.EXACT
+
+
+class CachedCounter(ExactCounter):
+    """
+    cached counter class.
+
+    it caches the exact count of each query and its bind params for a short time.
+    so consecutive page requests of the same list do not execute count queries.
+    """
+
+    mode = CountModeEnum.CACHED
+
+    def _get_key(self, query):
+        """
+        gets the cache key of given query.
+
+        it is generated from the compiled statement and its bind params.
+
+        :param CoreQuery query: query to get its key.
+
+        :rtype: str
+        """
+
+        compiled = query.options(lazyload('*')).statement.compile()
+        params = sorted(compiled.params.items())
+        value = '{statement}:{params}'.format(statement=compiled, params=params)
+        digest = blake2b(value.encode(APPLICATION_ENCODING), digest_size=20).hexdigest()
+        return 'paging.count.{digest}'.format(digest=digest)
+
+    def count(self, query, **options):
+        """
+        gets the total count of rows of given query.
+
+        it returns a tuple of two items. first item is the total count and
+        the second item is the count mode which has produced the count.
+
+        :param CoreQuery query: query to get its total count.
+
+        :keyword CoreColumn column: column to be used in count function.
+        :keyword bool distinct: specifies that count should be executed on distinct select.
+
+        :returns: tuple[int count, str mode]
+        :rtype: tuple[int, str]
+        """
+
+        name = config_services.get('database', 'paging', 'count_cache_name')
+        key = self._get_key(query)
+        result = caching_services.get(name, key)
+        if result is not None:
+            return result, CountModeEnum.CACHED
+
+        result, mode = super().count(query, **options)
+        expire = config_services.get('database', 'paging', 'count_cache_expire')
+        caching_services.set(name, key, result, expire=expire)
+        return result, mode
+
+
+class Explain(Executable, ClauseElement):
+    """
+    explain class.
+
+    it is a sql construct to get the execution plan of a select statement.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        """
+        initializes an instance of Explain.
+
+        :param Select statement: statement to get its execution plan.
+        """
+
+        super().__init__()
+
+        self.statement = statement
+
+
+@compiles(Explain, DialectEnum.POSTGRESQL)
+def _compile_explain_postgresql(element, compiler, **options):
+    """
+    compiles the given explain construct for postgresql.
+
+    :param Explain element: explain construct.
+    :param SQLCompiler compiler: sql compiler.
+
+    :rtype: str
+    """
+
+    return 'EXPLAIN (FORMAT JSON) {statement}'.format(
+        statement=compiler.process(element.statement, **options))
+
+
+class EstimatedCounter(ExactCounter):
+    """
+    estimated counter class.
+
+    it uses the row estimate of database query planner as total count if it
+    is bigger than `count_estimate_threshold`. otherwise, or if the database
+    could not provide an estimate, it executes an exact count query.
+
+    estimates are supported for postgresql using `EXPLAIN`, and for sqlite
+    using `sqlite_stat1` table, only for queries without any filters on a
+    single table which has been analyzed.
+    """
+
+    mode = CountModeEnum.ESTIMATED
+
+    def _estimate_postgresql(self, query, statement):
+        """
+        gets the row estimate of given statement on postgresql.
+
+        :param CoreQuery query: query of the statement.
+        :param Select statement: statement to get its estimate.
+
+        :rtype: int
+        """
+
+        plan = query.session.execute(Explain(statement),
+                                     bind_arguments=dict(clause=statement)).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]['Plan']['Plan Rows'])
+
+    def _estimate_sqlite(self, query, statement):
+        """
+        gets the row estimate of given statement on sqlite.
+
+        it returns None if the statement is not on a single table without filters.
+
+        :param CoreQuery query: query of the statement.
+        :param Select statement: statement to get its estimate.
+
+        :rtype: int
+        """
+
+        froms = statement.froms
+        if statement.whereclause is not None or len(froms) != 1 or \
+                getattr(froms[0], 'name', None) is None:
+            return None
+
+        stat = query.session.execute(text('SELECT stat FROM sqlite_stat1 '
+                                          'WHERE tbl = :name LIMIT 1'),
+                                     dict(name=froms[0].name),
+                                     bind_arguments=dict(clause=statement)).scalar()
+        if stat is None:
+            return None
+
+        return int(stat.split()[0])
+
+    def _estimate(self, query):
+        """
+        gets the row estimate of given query.
+
+        it returns None if an estimate could not be provided.
+        the estimate is executed in a savepoint, so a failed estimate query,
+        for example on a sqlite database which has not been analyzed, will
+        not affect the current transaction and the exact count could be used.
+
+        :param CoreQuery query: query to get its estimate.
+
+        :rtype: int
+        """
+
+        statement = query.options(lazyload('*')).statement
+        dialect = query.session.get_bind(clause=statement).dialect.name
+        if dialect not in (DialectEnum.POSTGRESQL, DialectEnum.SQLITE):
+            return None
+
+        try:
+            with query.session.begin_nested():
+                if dialect == DialectEnum.POSTGRESQL:
+                    return self._estimate_postgresql(query, statement)
+
+                return self._estimate_sqlite(query, statement)
+        except DBAPIError:
+            return None
+
+    def count(self, query, **options):
+        """
+        gets the total count of rows of given query.
+
+        it returns a tuple of two items. first item is the total count and
+        the second item is the count mode which has produced the count.
+
+        :param CoreQuery query: query to get its total count.
+
+        :keyword CoreColumn column: column to be used in count function.
+        :keyword bool distinct: specifies that count should be executed on distinct select.
+
+        :returns: tuple[int count, str mode]
+        :rtype: tuple[int, str]
+        """
+
+        estimate = self._estimate(query)
+        threshold = config_services.get('database', 'paging', 'count_estimate_threshold')
+        if estimate is not None and estimate > threshold:
+            return estimate, CountModeEnum.ESTIMATED
+
+        return super().count(query, **options)
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+database paging enumerations module.
+"""
+
+from pyrin.core.enumerations import CoreEnum
+
+
+class CountModeEnum(CoreEnum):
+    """
+    count mode enum.
+    """
+
+    EXACT = 'exact'
+    CACHED = 'cached'
+    ESTIMATED = 'estimated'
@@ -32,3 +32,31 @@ class TotalCountIsAlreadySetError(DatabasePagingException):
     total count is already set error.
     """
     pass
+
+
+class InvalidCursorError(DatabasePagingBusinessException):
+    """
+    invalid cursor error.
+    """
+    pass
+
+
+class KeysetOrderingRequiredError(DatabasePagingException):
+    """
+    keyset ordering required error.
+    """
+    pass
+
+
+class CursorValueNotFoundError(DatabasePagingException):
+    """
+    cursor value not found error.
+    """
+    pass
+
+
+class InvalidCountModeError(DatabasePagingException):
+    """
+    invalid count mode error.
+    """
+    pass
@@ -8,6 +8,9 @@ import pyrin.security.session.services as session_services
 
 from pyrin.core.structs import Manager
 from pyrin.database.paging import DatabasePagingPackage
+from pyrin.database.paging.enumerations import CountModeEnum
+from pyrin.database.paging.exceptions import InvalidCountModeError
+from pyrin.database.paging.counters import ExactCounter, CachedCounter, EstimatedCounter
 from pyrin.security.session.enumerations import RequestContextEnum
 
 
@@ -25,6 +28,7 @@ class DatabasePagingManager(Manager):
     # these values could be customized in 'paging' section of database config store.
     PAGE_PARAM = 'page'
     PAGE_SIZE_PARAM = 'page_size'
+    CURSOR_PARAM = 'cursor'
 
     package_class = DatabasePagingPackage
 
@@ -47,21 +51,45 @@ class DatabasePagingManager(Manager):
         else:
             self._page_size_param = self.PAGE_SIZE_PARAM
 
-    def extract_paging_params(self, values):
+        cursor_param = config_services.get('database', 'paging', 'cursor_param')
+        if cursor_param not in (None, '') and not cursor_param.isspace():
+            self._cursor_param = cursor_param
+        else:
+            self._cursor_param = self.CURSOR_PARAM
+
+        # a dict containing all available counters for total count of paginated queries.
+        # in the form of: {str mode: CounterBase counter}
+        self._counters = {counter.mode: counter for counter in
+                          (ExactCounter(), CachedCounter(), EstimatedCounter())}
+
+        self._count_mode = config_services.get('database', 'paging', 'count_mode',
+                                               default=CountModeEnum.EXACT)
+
+    def extract_paging_params(self, values, **options):
         """
         extracts paging parameters from given dict and returns them as a new dict.
 
-        the values will be removed from input dict.
+        the values will be removed from input dict. the cursor param will
+        only be extracted if `keyset` is set to True, otherwise it will be
+        left in input dict and the cursor will be None in the result.
 
         :param dict values: a dict to extract paging params from it.
 
+        :keyword bool keyset: specifies that cursor param must also be extracted.
+                              it should be set for routes which are paged
+                              using keyset pagination. defaults to False.
+
         :returns: dict(int page: page number,
-                       int page_size: page size)
+                       int page_size: page size,
+                       str cursor: cursor token)
         :rtype: dict
         """
 
         page = values.pop(self._page_param, None)
         page_size = values.pop(self._page_size_param, None)
+        cursor = None
+        if options.get('keyset', False) is True:
+            cursor = values.pop(self._cursor_param, None)
 
         if isinstance(page, list):
             if len(page) > 0:
@@ -75,9 +103,16 @@ class DatabasePagingManager(Manager):
             else:
                 page_size = None
 
+        if isinstance(cursor, list):
+            if len(cursor) > 0:
+                cursor = cursor[0]
+            else:
+                cursor = None
+
         result = dict()
         result[self._page_param] = page
         result[self._page_size_param] = page_size
+        result[self._cursor_param] = cursor
         return result
 
     def get_paging_params(self, **options):
@@ -96,6 +131,20 @@ class DatabasePagingManager(Manager):
 
         return options.get(self._page_param), options.get(self._page_size_param)
 
+    def get_cursor_param(self, **options):
+        """
+        gets cursor parameter from given inputs.
+
+        note that this method does not do any validation and just
+        returns the cursor as it is, even if its value is None.
+
+        :keyword str cursor: cursor token.
+
+        :rtype: str
+        """
+
+        return options.get(self._cursor_param)
+
     def generate_paging_params(self, page, page_size):
         """
         generates paging parameters from given inputs.
@@ -112,6 +161,22 @@ class DatabasePagingManager(Manager):
         params[self._page_size_param] = page_size
         return params
 
+    def generate_cursor_params(self, cursor, page_size):
+        """
+        generates cursor parameters from given inputs.
+
+        :param str cursor: cursor token.
+        :param int page_size: page size.
+
+        :returns: dict[str cursor, int page_size]
+        :rtype: dict
+        """
+
+        params = dict()
+        params[self._cursor_param] = cursor
+        params[self._page_size_param] = page_size
+        return params
+
     def inject_paging_keys(self, limit, offset, values):
         """
         injects paging keys into given dict.
@@ -162,6 +227,15 @@ class DatabasePagingManager(Manager):
 
         return self._page_param, self._page_size_param
 
+    def get_cursor_param_name(self):
+        """
+        gets current cursor param name in effect.
+
+        :rtype: str
+        """
+
+        return self._cursor_param
+
     def inject_paginator(self, paginator, inputs, **options):
         """
         injects the given paginator into current request context.
@@ -174,3 +248,41 @@ class DatabasePagingManager(Manager):
         paging_params = request.get_paging_params()
         paginator.inject_paging_keys(inputs, **paging_params)
         session_services.add_request_context(RequestContextEnum.PAGINATOR, paginator)
+
+    def count(self, query, mode=None, **options):
+        """
+        gets the total count of rows of given query using the given count mode.
+
+        it returns a tuple of two items. first item is the total count and
+        the second item is the count mode which has actually produced the count.
+        for example, `estimated` mode may fall back to an exact count.
+
+        :param CoreQuery query: query to get its total count.
+
+        :param str mode: count mode to be used. it could be one of `exact`,
+                         `cached` or `estimated`. defaults to `count_mode`
+                         of `database` config store if not provided.
+        :enum mode:
+            EXACT = 'exact'
+            CACHED = 'cached'
+            ESTIMATED = 'estimated'
+
+        :keyword CoreColumn column: column to be used in count function.
+        :keyword bool distinct: specifies that count should be executed on distinct select.
+
+        :raises InvalidCountModeError: invalid count mode error.
+
+        :returns: tuple[int count, str mode]
+        :rtype: tuple[int, str]
+        """
+
+        if mode is None:
+            mode = self._count_mode
+
+        counter = self._counters.get(mode)
+        if counter is None:
+            raise InvalidCountModeError('Count mode [{mode}] is invalid. it must '
+                                        'be one of {modes}.'
+                                        .format(mode=mode, modes=list(self._counters.keys())))
+
+        return counter.count(query, **options)
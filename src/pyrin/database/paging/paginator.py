@@ -3,20 +3,32 @@
 database paging paginator module.
 """
 
-from copy import deepcopy
+import json
+import base64
+
+from uuid import UUID
+from copy import deepcopy, copy
+from decimal import Decimal
 from abc import abstractmethod
 from collections import OrderedDict
+from datetime import datetime, date, time
 
 from flask import url_for
+from sqlalchemy import and_, or_, tuple_, literal
+from sqlalchemy.sql.operators import desc_op
 
 import pyrin.configuration.services as config_services
 import pyrin.database.paging.services as paging_services
 import pyrin.security.session.services as session_services
+import pyrin.utils.datetime as datetime_utils
 
+from pyrin.core.globals import _
 from pyrin.core.structs import CoreObject
 from pyrin.core.exceptions import CoreNotImplementedError
 from pyrin.database.orm.sql.schema.globals import BIG_INTEGER_MAX
-from pyrin.database.paging.exceptions import PageSizeLimitError, TotalCountIsAlreadySetError
+from pyrin.settings.static import APPLICATION_ENCODING
+from pyrin.database.paging.exceptions import PageSizeLimitError, TotalCountIsAlreadySetError, \
+    InvalidCursorError, KeysetOrderingRequiredError, CursorValueNotFoundError
 
 
 class PaginatorBase(CoreObject):
@@ -121,6 +133,24 @@ class PaginatorBase(CoreObject):
 
         raise CoreNotImplementedError()
 
+    def prepare_query(self, query, **options):
+        """
+        applies the pagination of this paginator on given query and returns a new query.
+
+        it applies the limit and offset which are injected into given inputs.
+        subclasses could override this to paginate the query in other ways.
+
+        :param CoreQuery query: query to be paginated.
+
+        :keyword int __limit__: limit value.
+        :keyword int __offset__: offset value.
+
+        :rtype: CoreQuery
+        """
+
+        limit, offset = paging_services.get_paging_keys(**options)
+        return query.limit(limit).offset(offset)
+
     def copy(self):
         """
         returns a deep copy of this instance
@@ -182,6 +212,45 @@ class PaginatorBase(CoreObject):
 
         raise CoreNotImplementedError()
 
+    @property
+    @abstractmethod
+    def count_mode(self):
+        """
+        gets the count mode to be used for total count of items.
+
+        :raises CoreNotImplementedError: core not implemented error.
+
+        :rtype: str
+        """
+
+        raise CoreNotImplementedError()
+
+    @property
+    @abstractmethod
+    def total_count_mode(self):
+        """
+        gets the count mode which has produced the total count of items.
+
+        :raises CoreNotImplementedError: core not implemented error.
+
+        :rtype: str
+        """
+
+        raise CoreNotImplementedError()
+
+    @total_count_mode.setter
+    @abstractmethod
+    def total_count_mode(self, value):
+        """
+        sets the count mode which has produced the total count of items.
+
+        :param str value: count mode to be set.
+
+        :raises CoreNotImplementedError: core not implemented error.
+        """
+
+        raise CoreNotImplementedError()
+
 
 class SimplePaginator(PaginatorBase):
     """
@@ -206,6 +275,11 @@ class SimplePaginator(PaginatorBase):
                                     if not provided, it will be get from
                                     `max_page_size` of `database` config store.
 
+        :keyword str count_mode: count mode to be used for total count of items.
+                                 it could be one of `exact`, `cached` or `estimated`.
+                                 if not provided, it will be get from `count_mode`
+                                 of `database` config store.
+
         :raises PageSizeLimitError: page size limit error.
         """
 
@@ -245,6 +319,20 @@ class SimplePaginator(PaginatorBase):
         self._has_next = False
         self._has_previous = False
         self._total_count = None
+        self._count_mode = options.get('count_mode')
+        self._total_count_mode = None
+
+    def copy(self):
+        """
+        returns a copy of this instance.
+
+        all attributes of this paginator are immutable values which will
+        be replaced on each change, so a shallow copy is sufficient.
+
+        :rtype: SimplePaginator
+        """
+
+        return copy(self)
 
     def _url_for(self, page, page_size):
         """
@@ -415,7 +503,8 @@ class SimplePaginator(PaginatorBase):
         previous_url = self.previous()
 
         if self.total_count is not None:
-            metadata.update(count_total=self.total_count)
+            metadata.update(count_total=self.total_count,
+                            count_mode=self.total_count_mode)
 
         metadata.update(count=count, next=next_url, previous=previous_url)
         return result, metadata
@@ -466,3 +555,484 @@ class SimplePaginator(PaginatorBase):
                                               'current request.')
 
         self._total_count = value
+
+    @property
+    def count_mode(self):
+        """
+        gets the count mode to be used for total count of items.
+
+        it returns None if the default count mode must be used.
+
+        :rtype: str
+        """
+
+        return self._count_mode
+
+    @property
+    def total_count_mode(self):
+        """
+        gets the count mode which has produced the total count of items.
+
+        :rtype: str
+        """
+
+        return self._total_count_mode
+
+    @total_count_mode.setter
+    def total_count_mode(self, value):
+        """
+        sets the count mode which has produced the total count of items.
+
+        :param str value: count mode to be set.
+        """
+
+        self._total_count_mode = value
+
+
+class KeysetPaginator(SimplePaginator):
+    """
+    keyset paginator class.
+
+    it paginates the query by filtering rows after the ordering column values of
+    the last row of previous page, instead of using offset. so the cost of fetching
+    each page is the same as fetching the first page, given that there is a suitable
+    index on ordering columns. it does not emit any extra queries to database.
+
+    the next and previous pages are referenced by opaque cursor tokens instead of
+    page numbers. the query must be ordered, normally using `safe_order_by`, and
+    the last ordering column must be unique, for example the primary key.
+    the ordering columns must be non-nullable entity columns and their values
+    must be present in the returned items with the same name.
+    """
+
+    # a dict containing the converter of each python type for decoding cursor values.
+    # values of other types will be used as they are decoded from json.
+    # it could be extended in subclasses to support other types.
+    converters = {
+        datetime: datetime_utils.to_datetime,
+        date: datetime_utils.to_date,
+        time: datetime_utils.to_time,
+        UUID: UUID,
+        Decimal: Decimal,
+    }
+
+    # the direction values to be used in cursor tokens.
+    FORWARD = 'n'
+    BACKWARD = 'p'
+
+    def __init__(self, endpoint, **options):
+        """
+        initializes an instance of KeysetPaginator.
+
+        :param str endpoint: endpoint of route.
+
+        :keyword int page_size: default page size.
+                                if not provided, it will be get from
+                                `default_page_size` of `database` config store.
+
+        :keyword int max_page_size: max allowed page size.
+                                    if not provided, it will be get from
+                                    `max_page_size` of `database` config store.
+
+        :keyword str count_mode: count mode to be used for total count of items.
+                                 it could be one of `exact`, `cached` or `estimated`.
+                                 if not provided, it will be get from `count_mode`
+                                 of `database` config store.
+
+        :raises PageSizeLimitError: page size limit error.
+        """
+
+        super().__init__(endpoint, **options)
+
+        self._cursor = None
+        self._direction = self.FORWARD
+        self._values = None
+        self._ordering = None
+        self._next_values = None
+        self._previous_values = None
+
+    def _url_for_cursor(self, cursor, page_size):
+        """
+        gets the url for given cursor.
+
+        :param str cursor: cursor token to generate its url.
+        :param int page_size: page size.
+
+        :rtype: str
+        """
+
+        request = session_services.get_current_request()
+        options = OrderedDict()
+        options.update(request.get_all_query_strings())
+        options.update(paging_services.generate_cursor_params(cursor, page_size))
+        options.update(request.view_args or {})
+        options.update(_method=request.method)
+        return url_for(self._endpoint, **options)
+
+    def _encode_cursor(self, direction, values):
+        """
+        encodes the given direction and values into a cursor token.
+
+        :param str direction: direction of the cursor.
+        :param list values: ordering column values of the boundary item.
+
+        :rtype: str
+        """
+
+        data = json.dumps([direction, values], default=self._to_json_value,
+                          separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode(APPLICATION_ENCODING)) \
+            .decode(APPLICATION_ENCODING)
+
+    def _to_json_value(self, value):
+        """
+        gets the json serializable representation of given cursor value.
+
+        datetime, date and time values will be represented in iso format
+        with full precision, and other values will be represented as string.
+
+        :param object value: value to be converted.
+
+        :rtype: str
+        """
+
+        if isinstance(value, (datetime, date, time)):
+            return value.isoformat()
+
+        return str(value)
+
+    def _decode_cursor(self, cursor):
+        """
+        decodes the given cursor token into direction and values.
+
+        :param str cursor: cursor token to be decoded.
+
+        :raises InvalidCursorError: invalid cursor error.
+
+        :returns: tuple[str direction, list values]
+        :rtype: tuple[str, list]
+        """
+
+        try:
+            data = base64.urlsafe_b64decode(cursor.encode(APPLICATION_ENCODING))
+            direction, values = json.loads(data.decode(APPLICATION_ENCODING))
+        except Exception:
+            raise InvalidCursorError(_('The provided cursor is invalid.'))
+
+        if direction not in (self.FORWARD, self.BACKWARD) or \
+                not isinstance(values, list) or len(values) <= 0:
+            raise InvalidCursorError(_('The provided cursor is invalid.'))
+
+        return direction, values
+
+    def _convert_value(self, value, column):
+        """
+        converts the given cursor value to the python type of given column.
+
+        :param object value: value to be converted.
+        :param ColumnElement column: column of the value.
+
+        :raises InvalidCursorError: invalid cursor error.
+
+        :rtype: object
+        """
+
+        if value is None:
+            return value
+
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return value
+
+        converter = self.converters.get(python_type)
+        if converter is None:
+            return value
+
+        try:
+            return converter(value)
+        except (ValueError, TypeError):
+            raise InvalidCursorError(_('The provided cursor is invalid.'))
+
+    def _get_ordering(self, query):
+        """
+        gets the ordering info of given query.
+
+        :param CoreQuery query: query to get its ordering.
+
+        :raises KeysetOrderingRequiredError: keyset ordering required error.
+
+        :returns: list[tuple[str key, ColumnElement column, bool descending]]
+        :rtype: list[tuple[str, ColumnElement, bool]]
+        """
+
+        result = []
+        for clause in query._order_by_clauses:
+            descending = getattr(clause, 'modifier', None) is desc_op
+            column = getattr(clause, 'element', clause)
+            key = getattr(column, 'key', None)
+            if key is None:
+                raise KeysetOrderingRequiredError('Ordering column [{column}] is not '
+                                                  'supported by keyset paginator on '
+                                                  'endpoint [{endpoint}].'
+                                                  .format(column=column,
+                                                          endpoint=self._endpoint))
+
+            result.append((key, column, descending))
+
+        if len(result) <= 0:
+            raise KeysetOrderingRequiredError('Query must be ordered to be paginated '
+                                              'by keyset paginator on endpoint [{endpoint}].'
+                                              .format(endpoint=self._endpoint))
+
+        return result
+
+    def _get_criterion(self, ordering, values):
+        """
+        gets the criterion to filter rows after the given values in given ordering.
+
+        if all columns have the same ordering, a single row value comparison
+        will be produced. for example: `(a, b) > (:a, :b)`.
+
+        :param list[tuple[str, ColumnElement, bool]] ordering: ordering info.
+        :param list values: ordering column values of the boundary item.
+
+        :raises InvalidCursorError: invalid cursor error.
+
+        :rtype: ColumnElement
+        """
+
+        if len(values) != len(ordering):
+            raise InvalidCursorError(_('The provided cursor is invalid.'))
+
+        columns = []
+        bounds = []
+        greater = []
+        for (key, column, descending), value in zip(ordering, values):
+            columns.append(column)
+            bounds.append(literal(self._convert_value(value, column), type_=column.type))
+            greater.append(descending is (self._direction == self.BACKWARD))
+
+        if all(greater):
+            return tuple_(*columns) > tuple_(*bounds)
+
+        if not any(greater):
+            return tuple_(*columns) < tuple_(*bounds)
+
+        criterion = []
+        for index, column in enumerate(columns):
+            equals = [columns[item] == bounds[item] for item in range(index)]
+            if greater[index] is True:
+                equals.append(column > bounds[index])
+            else:
+                equals.append(column < bounds[index])
+
+            criterion.append(and_(*equals))
+
+        return or_(*criterion)
+
+    def _get_values(self, item):
+        """
+        gets the ordering column values of given item.
+
+        :param object item: item to get its values.
+
+        :raises CursorValueNotFoundError: cursor value not found error.
+
+        :rtype: list
+        """
+
+        values = []
+        for key, column, descending in self._ordering:
+            if isinstance(item, dict):
+                if key not in item:
+                    raise CursorValueNotFoundError('Ordering column [{key}] is not present '
+                                                   'in results of endpoint [{endpoint}].'
+                                                   .format(key=key, endpoint=self._endpoint))
+                values.append(item[key])
+            else:
+                if not hasattr(item, key):
+                    raise CursorValueNotFoundError('Ordering column [{key}] is not present '
+                                                   'in results of endpoint [{endpoint}].'
+                                                   .format(key=key, endpoint=self._endpoint))
+                values.append(getattr(item, key))
+
+        return values
+
+    def prepare_query(self, query, **options):
+        """
+        applies the pagination of this paginator on given query and returns a new query.
+
+        it filters the query by the values of current cursor and applies the limit.
+        if the cursor is for previous page, the ordering will be reversed to fetch
+        the items right before the cursor and they will be reversed back on `paginate`.
+
+        :param CoreQuery query: query to be paginated.
+
+        :keyword int __limit__: limit value.
+
+        :raises KeysetOrderingRequiredError: keyset ordering required error.
+        :raises InvalidCursorError: invalid cursor error.
+
+        :rtype: CoreQuery
+        """
+
+        self._ordering = self._get_ordering(query)
+        if self._direction == self.BACKWARD:
+            criterion = [column.asc() if descending is True else column.desc()
+                         for key, column, descending in self._ordering]
+            query = query.order_by(None).order_by(*criterion)
+
+        if self._values is not None:
+            query = query.filter(self._get_criterion(self._ordering, self._values))
+
+        limit = paging_services.get_paging_keys(**options)[0]
+        return query.limit(limit)
+
+    def has_next(self, count, **options):
+        """
+        gets a value indicating that there is a next page available.
+
+        it returns a tuple of two items. first item is a boolean indicating
+        that there is a next page and the second item is the number of excess
+        items that must be removed from end of items.
+
+        :param int count: count of current items.
+
+        :returns: tuple[bool has_next, int excess]
+        :rtype: tuple[bool, int]
+        """
+
+        excess = max(count - self._current_page_size, 0)
+        if self._direction == self.FORWARD:
+            self._has_next = excess > 0
+        else:
+            # we have reached here from a next page.
+            self._has_next = True
+
+        return self._has_next, excess
+
+    def has_previous(self, count, **options):
+        """
+        gets a value indicating that there is a previous page available.
+
+        it returns a tuple of two items. first item is a boolean indicating
+        that there is a previous page and the second item is the number of
+        excess items that must be removed from beginning of items.
+
+        note that the excess items are always at the end of fetched items,
+        so this method always returns zero as excess.
+
+        :param int count: count of current items.
+
+        :returns: tuple[bool has_previous, int excess]
+        :rtype: tuple[bool, int]
+        """
+
+        if self._direction == self.FORWARD:
+            self._has_previous = self._values is not None and count > 0
+        else:
+            self._has_previous = count > self._current_page_size
+
+        return self._has_previous, 0
+
+    def next(self):
+        """
+        gets the next page url.
+
+        returns None if there is no next page.
+
+        :rtype: str
+        """
+
+        if self._has_next is True and self._next_values is not None:
+            cursor = self._encode_cursor(self.FORWARD, self._next_values)
+            return self._url_for_cursor(cursor, self._current_page_size)
+
+        return None
+
+    def previous(self):
+        """
+        gets the previous page url.
+
+        returns None if there is no previous page.
+
+        :rtype: str
+        """
+
+        if self._has_previous is True and self._previous_values is not None:
+            cursor = self._encode_cursor(self.BACKWARD, self._previous_values)
+            return self._url_for_cursor(cursor, self._current_page_size)
+
+        return None
+
+    def inject_paging_keys(self, values, **options):
+        """
+        injects paging keys into given values from given inputs.
+
+        :param dict values: dict values to inject paging keys into it.
+
+        :keyword str cursor: cursor token.
+        :keyword int page_size: page size.
+
+        :raises InvalidCursorError: invalid cursor error.
+        """
+
+        page_size = paging_services.get_paging_params(**options)[1]
+        cursor = paging_services.get_cursor_param(**options)
+
+        if page_size is None or not isinstance(page_size, int) or page_size < 1:
+            page_size = self._page_size
+        elif page_size > self._max_page_size:
+            page_size = self._max_page_size
+
+        if cursor not in (None, ''):
+            self._direction, self._values = self._decode_cursor(str(cursor))
+
+        # we increase limit by 1 to be able to detect if there is another page.
+        # the extra item will not be returned to client.
+        self._limit = page_size + 1
+        self._offset = None
+        self._cursor = cursor
+        self._current_page = 1
+        self._current_page_size = page_size
+        paging_services.inject_paging_keys(self._limit, self._offset, values)
+
+    def paginate(self, items, **options):
+        """
+        paginates the given items.
+
+        it returns a tuple of two values, first value is a list of items
+        to be returned to client, and second value is a dict of metadata
+        to be injected into client response.
+
+        :param list items: items to be paginated.
+
+        :raises CursorValueNotFoundError: cursor value not found error.
+
+        :returns: tuple[list items, dict metadata]
+        :rtype: tuple[list, dict]
+        """
+
+        metadata = OrderedDict()
+        count = len(items)
+        has_next, excess_end = self.has_next(count)
+        has_previous, excess_first = self.has_previous(count)
+        result = items[:count - excess_end]
+        if self._direction == self.BACKWARD:
+            result = list(reversed(result))
+
+        count = len(result)
+        if count > 0 and self._ordering is not None:
+            self._previous_values = self._get_values(result[0])
+            self._next_values = self._get_values(result[-1])
+
+        next_url = self.next()
+        previous_url = self.previous()
+
+        if self.total_count is not None:
+            metadata.update(count_total=self.total_count,
+                            count_mode=self.total_count_mode)
+
+        metadata.update(count=count, next=next_url, previous=previous_url)
+        return result, metadata
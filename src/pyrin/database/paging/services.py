@@ -7,20 +7,28 @@ from pyrin.application.services import get_component
 from pyrin.database.paging import DatabasePagingPackage
 
 
-def extract_paging_params(values):
+def extract_paging_params(values, **options):
     """
     extracts paging parameters from given dict and returns them as a new dict.
 
-    the values will be removed from input dict.
+    the values will be removed from input dict. the cursor param will
+    only be extracted if `keyset` is set to True, otherwise it will be
+    left in input dict and the cursor will be None in the result.
 
     :param dict values: a dict to extract paging params from it.
 
+    :keyword bool keyset: specifies that cursor param must also be extracted.
+                          it should be set for routes which are paged
+                          using keyset pagination. defaults to False.
+
     :returns: dict(int page: page number,
-                   int page_size: page size)
+                   int page_size: page size,
+                   str cursor: cursor token)
     :rtype: dict
     """
 
-    return get_component(DatabasePagingPackage.COMPONENT_NAME).extract_paging_params(values)
+    return get_component(DatabasePagingPackage.COMPONENT_NAME).extract_paging_params(values,
+                                                                                      **options)
 
 
 def get_paging_params(**options):
@@ -40,6 +48,21 @@ def get_paging_params(**options):
     return get_component(DatabasePagingPackage.COMPONENT_NAME).get_paging_params(**options)
 
 
+def get_cursor_param(**options):
+    """
+    gets cursor parameter from given inputs.
+
+    note that this method does not do any validation and just
+    returns the cursor as it is, even if its value is None.
+
+    :keyword str cursor: cursor token.
+
+    :rtype: str
+    """
+
+    return get_component(DatabasePagingPackage.COMPONENT_NAME).get_cursor_param(**options)
+
+
 def generate_paging_params(page, page_size):
     """
     generates paging parameters from given inputs.
@@ -55,6 +78,21 @@ def generate_paging_params(page, page_size):
                                                                                       page_size)
 
 
+def generate_cursor_params(cursor, page_size):
+    """
+    generates cursor parameters from given inputs.
+
+    :param str cursor: cursor token.
+    :param int page_size: page size.
+
+    :returns: dict[str cursor, int page_size]
+    :rtype: dict
+    """
+
+    return get_component(DatabasePagingPackage.COMPONENT_NAME).generate_cursor_params(cursor,
+                                                                                      page_size)
+
+
 def inject_paging_keys(limit, offset, values):
     """
     injects paging keys into given dict.
@@ -109,6 +147,16 @@ def get_paging_param_names():
     return get_component(DatabasePagingPackage.COMPONENT_NAME).get_paging_param_names()
 
 
+def get_cursor_param_name():
+    """
+    gets current cursor param name in effect.
+
+    :rtype: str
+    """
+
+    return get_component(DatabasePagingPackage.COMPONENT_NAME).get_cursor_param_name()
+
+
 def inject_paginator(paginator, inputs, **options):
     """
     injects the given paginator into current request context.
@@ -120,3 +168,34 @@ def inject_paginator(paginator, inputs, **options):
     return get_component(DatabasePagingPackage.COMPONENT_NAME).inject_paginator(paginator,
                                                                                 inputs,
                                                                                 **options)
+
+
+def count(query, mode=None, **options):
+    """
+    gets the total count of rows of given query using the given count mode.
+
+    it returns a tuple of two items. first item is the total count and
+    the second item is the count mode which has actually produced the count.
+    for example, `estimated` mode may fall back to an exact count.
+
+    :param CoreQuery query: query to get its total count.
+
+    :param str mode: count mode to be used. it could be one of `exact`,
+                     `cached` or `estimated`. defaults to `count_mode`
+                     of `database` config store if not provided.
+    :enum mode:
+        EXACT = 'exact'
+        CACHED = 'cached'
+        ESTIMATED = 'estimated'
+
+    :keyword CoreColumn column: column to be used in count function.
+    :keyword bool distinct: specifies that count should be executed on distinct select.
+
+    :raises InvalidCountModeError: invalid count mode error.
+
+    :returns: tuple[int count, str mode]
+    :rtype: tuple[int, str]
+    """
+
+    return get_component(DatabasePagingPackage.COMPONENT_NAME).count(query, mode=mode,
+                                                                     **options)
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+database sequence package.
+"""
+
+from pyrin.packaging.base import Package
+
+
+class DatabaseSequencePackage(Package):
+    """
+    database sequence package class.
+    """
+
+    NAME = __name__
+    COMPONENT_NAME = 'database.sequence.component'
+    DEPENDS = ['pyrin.configuration']
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""
+database sequence component module.
+"""
+
+from pyrin.application.decorators import component
+from pyrin.application.structs import Component
+from pyrin.database.sequence import DatabaseSequencePackage
+from pyrin.database.sequence.manager import DatabaseSequenceManager
+
+
+@component(DatabaseSequencePackage.COMPONENT_NAME)
+class DatabaseSequenceComponent(Component, DatabaseSequenceManager):
+    """
+    database sequence component class.
+    """
+    pass
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+database sequence exceptions module.
+"""
+
+from pyrin.core.exceptions import CoreException
+
+
+class DatabaseSequenceException(CoreException):
+    """
+    database sequence exception.
+    """
+    pass
+
+
+class InvalidSequenceBlockSizeError(DatabaseSequenceException):
+    """
+    invalid sequence block size error.
+    """
+    pass
+
+
+class InvalidSequenceValueCountError(DatabaseSequenceException):
+    """
+    invalid sequence value count error.
+    """
+    pass
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+database sequence manager module.
+"""
+
+import math
+
+from collections import deque
+from threading import Lock
+
+from sqlalchemy import select, func, text
+
+import pyrin.configuration.services as config_services
+
+from pyrin.core.structs import Manager
+from pyrin.database.sequence import DatabaseSequencePackage
+from pyrin.database.services import get_current_store
+from pyrin.database.sequence.exceptions import InvalidSequenceBlockSizeError, \
+    InvalidSequenceValueCountError
+
+
+class DatabaseSequenceManager(Manager):
+    """
+    database sequence manager class.
+
+    this class hands out values of sequences from blocks which are kept in memory.
+    each block will be fetched in a single round trip on dialects that support it.
+    sequences with an `increment` bigger than 1 could also be handled using hi/lo
+    scheme if `pooled_increment` is enabled. in that case each fetched value
+    reserves `increment` consecutive values. on other dialects, values will be
+    fetched one by one only when they are needed.
+    blocks are kept separately for each bind and sequence.
+    """
+
+    package_class = DatabaseSequencePackage
+
+    def __init__(self):
+        """
+        initializes an instance of DatabaseSequenceManager.
+        """
+
+        super().__init__()
+
+        self._block_size = config_services.get('database', 'sequence', 'block_size')
+        self._block_sizes = config_services.get('database', 'sequence', 'block_sizes',
+                                                default=None) or {}
+        self._pooled_increment = config_services.get('database', 'sequence',
+                                                     'pooled_increment', default=False)
+        self._block_dialects = set(config_services.get('database', 'sequence',
+                                                       'block_dialects', default=None) or [])
+
+        for size in [self._block_size, *self._block_sizes.values()]:
+            if not isinstance(size, int) or size < 1:
+                raise InvalidSequenceBlockSizeError('Sequence block size must be a '
+                                                    'positive integer, but [{size}] '
+                                                    'is provided.'.format(size=size))
+
+        # a dict containing functions to get a statement to fetch
+        # multiple values of a sequence in a single round trip.
+        # in the form of: {str dialect_name: callable builder}
+        self._block_statement_builders = dict(postgresql=self._get_postgresql_block_statement,
+                                              oracle=self._get_oracle_block_statement)
+
+        # a dict containing the remaining values of each sequence on each bind.
+        # in the form of: {tuple(Engine bind, str sequence_name): deque values}
+        self._blocks = {}
+
+        # a dict containing the lock of each sequence on each bind.
+        # in the form of: {tuple(Engine bind, str sequence_name): Lock lock}
+        self._locks = {}
+        self._lock = Lock()
+
+    def _get_name(self, sequence):
+        """
+        gets the schema qualified name of given sequence.
+
+        :param Sequence sequence: sequence instance.
+
+        :rtype: str
+        """
+
+        if sequence.schema is None:
+            return sequence.name
+
+        return '{schema}.{name}'.format(schema=sequence.schema, name=sequence.name)
+
+    def _get_lock(self, key):
+        """
+        gets the lock of given key.
+
+        it creates a new lock if not available.
+
+        :param tuple key: bind and sequence name.
+
+        :rtype: Lock
+        """
+
+        lock = self._locks.get(key)
+        if lock is None:
+            with self._lock:
+                lock = self._locks.setdefault(key, Lock())
+
+        return lock
+
+    def _get_block_size(self, name):
+        """
+        gets the block size of given sequence name.
+
+        :param str name: schema qualified sequence name.
+
+        :rtype: int
+        """
+
+        return self._block_sizes.get(name, self._block_size)
+
+    def _is_pooled(self, sequence):
+        """
+        gets a value indicating that given sequence must be handled using hi/lo scheme.
+
+        :param Sequence sequence: sequence instance.
+
+        :rtype: bool
+        """
+
+        return self._pooled_increment is True and \
+            sequence.increment is not None and sequence.increment > 1
+
+    def _get_postgresql_block_statement(self, sequence, count):
+        """
+        gets a statement to fetch given count of values of a sequence on postgresql.
+
+        :param Sequence sequence: sequence instance.
+        :param int count: count of values to be fetched.
+
+        :rtype: Select
+        """
+
+        return select(sequence.next_value()).select_from(func.generate_series(1, count))
+
+    def _get_oracle_block_statement(self, sequence, count):
+        """
+        gets a statement to fetch given count of values of a sequence on oracle.
+
+        :param Sequence sequence: sequence instance.
+        :param int count: count of values to be fetched.
+
+        :rtype: Select
+        """
+
+        return select(sequence.next_value()).select_from(text('dual')).suffix_with(
+            'CONNECT BY LEVEL <= {count}'.format(count=int(count)))
+
+    def _get_block_statement(self, dialect, sequence, count):
+        """
+        gets a statement to fetch given count of values of a sequence in a single round trip.
+
+        it returns None if the dialect does not support fetching blocks.
+
+        :param Dialect dialect: dialect of the bind.
+        :param Sequence sequence: sequence instance.
+        :param int count: count of values to be fetched.
+
+        :rtype: Select
+        """
+
+        if dialect.name not in self._block_dialects:
+            return None
+
+        builder = self._block_statement_builders.get(dialect.name)
+        if builder is None:
+            return None
+
+        return builder(sequence, count)
+
+    def _fetch_values(self, bind, sequence, count, **options):
+        """
+        fetches given count of values of a sequence from database.
+
+        it fetches all values in a single round trip if the dialect supports
+        it, otherwise the values will be fetched one by one.
+
+        :param Engine bind: bind to fetch values from it.
+        :param Sequence sequence: sequence instance.
+        :param int count: count of values to be fetched.
+
+        :keyword type[BaseEntity] mapper: entity class to be used to get the bind.
+
+        :rtype: list[int]
+        """
+
+        store = get_current_store()
+        bind_arguments = dict(mapper=options.get('mapper'))
+        statement = None
+        if count > 1:
+            statement = self._get_block_statement(bind.dialect, sequence, count)
+
+        if statement is None:
+            return [store.execute(sequence.next_value(),
+                                  bind_arguments=bind_arguments).scalar()
+                    for _ in range(count)]
+
+        return sorted(store.execute(statement, bind_arguments=bind_arguments).scalars())
+
+    def _is_block_supported(self, bind, sequence):
+        """
+        gets a value indicating that values of given sequence could be allocated in blocks.
+
+        :param Engine bind: bind of the sequence.
+        :param Sequence sequence: sequence instance.
+
+        :rtype: bool
+        """
+
+        if self._is_pooled(sequence):
+            return True
+
+        return bind.dialect.name in self._block_dialects and \
+            bind.dialect.name in self._block_statement_builders
+
+    def _allocate(self, bind, sequence, count, **options):
+        """
+        allocates at least the given count of values of a sequence.
+
+        :param Engine bind: bind to fetch values from it.
+        :param Sequence sequence: sequence instance.
+        :param int count: minimum count of values to be allocated.
+
+        :keyword type[BaseEntity] mapper: entity class to be used to get the bind.
+
+        :rtype: list[int]
+        """
+
+        if not self._is_block_supported(bind, sequence):
+            return self._fetch_values(bind, sequence, count, **options)
+
+        count = max(count, self._get_block_size(self._get_name(sequence)))
+        if not self._is_pooled(sequence):
+            return self._fetch_values(bind, sequence, count, **options)
+
+        increment = sequence.increment
+        values = []
+        for high in self._fetch_values(bind, sequence,
+                                       math.ceil(count / increment), **options):
+            values.extend(range(high, high + increment))
+
+        return values
+
+    def next_values(self, sequence, count, **options):
+        """
+        gets the given count of next values of a sequence.
+
+        values are handed out from the block of the sequence which is kept in
+        memory. if the block does not have enough values, a new block will
+        be allocated. note that the returned values are unique but they
+        are not guaranteed to be consecutive.
+
+        :param Sequence sequence: sequence instance.
+        :param int count: count of values to be returned.
+
+        :keyword type[BaseEntity] mapper: entity class to be used to get the bind.
+                                          if not provided, the default bind
+                                          will be used.
+
+        :raises InvalidSequenceValueCountError: invalid sequence value count error.
+
+        :rtype: list[int]
+        """
+
+        if not isinstance(count, int) or count < 0:
+            raise InvalidSequenceValueCountError('Count of sequence values must be a '
+                                                 'non-negative integer, but [{count}] '
+                                                 'is provided.'.format(count=count))
+
+        if count == 0:
+            return []
+
+        store = get_current_store()
+        bind = store.get_bind(mapper=options.get('mapper'))
+        key = (bind, self._get_name(sequence))
+        with self._get_lock(key):
+            block = self._blocks.setdefault(key, deque())
+            if len(block) < count:
+                block.extend(self._allocate(bind, sequence, count - len(block), **options))
+
+            return [block.popleft() for _ in range(count)]
+
+    def next_value(self, sequence, **options):
+        """
+        gets the next value of a sequence.
+
+        :param Sequence sequence: sequence instance.
+
+        :keyword type[BaseEntity] mapper: entity class to be used to get the bind.
+                                          if not provided, the default bind
+                                          will be used.
+
+        :rtype: int
+        """
+
+        return self.next_values(sequence, 1, **options)[0]
+
+    def clear(self):
+        """
+        clears all allocated values of all sequences.
+
+        note that the cleared values will not be handed out anymore.
+        """
+
+        with self._lock:
+            self._blocks.clear()
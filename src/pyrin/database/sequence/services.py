@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+database sequence services module.
+"""
+
+from pyrin.application.services import get_component
+from pyrin.database.sequence import DatabaseSequencePackage
+
+
+def next_values(sequence, count, **options):
+    """
+    gets the given count of next values of a sequence.
+
+    values are handed out from the block of the sequence which is kept in
+    memory. if the block does not have enough values, a new block will
+    be allocated. note that the returned values are unique but they
+    are not guaranteed to be consecutive.
+
+    :param Sequence sequence: sequence instance.
+    :param int count: count of values to be returned.
+
+    :keyword type[BaseEntity] mapper: entity class to be used to get the bind.
+                                      if not provided, the default bind
+                                      will be used.
+
+    :raises InvalidSequenceValueCountError: invalid sequence value count error.
+
+    :rtype: list[int]
+    """
+
+    return get_component(DatabaseSequencePackage.COMPONENT_NAME).next_values(sequence,
+                                                                            count, **options)
+
+
+def next_value(sequence, **options):
+    """
+    gets the next value of a sequence.
+
+    :param Sequence sequence: sequence instance.
+
+    :keyword type[BaseEntity] mapper: entity class to be used to get the bind.
+                                      if not provided, the default bind
+                                      will be used.
+
+    :rtype: int
+    """
+
+    return get_component(DatabaseSequencePackage.COMPONENT_NAME).next_value(sequence,
+                                                                           **options)
+
+
+def clear():
+    """
+    clears all allocated values of all sequences.
+
+    note that the cleared values will not be handed out anymore.
+    """
+
+    return get_component(DatabaseSequencePackage.COMPONENT_NAME).clear()
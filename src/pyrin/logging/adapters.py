@@ -10,6 +10,7 @@ import pyrin.logging.services as logging_services
 import pyrin.utils.string as string_utils
 
 from pyrin.logging.enumerations import LogLevelIntEnum
+from pyrin.logging.structs import LazyValue
 
 
 class BaseLoggerAdapter(Logger):
@@ -381,11 +382,15 @@ class BaseLoggerAdapter(Logger):
         :param bool stack_info: include stack info.
         :param int stacklevel: stack level to be included.
 
-        :keyword dict interpolation_data: data to be used for interpolation.
+        :keyword dict | LazyValue interpolation_data: data to be used for interpolation.
+                                                      any `LazyValue` will be evaluated
+                                                      here, after the log level has been
+                                                      checked.
         """
 
         data = options.pop('interpolation_data', None)
         if data is not None:
+            data = self._evaluate_data(data)
             data = logging_services.prepare_data(data)
             msg = string_utils.interpolate(msg, data)
 
@@ -395,6 +400,24 @@ class BaseLoggerAdapter(Logger):
                           extra=extra, stack_info=stack_info, stacklevel=stacklevel)
         logging_services.after_emit(custom_message, data, level, **custom_kwargs)
 
+    def _evaluate_data(self, data):
+        """
+        evaluates the lazy values of given interpolation data.
+
+        :param dict | LazyValue | object data: data to be evaluated.
+
+        :rtype: dict | object
+        """
+
+        if isinstance(data, LazyValue):
+            return data.get()
+
+        if isinstance(data, dict):
+            return {key: value.get() if isinstance(value, LazyValue) else value
+                    for key, value in data.items()}
+
+        return data
+
     def _process(self, msg, kwargs):
         """
         processes the logging message and keyword arguments passed in to a logging call.
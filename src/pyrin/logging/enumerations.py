@@ -32,3 +32,13 @@ class LogLevelIntEnum(CoreEnum):
     WARNING = logging.WARNING
     INFO = logging.INFO
     DEBUG = logging.DEBUG
+
+
+class OverflowPolicyEnum(CoreEnum):
+    """
+    overflow policy enum.
+    """
+
+    BLOCK = 'block'
+    DROP_OLDEST = 'drop_oldest'
+    DROP_DEBUG_FIRST = 'drop_debug_first'
@@ -32,3 +32,10 @@ class InvalidLoggingHookTypeError(LoggingManagerException):
     invalid logging hook type error.
     """
     pass
+
+
+class InvalidOverflowPolicyError(LoggingManagerException):
+    """
+    invalid overflow policy error.
+    """
+    pass
@@ -5,6 +5,9 @@ logging hooks module.
 
 import pyrin.logging.services as logging_services
 
+from pyrin.application.decorators import application_hook
+from pyrin.application.enumerations import ApplicationStatusEnum
+from pyrin.application.hooks import ApplicationHookBase
 from pyrin.core.structs import Hook
 from pyrin.packaging.decorators import packaging_hook
 from pyrin.packaging.hooks import PackagingHookBase
@@ -68,3 +71,28 @@ class PackagingHook(PackagingHookBase):
         # to inject request info into every log record.
         # it does not affect sqlalchemy logs.
         logging_services.wrap_all_loggers()
+
+
+@application_hook()
+class ApplicationHook(ApplicationHookBase):
+    """
+    application hook class.
+    """
+
+    def application_status_changed(self, old_status, new_status):
+        """
+        this method will be called whenever application status changes.
+
+        :param str old_status: old application status.
+        :param str new_status: new application status.
+
+        :enum status:
+            INITIALIZING = 'Initializing'
+            LOADING = 'Loading'
+            READY = 'Ready'
+            RUNNING = 'Running'
+            TERMINATED = 'Terminated'
+        """
+
+        if new_status == ApplicationStatusEnum.TERMINATED:
+            logging_services.shutdown_queue()
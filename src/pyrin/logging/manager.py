@@ -7,6 +7,7 @@ import logging
 import logging.config
 
 from logging import Logger
+from itertools import count
 
 import pyrin.configuration.services as config_services
 
@@ -15,6 +16,7 @@ from pyrin.logging import LoggingPackage
 from pyrin.core.structs import Manager
 from pyrin.logging.adapters import RequestInfoLoggerAdapter, BaseLoggerAdapter
 from pyrin.logging.hooks import LoggingHookBase
+from pyrin.logging.queue import LogQueue, QueueHandler, QueueListener
 from pyrin.logging.exceptions import InvalidLoggerAdapterTypeError, LoggerNotExistedError, \
     InvalidLoggingHookTypeError
 
@@ -37,10 +39,22 @@ class LoggingManager(Manager, HookMixin):
 
         super().__init__()
 
+        # queue and listener of asynchronous emission, if it is enabled.
+        self._log_queue = None
+        self._listener = None
+
         self._config_file_path = config_services.get_file_path(
             self.package_class.EXTRA_CONFIG_STORE_NAMES[0])
         self._load_configs(self._config_file_path)
 
+        # body sample rates will be loaded on first usage.
+        # in the form of: tuple[int default_rate, dict[str url_rule: int rate]]
+        self._body_sample_rates = None
+
+        # a dict containing the number of bodies which have been checked for each url rule.
+        # in the form of: {str url_rule: count counter}
+        self._body_counters = {}
+
     def _load_configs(self, config_file_path):
         """
         loads logging configuration and handlers from given file.
@@ -48,7 +62,47 @@ class LoggingManager(Manager, HookMixin):
         :param str config_file_path: config file path.
         """
 
+        self.shutdown_queue()
         logging.config.fileConfig(config_file_path, disable_existing_loggers=True)
+        self._start_queue()
+
+    def _start_queue(self):
+        """
+        starts asynchronous emission of logs if it is enabled.
+
+        handlers of all loggers will be replaced by a queue handler, so the records
+        are created on the calling thread and emitted by the original handlers on
+        a dedicated listener thread.
+
+        :raises InvalidOverflowPolicyError: invalid overflow policy error.
+        """
+
+        if config_services.get_active('logging', 'async_emission') is not True:
+            return
+
+        self._log_queue = LogQueue(config_services.get_active('logging', 'async_queue_size'),
+                                   config_services.get_active('logging',
+                                                              'async_overflow_policy'))
+
+        queue_handlers = {}
+        loggers = [logging.root, *self._get_all_loggers().values()]
+        for logger in loggers:
+            if isinstance(logger, BaseLoggerAdapter):
+                logger = logger._logger
+
+            if not isinstance(logger, Logger) or len(logger.handlers) <= 0:
+                continue
+
+            handlers = tuple(logger.handlers)
+            queue_handler = queue_handlers.get(handlers)
+            if queue_handler is None:
+                queue_handler = QueueHandler(handlers, self._log_queue)
+                queue_handlers[handlers] = queue_handler
+
+            logger.handlers = [queue_handler]
+
+        self._listener = QueueListener(self._log_queue)
+        self._listener.start()
 
     def _wrap_root_logger(self):
         """
@@ -170,6 +224,115 @@ class LoggingManager(Manager, HookMixin):
         """
 
         self._load_configs(self._config_file_path)
+        self._body_sample_rates = None
+        self._body_counters.clear()
+
+    def _get_body_sample_rate(self, url_rule):
+        """
+        gets the body sample rate of given url rule.
+
+        :param str url_rule: url rule to get its sample rate.
+
+        :rtype: int
+        """
+
+        if self._body_sample_rates is None:
+            default_rate = config_services.get_active('logging', 'body_sample_rate')
+            endpoint_rates = config_services.get_active('logging',
+                                                        'endpoint_body_sample_rates')
+            self._body_sample_rates = (default_rate, endpoint_rates or {})
+
+        default_rate, endpoint_rates = self._body_sample_rates
+        return endpoint_rates.get(url_rule, default_rate)
+
+    def is_body_sampled(self, url_rule=None):
+        """
+        gets a value indicating that request and response bodies of given url rule must be logged.
+
+        each url rule with a sample rate of `N` will have 1-in-N of its bodies logged.
+        a sample rate of `0` disables logging of its bodies.
+
+        :param str url_rule: url rule of current request.
+                             if not provided, the default sample rate will be used.
+
+        :rtype: bool
+        """
+
+        rate = self._get_body_sample_rate(url_rule)
+        if rate is None or rate <= 0:
+            return False
+
+        if rate == 1:
+            return True
+
+        counter = self._body_counters.get(url_rule)
+        if counter is None:
+            counter = self._body_counters.setdefault(url_rule, count())
+
+        return next(counter) % rate == 0
+
+    def flush_queue(self, **options):
+        """
+        waits for all queued logs to be emitted.
+
+        it returns False if timeout has been reached.
+        it does nothing if asynchronous emission is not enabled.
+
+        :keyword float timeout: timeout in seconds. defaults to
+                                waiting forever if not provided.
+
+        :rtype: bool
+        """
+
+        if self._log_queue is None:
+            return True
+
+        return self._log_queue.join(options.get('timeout'))
+
+    def shutdown_queue(self, **options):
+        """
+        emits all queued logs and stops the listener thread.
+
+        logs which are emitted after shutdown will be emitted synchronously.
+        it does nothing if asynchronous emission is not enabled.
+
+        :keyword float timeout: timeout in seconds. defaults to
+                                `async_shutdown_timeout` config
+                                if not provided.
+        """
+
+        if self._listener is not None:
+            timeout = options.get('timeout')
+            if timeout is None:
+                timeout = config_services.get_active('logging', 'async_shutdown_timeout')
+
+            self._listener.stop(timeout)
+            self._listener = None
+
+    def get_queue_stats(self):
+        """
+        gets the statistic info about asynchronous emission of logs.
+
+        :returns: dict(bool enabled: asynchronous emission is enabled,
+                       int size: number of queued logs,
+                       int max_size: max number of logs to be queued,
+                       str overflow_policy: overflow policy,
+                       int dropped: number of dropped logs,
+                       dict dropped_by_level: number of dropped logs of each level)
+        :rtype: dict
+        """
+
+        if self._log_queue is None:
+            return dict(enabled=False, size=0, max_size=0, overflow_policy=None,
+                        dropped=0, dropped_by_level={})
+
+        dropped = self._log_queue.dropped
+        return dict(enabled=self._log_queue.is_closed is False,
+                    size=self._log_queue.size,
+                    max_size=self._log_queue.max_size,
+                    overflow_policy=self._log_queue.overflow_policy,
+                    dropped=sum(dropped.values()),
+                    dropped_by_level=dropped)
 
     def get_logger(self, name, **options):
         """
@@ -265,7 +428,7 @@ class LoggingManager(Manager, HookMixin):
         """
 
         prepared_data = data
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('prepare_data'):
             prepared_data = hook.prepare_data(prepared_data, **options)
 
         return prepared_data
@@ -279,7 +442,7 @@ class LoggingManager(Manager, HookMixin):
         :param int level: log level.
         """
 
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('before_emit'):
             hook.before_emit(message, data, level, **options)
 
     def after_emit(self, message, data, level, **options):
@@ -291,5 +454,5 @@ class LoggingManager(Manager, HookMixin):
         :param int level: log level.
         """
 
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('after_emit'):
             hook.after_emit(message, data, level, **options)
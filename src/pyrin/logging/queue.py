@@ -0,0 +1,434 @@
+# -*- coding: utf-8 -*-
+"""
+logging queue module.
+"""
+
+import logging
+
+from copy import copy
+from collections import deque
+from threading import Thread, Lock, Condition
+
+from pyrin.core.structs import CoreObject
+from pyrin.logging.enumerations import OverflowPolicyEnum, LogLevelIntEnum
+from pyrin.logging.exceptions import InvalidOverflowPolicyError
+
+
+class LogQueue(CoreObject):
+    """
+    log queue class.
+
+    a bounded queue of log records which applies its overflow policy when it is full.
+    """
+
+    def __init__(self, max_size, overflow_policy=OverflowPolicyEnum.BLOCK):
+        """
+        initializes an instance of LogQueue.
+
+        :param int max_size: max number of records to be kept in the queue.
+
+        :param str overflow_policy: the policy to be applied when queue is full.
+                                    defaults to `block` if not provided.
+        :enum overflow_policy:
+            BLOCK = 'block'
+            DROP_OLDEST = 'drop_oldest'
+            DROP_DEBUG_FIRST = 'drop_debug_first'
+
+        :raises InvalidOverflowPolicyError: invalid overflow policy error.
+        """
+
+        super().__init__()
+
+        if overflow_policy not in OverflowPolicyEnum:
+            raise InvalidOverflowPolicyError('Overflow policy [{policy}] is invalid. '
+                                             'it must be one of {policies}.'
+                                             .format(policy=overflow_policy,
+                                                     policies=list(OverflowPolicyEnum)))
+
+        self._max_size = max(max_size, 1)
+        self._overflow_policy = overflow_policy
+        self._items = deque()
+        self._debug_count = 0
+        self._unfinished_count = 0
+        self._is_closed = False
+        self._lock = Lock()
+        self._not_empty = Condition(self._lock)
+        self._not_full = Condition(self._lock)
+        self._all_done = Condition(self._lock)
+
+        # a dict containing the number of dropped records of each log level.
+        # in the form of: {int level: int count}
+        self._dropped = {}
+
+    def _is_debug(self, record):
+        """
+        gets a value indicating that given record has debug level or lower.
+
+        :param LogRecord record: log record.
+
+        :rtype: bool
+        """
+
+        return record.levelno <= LogLevelIntEnum.DEBUG
+
+    def _drop(self, record):
+        """
+        counts the given record as dropped.
+
+        :param LogRecord record: log record which has been dropped.
+        """
+
+        self._dropped[record.levelno] = self._dropped.get(record.levelno, 0) + 1
+
+    def _remove(self, index):
+        """
+        removes the record at given index of the queue and counts it as dropped.
+
+        :param int index: index of record to be removed.
+        """
+
+        record = self._items[index][1]
+        del self._items[index]
+        if self._is_debug(record):
+            self._debug_count -= 1
+
+        self._unfinished_count -= 1
+        self._drop(record)
+
+    def _make_room(self, record):
+        """
+        makes room for given record based on overflow policy.
+
+        it must be called while the lock is acquired.
+        it returns False if the given record itself must be dropped.
+
+        :param LogRecord record: log record to be queued.
+
+        :rtype: bool
+        """
+
+        if self._overflow_policy == OverflowPolicyEnum.BLOCK:
+            while len(self._items) >= self._max_size and self._is_closed is False:
+                self._not_full.wait()
+
+            return self._is_closed is False
+
+        if self._overflow_policy == OverflowPolicyEnum.DROP_DEBUG_FIRST:
+            if self._debug_count > 0:
+                for index, item in enumerate(self._items):
+                    if self._is_debug(item[1]):
+                        self._remove(index)
+                        return True
+
+            if self._is_debug(record):
+                return False
+
+        self._remove(0)
+        return True
+
+    def put(self, handlers, record):
+        """
+        puts the given record into the queue to be emitted by given handlers.
+
+        it returns False if the record has not been queued, because the
+        queue is closed or the record has been dropped by overflow policy.
+
+        :param tuple[Handler] handlers: handlers to emit the record.
+        :param LogRecord record: log record to be queued.
+
+        :rtype: bool
+        """
+
+        with self._lock:
+            if self._is_closed is True:
+                return False
+
+            if len(self._items) >= self._max_size and \
+                    self._make_room(record) is not True:
+                if self._is_closed is False:
+                    self._drop(record)
+
+                return False
+
+            self._items.append((handlers, record))
+            if self._is_debug(record):
+                self._debug_count += 1
+
+            self._unfinished_count += 1
+            self._not_empty.notify()
+            return True
+
+    def get(self):
+        """
+        gets the next item of the queue.
+
+        it blocks until an item is available. it returns None
+        if the queue is closed and all of its items have been consumed.
+
+        :returns: tuple[tuple[Handler] handlers, LogRecord record]
+        :rtype: tuple[tuple[Handler], LogRecord]
+        """
+
+        with self._lock:
+            while len(self._items) <= 0 and self._is_closed is False:
+                self._not_empty.wait()
+
+            if len(self._items) <= 0:
+                return None
+
+            item = self._items.popleft()
+            if self._is_debug(item[1]):
+                self._debug_count -= 1
+
+            self._not_full.notify()
+            return item
+
+    def task_done(self):
+        """
+        marks an item which has been got from the queue as emitted.
+        """
+
+        with self._lock:
+            self._unfinished_count -= 1
+            if self._unfinished_count <= 0:
+                self._all_done.notify_all()
+
+    def join(self, timeout=None):
+        """
+        blocks until all queued items have been emitted.
+
+        it returns False if timeout has been reached.
+
+        :param float timeout: timeout in seconds. defaults to
+                              waiting forever if not provided.
+
+        :rtype: bool
+        """
+
+        with self._lock:
+            return self._all_done.wait_for(lambda: self._unfinished_count <= 0, timeout)
+
+    def close(self):
+        """
+        closes the queue.
+
+        no more items will be accepted, but the queued items could still be consumed.
+        """
+
+        with self._lock:
+            self._is_closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    @property
+    def size(self):
+        """
+        gets the number of queued items.
+
+        :rtype: int
+        """
+
+        return len(self._items)
+
+    @property
+    def max_size(self):
+        """
+        gets the max number of items to be kept in the queue.
+
+        :rtype: int
+        """
+
+        return self._max_size
+
+    @property
+    def overflow_policy(self):
+        """
+        gets the overflow policy of this queue.
+
+        :rtype: str
+        """
+
+        return self._overflow_policy
+
+    @property
+    def is_closed(self):
+        """
+        gets a value indicating that this queue is closed.
+
+        :rtype: bool
+        """
+
+        return self._is_closed
+
+    @property
+    def dropped(self):
+        """
+        gets the number of dropped records of each log level name.
+
+        :rtype: dict[str, int]
+        """
+
+        with self._lock:
+            return {logging.getLevelName(level): count
+                    for level, count in self._dropped.items()}
+
+
+class QueueHandler(logging.Handler):
+    """
+    queue handler class.
+
+    it puts prepared records into a log queue, to be emitted by
+    the handlers of the original logger in the listener thread.
+    if the queue is closed, records will be emitted synchronously.
+    """
+
+    def __init__(self, handlers, log_queue):
+        """
+        initializes an instance of QueueHandler.
+
+        :param tuple[Handler] handlers: handlers to emit the records.
+        :param LogQueue log_queue: log queue to put records into it.
+        """
+
+        super().__init__()
+
+        self._handlers = handlers
+        self._queue = log_queue
+
+    def _prepare(self, record):
+        """
+        prepares the given record to be emitted in another thread.
+
+        it merges the message and its arguments and formats the exception
+        info, so the record does not keep any references to caller objects.
+        it returns a copy of the record, because other handlers may also need
+        the original record.
+
+        :param LogRecord record: log record to be prepared.
+
+        :rtype: LogRecord
+        """
+
+        record = copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+
+            record.exc_info = None
+
+        return record
+
+    def handle(self, record):
+        """
+        handles the given record if it passes the filters of this handler.
+
+        it is overridden to not acquire handler lock, the log queue is thread-safe.
+
+        :param LogRecord record: log record to be handled.
+
+        :rtype: bool
+        """
+
+        result = self.filter(record)
+        if result:
+            self.emit(record)
+
+        return result
+
+    def emit(self, record):
+        """
+        puts the given record into the log queue.
+
+        :param LogRecord record: log record to be emitted.
+        """
+
+        try:
+            if self._queue.put(self._handlers, self._prepare(record)) is False and \
+                    self._queue.is_closed is True:
+                emit_record(self._handlers, record)
+        except Exception:
+            self.handleError(record)
+
+    @property
+    def handlers(self):
+        """
+        gets the handlers of this queue handler.
+
+        :rtype: tuple[Handler]
+        """
+
+        return self._handlers
+
+
+class QueueListener(CoreObject):
+    """
+    queue listener class.
+
+    it emits the records of a log queue using a dedicated thread.
+    """
+
+    def __init__(self, log_queue):
+        """
+        initializes an instance of QueueListener.
+
+        :param LogQueue log_queue: log queue to be listened.
+        """
+
+        super().__init__()
+
+        self._queue = log_queue
+        self._thread = None
+
+    def _listen(self):
+        """
+        emits the records of log queue until it is closed.
+        """
+
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            try:
+                emit_record(*item)
+            except Exception:
+                pass
+            finally:
+                self._queue.task_done()
+
+    def start(self):
+        """
+        starts the listener thread.
+        """
+
+        if self._thread is None:
+            self._thread = Thread(target=self._listen, name='pyrin-logging', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=None):
+        """
+        closes the log queue and waits for the queued records to be emitted.
+
+        :param float timeout: timeout in seconds. defaults to
+                              waiting forever if not provided.
+        """
+
+        self._queue.close()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+def emit_record(handlers, record):
+    """
+    emits the given record using given handlers.
+
+    :param tuple[Handler] handlers: handlers to emit the record.
+    :param LogRecord record: log record to be emitted.
+    """
+
+    for handler in handlers:
+        if record.levelno >= handler.level:
+            handler.handle(record)
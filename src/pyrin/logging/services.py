@@ -46,6 +46,22 @@ def reload_configs(**options):
     return get_component(LoggingPackage.COMPONENT_NAME).reload_configs(**options)
 
 
+def is_body_sampled(url_rule=None):
+    """
+    gets a value indicating that request and response bodies of given url rule must be logged.
+
+    each url rule with a sample rate of `N` will have 1-in-N of its bodies logged.
+    a sample rate of `0` disables logging of its bodies.
+
+    :param str url_rule: url rule of current request.
+                         if not provided, the default sample rate will be used.
+
+    :rtype: bool
+    """
+
+    return get_component(LoggingPackage.COMPONENT_NAME).is_body_sampled(url_rule)
+
+
 def wrap_all_loggers():
     """
     wraps all available loggers into an adapter.
@@ -56,6 +72,53 @@ def wrap_all_loggers():
     get_component(LoggingPackage.COMPONENT_NAME).wrap_all_loggers()
 
 
+def flush_queue(**options):
+    """
+    waits for all queued logs to be emitted.
+
+    it returns False if timeout has been reached.
+    it does nothing if asynchronous emission is not enabled.
+
+    :keyword float timeout: timeout in seconds. defaults to
+                            waiting forever if not provided.
+
+    :rtype: bool
+    """
+
+    return get_component(LoggingPackage.COMPONENT_NAME).flush_queue(**options)
+
+
+def shutdown_queue(**options):
+    """
+    emits all queued logs and stops the listener thread.
+
+    logs which are emitted after shutdown will be emitted synchronously.
+    it does nothing if asynchronous emission is not enabled.
+
+    :keyword float timeout: timeout in seconds. defaults to
+                            `async_shutdown_timeout` config
+                            if not provided.
+    """
+
+    return get_component(LoggingPackage.COMPONENT_NAME).shutdown_queue(**options)
+
+
+def get_queue_stats():
+    """
+    gets the statistic info about asynchronous emission of logs.
+
+    :returns: dict(bool enabled: asynchronous emission is enabled,
+                   int size: number of queued logs,
+                   int max_size: max number of logs to be queued,
+                   str overflow_policy: overflow policy,
+                   int dropped: number of dropped logs,
+                   dict dropped_by_level: number of dropped logs of each level)
+    :rtype: dict
+    """
+
+    return get_component(LoggingPackage.COMPONENT_NAME).get_queue_stats()
+
+
 def get_logger(name, **options):
     """
     gets the logger based on input parameters.
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+logging structs module.
+"""
+
+from pyrin.core.structs import CoreObject
+
+
+class LazyValue(CoreObject):
+    """
+    lazy value class.
+
+    it wraps a function to be called only when its value is required.
+    it could be used as `interpolation_data` or its values in logging calls,
+    so the data will only be computed if the log level is enabled.
+    the function will be called once and its result will be reused.
+    """
+
+    def __init__(self, func, *args, **kwargs):
+        """
+        initializes an instance of LazyValue.
+
+        :param function func: function to be called to get the value.
+        :param object args: function positional arguments.
+        :param object kwargs: function keyword arguments.
+        """
+
+        super().__init__()
+
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._is_evaluated = False
+        self._value = None
+
+    def get(self):
+        """
+        gets the value of this object.
+
+        the function will be called on first usage.
+
+        :returns: object
+        """
+
+        if self._is_evaluated is False:
+            self._value = self._func(*self._args, **self._kwargs)
+            self._is_evaluated = True
+
+        return self._value
@@ -311,7 +311,7 @@ class PackagingManager(Manager, HookMixin):
         this method will call `after_packages_loaded` method of all registered hooks.
         """
 
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('after_packages_loaded'):
             hook.after_packages_loaded()
 
     def _package_loaded(self, package_name, **options):
@@ -321,7 +321,7 @@ class PackagingManager(Manager, HookMixin):
         :param str package_name: name of the loaded package.
         """
 
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('package_loaded'):
             hook.package_loaded(package_name, **options)
 
     def load(self, module_name, **options):
@@ -3,6 +3,8 @@
 mimetype handlers base module.
 """
 
+import re
+
 from abc import abstractmethod
 
 from pyrin.core.exceptions import CoreNotImplementedError
@@ -93,3 +95,51 @@ class MIMETypeHandlerBase(AbstractMIMETypeHandlerBase):
         """
 
         return isinstance(value, self.accepted_type)
+
+
+class StringMIMETypeHandlerBase(MIMETypeHandlerBase):
+    """
+    string mimetype handler base class.
+
+    it provides the boundaries of string values by only scanning a limited
+    window at the start and end of the value. so the cost of detection
+    does not depend on the size of the value.
+    """
+
+    # max number of characters to be scanned at the start and end of values.
+    SCAN_WINDOW = 1024
+
+    # matches the first non-whitespace character.
+    NON_SPACE_REGEX = re.compile(r'\S')
+
+    def _get_boundaries(self, value):
+        """
+        gets the index of first non-whitespace character and the last non-whitespace character.
+
+        it returns (None, None) if there is no non-whitespace
+        character in the scanned window.
+
+        :param str value: value to get its boundaries.
+
+        :returns: tuple[int start, str last]
+        :rtype: tuple[int, str]
+        """
+
+        match = self.NON_SPACE_REGEX.search(value, 0, self.SCAN_WINDOW)
+        if match is None:
+            return None, None
+
+        last = value[-self.SCAN_WINDOW:].rstrip()[-1:]
+        return match.start(), last
+
+    @property
+    def accepted_type(self):
+        """
+        gets the accepted type for this mimetype handler.
+
+        which could detect mimetype from this type.
+
+        :rtype: type[str]
+        """
+
+        return str
@@ -7,22 +7,25 @@ import re
 
 from pyrin.processor.mimetype.decorators import mimetype_handler
 from pyrin.processor.mimetype.enumerations import MIMETypeEnum
-from pyrin.processor.mimetype.handlers.base import MIMETypeHandlerBase
+from pyrin.processor.mimetype.handlers.base import StringMIMETypeHandlerBase
 
 
 @mimetype_handler()
-class HTMLMIMETypeHandler(MIMETypeHandlerBase):
+class HTMLMIMETypeHandler(StringMIMETypeHandlerBase):
     """
     html mimetype handler class.
 
     this class detects html markup in most inclusive way. it's not a
     real html parser. it just provides a way to detect if a string
     has potential html markup inside it.
+
+    a value is considered as html if it starts with `<` and ends with `>`
+    or if it has a tag at its start window.
     """
 
-    # matches the html inside string.
+    # matches an html tag.
     # matching is case-insensitive.
-    HTML_REGEX = re.compile(r'^.*<.*\S+.*>.*', re.IGNORECASE | re.MULTILINE | re.DOTALL)
+    TAG_REGEX = re.compile(r'<[/!?]?[a-z][^<>]*>', re.IGNORECASE)
 
     def __init__(self, **options):
         """
@@ -42,19 +45,12 @@ class HTMLMIMETypeHandler(MIMETypeHandlerBase):
         :rtype: str
         """
 
-        if self.HTML_REGEX.match(value.strip()):
+        start, last = self._get_boundaries(value)
+        if start is None:
+            return None
+
+        if (value[start] == '<' and last == '>') or \
+                self.TAG_REGEX.search(value, start, start + self.SCAN_WINDOW):
             return MIMETypeEnum.HTML
 
         return None
-
-    @property
-    def accepted_type(self):
-        """
-        gets the accepted type for this mimetype handler.
-
-        which could detect mimetype from this type.
-
-        :rtype: type[str]
-        """
-
-        return str
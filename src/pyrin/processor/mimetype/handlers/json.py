@@ -3,11 +3,10 @@
 mimetype handlers json module.
 """
 
-import re
-
 from pyrin.processor.mimetype.decorators import mimetype_handler
 from pyrin.processor.mimetype.enumerations import MIMETypeEnum
-from pyrin.processor.mimetype.handlers.base import MIMETypeHandlerBase
+from pyrin.processor.mimetype.handlers.base import MIMETypeHandlerBase, \
+    StringMIMETypeHandlerBase
 
 
 @mimetype_handler()
@@ -50,14 +49,12 @@ class JSONMIMETypeHandler(MIMETypeHandlerBase):
 
 
 @mimetype_handler()
-class JSONStringMIMETypeHandler(MIMETypeHandlerBase):
+class JSONStringMIMETypeHandler(StringMIMETypeHandlerBase):
     """
     json string mimetype handler class.
-    """
 
-    # matches the json inside string.
-    # matching is case-insensitive.
-    JSON_REGEX = re.compile(r'^[ ]*\{.*\}[ ]*', re.IGNORECASE | re.MULTILINE | re.DOTALL)
+    a value is considered as json if it starts with `{` and ends with `}`.
+    """
 
     def _mimetype(self, value, **options):
         """
@@ -70,19 +67,8 @@ class JSONStringMIMETypeHandler(MIMETypeHandlerBase):
         :rtype: str
         """
 
-        if self.JSON_REGEX.match(value.strip()):
+        start, last = self._get_boundaries(value)
+        if start is not None and value[start] == '{' and last == '}':
             return MIMETypeEnum.JSON
 
         return None
-
-    @property
-    def accepted_type(self):
-        """
-        gets the accepted type for this mimetype handler.
-
-        which could detect mimetype from this type.
-
-        :rtype: type[str]
-        """
-
-        return str
@@ -168,7 +168,8 @@ class CoreRequest(Request):
         for example `locale_key` and `timezone_key` will be removed
         from query params because they will be stored in request object.
         the paging parameters will also be removed and stored in `_paging_params`
-        dict attribute. this method removes extra kwargs from input dict directly
+        dict attribute. the cursor param will only be removed if current route is
+        paged using keyset pagination. this method removes extra kwargs from input dict directly
         and does not return anything.
 
         :param dict params: a dict containing all query params.
@@ -186,7 +187,8 @@ class CoreRequest(Request):
             globalization[timezone_key] = timezone
 
         self._globalization_params = globalization
-        self._paging_params = paging_services.extract_paging_params(params)
+        keyset = self.url_rule is not None and self.url_rule.is_keyset_paged
+        self._paging_params = paging_services.extract_paging_params(params, keyset=keyset)
 
     def _get_safe_content_length(self):
         """
@@ -403,7 +405,8 @@ class CoreRequest(Request):
         gets the paging params of current request.
 
         :returns: dict(int page: page number,
-                       int page_size: page size)
+                       int page_size: page size,
+                       str cursor: cursor token)
         :rtype: dict
         """
 
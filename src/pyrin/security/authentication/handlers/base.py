@@ -286,6 +286,21 @@ class AuthenticatorBase(AbstractAuthenticatorBase):
         payloads = self._get_payloads(*credentials, **options)
         payloads = misc_utils.make_iterable(payloads, tuple)
         self._revoke(user, *payloads, **options)
+        self._invalidate(*credentials, **options)
+
+    def _invalidate(self, *credentials, **options):
+        """
+        invalidates the given credentials after they have been revoked.
+
+        this method could be overridden in subclasses to remove any
+        in-memory state of revoked credentials, for example cached tokens.
+
+        :param str credentials: user credentials.
+                                it is usually the contents of
+                                authorization or cookie headers.
+                                it can be multiple items if required.
+        """
+        pass
 
     @abstractmethod
     def _create_credentials(self, user, **options):
@@ -498,9 +513,30 @@ class TokenAuthenticatorBase(AuthenticatorBase):
         :rtype: tuple[dict, dict]
         """
 
-        header = token_services.get_unverified_header(token, **options)
-        payload = token_services.get_payload(token, **options)
-        return header, payload
+        return token_services.get_verified_token(token, **options)
+
+    def _is_revoked(self, *payloads, **options):
+        """
+        gets a value indicating that any of given token payloads is revoked.
+
+        revoked tokens are kept in memory by token services and will be synced
+        from registered token hooks, so this method does not access the database.
+
+        :param dict payloads: token payloads.
+
+        :rtype: bool
+        """
+
+        return any(token_services.is_revoked(payload) for payload in payloads if payload)
+
+    def _invalidate(self, *credentials, **options):
+        """
+        invalidates the given tokens after they have been revoked.
+
+        :param str credentials: access token and refresh token.
+        """
+
+        token_services.revoke(*credentials, **options)
 
     def _get_access_token_payload(self, access_token, **options):
         """
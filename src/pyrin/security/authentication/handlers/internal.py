@@ -99,7 +99,7 @@ class InternalTokenAuthenticator(TokenAuthenticatorBase):
         :rtype: bool
         """
 
-        # query on tokens
+        return super()._is_revoked(access_token_payload, refresh_token_payload, **options)
 
     def _persist_payloads(self, user, access_token_payload,
                           refresh_token_payload, **options):
@@ -13,3 +13,4 @@ class RequestContextEnum(CoreEnum):
 
     PAGINATOR = 'paginator'
     RESULT_SCHEMA = 'result_schema'
+    RESPONSE_CACHE = 'response_cache'
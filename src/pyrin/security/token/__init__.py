@@ -12,5 +12,5 @@ class TokenPackage(Package):
     """
 
     NAME = __name__
-    DEPENDS = []
+    DEPENDS = ['pyrin.configuration']
     COMPONENT_NAME = 'security.token.component'
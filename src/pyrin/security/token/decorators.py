@@ -44,3 +44,32 @@ def token(*args, **kwargs):
         return cls
 
     return decorator
+
+
+def token_hook():
+    """
+    decorator to register a token hook.
+
+    :raises InvalidTokenHookTypeError: invalid token hook type error.
+
+    :returns: token hook class.
+    :rtype: type
+    """
+
+    def decorator(cls):
+        """
+        decorates the given class and registers an instance
+        of it into available token hooks.
+
+        :param type cls: token hook class.
+
+        :returns: token hook class.
+        :rtype: type
+        """
+
+        instance = cls()
+        token_services.register_hook(instance)
+
+        return cls
+
+    return decorator
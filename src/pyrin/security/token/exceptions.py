@@ -82,3 +82,10 @@ class DuplicatedTokenKidHeaderError(TokenManagerException):
     duplicated token kid header error.
     """
     pass
+
+
+class InvalidTokenHookTypeError(TokenManagerException):
+    """
+    invalid token hook type error.
+    """
+    pass
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+token hooks module.
+"""
+
+from pyrin.core.structs import Hook
+
+
+class TokenHookBase(Hook):
+    """
+    token hook base class.
+
+    all packages that need to be hooked into token business must
+    implement this class and register it in token hooks.
+    """
+
+    def revoked(self, header, payload):
+        """
+        this method will be called after a token has been revoked in current process.
+
+        it could be used to persist the revocation or to notify
+        other processes of application about it.
+
+        :param dict header: header of revoked token.
+        :param dict payload: payload of revoked token.
+        """
+        pass
+
+    def get_revoked_tokens(self, since):
+        """
+        this method will be called periodically to sync revoked tokens into memory.
+
+        each subclass must return an iterable of tuples, each one containing the
+        `jti` and `exp` claims of a revoked token. `exp` could be None if the token
+        never expires. tokens which have been expired could be omitted.
+
+        :param float since: timestamp of the previous sync.
+                            it is None on the first sync and all
+                            revoked tokens must be returned.
+
+        :returns: iterable[tuple[str jti, float exp]]
+        :rtype: iterable[tuple[str, float]]
+        """
+
+        return []
@@ -3,26 +3,43 @@
 token manager module.
 """
 
+import time
+import hashlib
+
+from threading import Lock
+
 import jwt
 
+import pyrin.caching.services as caching_services
 import pyrin.configuration.services as config_services
 
+from pyrin.core.mixin import HookMixin
 from pyrin.core.structs import Context, DTO, Manager
 from pyrin.security.token import TokenPackage
+from pyrin.security.token.hooks import TokenHookBase
 from pyrin.security.token.interface import AbstractTokenBase
+from pyrin.settings.static import APPLICATION_ENCODING
 from pyrin.utils.custom_print import print_warning
 from pyrin.security.token.exceptions import InvalidTokenHandlerTypeError, \
     DuplicatedTokenHandlerError, TokenHandlerNotFoundError, InvalidTokenHandlerNameError, \
     TokenKidHeaderNotSpecifiedError, TokenKidHeaderNotFoundError, DuplicatedTokenKidHeaderError, \
-    TokenDecodingError
+    TokenDecodingError, InvalidTokenHookTypeError
 
 
-class TokenManager(Manager):
+class TokenManager(Manager, HookMixin):
     """
     token manager class.
+
+    this class provides some hooks to let different packages
+    sync revoked tokens or get notified about revocations.
     """
 
     package_class = TokenPackage
+    hook_type = TokenHookBase
+    invalid_hook_type_error = InvalidTokenHookTypeError
+
+    # prefix of the keys of verified tokens in the cache.
+    VERIFIED_CACHE_KEY = 'verified_token'
 
     def __init__(self):
         """
@@ -37,6 +54,19 @@ class TokenManager(Manager):
         # in the form of: {str kid: str handler_name}
         self._kid_to_handler_map = DTO()
 
+        self._verified_cache_name = config_services.get('security', 'token',
+                                                        'verified_cache_name', default=None)
+        self._verified_cache_expire = config_services.get('security', 'token',
+                                                          'verified_cache_expire')
+        self._revocation_sync_interval = config_services.get('security', 'token',
+                                                             'revocation_sync_interval')
+
+        # a dictionary containing the id of revoked tokens and their expire time.
+        # in the form of: {str jti: float exp}
+        self._revoked_tokens = {}
+        self._last_revocation_sync = None
+        self._revocation_lock = Lock()
+
     def register_token_handler(self, instance, **options):
         """
         registers a new token handler or replaces the existing one.
@@ -226,6 +256,160 @@ class TokenManager(Manager):
         except Exception as error:
             raise TokenDecodingError(error) from error
 
+    def _get_verified_cache_key(self, token):
+        """
+        gets the cache key of given token.
+
+        :param str token: token to get its cache key.
+
+        :rtype: tuple[str, str]
+        """
+
+        digest = hashlib.blake2b(token.encode(APPLICATION_ENCODING), digest_size=20)
+        return self.VERIFIED_CACHE_KEY, digest.hexdigest()
+
+    def _cache_verified_token(self, key, header, payload):
+        """
+        caches the given header and payload of a verified token.
+
+        the cached item will never outlive the `exp` claim of the token.
+
+        :param tuple[str, str] key: cache key of the token.
+        :param dict header: token header.
+        :param dict payload: token payload.
+        """
+
+        expire = self._verified_cache_expire
+        expire_at = payload.get('exp')
+        if expire_at is not None:
+            expire = min(expire, int((expire_at - time.time()) * 1000))
+
+        if expire > 0:
+            caching_services.set(self._verified_cache_name, key,
+                                 (header, payload), expire=expire)
+
+    def get_verified_token(self, token, **options):
+        """
+        decodes token using correct handler and gets its header and payload.
+
+        the header and payload of verified tokens are cached using a digest
+        of the raw token, so the signature of the same token will not be verified
+        again until its cached item expires. cached items never outlive the `exp`
+        claim of the token, and revoked tokens will not be returned from cache.
+
+        :param str token: token to get it's header and payload.
+
+        :raises TokenKidHeaderNotSpecifiedError: token kid header not specified error.
+        :raises TokenKidHeaderNotFoundError: token kid header not found error.
+        :raises TokenHandlerNotFoundError: token handler not found error.
+        :raises TokenVerificationError: token verification error.
+
+        :returns: tuple[dict header, dict payload]
+        :rtype: tuple[dict, dict]
+        """
+
+        if self._verified_cache_name is None:
+            return self.get_unverified_header(token), self.get_payload(token, **options)
+
+        key = self._get_verified_cache_key(token)
+        result = caching_services.get(self._verified_cache_name, key)
+        if result is not None:
+            header, payload = result
+            expire_at = payload.get('exp')
+            if (expire_at is None or expire_at > time.time()) and \
+                    payload.get('jti') not in self._revoked_tokens:
+                return header, payload
+
+            caching_services.remove(self._verified_cache_name, key)
+
+        header = self.get_unverified_header(token)
+        payload = self.get_payload(token, **options)
+        if payload.get('jti') not in self._revoked_tokens:
+            self._cache_verified_token(key, header, payload)
+
+        return header, payload
+
+    def _add_revoked_token(self, jti, exp):
+        """
+        adds the given token id into revoked tokens.
+
+        :param str jti: token id.
+        :param float exp: token expire time.
+        """
+
+        if jti is not None:
+            self._revoked_tokens[jti] = exp
+
+    def _sync_revoked_tokens(self):
+        """
+        syncs revoked tokens from all registered hooks if sync interval has been passed.
+
+        it also removes expired tokens from revoked tokens.
+        """
+
+        now = time.time()
+        if self._last_revocation_sync is not None and \
+                now - self._last_revocation_sync < self._revocation_sync_interval:
+            return
+
+        with self._revocation_lock:
+            if self._last_revocation_sync is not None and \
+                    now - self._last_revocation_sync < self._revocation_sync_interval:
+                return
+
+            for hook in self._get_hooks('get_revoked_tokens'):
+                for jti, exp in hook.get_revoked_tokens(self._last_revocation_sync):
+                    self._add_revoked_token(jti, exp)
+
+            self._revoked_tokens = {jti: exp for jti, exp in self._revoked_tokens.items()
+                                    if exp is None or exp > now}
+            self._last_revocation_sync = now
+
+    def is_revoked(self, payload):
+        """
+        gets a value indicating that given token payload is revoked.
+
+        revoked tokens are kept in memory and will be synced from
+        registered hooks after each `revocation_sync_interval`.
+
+        :param dict payload: token payload.
+
+        :rtype: bool
+        """
+
+        self._sync_revoked_tokens()
+        return payload.get('jti') in self._revoked_tokens
+
+    def revoke(self, *tokens, **options):
+        """
+        revokes the given tokens.
+
+        revoked tokens will be removed from verified tokens cache and will
+        be added into revoked tokens. then all registered hooks will be notified.
+
+        :param str tokens: tokens to be revoked.
+
+        :raises TokenKidHeaderNotSpecifiedError: token kid header not specified error.
+        :raises TokenKidHeaderNotFoundError: token kid header not found error.
+        :raises TokenHandlerNotFoundError: token handler not found error.
+        :raises TokenVerificationError: token verification error.
+        """
+
+        for token in tokens:
+            if not token:
+                continue
+
+            header, payload = self.get_verified_token(token, **options)
+            with self._revocation_lock:
+                self._add_revoked_token(payload.get('jti'), payload.get('exp'))
+
+            if self._verified_cache_name is not None:
+                caching_services.remove(self._verified_cache_name,
+                                        self._get_verified_cache_key(token))
+
+            for hook in self._get_hooks('revoked'):
+                hook.revoked(header, payload)
+
     def generate_key(self, handler_name, **options):
         """
         generates a valid key for the given handler and returns it.
@@ -156,3 +156,71 @@ def generate_key(handler_name, **options):
     """
 
     return get_component(TokenPackage.COMPONENT_NAME).generate_key(handler_name, **options)
+
+
+def get_verified_token(token, **options):
+    """
+    decodes token using correct handler and gets its header and payload.
+
+    the header and payload of verified tokens are cached using a digest
+    of the raw token, so the signature of the same token will not be verified
+    again until its cached item expires. cached items never outlive the `exp`
+    claim of the token, and revoked tokens will not be returned from cache.
+
+    :param str token: token to get it's header and payload.
+
+    :raises TokenKidHeaderNotSpecifiedError: token kid header not specified error.
+    :raises TokenKidHeaderNotFoundError: token kid header not found error.
+    :raises TokenHandlerNotFoundError: token handler not found error.
+    :raises TokenVerificationError: token verification error.
+
+    :returns: tuple[dict header, dict payload]
+    :rtype: tuple[dict, dict]
+    """
+
+    return get_component(TokenPackage.COMPONENT_NAME).get_verified_token(token, **options)
+
+
+def is_revoked(payload):
+    """
+    gets a value indicating that given token payload is revoked.
+
+    revoked tokens are kept in memory and will be synced from
+    registered hooks after each `revocation_sync_interval`.
+
+    :param dict payload: token payload.
+
+    :rtype: bool
+    """
+
+    return get_component(TokenPackage.COMPONENT_NAME).is_revoked(payload)
+
+
+def revoke(*tokens, **options):
+    """
+    revokes the given tokens.
+
+    revoked tokens will be removed from verified tokens cache and will
+    be added into revoked tokens. then all registered hooks will be notified.
+
+    :param str tokens: tokens to be revoked.
+
+    :raises TokenKidHeaderNotSpecifiedError: token kid header not specified error.
+    :raises TokenKidHeaderNotFoundError: token kid header not found error.
+    :raises TokenHandlerNotFoundError: token handler not found error.
+    :raises TokenVerificationError: token verification error.
+    """
+
+    return get_component(TokenPackage.COMPONENT_NAME).revoke(*tokens, **options)
+
+
+def register_hook(instance):
+    """
+    registers the given instance into token hooks.
+
+    :param TokenHookBase instance: token hook instance to be registered.
+
+    :raises InvalidTokenHookTypeError: invalid token hook type error.
+    """
+
+    return get_component(TokenPackage.COMPONENT_NAME).register_hook(instance)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+utils immutable module.
+"""
+
+from collections import OrderedDict
+
+from pyrin.core.structs import DTO, CoreImmutableDTO, CoreImmutableDict, CoreImmutableList
+
+
+def freeze(value):
+    """
+    gets a read-only version of given value.
+
+    dicts, dtos, lists, tuples and sets will be converted into their immutable
+    equivalents recursively. values of other types will be returned as they are,
+    so they must not be modified by the callers.
+
+    :param object value: value to be frozen.
+
+    :returns: object
+    """
+
+    value_type = type(value)
+    if value_type is DTO:
+        return CoreImmutableDTO((key, freeze(item)) for key, item in value.items())
+
+    if value_type in (dict, OrderedDict):
+        return CoreImmutableDict((key, freeze(item)) for key, item in value.items())
+
+    if value_type is list:
+        return CoreImmutableList(freeze(item) for item in value)
+
+    if value_type is tuple:
+        return tuple(freeze(item) for item in value)
+
+    if value_type is set:
+        return frozenset(freeze(item) for item in value)
+
+    return value
@@ -254,7 +254,7 @@ class ValidatorAutoManager(Manager, HookMixin):
         this will call `after_auto_validators_registered` method of registered hooks.
         """
 
-        for hook in self._get_hooks():
+        for hook in self._get_hooks('after_auto_validators_registered'):
             hook.after_auto_validators_registered()
 
     def register_auto_validator(self, domain, field, **options):
@@ -9,11 +9,40 @@ import pyrin.globalization.datetime.services as datetime_services
 import pyrin.utils.datetime as datetime_utils
 
 from pyrin.core.globals import _
+from pyrin.converters.json.decoder import coerce_string
 from pyrin.validator.handlers.base import ValidatorBase
 from pyrin.validator.handlers.exceptions import ValueIsNotDateTimeError, ValueIsNotDateError, \
     ValueIsNotTimeError
 
 
+def coerce_to_begin_of_day_datetime(value):
+    """
+    gets the begin of day datetime equivalent of given date or date string.
+
+    if the value is not a date, it returns the same input.
+
+    :param date | str value: value to be coerced.
+
+    :rtype: datetime | object
+    """
+
+    return datetime_utils.coerce_to_begin_of_day_datetime(coerce_string(value))
+
+
+def coerce_to_end_of_day_datetime(value):
+    """
+    gets the end of day datetime equivalent of given date or date string.
+
+    if the value is not a date, it returns the same input.
+
+    :param date | str value: value to be coerced.
+
+    :rtype: datetime | object
+    """
+
+    return datetime_utils.coerce_to_end_of_day_datetime(coerce_string(value))
+
+
 class DateTimeValidator(ValidatorBase):
     """
     datetime validator class.
@@ -22,6 +51,7 @@ class DateTimeValidator(ValidatorBase):
     invalid_type_error = ValueIsNotDateTimeError
     invalid_type_message = _('The provided value for [{param_name}] '
                              'must be a datetime.')
+    default_fixer = coerce_string
 
     def __init__(self, domain, field, **options):
         """
@@ -116,6 +146,7 @@ class DateValidator(ValidatorBase):
     invalid_type_error = ValueIsNotDateError
     invalid_type_message = _('The provided value for [{param_name}] '
                              'must be a date.')
+    default_fixer = coerce_string
 
     def __init__(self, domain, field, **options):
         """
@@ -210,6 +241,7 @@ class TimeValidator(ValidatorBase):
     invalid_type_error = ValueIsNotTimeError
     invalid_type_message = _('The provided value for [{param_name}] '
                              'must be a time.')
+    default_fixer = coerce_string
 
     def __init__(self, domain, field, **options):
         """
@@ -303,7 +335,7 @@ class FromDateTimeValidator(DateTimeValidator):
     this is a helper class that coerces date values to begin of day datetime.
     """
 
-    default_fixer = datetime_utils.coerce_to_begin_of_day_datetime
+    default_fixer = coerce_to_begin_of_day_datetime
 
 
 class ToDateTimeValidator(DateTimeValidator):
@@ -313,4 +345,4 @@ class ToDateTimeValidator(DateTimeValidator):
     this is a helper class that coerces date values to end of day datetime.
     """
 
-    default_fixer = datetime_utils.coerce_to_end_of_day_datetime
+    default_fixer = coerce_to_end_of_day_datetime
@@ -6,6 +6,7 @@ validator handlers uuid module.
 from uuid import UUID
 
 from pyrin.core.globals import _
+from pyrin.converters.json.decoder import coerce_string
 from pyrin.validator.handlers.base import ValidatorBase
 from pyrin.validator.handlers.exceptions import ValueIsNotUUIDError, ValueIsNotUUID4Error
 
@@ -18,6 +19,7 @@ class UUIDValidator(ValidatorBase):
     invalid_type_error = ValueIsNotUUIDError
     invalid_type_message = _('The provided value for [{param_name}] '
                              'must be of uuid type.')
+    default_fixer = coerce_string
 
     def __init__(self, domain, field, **options):
         """
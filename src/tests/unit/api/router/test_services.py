@@ -6,6 +6,7 @@ router test_services module.
 import pytest
 
 import pyrin.api.router.services as router_services
+import tests.unit.security.session.services as test_session_services
 
 from pyrin.api.router.exceptions import RouteAuthenticationMismatchError
 from pyrin.api.router.handlers.protected import FreshProtectedRoute, ProtectedRoute
@@ -14,8 +15,11 @@ from pyrin.api.schema.structs import ResultSchema
 from pyrin.application.exceptions import DuplicateRouteURLError
 from pyrin.core.enumerations import HTTPMethodEnum
 from pyrin.core.globals import SECURE_FALSE, SECURE_TRUE
+from pyrin.core.structs import CoreHeaders
+from pyrin.database.paging.paginator import KeysetPaginator
+from pyrin.processor.mimetype.enumerations import MIMETypeEnum
 from pyrin.api.router.handlers.exceptions import MaxContentLengthLimitMismatchError, \
-    InvalidViewFunctionTypeError, PermissionTypeError
+    InvalidViewFunctionTypeError, PermissionTypeError, ViewFunctionRequiredParamsError
 
 from tests.unit.security.permission.base import PermissionMock
 from tests.unit.common.mock_functions import mock_view_function
@@ -333,3 +337,189 @@ def test_add_route_duplicate_with_replace():
                               max_content_length=123,
                               permissions=permissions,
                               replace=True)
+
+
+def test_create_route_with_mimetype():
+    """
+    creates the appropriate route with provided mimetype.
+    """
+
+    route = router_services.create_route('/api/router/public_with_mimetype',
+                                         methods=HTTPMethodEnum.GET,
+                                         view_function=mock_view_function,
+                                         authenticated=False,
+                                         mimetype=MIMETypeEnum.HTML)
+
+    assert route.mimetype == MIMETypeEnum.HTML
+
+
+def test_create_route_with_stream():
+    """
+    creates the appropriate route with streaming enabled.
+    """
+
+    route = router_services.create_route('/api/router/public_with_stream',
+                                         methods=HTTPMethodEnum.GET,
+                                         view_function=mock_view_function,
+                                         authenticated=False,
+                                         stream=True)
+
+    assert route.stream is True
+
+
+def test_create_route_without_stream():
+    """
+    creates the appropriate route without streaming.
+    """
+
+    route = router_services.create_route('/api/router/public_without_stream',
+                                         methods=HTTPMethodEnum.GET,
+                                         view_function=mock_view_function,
+                                         authenticated=False)
+
+    assert route.stream is False
+
+
+def view_function_with_required_arguments(id, name, age=None, **options):
+    """
+    a view function which has required arguments.
+    """
+
+    return dict(id=id, name=name)
+
+
+def test_compiled_steps_of_public_route():
+    """
+    creates a public route without schema or paginator.
+    it should not have any steps to be performed around the view function.
+    """
+
+    route = router_services.create_route('/api/router/compiled/public',
+                                         methods=HTTPMethodEnum.GET,
+                                         view_function=mock_view_function,
+                                         authenticated=False)
+
+    assert route._prepare_steps == ()
+    assert route._finish_steps == ()
+
+
+def test_compiled_steps_of_paged_protected_temporary_route():
+    """
+    creates a paged protected temporary route with result schema.
+    it should have all the steps to be performed around the view function.
+    """
+
+    route = router_services.create_route('/api/router/compiled/protected',
+                                         methods=HTTPMethodEnum.GET,
+                                         view_function=mock_view_function,
+                                         authenticated=True,
+                                         paged=True,
+                                         endpoint='compiled_protected',
+                                         depth=2,
+                                         request_limit=10)
+
+    assert route._prepare_steps == (route._inject_result_schema,
+                                    route._inject_paginator,
+                                    route._handle)
+    assert route._finish_steps == (route._finished,)
+
+
+def test_keyset_paged_route():
+    """
+    creates paged routes with and without keyset paginator.
+    only the route with keyset paginator should be keyset paged.
+    """
+
+    route = router_services.create_route('/api/router/paged/simple',
+                                         methods=HTTPMethodEnum.GET,
+                                         view_function=mock_view_function,
+                                         authenticated=False,
+                                         paged=True,
+                                         endpoint='paged_simple')
+
+    keyset_route = router_services.create_route('/api/router/paged/keyset',
+                                                methods=HTTPMethodEnum.GET,
+                                                view_function=mock_view_function,
+                                                authenticated=False,
+                                                paged=True,
+                                                endpoint='paged_keyset',
+                                                paginator_class=KeysetPaginator)
+
+    assert route.is_paged is True
+    assert route.is_keyset_paged is False
+    assert keyset_route.is_paged is True
+    assert keyset_route.is_keyset_paged is True
+
+
+def test_handle_route():
+    """
+    handles a public route and checks the prepared response.
+    """
+
+    test_session_services.inject_new_request()
+    route = router_services.create_route('/api/router/handle',
+                                         methods=HTTPMethodEnum.GET,
+                                         view_function=view_function_with_required_arguments,
+                                         authenticated=False)
+
+    result = route.handle(dict(id=1, name='pyrin'))
+    assert result == (dict(id=1, name='pyrin'), 200)
+
+
+def test_handle_route_no_cache():
+    """
+    handles a no cache route and checks the prepared response headers.
+    """
+
+    test_session_services.inject_new_request()
+    route = router_services.create_route('/api/router/handle/no_cache',
+                                         methods=HTTPMethodEnum.GET,
+                                         view_function=view_function_with_required_arguments,
+                                         authenticated=False,
+                                         no_cache=True)
+
+    body, status_code, headers = route.handle(dict(id=1, name='pyrin'))
+    assert body == dict(id=1, name='pyrin')
+    assert status_code == 200
+    assert headers.get('Cache-Control') == 'no-cache'
+
+
+def test_handle_route_no_cache_with_response_headers():
+    """
+    handles a no cache route which its view function returns headers.
+    both headers must be present in the response.
+    """
+
+    def view_function(**options):
+        return dict(id=1), 201, {'X-Custom': 'value'}
+
+    test_session_services.inject_new_request()
+    route = router_services.create_route('/api/router/handle/no_cache_headers',
+                                         methods=HTTPMethodEnum.POST,
+                                         view_function=view_function,
+                                         authenticated=False,
+                                         no_cache=True)
+
+    body, status_code, headers = route.handle(dict())
+    assert isinstance(headers, CoreHeaders)
+    assert status_code == 201
+    assert headers.get('X-Custom') == 'value'
+    assert headers.get('Cache-Control') == 'no-cache'
+    assert route._static_headers.get('X-Custom') is None
+
+
+def test_handle_route_missing_required_arguments():
+    """
+    handles a route with missing required arguments. it should raise an error.
+    """
+
+    test_session_services.inject_new_request()
+    route = router_services.create_route('/api/router/handle/required',
+                                         methods=HTTPMethodEnum.GET,
+                                         view_function=view_function_with_required_arguments,
+                                         authenticated=False)
+
+    with pytest.raises(ViewFunctionRequiredParamsError) as error:
+        route.handle(dict(name=None, age=20))
+
+    assert "['id', 'name']" in str(error.value)
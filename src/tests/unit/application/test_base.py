@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+application test_base module.
+"""
+
+import json
+
+import pyrin.application.services as application_services
+import pyrin.api.router.services as router_services
+import pyrin.security.session.services as session_services
+import tests.unit.security.session.services as test_session_services
+
+from pyrin.core.globals import SECURE_TRUE
+from pyrin.core.enumerations import HTTPMethodEnum
+from pyrin.database.services import get_current_store
+
+from tests.unit.common.models import BoundedLocalEntity
+
+
+def inject_request(url, **options):
+    """
+    injects a new request into current request object with a route for given url.
+
+    :param str url: url of the route.
+    """
+
+    route = router_services.create_route(url, methods=HTTPMethodEnum.GET,
+                                         view_function=lambda **inputs: None,
+                                         authenticated=False, **options)
+
+    test_session_services.inject_new_request()
+    session_services.get_current_request().url_rule = route
+
+
+def test_make_response_declared_mimetype():
+    """
+    makes a response from a string body on a route with a declared mimetype.
+    it should be served with the declared mimetype and not be converted to json.
+    """
+
+    inject_request('/application/response/csv', mimetype='text/csv')
+    body = 'id,name\n1,"first"\n'
+    response = application_services.get_current_app().make_response(body)
+
+    assert response.mimetype == 'text/csv'
+    assert response.get_data(as_text=True) == body
+    assert response.original_data == body
+
+
+def make_stream_response(value, stream=True):
+    """
+    makes a response from given value on a route which streams its responses.
+
+    it returns the decoded json body of the response and a value
+    indicating that the response has been streamed.
+
+    :param object value: the return value from the view function.
+    :param bool stream: specifies that the route must stream its responses.
+
+    :returns: tuple[dict body, bool is_streamed]
+    :rtype: tuple[dict, bool]
+    """
+
+    inject_request('/application/response/stream', stream=stream)
+    app = application_services.get_current_app()
+    with app.test_request_context():
+        response = app.make_response(value)
+        is_streamed = response.is_streamed
+        return json.loads(response.get_data(as_text=True)), is_streamed
+
+
+def test_make_response_stream_chunks():
+    """
+    makes a streamed response from an iterator which has multiple chunks.
+    the body should be a valid json containing all items and their count.
+    """
+
+    items = [dict(id=index, name='item_{index}'.format(index=index))
+             for index in range(1201)]
+    body, is_streamed = make_stream_response(iter(items))
+
+    assert is_streamed is True
+    assert body['results'] == items
+    assert body['count_total'] == 1201
+
+
+def test_make_response_stream_chunk_boundaries():
+    """
+    generates the streamed json of items with counts around the chunk size.
+    the result should be a valid json on each chunk boundary.
+    """
+
+    inject_request('/application/response/stream/boundaries', stream=True)
+    app = application_services.get_current_app()
+    for count in range(7):
+        items = list(range(count))
+        data = ''.join(app._generate_json_stream(iter(items), 3))
+        assert json.loads(data) == dict(results=items, count_total=count)
+
+
+def test_make_response_stream_empty():
+    """
+    makes a streamed response from an empty iterator.
+    the body should be a valid json with no results.
+    """
+
+    body, is_streamed = make_stream_response(iter([]))
+
+    assert is_streamed is True
+    assert body == dict(results=[], count_total=0)
+
+
+def test_make_response_stream_query():
+    """
+    makes a streamed response from a query which is fetched with `yield_per`.
+    the body should be a valid json containing all rows and their count.
+    """
+
+    store = get_current_store()
+    try:
+        for index in range(1, 8):
+            store.add(BoundedLocalEntity(id=index, name='name_{index}'.format(index=index),
+                                         age=index, populate_all=SECURE_TRUE))
+        store.commit()
+
+        query = store.query(BoundedLocalEntity).order_by(BoundedLocalEntity.id)
+        body, is_streamed = make_stream_response(query)
+
+        assert is_streamed is True
+        assert body['count_total'] == 7
+        assert [item['id'] for item in body['results']] == list(range(1, 8))
+        assert body['results'][0]['name'] == 'name_1'
+    finally:
+        store.query(BoundedLocalEntity).delete()
+        store.commit()
+
+
+def test_make_response_stream_disabled():
+    """
+    makes a response from a list on a route which does not stream its responses.
+    it should not be streamed.
+    """
+
+    body, is_streamed = make_stream_response([1, 2], stream=False)
+    assert is_streamed is False
+    assert body == dict(results=[1, 2], count_total=2)
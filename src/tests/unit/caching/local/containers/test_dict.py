@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+caching local containers test_dict module.
+"""
+
+from pyrin.caching.local.containers.dict import FIFOContainer, LIFOContainer, LRUContainer
+
+
+def _fill(container, count):
+    """
+    fills the given container with given number of items.
+
+    :param LocalCacheContainerBase container: container to be filled.
+    :param int count: number of items.
+    """
+
+    for i in range(count):
+        container[i] = i
+
+
+def test_fifo_evict():
+    """
+    evicts items from fifo container. hits should not change the order.
+    """
+
+    container = FIFOContainer()
+    _fill(container, 5)
+    container.touch(0)
+
+    assert container.evict(2) == [0, 1]
+    assert list(container.keys()) == [2, 3, 4]
+
+
+def test_lifo_evict():
+    """
+    evicts items from lifo container. hit items should be removed last.
+    """
+
+    container = LIFOContainer()
+    _fill(container, 5)
+    container.touch(4)
+
+    assert container.evict(2) == [3, 2]
+    assert list(container.keys()) == [4, 0, 1]
+
+
+def test_lru_evict():
+    """
+    evicts items from lru container. least recently used items should be removed first.
+    """
+
+    container = LRUContainer()
+    _fill(container, 5)
+    container.touch(0)
+    container.touch(2)
+
+    assert container.evict(3) == [1, 3, 4]
+    assert list(container.keys()) == [0, 2]
+
+
+def test_evict_more_than_available():
+    """
+    evicts more items than available in container. it should remove all items.
+    """
+
+    container = LRUContainer()
+    _fill(container, 3)
+
+    assert container.evict(10) == [0, 1, 2]
+    assert len(container) == 0
+
+
+def test_touch_missing_key():
+    """
+    touches a key which is not available in container. it should not raise an error.
+    """
+
+    container = LRUContainer()
+    container.touch('missing')
+
+    assert len(container) == 0
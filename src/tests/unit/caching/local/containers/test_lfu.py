@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+caching local containers test_lfu module.
+"""
+
+from pyrin.caching.local.containers.lfu import LFUContainer
+
+
+def test_evict():
+    """
+    evicts items from lfu container. least frequently used items should be removed first.
+    """
+
+    container = LFUContainer()
+    for i in range(5):
+        container[i] = i
+
+    container.touch(0)
+    container.touch(0)
+    container.touch(3)
+    container.touch(1)
+
+    assert container.evict(2) == [2, 4]
+    assert container.evict(1) == [3]
+    assert container.evict(5) == [1, 0]
+    assert len(container) == 0
+
+
+def test_set_existing_key():
+    """
+    sets an existing key into lfu container. it should increase its frequency.
+    """
+
+    container = LFUContainer()
+    container['a'] = 1
+    container['b'] = 2
+    container['a'] = 3
+
+    assert container['a'] == 3
+    assert container.evict(1) == ['b']
+
+
+def test_remove_and_pop():
+    """
+    removes items from lfu container. eviction should not return removed items.
+    """
+
+    container = LFUContainer()
+    for i in range(5):
+        container[i] = i
+
+    del container[0]
+    container.remove(1)
+    container.remove('missing')
+
+    assert container.pop(2) == 2
+    assert container.pop('missing', 10) == 10
+    assert container.evict(5) == [3, 4]
+
+
+def test_clear():
+    """
+    clears lfu container. it should remove all items and their frequencies.
+    """
+
+    container = LFUContainer(a=1, b=2)
+    container.touch('a')
+    container.clear()
+
+    assert len(container) == 0
+    assert container.evict(1) == []
+
+    container['c'] = 3
+    assert container.evict(1) == ['c']
+
+
+def test_slice():
+    """
+    gets a slice of lfu container. keys should be in the order of removal.
+    """
+
+    container = LFUContainer()
+    for i in range(4):
+        container[i] = i
+
+    container.touch(0)
+    container.touch(1)
+    container.touch(1)
+
+    assert container.slice(2) == [2, 3]
+    assert container.slice(2, last=True) == [0, 1]
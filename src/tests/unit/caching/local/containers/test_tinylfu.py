@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+caching local containers test_tinylfu module.
+"""
+
+from pyrin.caching.local.containers.structs import FrequencySketch
+from pyrin.caching.local.containers.tinylfu import TinyLFUContainer
+
+
+def test_admit_when_not_full():
+    """
+    admits new keys into a container which is not full. it should admit all keys.
+    """
+
+    container = TinyLFUContainer()
+
+    assert container.admit('a', False) is True
+
+
+def test_admit_when_full():
+    """
+    admits new keys into a full container. it should only admit
+    keys which are more frequently used than the victim.
+    """
+
+    container = TinyLFUContainer()
+    container['hot'] = 1
+    for i in range(5):
+        container.touch('hot')
+
+    assert container.admit('cold', True) is False
+    for i in range(10):
+        container.admit('warm', True)
+
+    assert container.admit('warm', True) is True
+
+
+def test_evict():
+    """
+    evicts items from tinylfu container. least recently used items should be removed first.
+    """
+
+    container = TinyLFUContainer()
+    for i in range(5):
+        container[i] = i
+
+    container.touch(0)
+
+    assert container.evict(2) == [1, 2]
+
+
+def test_frequency_sketch_estimate():
+    """
+    estimates the frequency of keys in a frequency sketch.
+    """
+
+    sketch = FrequencySketch(64)
+    for i in range(5):
+        sketch.increment('a')
+
+    sketch.increment('b')
+
+    assert sketch.estimate('a') >= 5
+    assert sketch.estimate('b') >= 1
+    assert sketch.estimate('a') > sketch.estimate('b')
+
+
+def test_frequency_sketch_saturation_and_aging():
+    """
+    increments a key more than max frequency of a frequency sketch.
+    it should be saturated and then halved after the sample size is reached.
+    """
+
+    sketch = FrequencySketch(16)
+    for i in range(FrequencySketch.MAX_FREQUENCY + 5):
+        sketch.increment('a')
+
+    assert sketch.estimate('a') == FrequencySketch.MAX_FREQUENCY
+
+    for i in range(16 * 10):
+        sketch.increment(i)
+
+    assert sketch.estimate('a') < FrequencySketch.MAX_FREQUENCY
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+caching local handlers test_complex module.
+"""
+
+from pyrin.caching.enumerations import EvictionPolicyEnum
+from pyrin.caching.local.handlers.complex import ComplexLocalCache
+from pyrin.caching.local.containers.lfu import LFUContainer
+
+
+class LFUComplexLocalCache(ComplexLocalCache):
+    """
+    lfu complex local cache class.
+    """
+
+    cache_name = 'complex.lfu'
+
+
+class LIFOComplexLocalCache(ComplexLocalCache):
+    """
+    lifo complex local cache class.
+    """
+
+    cache_name = 'complex.lifo'
+
+
+def test_complex_cache_eviction_policy():
+    """
+    creates a complex cache with given eviction policy.
+    it should use the container of that policy.
+    """
+
+    cache = LFUComplexLocalCache(eviction_policy=EvictionPolicyEnum.LFU)
+    assert cache.eviction_policy == EvictionPolicyEnum.LFU
+    assert isinstance(cache._container, LFUContainer)
+
+
+def test_complex_cache_eviction_policy_from_use_lifo():
+    """
+    creates a complex cache with `use_lifo` and without eviction policy.
+    the eviction policy should be resolved from `use_lifo` value.
+    """
+
+    cache = LIFOComplexLocalCache(use_lifo=True)
+    assert cache.use_lifo is True
+    assert cache.eviction_policy == EvictionPolicyEnum.LIFO
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+caching local items test_complex module.
+"""
+
+import pytest
+
+from pyrin.caching.local.items.complex import ComplexLocalCacheItem, \
+    FrozenComplexLocalCacheItem
+
+
+def test_complex_item_copies_value():
+    """
+    gets the value of a complex cache item. it should be a new copy on each get.
+    """
+
+    value = [dict(id=1), dict(id=2)]
+    item = ComplexLocalCacheItem('key', value, 1000)
+    result = item.value
+    result.append(dict(id=3))
+
+    assert result is not item.value
+    assert item.value == value
+
+
+def test_frozen_complex_item_returns_same_value():
+    """
+    gets the value of a frozen complex cache item. it should be
+    the same read-only object on each get.
+    """
+
+    value = [dict(id=1), dict(id=2)]
+    item = FrozenComplexLocalCacheItem('key', value, 1000)
+    value.append(dict(id=3))
+
+    assert item.value is item.value
+    assert item.value == [dict(id=1), dict(id=2)]
+
+    with pytest.raises(TypeError):
+        item.value.append(dict(id=3))
+
+    with pytest.raises(TypeError):
+        item.value[0]['id'] = 10
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+caching remote test_base module.
+"""
+
+from pyrin.caching.remote.handlers.base import RemoteCacheBase
+
+
+class FakeRemoteCache(RemoteCacheBase):
+    """
+    fake remote cache class.
+
+    it keeps the items in a dict and counts the number of round trips.
+    """
+
+    cache_name = 'redis'
+
+    def _create_client(self, *args, kwargs=None, **configs):
+        self.round_trips = 0
+        self.flushed_stats = []
+        return dict()
+
+    def _clear(self):
+        self.client.clear()
+
+    def _set(self, key, value, *args, **options):
+        self.round_trips += 1
+        self.client[key] = value
+
+    def _get(self, key, default=None, **options):
+        self.round_trips += 1
+        result = self.client.get(key, default)
+        if result is default:
+            self._increase_miss()
+        else:
+            self._increase_hit()
+
+        return result
+
+    def _get_many(self, keys, default=None, **options):
+        self.round_trips += 1
+        return [self.client.get(key, default) for key in keys]
+
+    def _delete(self, key, **options):
+        self.round_trips += 1
+        self.client.pop(key, None)
+
+    def _flush_stats(self, hits, misses):
+        self.round_trips += 1
+        self.flushed_stats.append((hits, misses))
+
+    @property
+    def hit_count(self):
+        self.flush_stats()
+        return sum(hits for hits, misses in self.flushed_stats)
+
+    @property
+    def miss_count(self):
+        self.flush_stats()
+        return sum(misses for hits, misses in self.flushed_stats)
+
+
+def create_cache(**options):
+    """
+    creates a new fake remote cache.
+
+    caches are singleton, so a new subclass is created on each call.
+
+    :rtype: FakeRemoteCache
+    """
+
+    return type('FakeRemoteCache', (FakeRemoteCache,), {})(**options)
+
+
+def test_get_does_not_send_stats_on_each_call():
+    """
+    gets values from cache and checks that hit and miss
+    counts are not sent to the server on each get.
+    """
+
+    cache = create_cache(stats_flush_interval=60000)
+    cache.set('key', 1)
+    cache.round_trips = 0
+
+    assert cache.get('key') == 1
+    assert cache.get('missing') is None
+    assert cache.get('missing') is None
+    assert cache.round_trips == 3
+    assert cache.flushed_stats == []
+
+    assert cache.hit_count == 1
+    assert cache.miss_count == 2
+    assert cache.flushed_stats == [(1, 2)]
+
+
+def test_stats_are_sent_on_each_get():
+    """
+    sets stats flush interval to zero and checks that
+    hit and miss counts are sent on each get.
+    """
+
+    cache = create_cache(stats_flush_interval=0)
+    cache.get('a')
+    cache.get('b')
+
+    assert cache.flushed_stats == [(0, 1), (0, 1)]
+
+
+def test_stats_are_not_recorded():
+    """
+    disables stats and checks that hit and miss counts are not recorded.
+    """
+
+    cache = create_cache(stats_flush_interval=None)
+    cache.get('a')
+
+    assert cache.miss_count == 0
+    assert cache.flushed_stats == []
+
+
+def test_batched_operations():
+    """
+    sets, gets and deletes many keys.
+    """
+
+    cache = create_cache(stats_flush_interval=60000)
+    cache.set_many({'a': 1, 'b': [2]})
+
+    cache.round_trips = 0
+    assert cache.get_many(['a', 'missing', 'b'], default=0) == [1, 0, [2]]
+    assert cache.round_trips == 1
+    assert cache.hit_count == 2
+    assert cache.miss_count == 1
+
+    cache.delete_many(['a', 'b'])
+    assert cache.get_many(['a', 'b']) == [None, None]
+    assert cache.get_many([]) == []
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+caching remote test_hashing module.
+"""
+
+import pytest
+
+from pyrin.caching.remote.handlers.hashing import KetamaHash
+
+
+def test_ketama_distribution():
+    """
+    distributes keys between nodes. each node must get a fair share of keys.
+    """
+
+    hasher = KetamaHash(['10.0.0.1:11211', '10.0.0.2:11211', '10.0.0.3:11211'])
+    counts = {}
+    for index in range(3000):
+        node = hasher.get_node('key_{index}'.format(index=index))
+        counts[node] = counts.get(node, 0) + 1
+
+    assert len(counts) == 3
+    assert all(count > 600 for count in counts.values())
+
+
+def test_ketama_remove_node():
+    """
+    removes a node. only the keys of removed node must be moved.
+    """
+
+    hasher = KetamaHash(['10.0.0.1:11211', '10.0.0.2:11211', '10.0.0.3:11211'])
+    keys = ['key_{index}'.format(index=index) for index in range(1000)]
+    before = {key: hasher.get_node(key) for key in keys}
+    hasher.remove_node('10.0.0.2:11211')
+    after = {key: hasher.get_node(key) for key in keys}
+
+    for key in keys:
+        if before[key] != '10.0.0.2:11211':
+            assert after[key] == before[key]
+        else:
+            assert after[key] != '10.0.0.2:11211'
+
+
+def test_ketama_is_stable():
+    """
+    gets the node of a key on different instances with nodes in different orders.
+    """
+
+    first = KetamaHash(['10.0.0.1:11211', '10.0.0.2:11211'])
+    second = KetamaHash(['10.0.0.2:11211', '10.0.0.1:11211'])
+    for index in range(100):
+        key = 'key_{index}'.format(index=index)
+        assert first.get_node(key) == second.get_node(key)
+
+
+def test_ketama_without_nodes():
+    """
+    gets the node of a key when there is no node available.
+    """
+
+    hasher = KetamaHash()
+    assert hasher.get_node('key') is None
+
+    with pytest.raises(ValueError):
+        hasher.remove_node('10.0.0.1:11211')
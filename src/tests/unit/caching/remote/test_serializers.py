@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+caching remote test_serializers module.
+"""
+
+import pickle
+
+from uuid import UUID
+from decimal import Decimal
+from datetime import datetime, date, time, timedelta, timezone
+
+import pytest
+
+from pyrin.caching.enumerations import SerializerEnum, CompressionEnum
+from pyrin.caching.remote.serializers.handlers import msgpack
+from pyrin.caching.remote.serializers.structs import ValueCodec
+from pyrin.caching.remote.serializers.exceptions import InvalidSerializerError, \
+    InvalidCompressionError, InvalidCompressionThresholdError, \
+    UnknownSerializedValueHeaderError
+
+
+VALUE = [dict(id=index, name='name {index}'.format(index=index),
+              is_active=index % 2 == 0, rate=index / 3, tags=['a', 'b'])
+         for index in range(100)]
+
+
+@pytest.mark.parametrize('serializer', [SerializerEnum.PICKLE, SerializerEnum.JSON,
+                                        SerializerEnum.MSGPACK])
+def test_encode_decode(serializer):
+    """
+    encodes and decodes a value with different serializers.
+    """
+
+    if serializer == SerializerEnum.MSGPACK and msgpack is None:
+        pytest.skip('msgpack is not installed.')
+
+    codec = ValueCodec(serializer)
+    encoded = codec.encode(VALUE)
+
+    assert encoded[0] == codec.serializer.code
+    assert codec.decode(encoded) == VALUE
+
+
+@pytest.mark.parametrize('serializer', [SerializerEnum.JSON, SerializerEnum.MSGPACK])
+def test_encode_decode_complex_values(serializer):
+    """
+    encodes and decodes complex values which are not natively
+    supported by json and msgpack serializers.
+    """
+
+    if serializer == SerializerEnum.MSGPACK and msgpack is None:
+        pytest.skip('msgpack is not installed.')
+
+    offset = timezone(timedelta(hours=3, minutes=30))
+    value = [dict(id=UUID(int=index),
+                  created_on=datetime(2021, 6, 1, 12, 30, 15, 123456),
+                  modified_on=datetime(2021, 6, 2, 8, 0, tzinfo=offset),
+                  birth_date=date(1990, 1, index + 1),
+                  start_time=time(10, 20, 30, 500),
+                  end_time=time(18, 0, tzinfo=timezone.utc),
+                  price=Decimal('12.50'),
+                  nested={'__pyrin_type__': 'normal value', 'other': 1})
+             for index in range(10)]
+
+    codec = ValueCodec(serializer)
+    result = codec.decode(codec.encode(value))
+
+    assert result == value
+    assert result[0]['modified_on'].utcoffset() == timedelta(hours=3, minutes=30)
+    assert result[0]['created_on'].tzinfo is None
+    assert isinstance(result[0]['birth_date'], date)
+    assert not isinstance(result[0]['birth_date'], datetime)
+
+
+@pytest.mark.parametrize('serializer', [SerializerEnum.JSON, SerializerEnum.MSGPACK])
+def test_encode_unsupported_value(serializer):
+    """
+    encodes a value which is not supported by json and msgpack serializers.
+    it should raise an error.
+    """
+
+    if serializer == SerializerEnum.MSGPACK and msgpack is None:
+        pytest.skip('msgpack is not installed.')
+
+    with pytest.raises(TypeError):
+        ValueCodec(serializer).encode(dict(value=object()))
+
+
+def test_encode_compressed():
+    """
+    encodes values with compression and checks that only
+    values bigger than the threshold are compressed.
+    """
+
+    codec = ValueCodec(SerializerEnum.PICKLE, CompressionEnum.ZLIB, 1024)
+    encoded = codec.encode(VALUE)
+    small_encoded = codec.encode('small')
+
+    assert encoded[0] >> ValueCodec.COMPRESSOR_SHIFT == codec.compressor.code
+    assert len(encoded) < len(ValueCodec(SerializerEnum.PICKLE).encode(VALUE))
+    assert small_encoded[0] == codec.serializer.code
+    assert codec.decode(encoded) == VALUE
+    assert codec.decode(small_encoded) == 'small'
+
+
+def test_decode_mixed_formats():
+    """
+    decodes values which are encoded with different codecs.
+    """
+
+    codec = ValueCodec(SerializerEnum.JSON)
+    pickled = ValueCodec(SerializerEnum.PICKLE, CompressionEnum.ZLIB, 0).encode(VALUE)
+
+    assert codec.decode(pickled) == VALUE
+    assert codec.decode(pickle.dumps(VALUE)) == VALUE
+
+
+def test_decode_unknown_header():
+    """
+    decodes a value with an unknown header.
+    """
+
+    codec = ValueCodec(SerializerEnum.PICKLE)
+
+    with pytest.raises(UnknownSerializedValueHeaderError):
+        codec.decode(b'\x0fvalue')
+
+
+def test_invalid_configs():
+    """
+    creates codecs with invalid configs.
+    """
+
+    with pytest.raises(InvalidSerializerError):
+        ValueCodec('missing')
+
+    with pytest.raises(InvalidCompressionError):
+        ValueCodec(SerializerEnum.PICKLE, 'missing', 10)
+
+    with pytest.raises(InvalidCompressionThresholdError):
+        ValueCodec(SerializerEnum.PICKLE, CompressionEnum.ZLIB, None)
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+caching response test_services module.
+"""
+
+import pytest
+
+import pyrin.api.router.services as router_services
+import pyrin.caching.response.services as response_cache_services
+import pyrin.security.session.services as session_services
+import tests.unit.security.session.services as test_session_services
+
+from pyrin.core.enumerations import HTTPMethodEnum
+from pyrin.processor.response.wrappers.base import CoreResponse
+from pyrin.caching.response.exceptions import InvalidResponseCacheError
+
+
+class ViewMock:
+    """
+    view mock class.
+
+    it counts the number of calls to its view function.
+    """
+
+    def __init__(self):
+        """
+        initializes an instance of ViewMock.
+        """
+
+        self.calls = 0
+
+    def view(self, id, **options):
+        """
+        a view function that returns the given id.
+
+        :param int id: id value.
+
+        :rtype: str
+        """
+
+        self.calls += 1
+        return 'result_{id}'.format(id=id)
+
+
+def create_route(url, **options):
+    """
+    creates a public route with response cache for given url.
+
+    :param str url: url of the route.
+
+    :returns: tuple[RouteBase route, ViewMock view]
+    :rtype: tuple[RouteBase, ViewMock]
+    """
+
+    view = ViewMock()
+    options.setdefault('cache_response', True)
+    route = router_services.create_route(url, methods=HTTPMethodEnum.GET,
+                                         view_function=view.view,
+                                         authenticated=False, **options)
+    return route, view
+
+
+def request(route, inputs, etag=None, status_code=200):
+    """
+    handles a new request by given route and stores its response.
+
+    :param RouteBase route: route to handle the request.
+    :param dict inputs: view function inputs.
+    :param str etag: value of `If-None-Match` header.
+    :param int status_code: status code of the response if it is not cached.
+
+    :rtype: CoreResponse
+    """
+
+    test_session_services.inject_new_request()
+    client_request = session_services.get_current_request()
+    client_request.environ['REQUEST_METHOD'] = HTTPMethodEnum.GET
+    if etag is not None:
+        client_request.environ['HTTP_IF_NONE_MATCH'] = '"{etag}"'.format(etag=etag)
+
+    result = route.handle(dict(inputs))
+    if isinstance(result, CoreResponse):
+        return result
+
+    response = CoreResponse(result[0], status=status_code)
+    response_cache_services.store(response)
+    return response
+
+
+def test_cache_response():
+    """
+    caches the response of a route and returns it without calling the view function.
+    """
+
+    route, view = create_route('/caching/response/cached')
+    first = request(route, dict(id=1))
+    second = request(route, dict(id=1))
+
+    assert view.calls == 1
+    assert first.get_data() == second.get_data() == b'result_1'
+    assert first.get_etag() == second.get_etag()
+    assert first.get_etag()[1] is False
+
+
+def test_cache_response_different_inputs():
+    """
+    caches the responses of a route with different inputs separately.
+    """
+
+    route, view = create_route('/caching/response/inputs')
+    first = request(route, dict(id=1))
+    second = request(route, dict(id=2))
+
+    assert view.calls == 2
+    assert first.get_data() == b'result_1'
+    assert second.get_data() == b'result_2'
+    assert first.get_etag() != second.get_etag()
+
+
+def test_cache_response_not_modified():
+    """
+    returns a not modified response for a request with matching etag.
+    """
+
+    route, view = create_route('/caching/response/not_modified')
+    etag, weak = request(route, dict(id=1)).get_etag()
+    response = request(route, dict(id=1), etag=etag)
+
+    assert view.calls == 1
+    assert response.status_code == 304
+
+    response = request(route, dict(id=1), etag='other')
+    assert response.status_code == 200
+    assert response.get_data() == b'result_1'
+
+
+def test_cache_response_invalidate():
+    """
+    invalidates the cached responses of a route by its tags.
+    """
+
+    route, view = create_route('/caching/response/invalidate',
+                               cache_tags=('users', 'groups'))
+    other_route, other_view = create_route('/caching/response/invalidate_other',
+                                           cache_tags='groups')
+
+    request(route, dict(id=1))
+    request(other_route, dict(id=1))
+    response_cache_services.invalidate('users')
+    request(route, dict(id=1))
+    request(other_route, dict(id=1))
+
+    assert view.calls == 2
+    assert other_view.calls == 1
+
+    response_cache_services.invalidate('groups')
+    request(route, dict(id=1))
+    request(other_route, dict(id=1))
+
+    assert view.calls == 3
+    assert other_view.calls == 2
+
+
+def test_cache_response_unsuccessful():
+    """
+    does not cache unsuccessful responses.
+    """
+
+    route, view = create_route('/caching/response/unsuccessful')
+    response = request(route, dict(id=1), status_code=202)
+    request(route, dict(id=1))
+
+    assert view.calls == 2
+    assert response.get_etag() == (None, None)
+
+
+def test_cache_response_not_cacheable_method():
+    """
+    does not cache the responses of requests which their method is not cacheable.
+    """
+
+    view = ViewMock()
+    route = router_services.create_route('/caching/response/post',
+                                         methods=HTTPMethodEnum.POST,
+                                         view_function=view.view,
+                                         authenticated=False,
+                                         cache_response=True)
+
+    for index in range(2):
+        test_session_services.inject_new_request()
+        session_services.get_current_request().method = HTTPMethodEnum.POST
+        route.handle(dict(id=1))
+
+    assert view.calls == 2
+
+
+def test_cache_response_disabled():
+    """
+    does not cache responses of a route without `cache_response`.
+    """
+
+    route, view = create_route('/caching/response/disabled', cache_response=False)
+    request(route, dict(id=1))
+    request(route, dict(id=1))
+
+    assert view.calls == 2
+
+
+def test_get_cache_name():
+    """
+    gets the cache name to be used for responses.
+    """
+
+    assert response_cache_services.get_cache_name(None) is None
+    assert response_cache_services.get_cache_name(False) is None
+    assert response_cache_services.get_cache_name(True) == 'complex'
+    assert response_cache_services.get_cache_name('redis') == 'redis'
+
+
+def test_get_cache_name_invalid():
+    """
+    gets the cache name for an invalid value. it should raise an error.
+    """
+
+    with pytest.raises(InvalidResponseCacheError):
+        response_cache_services.get_cache_name(' ')
+
+    with pytest.raises(InvalidResponseCacheError):
+        response_cache_services.get_cache_name(12)
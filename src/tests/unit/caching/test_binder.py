@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+caching test_binder module.
+"""
+
+import pytest
+
+from pyrin.caching.structs import CacheableDict
+from pyrin.caching.binder import ArgumentBinder, get_binder
+
+
+def function(a, b=2, *args, c=3, **kwargs):
+    """
+    a function to be used in tests.
+    """
+    pass
+
+
+class Service:
+    """
+    a class to be used in tests.
+    """
+
+    def method(self, x, y=None):
+        """
+        a method to be used in tests.
+        """
+        pass
+
+    @classmethod
+    def class_method(cls, x):
+        """
+        a class method to be used in tests.
+        """
+        pass
+
+
+def test_bind_positionals():
+    """
+    binds positional arguments and checks that defaults are filled.
+    """
+
+    binder = ArgumentBinder(function)
+    inputs, parent = binder.bind((1,), {})
+
+    assert inputs == (('a', 1), ('b', 2), ('c', 3))
+    assert parent is None
+
+
+def test_bind_same_call_in_different_ways():
+    """
+    binds the same call in different ways and checks that the results are equal.
+    """
+
+    binder = ArgumentBinder(function)
+    expected = (('a', 1), ('b', 2), ('c', 3))
+
+    assert binder.bind((1,), {})[0] == expected
+    assert binder.bind((1, 2), {})[0] == expected
+    assert binder.bind((), dict(a=1))[0] == expected
+    assert binder.bind((1,), dict(b=2, c=3))[0] == expected
+    assert binder.bind((), dict(c=3, b=2, a=1))[0] == expected
+
+
+def test_bind_var_arguments():
+    """
+    binds extra positional and keyword arguments.
+    """
+
+    binder = ArgumentBinder(function)
+    inputs, parent = binder.bind((1, 2, 5, 4), dict(d=6, e=[2, 1]))
+
+    assert inputs == (('a', 1), ('args', (4, 5)), ('b', 2),
+                      ('c', 3), ('d', 6), ('e', (1, 2)))
+
+
+def test_bind_unhashable_values():
+    """
+    binds unhashable values and checks that they are converted.
+    """
+
+    binder = ArgumentBinder(function)
+    inputs, parent = binder.bind(([3, 1], dict(x=[1])), {})
+
+    assert inputs[0] == ('a', (1, 3))
+    assert inputs[1] == ('b', CacheableDict(x=(1,)))
+    hash(inputs)
+
+
+def test_bind_invalid_arguments():
+    """
+    binds invalid arguments and checks that it raises an error.
+    """
+
+    binder = ArgumentBinder(Service.method)
+
+    with pytest.raises(TypeError):
+        binder.bind((Service(), 1, 2, 3), {})
+
+    with pytest.raises(TypeError):
+        binder.bind((Service(), 1), dict(x=2))
+
+    with pytest.raises(TypeError):
+        binder.bind((Service(), 1), dict(z=2))
+
+
+def test_bind_method():
+    """
+    binds a method call and checks that instance is returned as parent.
+    """
+
+    service = Service()
+    binder = ArgumentBinder(Service.method)
+    inputs, parent = binder.bind((service, 1), {})
+
+    assert inputs == (('x', 1), ('y', None))
+    assert parent is service
+
+
+def test_bind_class_method():
+    """
+    binds a class method call and checks that class is returned as parent.
+    """
+
+    binder = ArgumentBinder(Service.class_method.__func__)
+    inputs, parent = binder.bind((Service, 1), {})
+
+    assert inputs == (('x', 1),)
+    assert parent is Service
+
+
+def test_bind_bound_method():
+    """
+    binds a method call which does not include the instance.
+    """
+
+    binder = ArgumentBinder(Service.method, bound=True)
+
+    assert binder.bind((1,), {}) == ((('x', 1), ('y', None)), None)
+    assert binder.bind((2,), {}) == ((('x', 2), ('y', None)), None)
+
+
+def test_get_binder():
+    """
+    gets binder of a function multiple times and checks that it is created once.
+    """
+
+    binder = get_binder(function)
+
+    assert get_binder(function) is binder
+    assert get_binder(function, bound=True) is not binder
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+caching test_encoder module.
+"""
+
+import os
+import sys
+import subprocess
+
+from enum import Enum
+from uuid import UUID
+from decimal import Decimal
+from datetime import datetime
+
+import pytest
+
+from pyrin.caching.structs import CacheableDict
+from pyrin.caching.encoder import CacheKeyEncoder
+
+
+class ColorEnum(Enum):
+    """
+    color enum.
+    """
+
+    RED = 'red'
+    BLUE = 'blue'
+
+
+class StatefulObject:
+    """
+    stateful object class.
+
+    it provides its state to be used in cache keys.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __getstate__(self):
+        return dict(name=self.name)
+
+
+def test_encode_equal_keys():
+    """
+    encodes equal keys and checks that they have the same encoding.
+    """
+
+    encoder = CacheKeyEncoder()
+    first = (CacheKeyEncoder, 'get', CacheableDict(a=1, b=[1, 2], c={'x': 1, 'y': 2}),
+             None, None, 'UTC', 'en')
+    second = (CacheKeyEncoder, 'get', CacheableDict(c={'y': 2, 'x': 1}, b=[1, 2], a=1),
+              None, None, 'UTC', 'en')
+
+    assert encoder.encode(first) == encoder.encode(second)
+    assert encoder.get_digest(first) == encoder.get_digest(second)
+    assert encoder.get_short_digest(first) == encoder.get_short_digest(second)
+
+
+def test_encode_different_keys():
+    """
+    encodes different keys and checks that they have different encodings.
+    """
+
+    encoder = CacheKeyEncoder()
+    values = [None, True, False, 1, 1.0, Decimal('1'), '1', b'1', (1,), [1], {1},
+              ('1', '2'), ('12',), ('1', ('2',)), CacheableDict(a='1'),
+              CacheableDict(a=1), {'a': 1}, CacheKeyEncoder, test_encode_equal_keys,
+              ColorEnum.RED, ColorEnum.BLUE, 'red', datetime(2020, 1, 1),
+              UUID('12345678123456781234567812345678'), -1, 0]
+
+    encodings = set(encoder.encode(item) for item in values)
+    digests = set(encoder.get_digest(item) for item in values)
+
+    assert len(encodings) == len(values)
+    assert len(digests) == len(values)
+
+
+def test_encode_set_and_dict_are_order_independent():
+    """
+    encodes sets and dicts with different orders and checks
+    that they have the same encoding.
+    """
+
+    encoder = CacheKeyEncoder()
+
+    assert encoder.encode({'b', 'a', 'c'}) == encoder.encode({'c', 'b', 'a'})
+    assert encoder.encode({'b': 1, 'a': 2}) == encoder.encode({'a': 2, 'b': 1})
+
+
+def test_get_digest_is_stable_across_processes():
+    """
+    gets the digest of a key in different processes with different
+    hash seeds and checks that they are the same.
+    """
+
+    encoder = CacheKeyEncoder()
+    key = "(CacheKeyEncoder, 'get', CacheableDict(a=1, b=('x', 'y')), None, None, 'UTC', 'en')"
+    script = ('from pyrin.caching.encoder import CacheKeyEncoder;'
+              'from pyrin.caching.structs import CacheableDict;'
+              'print(CacheKeyEncoder().get_digest({key}))'.format(key=key))
+
+    digests = set()
+    for seed in ('1', '2'):
+        environment = dict(os.environ, PYTHONHASHSEED=seed)
+        result = subprocess.run([sys.executable, '-c', script], env=environment,
+                                stdout=subprocess.PIPE, check=True)
+        digests.add(result.stdout.decode().strip())
+
+    assert digests == {encoder.get_digest(eval(key))}
+
+
+def test_encode_object_with_state():
+    """
+    encodes objects which implement `__getstate__`.
+    objects with the same state should have the same encoding.
+    """
+
+    encoder = CacheKeyEncoder()
+
+    assert encoder.encode(StatefulObject('a')) == encoder.encode(StatefulObject('a'))
+    assert encoder.encode(StatefulObject('a')) != encoder.encode(StatefulObject('b'))
+    assert encoder.encode(StatefulObject('a')) != encoder.encode(dict(name='a'))
+
+
+def test_encode_object_without_state():
+    """
+    encodes an object which has no stable representation. it should raise an error.
+    """
+
+    encoder = CacheKeyEncoder()
+
+    with pytest.raises(TypeError):
+        encoder.encode(('key', object()))
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""
+caching test_flight module.
+"""
+
+import time
+
+from threading import Thread, Event
+
+import pytest
+
+import pyrin.caching.services as caching_services
+import pyrin.logging.services as logging_services
+
+from pyrin.caching.decorators import cached
+from pyrin.caching.flight import SingleFlight, CachedCall
+from pyrin.caching.exceptions import InvalidRefreshAheadError
+from tests.unit.caching.remote.test_base import FakeRemoteCache, create_cache
+
+
+def test_single_flight_coalesces_calls():
+    """
+    calls the same key concurrently and checks that it is computed once.
+    """
+
+    flight = SingleFlight()
+    started = Event()
+    release = Event()
+    calls = []
+    results = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return 'result'
+
+    leader = Thread(target=lambda: results.append(flight.do('key', compute)))
+    leader.start()
+    started.wait()
+    followers = [Thread(target=lambda: results.append(flight.do('key', compute)))
+                 for _ in range(3)]
+    for follower in followers:
+        follower.start()
+
+    time.sleep(0.05)
+    assert flight.is_in_flight('key') is True
+    release.set()
+    leader.join()
+    for follower in followers:
+        follower.join()
+
+    assert len(calls) == 1
+    assert results == ['result'] * 4
+    assert flight.is_in_flight('key') is False
+
+
+def test_single_flight_raises_error():
+    """
+    computes a key which fails and checks that the error is raised.
+    """
+
+    flight = SingleFlight()
+
+    def compute():
+        raise ValueError('failed')
+
+    with pytest.raises(ValueError):
+        flight.do('key', compute)
+
+    assert flight.is_in_flight('key') is False
+
+
+def test_cached_call_invalid_refresh_ahead():
+    """
+    creates a cached call with invalid refresh ahead fraction.
+    it should raise an error.
+    """
+
+    with pytest.raises(InvalidRefreshAheadError):
+        CachedCall('complex', lambda: None, refresh_ahead=1)
+
+    with pytest.raises(InvalidRefreshAheadError):
+        @cached(refresh_ahead=0)
+        def function():
+            pass
+
+
+def test_cached_single_flight():
+    """
+    calls a single-flight cached function concurrently
+    and checks that it is computed once.
+    """
+
+    release = Event()
+    calls = []
+
+    @cached(single_flight=True, consider_user=False, expire=5000)
+    def function(value):
+        calls.append(value)
+        release.wait()
+        return value * 2
+
+    results = []
+    threads = [Thread(target=lambda: results.append(function(10))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [10]
+    assert results == [20] * 4
+    assert function(10) == 20
+    assert calls == [10]
+
+
+def test_cached_refresh_ahead():
+    """
+    hits a refresh-ahead cached function after the refresh fraction
+    and checks that it is recomputed in background.
+    """
+
+    calls = []
+
+    @cached(refresh_ahead=0.5, consider_user=False, expire=400)
+    def function():
+        calls.append(1)
+        return len(calls)
+
+    assert function() == 1
+    assert function() == 1
+    assert len(calls) == 1
+
+    time.sleep(0.25)
+    assert function() == 1
+    caching_services.shutdown_refresh_workers()
+    assert len(calls) == 2
+    assert function() == 2
+
+
+def test_cached_call_invalid_key(monkeypatch):
+    """
+    calls a cached call which its key could not be generated.
+    it should log the error and call the function directly.
+    """
+
+    def generate_key(*args, **options):
+        raise TypeError('unhashable')
+
+    errors = []
+    calls = []
+    call = CachedCall('complex', lambda value: calls.append(value) or value * 2)
+    monkeypatch.setattr(logging_services, 'exception', errors.append)
+    monkeypatch.setattr(caching_services, 'generate_key', generate_key)
+
+    assert call(3) == 6
+    assert call(3) == 6
+    assert calls == [3, 3]
+    assert errors == ['unhashable'] * 2
+
+
+def test_cached_call_refresh_error(monkeypatch):
+    """
+    refreshes a key of a cached call which its function fails.
+    it should log the error and must not raise it.
+    """
+
+    def function():
+        raise ValueError('failed')
+
+    errors = []
+    call = CachedCall('complex', function, refresh_ahead=0.5)
+    monkeypatch.setattr(logging_services, 'exception', errors.append)
+
+    call._refresh('key', (), {})
+    assert errors == ['failed']
+
+
+def test_cached_call_remote_expire_unit(monkeypatch):
+    """
+    adds the deadline of a key on a cache which keeps
+    the expire time in seconds and checks that it is
+    converted to milliseconds.
+    """
+
+    cache = type('FakeMemcached', (FakeRemoteCache,), dict(EXPIRE_UNIT=1000))(expire=4)
+    monkeypatch.setattr(caching_services, 'get_cache', lambda name: cache)
+
+    call = CachedCall('memcached', lambda: None, refresh_ahead=0.5)
+    assert call._get_expire() == 4000
+
+    now = time.time() * 1000
+    call._add_deadline('key')
+    refresh_at, expire_at = call._deadlines['key']
+    assert 1900 < refresh_at - now < 2100
+    assert 3900 < expire_at - now < 4100
+
+
+def test_cached_call_no_expire(monkeypatch):
+    """
+    adds the deadline of a key on a cache which has no expire time.
+    it should not be refreshed ahead.
+    """
+
+    cache = create_cache(expire=0)
+    monkeypatch.setattr(caching_services, 'get_cache', lambda name: cache)
+
+    call = CachedCall('redis', lambda: None, refresh_ahead=0.5)
+    call._add_deadline('key')
+    assert 'key' not in call._deadlines
+
+
+def test_shutdown_refresh_workers_cancels_pending():
+    """
+    submits more refreshes than available workers and shuts down the
+    workers. the running ones should be finished and the pending ones
+    should be cancelled.
+    """
+
+    caching_services.shutdown_refresh_workers()
+    release = Event()
+    started = Event()
+    calls = []
+
+    def refresh(value):
+        started.set()
+        release.wait()
+        calls.append(value)
+
+    for value in range(50):
+        caching_services.submit_refresh(refresh, value)
+
+    started.wait()
+    Thread(target=lambda: (time.sleep(0.05), release.set())).start()
+    caching_services.shutdown_refresh_workers()
+
+    assert 0 < len(calls) < 50
+
+
+def test_submit_refresh_during_shutdown():
+    """
+    submits refreshes while workers are being shut down concurrently.
+    submitting should never fail.
+    """
+
+    errors = []
+    calls = []
+    stop = Event()
+
+    def submit():
+        while not stop.is_set():
+            try:
+                caching_services.submit_refresh(calls.append, 1)
+            except Exception as error:
+                errors.append(error)
+
+    threads = [Thread(target=submit) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    for _ in range(20):
+        caching_services.shutdown_refresh_workers()
+        time.sleep(0.001)
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    caching_services.shutdown_refresh_workers()
+    assert errors == []
@@ -109,3 +109,15 @@ def test_cacheable_dict_not_equal():
 
     data13 = CacheableDict(z=90, u=value1)
     data13[data_equal1] = data_equal1
+
+
+def test_cacheable_dict_not_equal_with_same_hash():
+    """
+    compares different cacheable dict objects which have the same hash.
+    """
+
+    data1 = CacheableDict(a=-1)
+    data2 = CacheableDict(a=-2)
+
+    assert hash(data1) == hash(data2)
+    assert data1 != data2
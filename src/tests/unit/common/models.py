@@ -37,6 +37,19 @@ class BoundedLocalEntity(CoreEntity):
     age = CoreColumn(name='age', type_=Integer)
 
 
+@bind('local')
+class DefaultedLocalEntity(CoreEntity):
+    """
+    defaulted local entity class.
+    """
+
+    _table = 'defaulted_local_table'
+
+    id = CoreColumn(name='id', type_=Integer, primary_key=True, autoincrement=True)
+    name = CoreColumn(name='name', type_=Unicode)
+    status = CoreColumn(name='status', type_=Integer, nullable=False, default=1)
+
+
 @bind('test')
 class BoundedTestEntity(CoreEntity):
     """
@@ -702,6 +702,79 @@ def test_get_section_uppercase_key():
     assert all(name.isupper() for name in section.keys())
 
 
+def test_get_section_is_copy():
+    """
+    gets all key/values stored in given section of specified config store
+    and modifies the result. it should not affect the config store.
+    """
+
+    section = config_services.get_section('database', 'test')
+    section['bind_names'].append('fake_bind')
+    section['sqlalchemy_echo'] = True
+
+    assert 'fake_bind' not in config_services.get('database', 'test', 'bind_names')
+    assert config_services.get('database', 'test', 'sqlalchemy_echo') is False
+
+
+def test_get_section_view():
+    """
+    gets a read-only view of given section of specified config store.
+    it should not be possible to modify it.
+    """
+
+    section = config_services.get_section_view('security', 'token')
+    assert section is not None
+    assert section is config_services.get_section_view('security', 'token')
+    assert section.get('default_token_handler') == \
+        config_services.get('security', 'token', 'default_token_handler')
+
+    with pytest.raises(TypeError):
+        section['default_token_handler'] = 'fake'
+
+
+def test_get_section_view_nested_values():
+    """
+    gets a read-only view of given section of specified config store
+    and modifies its nested values. it should not be possible to modify
+    them and the config store should not be affected.
+    """
+
+    section = config_services.get_section_view('database', 'test')
+    bind_names = config_services.get('database', 'test', 'bind_names')
+
+    with pytest.raises(TypeError):
+        section['bind_names'].append('fake_bind')
+
+    assert config_services.get('database', 'test', 'bind_names') == bind_names
+    assert 'fake_bind' not in config_services.get_section('database', 'test')['bind_names']
+
+    value = config_services.get('database', 'test', 'bind_names')
+    value.append('fake_bind')
+    assert 'fake_bind' not in section['bind_names']
+
+
+def test_get_section_view_invalid_section():
+    """
+    gets a read-only view of given section which is unavailable
+    of specified config store. it should raise an error.
+    """
+
+    with pytest.raises(ConfigurationStoreSectionNotFoundError):
+        config_services.get_section_view('application', 'missing_section')
+
+
+def test_get_mutable_value_is_copy():
+    """
+    gets a mutable value of specified key from provided section of given
+    config store and modifies it. it should not affect the config store.
+    """
+
+    value = config_services.get('database', 'test', 'bind_names')
+    value.append('fake_bind')
+
+    assert 'fake_bind' not in config_services.get('database', 'test', 'bind_names')
+
+
 def test_get_section_keys():
     """
     gets all available keys in given section of specified config store.
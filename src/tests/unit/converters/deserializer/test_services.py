@@ -3,6 +3,8 @@
 deserializer test_services module.
 """
 
+import re
+
 import pytest
 
 from sqlalchemy.pool import QueuePool, AssertionPool
@@ -11,9 +13,13 @@ import pyrin.converters.deserializer.services as deserializer_services
 
 from pyrin.converters.deserializer.handlers.base import DeserializerBase
 from pyrin.core.structs import DTO
+from pyrin.core.globals import NULL
+from pyrin.converters.deserializer.structs import StringDispatcher
 from pyrin.converters.deserializer.handlers.boolean import BooleanDeserializer
 from pyrin.converters.deserializer.handlers.dictionary import DictionaryDeserializer
 from pyrin.converters.deserializer.handlers.list import StringListDeserializer
+from pyrin.converters.deserializer.handlers.none import NoneDeserializer
+from pyrin.converters.deserializer.handlers.number import IntegerDeserializer
 from pyrin.converters.deserializer.exceptions import InvalidDeserializerTypeError, \
     DuplicatedDeserializerError
 
@@ -443,3 +449,45 @@ def test_deserializer_is_singleton():
     deserializer4 = StringListDeserializer()
 
     assert deserializer3 == deserializer4
+
+
+def test_string_dispatcher_skips_not_matching_first_character():
+    """
+    deserializes string values using a string dispatcher.
+    deserializers which do not accept the first character
+    of the value should not be called.
+    """
+
+    class CountingIntegerDeserializer(IntegerDeserializer):
+
+        calls = 0
+
+        def get_matching_pattern(self, value):
+            CountingIntegerDeserializer.calls += 1
+            return super().get_matching_pattern(value)
+
+    dispatcher = StringDispatcher([BooleanDeserializer(), CountingIntegerDeserializer()])
+
+    assert dispatcher('alpha') is NULL
+    assert dispatcher(' true ') is True
+    assert CountingIntegerDeserializer.calls == 0
+    assert dispatcher(' -12 ') == -12
+    assert CountingIntegerDeserializer.calls == 1
+
+
+def test_string_dispatcher_with_custom_formats():
+    """
+    deserializes string values using a deserializer with custom formats.
+    it should not filter values based on the first character.
+    """
+
+    class CustomNoneDeserializer(NoneDeserializer):
+        pass
+
+    deserializer = CustomNoneDeserializer(accepted_formats=[(re.compile(r'^nil$'), 3, 3)])
+    dispatcher = StringDispatcher([deserializer])
+
+    assert deserializer.first_characters is None
+    assert NoneDeserializer().first_characters == frozenset('nN')
+    assert dispatcher('nil') is None
+    assert dispatcher('true') is NULL
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+json test_decoder module.
+"""
+
+import json
+
+from uuid import UUID
+from datetime import datetime, date, time
+
+import pyrin.globalization.datetime.services as datetime_services
+
+from pyrin.converters.json.decoder import CoreJSONDecoder, coerce_string, coerce_values
+from pyrin.validator.handlers.uuid import UUIDValidator
+from pyrin.validator.handlers.datetime import DateTimeValidator, DateValidator, \
+    TimeValidator, FromDateTimeValidator, ToDateTimeValidator
+
+
+def test_decode_complex_values():
+    """
+    decodes complex string values of nested dicts and lists.
+    """
+
+    value = '{"id": "00000000-0000-0000-0000-000000000001", ' \
+            '"items": [{"date": "2021-06-01", "time": "10:20:30"}], ' \
+            '"created": "2021-06-01T12:30:15"}'
+
+    result = json.loads(value, cls=CoreJSONDecoder)
+    assert result['id'] == UUID(int=1)
+    assert result['items'] == [dict(date=date(2021, 6, 1), time=time(10, 20, 30))]
+    assert result['created'] == datetime_services.to_datetime('2021-06-01T12:30:15',
+                                                              to_server=False,
+                                                              from_server=False)
+
+
+def test_decode_keys_are_not_coerced():
+    """
+    decodes a json whose keys are complex strings. keys must not be coerced.
+    """
+
+    value = '{"2021-06-01": 1, "00000000-0000-0000-0000-000000000001": ["10:20:30"]}'
+    result = json.loads(value, cls=CoreJSONDecoder)
+    assert result == {'2021-06-01': 1, '00000000-0000-0000-0000-000000000001': [time(10, 20, 30)]}
+
+
+def test_decode_normal_values():
+    """
+    decodes normal values. they must not be changed.
+    """
+
+    value = '["pyrin", "", "2021-06-01 12:30:15", "20210601", 12, 1.5, true, null, ' \
+            '"a0000000-0000-0000-0000-00000000000z", "1-2-3-4-5-6-7-8-9", "12345678"]'
+
+    result = json.loads(value, cls=CoreJSONDecoder)
+    assert result == json.loads(value)
+
+
+def test_coerce_values_single_string():
+    """
+    coerces a single complex string.
+    """
+
+    assert coerce_values('2021-06-01') == date(2021, 6, 1)
+    assert coerce_values(12) == 12
+
+
+def test_coerce_string():
+    """
+    coerces different complex strings.
+    """
+
+    assert coerce_string('10:20:30.5') == time(10, 20, 30, 500000)
+    assert isinstance(coerce_string('10:20:30+03:30'), time)
+    assert isinstance(coerce_string('10:20:30Z'), time)
+    assert isinstance(coerce_string('2021-06-01T12:30:15.123456+03:30'), datetime)
+    assert isinstance(coerce_string('2021-06-01T12:30:15Z'), datetime)
+    assert coerce_string('0B7B5C5E-3E62-4F0E-8A47-3E4A2C7D1F90') == \
+        UUID('0b7b5c5e-3e62-4f0e-8a47-3e4a2c7d1f90')
+
+
+def test_coerce_string_not_complex():
+    """
+    coerces strings which look like complex strings but they are not.
+    """
+
+    for value in ('10:20:3', '2021-06-1', '2021-06-01X12:30:15', 'a1:20:30',
+                  '99:99:99', '2021/06/01', '2021-06-01T12:30:15+03:30:00:00:00:00'):
+        assert coerce_string(value) == value
+
+
+def test_validators_fix_complex_strings():
+    """
+    fixes complex strings using default fixer of datetime and uuid validators.
+    """
+
+    assert DateValidator._fix_value('2021-06-01') == date(2021, 6, 1)
+    assert TimeValidator._fix_value('10:20:30') == time(10, 20, 30)
+    assert isinstance(DateTimeValidator._fix_value('2021-06-01T12:30:15'), datetime)
+    assert UUIDValidator._fix_value('00000000-0000-0000-0000-000000000001') == UUID(int=1)
+    assert DateValidator._fix_value('pyrin') == 'pyrin'
+
+
+def test_from_and_to_datetime_validators_fix_date_strings():
+    """
+    fixes date strings to begin and end of day datetime.
+    """
+
+    begin = FromDateTimeValidator._fix_value('2021-06-01')
+    end = ToDateTimeValidator._fix_value('2021-06-01')
+    assert isinstance(begin, datetime)
+    assert isinstance(end, datetime)
+    assert begin < end
+    assert begin.date() == date(2021, 6, 1)
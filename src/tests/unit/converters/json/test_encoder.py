@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+json test_encoder module.
+"""
+
+import json
+
+from uuid import UUID
+from datetime import datetime, date, time
+
+import pytest
+
+import pyrin.globalization.datetime.services as datetime_services
+
+from pyrin.converters.json.encoder import CoreJSONEncoder
+from pyrin.converters.json.exceptions import InvalidJSONBackendError
+from pyrin.converters.json.backends import StandardJSONBackend, ORJSONBackend, get_backend
+
+
+def test_encode_datetime():
+    """
+    encodes datetime values into client timezone.
+    """
+
+    value = datetime(2021, 6, 1, 12, 30, 15)
+    result = json.loads(json.dumps(dict(value=value), cls=CoreJSONEncoder))
+    expected = datetime_services.to_datetime_string(value, to_server=False, from_server=True)
+    assert result['value'] == expected
+
+
+def test_encode_date_and_time():
+    """
+    encodes date and time values.
+    """
+
+    result = json.loads(json.dumps([date(2021, 6, 1), time(10, 20, 30)],
+                                   cls=CoreJSONEncoder))
+    assert result == ['2021-06-01', '10:20:30']
+
+
+def test_encode_uuid_and_bytes():
+    """
+    encodes uuid and bytes values.
+    """
+
+    result = json.loads(json.dumps([UUID(int=1), b'pyrin'], cls=CoreJSONEncoder))
+    assert result == ['00000000-0000-0000-0000-000000000001', 'cHlyaW4=']
+
+
+def test_encode_invalid_type():
+    """
+    encodes a value which has no converter. it should raise an error.
+    """
+
+    with pytest.raises(TypeError):
+        json.dumps(object(), cls=CoreJSONEncoder)
+
+
+def test_get_backend():
+    """
+    gets the standard json backend.
+    """
+
+    backend = get_backend(StandardJSONBackend.name)
+    assert isinstance(backend, StandardJSONBackend)
+    assert backend.is_available is True
+    assert backend.dumps(dict(value=UUID(int=1)), CoreJSONEncoder) == \
+        '{"value": "00000000-0000-0000-0000-000000000001"}'
+
+
+def test_get_backend_invalid():
+    """
+    gets a json backend which does not exist. it should raise an error.
+    """
+
+    with pytest.raises(InvalidJSONBackendError):
+        get_backend('missing_backend')
+
+
+def test_orjson_backend():
+    """
+    serializes complex values with orjson backend.
+    the result should be the same as the standard backend.
+    """
+
+    backend = get_backend(ORJSONBackend.name)
+    if backend.is_available is not True:
+        pytest.skip('orjson is not installed.')
+
+    value = dict(created=datetime(2021, 6, 1, 12, 30, 15), day=date(2021, 6, 1),
+                 id=UUID(int=1), data=b'pyrin', items=[1, 2.5, None, True])
+    result = backend.dumps(value, CoreJSONEncoder, sort_keys=True)
+    expected = StandardJSONBackend().dumps(value, CoreJSONEncoder, sort_keys=True)
+    assert json.loads(result) == json.loads(expected)
+    assert json.loads(result)['data'] == 'cHlyaW4='
+    assert json.loads(result)['id'] == '00000000-0000-0000-0000-000000000001'
+
+
+def test_orjson_backend_ensure_ascii():
+    """
+    serializes non-ascii values with orjson backend.
+    they should be escaped the same as the standard backend if required.
+    """
+
+    backend = get_backend(ORJSONBackend.name)
+    if backend.is_available is not True:
+        pytest.skip('orjson is not installed.')
+
+    value = dict(name='café \U0001f600', data=b'\xff')
+    expected = StandardJSONBackend().dumps(value, CoreJSONEncoder, ensure_ascii=True,
+                                           separators=(',', ':'))
+
+    assert backend.dumps(value, CoreJSONEncoder, ensure_ascii=True) == expected
+    assert json.loads(backend.dumps(value, CoreJSONEncoder)) == json.loads(expected)
+    assert backend.dumps(value, CoreJSONEncoder).isascii() is False
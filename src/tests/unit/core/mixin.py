@@ -4,6 +4,7 @@ core structs module.
 """
 
 from pyrin.core.mixin import HookMixin
+from pyrin.core.structs import Hook
 
 
 class HookEnabledMock(HookMixin):
@@ -11,3 +12,57 @@ class HookEnabledMock(HookMixin):
     hook enabled mock class.
     """
     pass
+
+
+class HookBaseMock(Hook):
+    """
+    hook base mock class.
+    """
+
+    def first(self):
+        """
+        first hook method.
+        """
+        pass
+
+    def second(self):
+        """
+        second hook method.
+        """
+        pass
+
+
+class FirstHookMock(HookBaseMock):
+    """
+    first hook mock class.
+
+    it only overrides the `first` method.
+    """
+
+    def first(self):
+        """
+        first hook method.
+        """
+        pass
+
+
+class BothHookMock(FirstHookMock):
+    """
+    both hook mock class.
+
+    it overrides the `second` method and inherits the `first` method.
+    """
+
+    def second(self):
+        """
+        second hook method.
+        """
+        pass
+
+
+class TypedHookEnabledMock(HookMixin):
+    """
+    typed hook enabled mock class.
+    """
+
+    hook_type = HookBaseMock
@@ -8,7 +8,8 @@ import pytest
 from pyrin.core.structs import Hook
 from pyrin.core.exceptions import InvalidHookTypeError
 
-from tests.unit.core.mixin import HookEnabledMock
+from tests.unit.core.mixin import HookEnabledMock, TypedHookEnabledMock, \
+    HookBaseMock, FirstHookMock, BothHookMock
 
 
 def test_get_hooks_attribute():
@@ -50,3 +51,39 @@ def test_register_hook_invalid_type():
     hooks = hook_holder._get_hooks()
     assert isinstance(hooks, list)
     assert len(hooks) == 0
+
+
+def test_get_hooks_of_method():
+    """
+    gets the hooks which override each hook method.
+    """
+
+    hook_holder = TypedHookEnabledMock()
+    base_hook = HookBaseMock()
+    first_hook = FirstHookMock()
+    hook_holder.register_hook(base_hook)
+    hook_holder.register_hook(first_hook)
+
+    assert hook_holder._get_hooks('first') == (first_hook,)
+    assert hook_holder._get_hooks('second') == ()
+
+    both_hook = BothHookMock()
+    hook_holder.register_hook(both_hook)
+
+    assert hook_holder._get_hooks('first') == (first_hook, both_hook)
+    assert hook_holder._get_hooks('second') == (both_hook,)
+    assert hook_holder._get_hooks('unknown') == [base_hook, first_hook, both_hook]
+    assert hook_holder._get_hooks() == [base_hook, first_hook, both_hook]
+
+
+def test_get_active_hooks():
+    """
+    gets the active hooks of each hook method.
+    """
+
+    hook_holder = TypedHookEnabledMock()
+    assert hook_holder.get_active_hooks() == dict(first=[], second=[])
+
+    hook_holder.register_hook(FirstHookMock())
+    assert hook_holder.get_active_hooks() == \
+        dict(first=['tests.unit.core.mixin.FirstHookMock'], second=[])
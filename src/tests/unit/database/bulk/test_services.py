@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+database bulk test_services module.
+"""
+
+import pytest
+
+import pyrin.database.bulk.services as bulk_services
+
+from pyrin.core.globals import SECURE_TRUE
+from pyrin.database.services import get_current_store
+from pyrin.database.bulk.exceptions import BulkEntityTypeIsRequiredError
+
+from tests.unit.common.models import BoundedLocalEntity, DefaultedLocalEntity
+
+
+def generate_entities(start, count):
+    """
+    generates the given number of entities.
+
+    :param int start: start id of entities.
+    :param int count: number of entities.
+
+    :rtype: iterator[BoundedLocalEntity]
+    """
+
+    for index in range(start, start + count):
+        yield BoundedLocalEntity(id=index, name='name_{index}'.format(index=index),
+                                 age=index, populate_all=SECURE_TRUE)
+
+
+def cleanup():
+    """
+    deletes all bounded local entities.
+    """
+
+    store = get_current_store()
+    store.query(BoundedLocalEntity).delete()
+    store.commit()
+
+
+def test_stream_insert():
+    """
+    inserts entities from a generator in chunks.
+    """
+
+    try:
+        count = bulk_services.stream_insert(generate_entities(101, 25), chunk_size=10)
+        assert count == 25
+
+        store = get_current_store()
+        assert store.query(BoundedLocalEntity).count() == 25
+        entity = store.query(BoundedLocalEntity).get(125)
+        assert entity.name == 'name_125'
+        assert entity.age == 125
+    finally:
+        cleanup()
+
+
+def test_stream_insert_multi_values_with_mappings():
+    """
+    inserts mappings using multiple values statement.
+    """
+
+    try:
+        values = (dict(id=index, name='item', age=index) for index in range(1, 8))
+        count = bulk_services.stream_insert(values, entity=BoundedLocalEntity,
+                                            chunk_size=3, multi_values=True)
+        assert count == 7
+
+        store = get_current_store()
+        assert store.query(BoundedLocalEntity).count() == 7
+    finally:
+        cleanup()
+
+
+def test_stream_insert_with_primary_keys():
+    """
+    inserts entities and gets their primary keys.
+    """
+
+    try:
+        result = bulk_services.stream_insert(generate_entities(11, 5), chunk_size=2,
+                                             return_primary_keys=True)
+        assert result == [(11,), (12,), (13,), (14,), (15,)]
+    finally:
+        cleanup()
+
+
+def test_stream_insert_mappings_without_entity():
+    """
+    inserts mappings without providing the entity class. it should raise an error.
+    """
+
+    with pytest.raises(BulkEntityTypeIsRequiredError):
+        bulk_services.stream_insert([dict(id=1, name='item', age=1)])
+
+
+def test_stream_insert_empty():
+    """
+    inserts an empty generator.
+    """
+
+    assert bulk_services.stream_insert(iter([])) == 0
+
+
+def test_stream_update():
+    """
+    updates mappings from a generator in chunks.
+    """
+
+    try:
+        bulk_services.stream_insert(generate_entities(1, 12), chunk_size=5)
+        values = (dict(id=index, age=index * 10) for index in range(1, 13))
+        count = bulk_services.stream_update(values, entity=BoundedLocalEntity, chunk_size=5)
+        assert count == 12
+
+        store = get_current_store()
+        store.expire_all()
+        entity = store.query(BoundedLocalEntity).get(12)
+        assert entity.age == 120
+        assert entity.name == 'name_12'
+    finally:
+        cleanup()
+
+
+def cleanup_defaulted():
+    """
+    deletes all defaulted local entities.
+    """
+
+    store = get_current_store()
+    store.query(DefaultedLocalEntity).delete()
+    store.commit()
+
+
+def test_stream_insert_with_defaults():
+    """
+    inserts transient entities without primary keys and defaulted values.
+    the database and column defaults should generate the missing values.
+    """
+
+    try:
+        values = [DefaultedLocalEntity(name='first'),
+                  DefaultedLocalEntity(name='second', status=5),
+                  DefaultedLocalEntity(name='third')]
+        count = bulk_services.stream_insert(values, chunk_size=10)
+        assert count == 3
+
+        store = get_current_store()
+        result = store.query(DefaultedLocalEntity.name, DefaultedLocalEntity.status)\
+            .order_by(DefaultedLocalEntity.id).all()
+        assert [tuple(item) for item in result] == [('first', 1), ('second', 5), ('third', 1)]
+    finally:
+        cleanup_defaulted()
+
+
+def test_stream_insert_mappings_with_defaults():
+    """
+    inserts mappings which have None values for the primary key and defaulted
+    columns or do not have them at all. the database and column defaults
+    should generate the missing values.
+    """
+
+    try:
+        values = [dict(id=None, name='first', status=None),
+                  dict(name='second'),
+                  dict(id=None, name='third', status=7),
+                  dict(id=None, name='fourth', status=None)]
+        count = bulk_services.stream_insert(values, entity=DefaultedLocalEntity,
+                                            chunk_size=10)
+        assert count == 4
+
+        store = get_current_store()
+        result = store.query(DefaultedLocalEntity.name, DefaultedLocalEntity.status)\
+            .order_by(DefaultedLocalEntity.id).all()
+        assert [tuple(item) for item in result] == \
+            [('first', 1), ('second', 1), ('third', 7), ('fourth', 1)]
+    finally:
+        cleanup_defaulted()
+
+
+def test_stream_insert_with_defaults_multi_values():
+    """
+    inserts transient entities without primary keys and defaulted
+    values using multiple values statement.
+    """
+
+    try:
+        values = (DefaultedLocalEntity(name='item_{index}'.format(index=index))
+                  for index in range(5))
+        count = bulk_services.stream_insert(values, chunk_size=2, multi_values=True)
+        assert count == 5
+
+        store = get_current_store()
+        assert store.query(DefaultedLocalEntity)\
+            .filter(DefaultedLocalEntity.status == 1).count() == 5
+    finally:
+        cleanup_defaulted()
+
+
+def test_stream_insert_with_defaults_primary_keys():
+    """
+    inserts transient entities without primary keys and gets
+    the primary keys which are generated by the database.
+    """
+
+    try:
+        values = [DefaultedLocalEntity(name='item_{index}'.format(index=index))
+                  for index in range(4)]
+        result = bulk_services.stream_insert(values, chunk_size=3, return_primary_keys=True)
+        assert len(result) == 4
+        assert all(item[0] is not None for item in result)
+
+        store = get_current_store()
+        names = [store.query(DefaultedLocalEntity).get(item).name for item in result]
+        assert names == ['item_0', 'item_1', 'item_2', 'item_3']
+    finally:
+        cleanup_defaulted()
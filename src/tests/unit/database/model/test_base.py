@@ -10,11 +10,13 @@ from sqlalchemy import Integer, Unicode
 from pyrin.core.globals import SECURE_TRUE, SECURE_FALSE
 from pyrin.core.structs import DTO
 from pyrin.database.model.declarative import CoreEntity
-from pyrin.database.model.exceptions import ColumnNotExistedError
+from pyrin.database.model.conversion import ConversionPlanner
+from pyrin.database.model.exceptions import ColumnNotExistedError, InvalidDepthProvidedError
 from pyrin.database.orm.sql.schema.base import CoreColumn
 
 from tests.unit.common.models import SampleEntity, SampleWithHiddenFieldEntity, \
-    RightChildEntity, LeftChildEntity, BaseEntity, SubBaseEntity, SampleTestEntity
+    RightChildEntity, LeftChildEntity, BaseEntity, SubBaseEntity, SampleTestEntity, \
+    ParentEntity, ChildEntity
 
 
 def test_init():
@@ -163,6 +165,78 @@ def test_to_dict_with_hidden_column():
     assert 'hidden_field' not in result
 
 
+def test_to_dict_with_conditions():
+    """
+    converts the entity into a dict using columns, rename and exclude.
+    """
+
+    entity = SampleEntity(id=1000, name='no name', age=32, populate_all=SECURE_TRUE)
+
+    result = entity.to_dict(columns=['id', 'age', 'not_existed'], rename=dict(age='new_age'))
+    assert result == dict(id=1000, new_age=32)
+
+    result = entity.to_dict(exclude=dict(SampleEntity=['age']))
+    assert result == dict(id=1000, name='no name')
+
+
+def test_to_dict_with_depth():
+    """
+    converts the entity and its relationships into a dict.
+    """
+
+    parent = ParentEntity(id=1, name='parent', populate_all=SECURE_TRUE)
+    parent.children = [ChildEntity(id=2, name='child', populate_all=SECURE_TRUE)]
+
+    result = parent.to_dict(depth=0)
+    assert result == dict(id=1, name='parent')
+
+    result = parent.to_dict(depth=2, exclude=dict(ChildEntity=['parent_id']))
+    assert result == dict(id=1, name='parent',
+                          children=[dict(id=2, name='child', parent=dict(id=1, name='parent'))])
+
+
+def test_to_dict_with_planner():
+    """
+    converts many entities using a single planner.
+    """
+
+    columns = ['id', 'name']
+    planner = ConversionPlanner(columns=columns, depth=0)
+    entities = [SampleEntity(id=index, name=str(index), age=index,
+                             populate_all=SECURE_TRUE) for index in range(3)]
+
+    results = [entity.to_dict(planner=planner, columns=columns, depth=0)
+               for entity in entities]
+
+    assert results == [dict(id=index, name=str(index)) for index in range(3)]
+    assert planner.get_plan(SampleEntity) is ConversionPlanner(
+        columns=['id', 'name'], depth=0).get_plan(SampleEntity)
+
+
+def test_to_dict_with_not_matched_planner():
+    """
+    converts an entity with a planner which does not match the given conditions.
+    the planner should not be used.
+    """
+
+    planner = ConversionPlanner(columns=['id'], depth=0)
+    entity = SampleEntity(id=1000, name='no name', age=32, populate_all=SECURE_TRUE)
+
+    assert planner.matches(columns=['id'], depth=0) is False
+    assert entity.to_dict(planner=planner, columns=['age']) == dict(age=32)
+
+
+def test_to_dict_with_invalid_depth():
+    """
+    converts the entity with a depth higher than max depth.
+    it should raise an error.
+    """
+
+    parent = ParentEntity(id=1, name='parent', populate_all=SECURE_TRUE)
+    with pytest.raises(InvalidDepthProvidedError):
+        parent.to_dict(depth=ParentEntity.MAX_DEPTH + 1)
+
+
 def test_from_dict():
     """
     updates the column values of the entity from those
@@ -410,3 +484,19 @@ def test_entity_without_schema_table_fullname():
 
     assert entity.table_fullname == entity.table_name
     assert entity.table_schema is None
+
+
+def test_extract_conditions():
+    """
+    extracts conditions of an entity instance and its class.
+    both should give the same result for the entity.
+    """
+
+    options = dict(columns=dict(SampleEntity=['id', 'name', 'age']),
+                   rename=dict(SampleEntity=dict(name='new_name')),
+                   exclude=dict(SampleEntity=['age']))
+
+    entity = SampleEntity()
+    result = entity._extract_conditions(**options)
+    assert result == ({'id', 'name'}, dict(name='new_name'), {'age'})
+    assert SampleEntity._extract_entity_conditions(**options) == result
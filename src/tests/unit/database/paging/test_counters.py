@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+paging test_counters module.
+"""
+
+from sqlalchemy import text
+
+import pyrin.application.services as application_services
+import pyrin.database.paging.services as paging_services
+import pyrin.security.session.services as session_services
+import tests.unit.security.session.services as test_session_services
+
+from pyrin.core.globals import SECURE_TRUE
+from pyrin.database.services import get_current_store
+from pyrin.database.paging.paginator import SimplePaginator
+from pyrin.database.paging.enumerations import CountModeEnum
+from pyrin.security.session.enumerations import RequestContextEnum
+
+from tests.unit.common.models import BoundedLocalEntity
+
+
+def insert_entities(count):
+    """
+    inserts the given number of bounded local entities.
+
+    :param int count: number of entities.
+    """
+
+    store = get_current_store()
+    for index in range(1, count + 1):
+        store.add(BoundedLocalEntity(id=index, name='name_{index}'.format(index=index),
+                                     age=index, populate_all=SECURE_TRUE))
+    store.commit()
+
+
+def execute(sql, **params):
+    """
+    executes the given sql on the database of bounded local entity.
+
+    :param str sql: sql to be executed.
+    """
+
+    get_current_store().execute(text(sql), params,
+                                bind_arguments=dict(mapper=BoundedLocalEntity))
+
+
+def cleanup():
+    """
+    deletes all bounded local entities and the statistics of sqlite.
+    """
+
+    store = get_current_store()
+    store.query(BoundedLocalEntity).delete()
+    execute('DROP TABLE IF EXISTS sqlite_stat1')
+    store.commit()
+
+
+def set_estimate(value):
+    """
+    sets the row estimate of bounded local table in sqlite statistics.
+
+    :param int value: row estimate.
+    """
+
+    execute('ANALYZE')
+    execute('UPDATE sqlite_stat1 SET stat = :stat WHERE tbl = :name',
+            stat=str(value), name=BoundedLocalEntity.table_name)
+    get_current_store().commit()
+
+
+def test_count_cached():
+    """
+    counts a query in cached mode twice.
+    the second count should be get from cache even if rows have been changed.
+    """
+
+    try:
+        insert_entities(5)
+        store = get_current_store()
+        query = store.query(BoundedLocalEntity).filter(BoundedLocalEntity.age > 1)
+        assert paging_services.count(query, mode=CountModeEnum.CACHED) == \
+            (4, CountModeEnum.EXACT)
+
+        store.query(BoundedLocalEntity).filter(BoundedLocalEntity.id == 5).delete()
+        store.commit()
+        assert paging_services.count(query, mode=CountModeEnum.CACHED) == \
+            (4, CountModeEnum.CACHED)
+
+        query = store.query(BoundedLocalEntity).filter(BoundedLocalEntity.age > 2)
+        assert paging_services.count(query, mode=CountModeEnum.CACHED) == \
+            (2, CountModeEnum.EXACT)
+    finally:
+        cleanup()
+
+
+def test_count_estimated():
+    """
+    counts a query in estimated mode on an analyzed sqlite table.
+    the estimate should only be used if it is bigger than the threshold.
+    """
+
+    try:
+        insert_entities(5)
+        store = get_current_store()
+        query = store.query(BoundedLocalEntity)
+
+        set_estimate(5)
+        assert paging_services.count(query, mode=CountModeEnum.ESTIMATED) == \
+            (5, CountModeEnum.EXACT)
+
+        set_estimate(50000)
+        assert paging_services.count(query, mode=CountModeEnum.ESTIMATED) == \
+            (50000, CountModeEnum.ESTIMATED)
+
+        filtered = query.filter(BoundedLocalEntity.age > 1)
+        assert paging_services.count(filtered, mode=CountModeEnum.ESTIMATED) == \
+            (4, CountModeEnum.EXACT)
+    finally:
+        cleanup()
+
+
+def test_count_estimated_not_analyzed():
+    """
+    counts a query in estimated mode on a sqlite database which is not analyzed.
+    it should fall back to an exact count without affecting current transaction.
+    """
+
+    try:
+        insert_entities(5)
+        store = get_current_store()
+        execute('DROP TABLE IF EXISTS sqlite_stat1')
+        store.commit()
+
+        store.add(BoundedLocalEntity(id=6, name='name_6', age=6, populate_all=SECURE_TRUE))
+        store.flush()
+        query = store.query(BoundedLocalEntity)
+        assert paging_services.count(query, mode=CountModeEnum.ESTIMATED) == \
+            (6, CountModeEnum.EXACT)
+
+        store.commit()
+        assert store.query(BoundedLocalEntity).count() == 6
+    finally:
+        cleanup()
+
+
+def test_paginate_count_mode():
+    """
+    paginates a query with total count in cached mode.
+    the count mode which has produced the total count should be in metadata.
+    """
+
+    try:
+        insert_entities(3)
+        store = get_current_store()
+        app = application_services.get_current_app()
+        for mode in (CountModeEnum.EXACT, CountModeEnum.CACHED):
+            test_session_services.inject_new_request()
+            paginator = SimplePaginator('paging.count', count_mode=CountModeEnum.CACHED)
+            session_services.add_request_context(RequestContextEnum.PAGINATOR, paginator)
+            values = dict()
+            paginator.inject_paging_keys(values)
+
+            with app.test_request_context():
+                items = store.query(BoundedLocalEntity).filter(BoundedLocalEntity.age > 0) \
+                    .paginate(inject_total=SECURE_TRUE, **values).all()
+                result, metadata = paginator.paginate(items)
+
+            assert len(result) == 3
+            assert metadata['count_total'] == 3
+            assert metadata['count_mode'] == mode
+    finally:
+        cleanup()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+paging test_paginator module.
+"""
+
+from uuid import UUID
+from datetime import datetime, date, time
+
+import pytest
+
+from sqlalchemy import Integer, DateTime, Date, Time, column
+
+from pyrin.database.paging.paginator import KeysetPaginator
+from pyrin.database.paging.exceptions import InvalidCursorError
+
+
+def test_keyset_cursor_round_trip():
+    """
+    encodes values into a cursor token and decodes them back.
+    """
+
+    paginator = KeysetPaginator('pyrin.api.test')
+    values = [datetime(2021, 6, 1, 12, 30), UUID(int=1), 10]
+    cursor = paginator._encode_cursor(KeysetPaginator.BACKWARD, values)
+    direction, decoded = paginator._decode_cursor(cursor)
+    assert direction == KeysetPaginator.BACKWARD
+    assert decoded == ['2021-06-01T12:30:00', '00000000-0000-0000-0000-000000000001', 10]
+
+    created_on = column('created_on', DateTime)
+    assert paginator._convert_value(decoded[0], created_on) == values[0]
+
+
+def test_keyset_cursor_round_trip_temporal_values():
+    """
+    encodes temporal values into a cursor token and decodes them back.
+    the values must be converted to their python types with full precision.
+    """
+
+    paginator = KeysetPaginator('pyrin.api.test')
+    values = [datetime(2021, 6, 1, 12, 30, 15, 123456), date(2021, 6, 1),
+              time(12, 30, 15, 654321)]
+    cursor = paginator._encode_cursor(KeysetPaginator.FORWARD, values)
+    direction, decoded = paginator._decode_cursor(cursor)
+    assert direction == KeysetPaginator.FORWARD
+
+    columns = [column('created_on', DateTime), column('birth_date', Date),
+               column('start_time', Time)]
+    for value, decoded_value, item in zip(values, decoded, columns):
+        assert paginator._convert_value(decoded_value, item) == value
+
+
+def test_keyset_invalid_cursor_value():
+    """
+    converts an invalid cursor value. it should raise an error.
+    """
+
+    paginator = KeysetPaginator('pyrin.api.test')
+    with pytest.raises(InvalidCursorError):
+        paginator._convert_value('not a datetime', column('created_on', DateTime))
+
+
+def test_keyset_invalid_cursor():
+    """
+    decodes an invalid cursor token. it should raise an error.
+    """
+
+    paginator = KeysetPaginator('pyrin.api.test')
+    with pytest.raises(InvalidCursorError):
+        paginator._decode_cursor('not a valid cursor')
+
+
+def test_keyset_criterion_uniform_ordering():
+    """
+    gets the criterion for ordering with the same direction on all columns.
+    """
+
+    paginator = KeysetPaginator('pyrin.api.test')
+    ordering = [('age', column('age', Integer), False),
+                ('id', column('id', Integer), False)]
+
+    criterion = paginator._get_criterion(ordering, [20, 5])
+    assert str(criterion) == '(age, id) > (:param_1, :param_2)'
+
+
+def test_keyset_criterion_mixed_ordering():
+    """
+    gets the criterion for ordering with different directions on columns.
+    """
+
+    paginator = KeysetPaginator('pyrin.api.test')
+    ordering = [('age', column('age', Integer), True),
+                ('id', column('id', Integer), False)]
+
+    criterion = paginator._get_criterion(ordering, [20, 5])
+    assert str(criterion) == 'age < :param_1 OR age = :param_1 AND id > :param_2'
+
+
+def test_keyset_criterion_invalid_values():
+    """
+    gets the criterion for values which do not match the ordering. it should raise an error.
+    """
+
+    paginator = KeysetPaginator('pyrin.api.test')
+    ordering = [('id', column('id', Integer), False)]
+    with pytest.raises(InvalidCursorError):
+        paginator._get_criterion(ordering, [20, 5])
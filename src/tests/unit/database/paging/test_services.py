@@ -3,7 +3,60 @@
 paging test_services module.
 """
 
+import pytest
+
 import pyrin.configuration.services as config_services
 import pyrin.database.paging.services as paging_services
 
 from pyrin.core.structs import DTO
+from pyrin.database.paging.exceptions import InvalidCountModeError
+
+
+def test_extract_paging_params_with_cursor():
+    """
+    extracts paging params including cursor from given values.
+    """
+
+    values = dict(page=['2'], page_size=['10'], cursor=['abc'], name='test')
+    result = paging_services.extract_paging_params(values, keyset=True)
+    assert result == dict(page='2', page_size='10', cursor='abc')
+    assert values == dict(name='test')
+
+
+def test_extract_paging_params_without_keyset():
+    """
+    extracts paging params from given values without keyset pagination.
+    the cursor param must be left in given values.
+    """
+
+    values = dict(page=['2'], page_size=['10'], cursor=['abc'], name='test')
+    result = paging_services.extract_paging_params(values)
+    assert result == dict(page='2', page_size='10', cursor=None)
+    assert values == dict(cursor=['abc'], name='test')
+
+
+def test_get_cursor_param():
+    """
+    gets cursor param from given inputs.
+    """
+
+    assert paging_services.get_cursor_param(cursor='abc', page=1) == 'abc'
+    assert paging_services.get_cursor_param(page=1) is None
+
+
+def test_generate_cursor_params():
+    """
+    generates cursor params from given inputs.
+    """
+
+    result = paging_services.generate_cursor_params('abc', 20)
+    assert result == dict(cursor='abc', page_size=20)
+
+
+def test_count_invalid_mode():
+    """
+    gets the total count with an invalid count mode. it should raise an error.
+    """
+
+    with pytest.raises(InvalidCountModeError):
+        paging_services.count(None, mode='unknown')
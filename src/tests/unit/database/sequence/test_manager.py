@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+database sequence test_manager module.
+"""
+
+import itertools
+
+from threading import Thread
+
+import pytest
+
+from sqlalchemy import Sequence
+from sqlalchemy.dialects import postgresql, oracle
+
+from pyrin.database.sequence.manager import DatabaseSequenceManager
+from pyrin.database.sequence.exceptions import InvalidSequenceValueCountError
+
+
+class DatabaseSequenceManagerMock(DatabaseSequenceManager):
+    """
+    database sequence manager mock class.
+
+    it generates sequence values in memory and keeps
+    the count of values of each fetch from database.
+    """
+
+    def reset(self, block_size=50, block_sizes=None,
+              pooled_increment=False, block_supported=True):
+        """
+        resets the state of this manager.
+
+        :param int block_size: block size of sequences.
+        :param dict block_sizes: block sizes of specific sequences.
+        :param bool pooled_increment: handle sequences using hi/lo scheme.
+        :param bool block_supported: specifies that the dialect supports blocks.
+        """
+
+        self.clear()
+        self._block_size = block_size
+        self._block_sizes = block_sizes or {}
+        self._pooled_increment = pooled_increment
+        self.block_supported = block_supported
+        self.fetches = []
+        self.generators = {}
+
+    def _is_block_supported(self, bind, sequence):
+        """
+        gets a value indicating that values of given sequence could be allocated in blocks.
+
+        :param Engine bind: bind of the sequence.
+        :param Sequence sequence: sequence instance.
+
+        :rtype: bool
+        """
+
+        return self._is_pooled(sequence) or self.block_supported
+
+    def _fetch_values(self, bind, sequence, count, **options):
+        """
+        generates given count of values of a sequence.
+
+        :param Engine bind: bind to fetch values from it.
+        :param Sequence sequence: sequence instance.
+        :param int count: count of values to be fetched.
+
+        :rtype: list[int]
+        """
+
+        name = self._get_name(sequence)
+        generator = self.generators.setdefault(name, itertools.count(1, sequence.increment or 1))
+        self.fetches.append(count)
+        return [next(generator) for _ in range(count)]
+
+
+def test_next_value_from_block():
+    """
+    gets next values of a sequence from a single block.
+    """
+
+    manager = DatabaseSequenceManagerMock()
+    manager.reset()
+    sequence = Sequence('block_sequence')
+    values = [manager.next_value(sequence) for _ in range(3)]
+
+    assert values == [1, 2, 3]
+    assert manager.fetches == [50]
+
+
+def test_next_values_more_than_remaining():
+    """
+    gets next values of a sequence which are more than remaining values of the block.
+    """
+
+    manager = DatabaseSequenceManagerMock()
+    manager.reset()
+    sequence = Sequence('block_sequence')
+    first = manager.next_values(sequence, 10)
+    second = manager.next_values(sequence, 45)
+
+    assert first == list(range(1, 11))
+    assert second == list(range(11, 56))
+    assert manager.fetches == [50, 50]
+
+
+def test_next_values_bigger_than_block_size():
+    """
+    gets next values of a sequence which are more than block size.
+    """
+
+    manager = DatabaseSequenceManagerMock()
+    manager.reset(block_size=10)
+    sequence = Sequence('block_sequence')
+    values = manager.next_values(sequence, 25)
+
+    assert values == list(range(1, 26))
+    assert manager.fetches == [25]
+
+
+def test_next_value_with_specific_block_size():
+    """
+    gets next value of a sequence which has a specific block size.
+    """
+
+    manager = DatabaseSequenceManagerMock()
+    manager.reset(block_sizes={'schema.block_sequence': 5})
+    manager.next_value(Sequence('block_sequence', schema='schema'))
+    manager.next_value(Sequence('block_sequence'))
+
+    assert manager.fetches == [5, 50]
+
+
+def test_next_value_unsupported_dialect():
+    """
+    gets next values of a sequence on a dialect which does not support blocks.
+    values must be fetched only when they are needed.
+    """
+
+    manager = DatabaseSequenceManagerMock()
+    manager.reset(block_supported=False)
+    sequence = Sequence('block_sequence')
+    values = [manager.next_value(sequence) for _ in range(3)]
+    values.extend(manager.next_values(sequence, 4))
+
+    assert values == list(range(1, 8))
+    assert manager.fetches == [1, 1, 1, 4]
+
+
+def test_next_values_pooled():
+    """
+    gets next values of a sequence with an increment using hi/lo scheme.
+    """
+
+    manager = DatabaseSequenceManagerMock()
+    manager.reset(block_size=25, pooled_increment=True, block_supported=False)
+    sequence = Sequence('pooled_sequence', increment=10)
+    values = manager.next_values(sequence, 30)
+
+    assert values == list(range(1, 31))
+    assert manager.fetches == [3]
+
+
+def test_next_values_increment_without_pooled():
+    """
+    gets next values of a sequence with an increment when hi/lo scheme is disabled.
+    """
+
+    manager = DatabaseSequenceManagerMock()
+    manager.reset(block_size=3, block_supported=False)
+    sequence = Sequence('pooled_sequence', increment=10)
+    values = manager.next_values(sequence, 3)
+
+    assert values == [1, 11, 21]
+    assert manager.fetches == [3]
+
+
+def test_next_values_invalid_count():
+    """
+    gets next values of a sequence with invalid count. it should raise an error.
+    """
+
+    manager = DatabaseSequenceManagerMock()
+    manager.reset()
+    with pytest.raises(InvalidSequenceValueCountError):
+        manager.next_values(Sequence('block_sequence'), -1)
+
+
+def test_next_values_zero_count():
+    """
+    gets zero next values of a sequence.
+    """
+
+    manager = DatabaseSequenceManagerMock()
+    manager.reset()
+
+    assert manager.next_values(Sequence('block_sequence'), 0) == []
+    assert manager.fetches == []
+
+
+def test_next_value_concurrent():
+    """
+    gets next values of a sequence from multiple threads.
+    all values must be unique.
+    """
+
+    manager = DatabaseSequenceManagerMock()
+    manager.reset(block_size=7)
+    sequence = Sequence('block_sequence')
+    results = []
+
+    def allocate():
+        results.extend(manager.next_value(sequence) for _ in range(100))
+
+    threads = [Thread(target=allocate) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == list(range(1, 801))
+
+
+def test_block_statements():
+    """
+    gets the statements to fetch a block of sequence values.
+    """
+
+    manager = DatabaseSequenceManagerMock()
+    sequence = Sequence('block_sequence', schema='schema')
+    postgresql_statement = manager._get_postgresql_block_statement(sequence, 10)
+    oracle_statement = manager._get_oracle_block_statement(sequence, 10)
+    postgresql_sql = str(postgresql_statement.compile(dialect=postgresql.dialect()))
+    oracle_sql = str(oracle_statement.compile(dialect=oracle.dialect()))
+
+    assert "nextval('schema.block_sequence')" in postgresql_sql
+    assert 'generate_series' in postgresql_sql
+    assert 'schema.block_sequence.nextval' in oracle_sql
+    assert 'CONNECT BY LEVEL <= 10' in oracle_sql
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+logging test_queue module.
+"""
+
+import logging
+import threading
+
+from threading import Thread
+
+import pytest
+
+import pyrin.logging.services as logging_services
+
+from pyrin.logging.enumerations import OverflowPolicyEnum
+from pyrin.logging.exceptions import InvalidOverflowPolicyError
+from pyrin.logging.queue import LogQueue, QueueHandler, QueueListener
+
+
+class ListHandler(logging.Handler):
+    """
+    list handler class.
+    """
+
+    def __init__(self):
+        """
+        initializes an instance of ListHandler.
+        """
+
+        super().__init__()
+
+        self.records = []
+        self.threads = []
+
+    def emit(self, record):
+        """
+        keeps the given record.
+
+        :param LogRecord record: log record.
+        """
+
+        self.records.append(self.format(record))
+        self.threads.append(threading.current_thread())
+
+
+def create_record(message, level=logging.INFO):
+    """
+    creates a log record with given message and level.
+
+    :param str message: log message.
+    :param int level: log level.
+
+    :rtype: LogRecord
+    """
+
+    return logging.LogRecord('test', level, __file__, 1, message, None, None)
+
+
+def get_messages(log_queue):
+    """
+    gets the messages of all queued records.
+
+    :param LogQueue log_queue: log queue.
+
+    :rtype: list[str]
+    """
+
+    messages = []
+    log_queue.close()
+    item = log_queue.get()
+    while item is not None:
+        messages.append(item[1].msg)
+        item = log_queue.get()
+
+    return messages
+
+
+def test_log_queue_invalid_overflow_policy():
+    """
+    creates a log queue with invalid overflow policy.
+    it should raise an error.
+    """
+
+    with pytest.raises(InvalidOverflowPolicyError):
+        LogQueue(10, 'invalid')
+
+
+def test_log_queue_drop_oldest():
+    """
+    puts more records than max size into a drop oldest queue.
+    the oldest records should be dropped.
+    """
+
+    log_queue = LogQueue(2, OverflowPolicyEnum.DROP_OLDEST)
+    for message in ('1', '2', '3'):
+        assert log_queue.put((), create_record(message)) is True
+
+    assert log_queue.dropped == {'INFO': 1}
+    assert get_messages(log_queue) == ['2', '3']
+
+
+def test_log_queue_drop_debug_first():
+    """
+    puts more records than max size into a drop debug first queue.
+    the debug records should be dropped first.
+    """
+
+    log_queue = LogQueue(2, OverflowPolicyEnum.DROP_DEBUG_FIRST)
+    assert log_queue.put((), create_record('1')) is True
+    assert log_queue.put((), create_record('2', logging.DEBUG)) is True
+    assert log_queue.put((), create_record('3')) is True
+    assert log_queue.put((), create_record('4', logging.DEBUG)) is False
+    assert log_queue.put((), create_record('5', logging.ERROR)) is True
+
+    assert log_queue.dropped == {'DEBUG': 2, 'INFO': 1}
+    assert get_messages(log_queue) == ['3', '5']
+
+
+def test_log_queue_block():
+    """
+    puts more records than max size into a blocking queue.
+    it should wait until a record is consumed.
+    """
+
+    log_queue = LogQueue(1, OverflowPolicyEnum.BLOCK)
+    log_queue.put((), create_record('1'))
+    producer = Thread(target=log_queue.put, args=((), create_record('2')))
+    producer.start()
+    producer.join(0.05)
+    assert producer.is_alive() is True
+    assert log_queue.get()[1].msg == '1'
+    producer.join()
+
+    assert log_queue.dropped == {}
+    assert get_messages(log_queue) == ['2']
+
+
+def test_queue_listener():
+    """
+    emits logs using a queue handler.
+    the logs should be emitted by the listener thread.
+    """
+
+    handler = ListHandler()
+    log_queue = LogQueue(100, OverflowPolicyEnum.BLOCK)
+    listener = QueueListener(log_queue)
+    logger = logging.Logger('queue_listener')
+    logger.addHandler(QueueHandler((handler,), log_queue))
+    listener.start()
+    try:
+        for index in range(10):
+            logger.info('record [%s].', index)
+
+        assert log_queue.join(5) is True
+    finally:
+        listener.stop(5)
+
+    assert handler.records == ['record [{index}].'.format(index=index)
+                               for index in range(10)]
+    assert all(thread is not threading.current_thread() for thread in handler.threads)
+
+    logger.info('after stop.')
+    assert handler.records[-1] == 'after stop.'
+    assert handler.threads[-1] is threading.current_thread()
+
+
+def test_get_queue_stats_disabled():
+    """
+    gets queue stats while asynchronous emission is disabled.
+    """
+
+    stats = logging_services.get_queue_stats()
+    assert stats['enabled'] is False
+    assert stats['dropped'] == 0
+    assert logging_services.flush_queue() is True
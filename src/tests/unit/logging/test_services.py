@@ -7,7 +7,10 @@ import logging
 
 import pyrin.logging.services as logging_services
 
+from pyrin.application.services import get_component
+from pyrin.logging import LoggingPackage
 from pyrin.logging.adapters import RequestInfoLoggerAdapter
+from pyrin.logging.structs import LazyValue
 
 
 def test_reload_configs():
@@ -332,3 +335,64 @@ def test_error_database(caplog):
     assert caplog.records is not None and len(caplog.records) > 0
     assert message in caplog.records[0].message
     caplog.clear()
+
+
+def test_lazy_interpolation_data_disabled_level(caplog):
+    """
+    emits a debug log with lazy interpolation data while debug level is disabled.
+    the lazy data should not be evaluated.
+    """
+
+    calls = []
+
+    def get_data():
+        calls.append(1)
+        return 'lazy data'
+
+    caplog.clear()
+    caplog.set_level(logging.WARNING)
+    logging_services.debug('this is a lazy [{data}] log.',
+                           interpolation_data=dict(data=LazyValue(get_data)))
+    assert len(caplog.records) == 0
+    assert len(calls) == 0
+    caplog.clear()
+
+
+def test_lazy_interpolation_data_enabled_level(caplog):
+    """
+    emits an info log with lazy interpolation data while info level is enabled.
+    the lazy data should be evaluated once.
+    """
+
+    calls = []
+
+    def get_data():
+        calls.append(1)
+        return 'lazy data'
+
+    caplog.clear()
+    caplog.set_level(logging.INFO)
+    logging_services.info('this is a lazy [{data}] log.',
+                          interpolation_data=dict(data=LazyValue(get_data)))
+    assert len(caplog.records) == 1
+    assert 'this is a lazy [lazy data] log.' in caplog.records[0].message
+    assert len(calls) == 1
+    caplog.clear()
+
+
+def test_is_body_sampled():
+    """
+    checks that bodies of each url rule are sampled based on their sample rate.
+    """
+
+    logging_manager = get_component(LoggingPackage.COMPONENT_NAME)
+    logging_services.reload_configs()
+    logging_manager._body_sample_rates = (1, {'/api/sampled': 3, '/api/ignored': 0})
+    try:
+        assert logging_services.is_body_sampled() is True
+        assert logging_services.is_body_sampled('/api/other') is True
+        assert logging_services.is_body_sampled('/api/ignored') is False
+        results = [logging_services.is_body_sampled('/api/sampled') for _ in range(6)]
+        assert results == [True, False, False, True, False, False]
+    finally:
+        logging_services.reload_configs()
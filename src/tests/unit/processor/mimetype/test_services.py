@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+mimetype test_services module.
+"""
+
+import pyrin.processor.mimetype.services as mimetype_services
+
+from pyrin.processor.mimetype.enumerations import MIMETypeEnum
+
+
+def test_get_mimetype_dict():
+    """
+    gets the mimetype of a dict value.
+    """
+
+    assert mimetype_services.get_mimetype(dict(name='value')) == MIMETypeEnum.JSON
+
+
+def test_get_mimetype_json_string():
+    """
+    gets the mimetype of json string values.
+    """
+
+    assert mimetype_services.get_mimetype('{"name": "value"}') == MIMETypeEnum.JSON
+    assert mimetype_services.get_mimetype(' \n {"name": "value"}\n ') == MIMETypeEnum.JSON
+
+
+def test_get_mimetype_html_string():
+    """
+    gets the mimetype of html string values.
+    """
+
+    assert mimetype_services.get_mimetype('<html><body>ok</body></html>') == MIMETypeEnum.HTML
+    assert mimetype_services.get_mimetype('  <!DOCTYPE html>\n<p>ok</p>') == MIMETypeEnum.HTML
+    assert mimetype_services.get_mimetype('hello <b>world</b>!') == MIMETypeEnum.HTML
+
+
+def test_get_mimetype_text_string():
+    """
+    gets the mimetype of text string values.
+    """
+
+    assert mimetype_services.get_mimetype('plain text') == MIMETypeEnum.TEXT
+    assert mimetype_services.get_mimetype('1 < 2 and 3 > 2') == MIMETypeEnum.TEXT
+    assert mimetype_services.get_mimetype('{ not closed') == MIMETypeEnum.TEXT
+    assert mimetype_services.get_mimetype('') == MIMETypeEnum.TEXT
+    assert mimetype_services.get_mimetype('   ') == MIMETypeEnum.TEXT
+
+
+def test_get_mimetype_large_string():
+    """
+    gets the mimetype of large string values.
+    detection should only scan the start and end of the value. so the
+    content and size of the middle part should not affect the result.
+    """
+
+    head = '{' + ' x ' * 1000
+    tail = ' y ' * 1000 + '}'
+    for middle in ('', '<p>' * 1000000, '<html><body>ok</body></html>', ' ' * 3000000):
+        assert mimetype_services.get_mimetype(head + middle + tail) == MIMETypeEnum.JSON
+        assert mimetype_services.get_mimetype(head[1:] + middle + tail) == MIMETypeEnum.TEXT
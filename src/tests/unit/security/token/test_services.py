@@ -3,17 +3,23 @@
 token test_services module.
 """
 
+import time
+
 import pytest
 
+import pyrin.caching.services as caching_services
 import pyrin.security.token.services as token_services
 import pyrin.configuration.services as config_services
 
 from pyrin.core.structs import DTO
+from pyrin.application.services import get_component
+from pyrin.security.token import TokenPackage
+from pyrin.security.token.hooks import TokenHookBase
 from pyrin.security.token.handlers.rs256 import RS256Token
 from pyrin.security.token.handlers.hs256 import HS256Token
 from pyrin.security.token.exceptions import DuplicatedTokenHandlerError, \
     DuplicatedTokenKidHeaderError, InvalidTokenHandlerTypeError, TokenHandlerNotFoundError, \
-    TokenDecodingError
+    TokenDecodingError, TokenVerificationError, InvalidTokenHookTypeError
 
 from tests.unit.security.token.handlers.hs256_test_token import HS256TestToken
 
@@ -415,3 +421,153 @@ def test_token_is_singleton():
     token4 = HS256Token()
 
     assert token3 == token4
+
+
+class RevocationTestHook(TokenHookBase):
+    """
+    revocation test hook class.
+    """
+
+    def __init__(self):
+        """
+        initializes an instance of RevocationTestHook.
+        """
+
+        super().__init__()
+
+        self.revoked_tokens = []
+        self.synced = []
+
+    def revoked(self, header, payload):
+        """
+        this method will be called after a token has been revoked in current process.
+
+        :param dict header: header of revoked token.
+        :param dict payload: payload of revoked token.
+        """
+
+        self.revoked_tokens.append(payload.get('jti'))
+
+    def get_revoked_tokens(self, since):
+        """
+        this method will be called periodically to sync revoked tokens into memory.
+
+        :param float since: timestamp of the previous sync.
+
+        :rtype: list[tuple[str, float]]
+        """
+
+        self.synced.append(since)
+        return [('synced_revoked_jti', time.time() + 100),
+                ('synced_expired_jti', time.time() - 100)]
+
+
+def get_revocation_hook():
+    """
+    gets the revocation test hook.
+
+    it registers the hook if it is not registered yet.
+    note that hooks are singleton.
+
+    :rtype: RevocationTestHook
+    """
+
+    hook = RevocationTestHook()
+    manager = get_component(TokenPackage.COMPONENT_NAME)
+    if hook not in manager._get_hooks():
+        token_services.register_hook(hook)
+
+    hook.revoked_tokens.clear()
+    hook.synced.clear()
+    return hook
+
+
+def test_get_verified_token():
+    """
+    gets the verified header and payload of a token.
+    they must be cached for subsequent calls.
+    """
+
+    token = token_services.generate_access_token(DTO(name='cached'))
+    header, payload = token_services.get_verified_token(token)
+    manager = get_component(TokenPackage.COMPONENT_NAME)
+    cached = caching_services.get(config_services.get('security', 'token',
+                                                      'verified_cache_name'),
+                                  manager._get_verified_cache_key(token))
+
+    assert header.get('kid') is not None
+    assert payload.get('name') == 'cached'
+    assert cached == (header, payload)
+    assert token_services.get_verified_token(token) == (header, payload)
+
+
+def test_get_verified_token_tampered():
+    """
+    gets the verified header and payload of a tampered token after caching the original.
+    it should raise an error.
+    """
+
+    token = token_services.generate_access_token(DTO(name='tampered'))
+    token_services.get_verified_token(token)
+    header, payload, signature = token.split('.')
+    tampered = '.'.join((header, payload, signature[:-4] + 'AAAA'))
+
+    with pytest.raises(TokenVerificationError):
+        token_services.get_verified_token(tampered)
+
+
+def test_cache_verified_token_expired():
+    """
+    caches the header and payload of an expired token. it should not be cached.
+    """
+
+    manager = get_component(TokenPackage.COMPONENT_NAME)
+    key = manager._get_verified_cache_key('expired_token')
+    manager._cache_verified_token(key, dict(kid='kid'), dict(exp=time.time() - 1))
+    cache_name = config_services.get('security', 'token', 'verified_cache_name')
+
+    assert caching_services.get(cache_name, key) is None
+
+
+def test_revoke():
+    """
+    revokes a token. it must be removed from cache and hooks must be notified.
+    """
+
+    hook = get_revocation_hook()
+    token = token_services.generate_access_token(DTO(name='revoked'))
+    header, payload = token_services.get_verified_token(token)
+
+    assert token_services.is_revoked(payload) is False
+
+    token_services.revoke(token)
+    manager = get_component(TokenPackage.COMPONENT_NAME)
+    cache_name = config_services.get('security', 'token', 'verified_cache_name')
+
+    assert token_services.is_revoked(payload) is True
+    assert caching_services.get(cache_name, manager._get_verified_cache_key(token)) is None
+    assert payload.get('jti') in hook.revoked_tokens
+
+
+def test_is_revoked_synced():
+    """
+    gets a value indicating that tokens which are synced from hooks are revoked.
+    """
+
+    hook = get_revocation_hook()
+    manager = get_component(TokenPackage.COMPONENT_NAME)
+    manager._last_revocation_sync = None
+
+    assert token_services.is_revoked(DTO(jti='synced_revoked_jti')) is True
+    assert token_services.is_revoked(DTO(jti='synced_expired_jti')) is False
+    assert token_services.is_revoked(DTO(jti='not_revoked_jti')) is False
+    assert hook.synced == [None]
+
+
+def test_register_hook_invalid_type():
+    """
+    registers an invalid token hook. it should raise an error.
+    """
+
+    with pytest.raises(InvalidTokenHookTypeError):
+        token_services.register_hook(object())
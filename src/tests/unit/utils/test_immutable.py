@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+utils test_immutable module.
+"""
+
+import json
+import pickle
+
+import pytest
+
+import pyrin.utils.immutable as immutable_utils
+
+from pyrin.core.structs import DTO, CoreObject
+
+
+def test_freeze():
+    """
+    freezes a nested value. all nested dicts, lists and sets should be read-only.
+    """
+
+    value = DTO(name='fake_name', items=[dict(id=1, tags={'a', 'b'}), (1, [2])])
+    result = immutable_utils.freeze(value)
+
+    assert result == value
+    assert result.name == 'fake_name'
+
+    with pytest.raises(TypeError):
+        result['name'] = 'new_name'
+
+    with pytest.raises(TypeError):
+        result.name = 'new_name'
+
+    with pytest.raises(TypeError):
+        result['items'].append(1)
+
+    with pytest.raises(TypeError):
+        result['items'][0]['id'] = 2
+
+    with pytest.raises(TypeError):
+        result['items'][1][1].append(3)
+
+    assert isinstance(result['items'], list)
+    assert isinstance(result['items'][0], dict)
+    assert isinstance(result['items'][0]['tags'], frozenset)
+    assert value['items'][0]['id'] == 1
+
+
+def test_freeze_is_serializable():
+    """
+    freezes a nested value and serializes it. it should be the same as original value.
+    """
+
+    value = dict(id=1, items=[dict(name='a'), dict(name='b')])
+    result = immutable_utils.freeze(value)
+
+    assert json.dumps(result) == json.dumps(value)
+    assert pickle.loads(pickle.dumps(result)) == value
+
+
+def test_freeze_copy():
+    """
+    freezes a value and gets a copy of it. the copy should be mutable.
+    """
+
+    result = immutable_utils.freeze(dict(items=[1, 2]))
+    copied = result.copy()
+    copied['name'] = 'fake_name'
+    items = copied['items'].copy()
+    items.append(3)
+
+    assert 'name' not in result
+    assert items == [1, 2, 3]
+
+
+def test_freeze_other_types():
+    """
+    freezes values of other types. it should return the same object.
+    """
+
+    instance = CoreObject()
+
+    assert immutable_utils.freeze(instance) is instance
+    assert immutable_utils.freeze('value') == 'value'
+    assert immutable_utils.freeze(None) is None